@@ -34,6 +34,8 @@ from .core import (
     set_test_session_id,
     clear_test_session_id,
     generate_test_session_id,
+    set_active_framework,
+    get_active_framework,
 )
 from .substep import SubStepExecutor
 from .parallelstep import ParallelStepExecutor, startFirstWith
@@ -64,6 +66,8 @@ __all__ = [
     "set_test_session_id",
     "clear_test_session_id",
     "generate_test_session_id",
+    "set_active_framework",
+    "get_active_framework",
     # Sub-step execution
     "SubStepExecutor",
     "ParallelStepExecutor",
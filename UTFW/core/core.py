@@ -17,6 +17,9 @@ from .logger import get_active_logger
 # Global test session ID - unique per test execution
 _current_test_session_id: Optional[str] = None
 
+# Framework currently executing a test (modules register long-lived resources on it)
+_ACTIVE_FRAMEWORK: Optional["TestFramework"] = None
+
 
 def generate_test_session_id(test_name: str) -> str:
     """Generate a unique test session ID based on test name and timestamp.
@@ -61,6 +64,25 @@ def clear_test_session_id() -> None:
     _current_test_session_id = None
 
 
+def set_active_framework(framework: Optional["TestFramework"]) -> None:
+    """Set the TestFramework that modules should register resources with.
+
+    Args:
+        framework: The running framework, or None to clear it.
+    """
+    global _ACTIVE_FRAMEWORK
+    _ACTIVE_FRAMEWORK = framework
+
+
+def get_active_framework() -> Optional["TestFramework"]:
+    """Get the currently running TestFramework.
+
+    Returns:
+        The active framework or None when actions run outside a framework.
+    """
+    return _ACTIVE_FRAMEWORK
+
+
 @dataclass
 class TestStep:
     step_number: str
@@ -69,6 +91,7 @@ class TestStep:
     duration: float
     error: Optional[str] = None
     negative_test: bool = False
+    start_time: Optional[float] = None
 
 
 class TestAction:
@@ -290,6 +313,8 @@ class TestFramework:
     - Exception handling and error reporting  
     - Integration with TestReporter for HTML/XML report generation
     - Support for individual TestActions, STE groups, and PTE groups
+    - Registry for long-lived resources (capture sessions, open buses, ...)
+      that are released automatically at the end of the test
     """
 
     def __init__(self, test_name: str, reports_dir: Optional[str] = None):
@@ -297,6 +322,11 @@ class TestFramework:
         self.reports_dir = reports_dir
         self.test_steps: List[TestStep] = []
         self.overall_result = "UNKNOWN"
+        self._resources: Dict[str, tuple[Any, Optional[Callable[[Any], None]]]] = {}
+        self._resources_lock = threading.Lock()
+        # Wall-clock start of every step started so far (also running ones)
+        self.step_started: Dict[str, float] = {}
+        set_active_framework(self)
 
         # Generate and set unique test session ID
         self.session_id = generate_test_session_id(test_name)
@@ -307,6 +337,55 @@ class TestFramework:
         # Make reporter globally accessible so modules can log TX/RX
         set_active_reporter(self.reporter)
 
+    def register_resource(self, key: str, resource: Any,
+                          closer: Optional[Callable[[Any], None]] = None) -> Any:
+        """Register a long-lived resource that must be released when the test ends.
+
+        Resources are released in reverse registration order after the teardown
+        steps have run (and again, idempotently, in cleanup()).
+
+        Args:
+            key: Unique resource key, e.g. "pcap:session_name".
+            resource: The resource object.
+            closer: Callable invoked with the resource to release it.
+
+        Returns:
+            The registered resource.
+        """
+        with self._resources_lock:
+            self._resources[key] = (resource, closer)
+        return resource
+
+    def get_resource(self, key: str) -> Optional[Any]:
+        """Return the resource registered under `key`, or None."""
+        with self._resources_lock:
+            entry = self._resources.get(key)
+        return entry[0] if entry else None
+
+    def resource_keys(self, prefix: str = "") -> list[str]:
+        """Return registered resource keys starting with `prefix`, oldest first."""
+        with self._resources_lock:
+            return [k for k in self._resources if k.startswith(prefix)]
+
+    def release_resource(self, key: str) -> None:
+        """Unregister a resource and run its closer (no-op if unknown)."""
+        with self._resources_lock:
+            entry = self._resources.pop(key, None)
+        if entry and entry[1]:
+            entry[1](entry[0])
+
+    def release_all_resources(self) -> None:
+        """Release every registered resource, newest first. Errors are logged, not raised."""
+        while True:
+            with self._resources_lock:
+                if not self._resources:
+                    return
+                key = next(reversed(self._resources))
+            try:
+                self.release_resource(key)
+            except Exception as e:
+                self.reporter.log_warn(f"Releasing resource {key!r} failed: {e}")
+
     def _resolve_action(self, action) -> tuple[str, Callable[[], Any]]:
         """
         Resolve any action-like object to (name, callable).
@@ -332,6 +411,7 @@ class TestFramework:
         self.reporter.log_step_start(step_id, action_name, negative_test=negative_test)
 
         start_time = time.time()
+        self.step_started[step_id] = start_time
         error_obj = None
         result_str = "UNKNOWN"
 
@@ -363,7 +443,8 @@ class TestFramework:
                 result_str,
                 duration,
                 str(error_obj) if error_obj else None,
-                negative_test
+                negative_test,
+                start_time
             ))
             self.reporter.log_step_end(step_id)
 
@@ -523,6 +604,9 @@ class TestFramework:
                     if not test_failed:
                         self.overall_result = "FAIL"
 
+            # Stop anything the steps left running (capture sessions, open buses, ...)
+            self.release_all_resources()
+
             self.reporter.log_test_end(self.test_name, self.overall_result)
 
         return self.overall_result
@@ -539,12 +623,15 @@ class TestFramework:
         return self.reporter.generate_reports()
 
     def cleanup(self):
-        """Cleanup resources and close the reporter."""
+        """Release registered resources and close the reporter."""
         try:
+            self.release_all_resources()
             self.reporter.close()
         finally:
             from .reporting import set_active_reporter
             set_active_reporter(None)
+            if get_active_framework() is self:
+                set_active_framework(None)
             # Clear the test session ID
             clear_test_session_id()
 
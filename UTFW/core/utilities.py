@@ -636,4 +636,27 @@ def get_reports_dir() -> Optional[str]:
         >>> reports_dir = get_reports_dir()
         >>> output_file = Path(reports_dir) / "capture.pcap"
     """
-    return _test_context['reports_dir']
\ No newline at end of file
+    return _test_context['reports_dir']
+
+def get_cache_dir(subdir: Optional[str] = None) -> Path:
+    """Get (and create) the persistent UTFW cache directory.
+
+    Modules use this directory for data that is expensive to rebuild and
+    should survive across test runs (e.g. capture interface listings).
+    The location is ``$UTFW_CACHE_DIR`` when set, otherwise ``~/.utfw/cache``.
+
+    Args:
+        subdir (Optional[str]): Optional sub-directory name inside the cache.
+
+    Returns:
+        Path: Existing cache directory path.
+
+    Example:
+        >>> cache_file = get_cache_dir("pcap") / "interfaces.json"
+    """
+    base = os.environ.get('UTFW_CACHE_DIR')
+    path = Path(base) if base else Path.home() / ".utfw" / "cache"
+    if subdir:
+        path = path / subdir
+    path.mkdir(parents=True, exist_ok=True)
+    return path
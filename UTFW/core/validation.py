@@ -8,11 +8,17 @@ including regex matching, numeric range validation, string comparisons,
 and specialized validators for common data types like IP addresses,
 MAC addresses, and firmware versions.
 
+Repeated checks on one response go through a compiled pattern registry:
+``compile_patterns`` builds a step's tokens and regexes once, and
+``scan_response`` scans a response once into a ``MatchTable`` that every
+later check queries.
+
 Author: DvidMakesThings
 """
 
 import re
-from typing import Any, List, Dict, Optional, Union
+from collections import OrderedDict
+from typing import Any, List, Dict, Optional, Sequence, Tuple, Union
 
 
 class ValidationTestError(Exception):
@@ -54,13 +60,10 @@ def test_regex_match(text: str, pattern: str, description: str = "") -> bool:
         >>> test_regex_match("invalid", r"^\\d+\\.\\d+\\.\\d+\\.\\d+$", "IP address")
         ValidationTestError: Regex match failed (IP address): 'invalid' does not match '^\\d+\\.\\d+\\.\\d+\\.\\d+$'
     """
-    try:
-        if not re.match(pattern, text):
-            desc_part = f" ({description})" if description else ""
-            raise ValidationTestError(f"Regex match failed{desc_part}: '{text}' does not match '{pattern}'")
-        return True
-    except re.error as e:
-        raise ValidationTestError(f"Invalid regex pattern '{pattern}': {e}")
+    if not _compiled(pattern).match(text):
+        desc_part = f" ({description})" if description else ""
+        raise ValidationTestError(f"Regex match failed{desc_part}: '{text}' does not match '{pattern}'")
+    return True
 
 
 def test_regex_search(text: str, pattern: str, description: str = "") -> bool:
@@ -89,13 +92,10 @@ def test_regex_search(text: str, pattern: str, description: str = "") -> bool:
         >>> test_regex_search("No IP here", r"\\d+\\.\\d+\\.\\d+\\.\\d+", "IP in text")
         ValidationTestError: Regex search failed (IP in text): '\\d+\\.\\d+\\.\\d+\\.\\d+' not found in 'No IP here'
     """
-    try:
-        if not re.search(pattern, text):
-            desc_part = f" ({description})" if description else ""
-            raise ValidationTestError(f"Regex search failed{desc_part}: '{pattern}' not found in '{text}'")
-        return True
-    except re.error as e:
-        raise ValidationTestError(f"Invalid regex pattern '{pattern}': {e}")
+    if not match_table(text, patterns={pattern: pattern}).has(pattern):
+        desc_part = f" ({description})" if description else ""
+        raise ValidationTestError(f"Regex search failed{desc_part}: '{pattern}' not found in '{text}'")
+    return True
 
 
 def test_numeric_range(value: Union[str, int, float], min_val: float, max_val: float,
@@ -248,20 +248,8 @@ def test_key_value_pairs(text: str, expected_pairs: Dict[str, Union[str, re.Patt
     if separators is None:
         separators = [":", "="]
     
-    # Parse key-value pairs
-    parsed_pairs = {}
-    lines = text.replace("\r\n", "\n").replace("\r", "\n").splitlines()
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        for sep in separators:
-            if sep in line:
-                key, value = line.split(sep, 1)
-                parsed_pairs[key.strip()] = value.strip()
-                break
+    # Parse key-value pairs (shared with every other check of this response)
+    parsed_pairs = dict(match_table(text).key_values(separators))
     
     # Validate expected pairs
     failures = []
@@ -279,9 +267,9 @@ def test_key_value_pairs(text: str, expected_pairs: Dict[str, Union[str, re.Patt
         elif isinstance(expected, str):
             # String comparison (can contain regex)
             try:
-                if not re.match(expected, actual_value):
+                if not _compiled(expected).match(actual_value):
                     failures.append(f"Key '{key}': '{actual_value}' does not match '{expected}'")
-            except re.error:
+            except ValidationTestError:
                 # If regex is invalid, do exact string comparison
                 if actual_value != expected:
                     failures.append(f"Key '{key}': expected '{expected}', got '{actual_value}'")
@@ -426,4 +414,250 @@ def test_frequency_value(freq_string: str, expected_hz: int, tolerance_percent:
             f"Frequency out of tolerance{desc_part}: {actual_hz} Hz not within {tolerance_percent}% of {expected_hz} Hz"
         )
     
-    return True
\ No newline at end of file
+    return True
+
+
+# ======================== Compiled Pattern Registry ========================
+
+AUTOMATON_MIN_TOKENS = 16
+
+_REGISTRY_SIZE = 256
+_TABLE_CACHE_SIZE = 32
+
+_PATTERN_REGISTRY: "OrderedDict[tuple, PatternSet]" = OrderedDict()
+_TABLE_CACHE: "OrderedDict[tuple, MatchTable]" = OrderedDict()
+
+
+class PatternSet:
+    """All patterns one step checks, compiled into combined automata.
+
+    Literal tokens are compiled into one alternation (longest first). A
+    scan searches with the automaton of the tokens not found yet; at the
+    leftmost position where any of them matches, the reported token and
+    its prefixes are recorded and the search resumes there with the
+    remaining tokens, so the text is walked once and each first offset is
+    exactly what ``str.find`` returns. CPython's ``re`` has no real
+    multi-literal matcher, so below ``AUTOMATON_MIN_TOKENS`` tokens one
+    ``str.find`` per token is cheaper and is used instead.
+
+    Regular expressions are compiled once and kept per set. They are not
+    merged into one alternation: that defeats ``re``'s literal-prefix
+    scanning and measured an order of magnitude slower than separate
+    searches on multi-kilobyte responses.
+
+    Build through :func:`compile_patterns`, which keeps a registry of
+    compiled sets.
+
+    Args:
+        tokens: Literal substrings.
+        patterns: Mapping of name -> regex (string or compiled).
+        flags: Flags for string patterns.
+    """
+
+    def __init__(self, tokens: Sequence[str] = (),
+                 patterns: Optional[Dict[str, Union[str, "re.Pattern"]]] = None,
+                 flags: int = 0):
+        self.tokens: Tuple[str, ...] = tuple(dict.fromkeys(t for t in tokens if t))
+        self.patterns: Dict[str, re.Pattern] = {}
+        for name, p in (patterns or {}).items():
+            try:
+                self.patterns[name] = p if isinstance(p, re.Pattern) else re.compile(p, flags)
+            except re.error as e:
+                raise ValidationTestError(f"Invalid regex pattern '{p}': {e}")
+        # token -> tokens that are a prefix of it (itself included)
+        self._prefixes = {t: [u for u in self.tokens if t.startswith(u)] for t in self.tokens}
+        self._automata: Dict[Tuple[str, ...], re.Pattern] = {}
+
+    def _token_automaton(self, tokens: Tuple[str, ...]) -> re.Pattern:
+        rx = self._automata.get(tokens)
+        if rx is None:
+            ordered = sorted(tokens, key=len, reverse=True)
+            rx = re.compile("(" + "|".join(map(re.escape, ordered)) + ")")
+            self._automata[tokens] = rx
+        return rx
+
+    def scan(self, text: str) -> "MatchTable":
+        """Scan ``text`` and return its match table."""
+        return MatchTable(self, text)
+
+
+class MatchTable:
+    """Result of scanning one response with one :class:`PatternSet`.
+
+    Every check of a step queries the table instead of re-scanning the
+    text: token presence, first regex match per pattern, and on demand
+    all token positions, normalised lines and key/value pairs (each
+    computed once).
+    """
+
+    def __init__(self, patterns: PatternSet, text: str):
+        self.patterns = patterns
+        self.text = text
+        self._lines: Optional[List[str]] = None
+        self._key_values: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        self._all: Dict[str, List[re.Match]] = {}
+        self._positions: Optional[Dict[str, List[int]]] = None
+
+        # Tokens: first occurrence of each
+        self._token_first: Dict[str, Optional[int]] = dict.fromkeys(patterns.tokens)
+        if len(patterns.tokens) < AUTOMATON_MIN_TOKENS:
+            for token in patterns.tokens:
+                pos = text.find(token)
+                self._token_first[token] = pos if pos >= 0 else None
+        else:
+            remaining, pos = list(patterns.tokens), 0
+            while remaining:
+                m = patterns._token_automaton(tuple(remaining)).search(text, pos)
+                if m is None:
+                    break
+                pos = m.start()
+                for token in patterns._prefixes[m.group(1)]:
+                    if self._token_first[token] is None:
+                        self._token_first[token] = pos
+                remaining = [t for t in remaining if self._token_first[t] is None]
+                pos += 1
+
+        # Regexes: first match of each
+        self._first: Dict[str, Optional[re.Match]] = {
+            name: pat.search(text) for name, pat in patterns.patterns.items()
+        }
+
+    # -- tokens --
+
+    def has(self, key: str) -> bool:
+        """True if a token occurs / a named pattern matched."""
+        if key in self._token_first:
+            return self._token_first[key] is not None
+        return self.first(key) is not None
+
+    def find(self, token: str) -> int:
+        """Offset of the first occurrence of a token, -1 if absent (like ``str.find``)."""
+        pos = self._token_first[token]
+        return -1 if pos is None else pos
+
+    def positions(self, token: str) -> List[int]:
+        """Start offsets of every occurrence of a token, overlapping ones included."""
+        if self._positions is None:
+            # At each offset the longest token is reported; its prefixes occur there too
+            self._positions = {t: [] for t in self.patterns.tokens}
+            if len(self.patterns.tokens) < AUTOMATON_MIN_TOKENS:
+                for t, found in self._positions.items():
+                    pos = self.text.find(t)
+                    while pos >= 0:
+                        found.append(pos)
+                        pos = self.text.find(t, pos + 1)
+            else:
+                rx = self.patterns._token_automaton(self.patterns.tokens)
+                m = rx.search(self.text)
+                while m is not None:
+                    for t in self.patterns._prefixes[m.group(1)]:
+                        self._positions[t].append(m.start())
+                    m = rx.search(self.text, m.start() + 1)
+        return list(self._positions[token])
+
+    def count(self, token: str) -> int:
+        """Occurrences of a token, overlapping ones included."""
+        return len(self.positions(token))
+
+    def missing(self) -> List[str]:
+        """Tokens and pattern names without a match, in registration order."""
+        return ([t for t, pos in self._token_first.items() if pos is None]
+                + [n for n, m in self._first.items() if m is None])
+
+    # -- regexes --
+
+    def first(self, name: str) -> Optional["re.Match"]:
+        """First match of a named pattern (same as ``re.search``)."""
+        if name not in self._first:
+            raise KeyError(f"Pattern '{name}' is not part of this pattern set")
+        return self._first[name]
+
+    def group(self, name: str, group: Union[int, str] = 0) -> Optional[str]:
+        """A group of the first match of a named pattern, or None."""
+        m = self.first(name)
+        return m.group(group) if m else None
+
+    def all(self, name: str) -> List["re.Match"]:
+        """All non-overlapping matches of a named pattern (scanned on first use)."""
+        if name not in self._all:
+            self._all[name] = list(self.patterns.patterns[name].finditer(self.text))
+        return self._all[name]
+
+    # -- structure --
+
+    @property
+    def lines(self) -> List[str]:
+        """Stripped, non-empty lines with CR/LF normalised."""
+        if self._lines is None:
+            text = self.text.replace("\r\n", "\n").replace("\r", "\n")
+            self._lines = [s for s in (line.strip() for line in text.split("\n")) if s]
+        return self._lines
+
+    def key_values(self, separators: Sequence[str] = (":", "=")) -> Dict[str, str]:
+        """``key<sep>value`` pairs of all lines (first separator found wins)."""
+        key = tuple(separators)
+        if key not in self._key_values:
+            pairs: Dict[str, str] = {}
+            for line in self.lines:
+                for sep in separators:
+                    if sep in line:
+                        k, v = line.split(sep, 1)
+                        pairs[k.strip()] = v.strip()
+                        break
+            self._key_values[key] = pairs
+        return self._key_values[key]
+
+
+def _pattern_key(p: Union[str, "re.Pattern"]) -> tuple:
+    return (p.pattern, p.flags) if isinstance(p, re.Pattern) else (p, None)
+
+
+def compile_patterns(tokens: Sequence[str] = (),
+                     patterns: Optional[Dict[str, Union[str, "re.Pattern"]]] = None,
+                     flags: int = 0) -> PatternSet:
+    """Return the compiled :class:`PatternSet` for these patterns.
+
+    Sets are kept in a registry, so building the same checks again (e.g.
+    in a loop or on every step run) reuses the compiled automata.
+
+    Raises:
+        ValidationTestError: If a regex is invalid.
+    """
+    key = (tuple(tokens),
+           tuple((n, _pattern_key(p)) for n, p in (patterns or {}).items()),
+           flags)
+    pset = _PATTERN_REGISTRY.get(key)
+    if pset is None:
+        pset = PatternSet(tokens, patterns, flags)
+        _PATTERN_REGISTRY[key] = pset
+        if len(_PATTERN_REGISTRY) > _REGISTRY_SIZE:
+            _PATTERN_REGISTRY.popitem(last=False)
+    else:
+        _PATTERN_REGISTRY.move_to_end(key)
+    return pset
+
+
+def scan_response(text: str, patterns: PatternSet) -> MatchTable:
+    """Scan a response with a pattern set, reusing the table of a recent identical scan."""
+    key = (id(patterns), text)
+    table = _TABLE_CACHE.get(key)
+    if table is None or table.patterns is not patterns:
+        table = patterns.scan(text)
+        _TABLE_CACHE[key] = table
+        if len(_TABLE_CACHE) > _TABLE_CACHE_SIZE:
+            _TABLE_CACHE.popitem(last=False)
+    else:
+        _TABLE_CACHE.move_to_end(key)
+    return table
+
+
+def _compiled(pattern: str, flags: int = 0) -> "re.Pattern":
+    """A single regex compiled once through the registry."""
+    return compile_patterns(patterns={pattern: pattern}, flags=flags).patterns[pattern]
+
+
+def match_table(text: str, tokens: Sequence[str] = (),
+                patterns: Optional[Dict[str, Union[str, "re.Pattern"]]] = None,
+                flags: int = 0) -> MatchTable:
+    """Shortcut: ``scan_response(text, compile_patterns(tokens, patterns, flags))``."""
+    return scan_response(text, compile_patterns(tokens, patterns, flags))
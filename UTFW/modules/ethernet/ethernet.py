@@ -337,6 +337,12 @@ def _ping_once(host: str, timeout_s: float = 1.0) -> bool:
         return False
 
 
+def _invalidate_eeprom_images(reason: str) -> None:
+    """Mark every session EEPROM image as stale after a write over HTTP."""
+    from ..serial.eeprom_dump import invalidate_eeprom_cache
+    invalidate_eeprom_cache(None, reason)
+
+
 def _http_request(
     method: str,
     url: str,
@@ -383,6 +389,10 @@ def _http_request(
             f"[HTTP {method}] {url} timeout={timeout}s headers={h_preview or 'none'} data_len={len(data_bytes or b'')}"
         )
 
+    if method.upper() not in ("GET", "HEAD", "OPTIONS"):
+        # Writes over the web interface change configuration behind the UART's back
+        _invalidate_eeprom_images(f"HTTP {method.upper()} {url}")
+
     attempts = 3
     last_err = None
 
@@ -7,17 +7,25 @@ UTFW PU2CANFD Adapter Module
 CAN / CAN FD test module for the Pibiger USB TO CAN FD adapter
 (PU2CANFD / SavvyCAN-FD series).
 
-This package exposes two protocol sub-modules accessible as:
+This package exposes protocol sub-modules accessible as:
     PU2CANFD.can.send(...)              # Raw CAN frame operations
     PU2CANFD.can.receive(...)
     PU2CANFD.can.loopback(...)
     PU2CANFD.canopen.sdo_read(...)      # CANopen protocol layer
     PU2CANFD.canopen.nmt_start(...)
     PU2CANFD.canopen.heartbeat(...)
+    PU2CANFD.capture.CANCapture.load(...)  # Columnar capture store / logs
+    PU2CANFD.dispatcher.get_dispatcher(bus)  # Background RX queues per COB-ID
+    PU2CANFD.od.load_od("device.eds")       # EDS/DCF object dictionary
+    PU2CANFD.periodic.PeriodicScheduler(bus)  # Cyclic transmit scheduler
 
 Sub-modules:
 - can:     Raw CAN / CAN FD frame send, receive, loopback, bus scan
 - canopen: CANopen NMT, SDO, PDO, heartbeat, and eWald board helpers
+- capture: Columnar CAN capture store, statistics, log export and replay
+- dispatcher: Background receive thread with per-ID queues and history
+- od:      EDS/DCF object dictionary with typed, range-checked codecs
+- periodic: Cyclic transmit scheduler with jitter statistics
 
 Shared utilities (interface discovery, hex formatting) are available
 from the package level:
@@ -70,6 +78,10 @@ __all__ = [
     # Sub-modules (lazy loaded)
     "can",
     "canopen",
+    "capture",
+    "dispatcher",
+    "od",
+    "periodic",
 
     # Base exception
     "PU2CANFDError",
@@ -110,6 +122,6 @@ __all__ = [
 
 def __getattr__(name):  # pragma: no cover - simple delegation
     """Lazy-load protocol sub-modules on first access."""
-    if name in ("can", "canopen"):
+    if name in ("can", "canopen", "capture", "dispatcher", "od", "periodic"):
         return importlib.import_module(f"{__name__}.{name}")
     raise AttributeError(f"module {__name__} has no attribute {name}")
@@ -17,9 +17,12 @@ The module includes TestAction factories for common CAN operations:
 - send: Transmit a CAN frame
 - receive: Wait for and capture a CAN frame
 - send_receive: Send a frame and wait for a response
-- send_periodic: Transmit frames at a fixed interval
+- send_periodic: Transmit frames at a fixed interval for a duration
+- start_periodic / stop_periodic: Background cyclic traffic across steps
 - bus_scan: Listen on the bus and report all traffic
+- replay: Re-transmit a recorded candump/ASC/BLF log
 - loopback: Validate CAN loopback (TX → RX on two channels)
+- release_bus: Close framework-shared buses before the test ends
 
 Usage:
     import UTFW
@@ -39,10 +42,10 @@ Author: DvidMakesThings
 
 import time
 import threading
-from typing import Optional, Dict, List, Any, Union
+from typing import Optional, Dict, List, Any, Tuple, Union
 
 from ....core.logger import get_active_logger
-from ....core.core import TestAction
+from ....core.core import TestAction, get_active_framework
 from ._base import (
     PU2CANFDError,
     _format_hex_dump,
@@ -62,6 +65,9 @@ from ._base import (
     DEFAULT_SEND_TIMEOUT,
     DEFAULT_RECV_TIMEOUT,
 )
+from .capture import CANCapture, PU2CANFDCaptureError
+from .dispatcher import get_dispatcher, detach_dispatcher
+from .periodic import PeriodicScheduler, PU2CANFDPeriodicError, counter_mutator
 
 
 class PU2CANFDCANError(PU2CANFDError):
@@ -194,6 +200,7 @@ def close_bus(bus) -> None:
     logger = get_active_logger()
 
     try:
+        detach_dispatcher(bus)
         bus.shutdown()
         if logger:
             logger.info("[PU2CANFD] Bus closed")
@@ -271,7 +278,8 @@ def send_frame(bus, arb_id: int, data: Union[bytes, List[int]],
 
 
 def receive_frame(bus, timeout: float = DEFAULT_RECV_TIMEOUT,
-                  filter_id: Optional[int] = None) -> Optional[Any]:
+                  filter_id: Optional[int] = None,
+                  since: Optional[float] = None) -> Optional[Any]:
     """Receive a single CAN frame from the bus.
 
     Blocks until a frame is received or the timeout expires. Optionally
@@ -282,6 +290,10 @@ def receive_frame(bus, timeout: float = DEFAULT_RECV_TIMEOUT,
         timeout (float, optional): Receive timeout in seconds. Defaults to 5.0.
         filter_id (int, optional): If set, only accept frames with this
             arbitration ID (masked to 11 or 29 bits). Defaults to None.
+        since (float, optional): With a background dispatcher, only accept
+            frames that arrived at or after this ``time.monotonic()`` value.
+            Defaults to the time of the call, so frames queued earlier are
+            never returned as a fresh reply.
 
     Returns:
         can.Message or None: Received message, or None if timeout.
@@ -301,7 +313,10 @@ def receive_frame(bus, timeout: float = DEFAULT_RECV_TIMEOUT,
             logger.info(f"  Filter ID: 0x{filter_id:03X}")
         logger.info("")
 
+    if since is None:
+        since = time.monotonic()
     start = time.time()
+    dispatcher = get_dispatcher(bus, create=False)
 
     try:
         while True:
@@ -311,7 +326,11 @@ def receive_frame(bus, timeout: float = DEFAULT_RECV_TIMEOUT,
                     logger.info(f"  [RX TIMEOUT] No frame received within {timeout:.1f}s")
                 return None
 
-            msg = bus.recv(timeout=remaining)
+            if dispatcher is not None:
+                # Background reader owns the bus: take from the ID queue
+                msg = dispatcher.wait_for(filter_id, timeout=remaining, since=since)
+            else:
+                msg = bus.recv(timeout=remaining)
 
             if msg is None:
                 if logger:
@@ -384,24 +403,41 @@ def send_and_receive(bus, arb_id: int, data: Union[bytes, List[int]],
         logger.info("=" * 80)
         logger.info("")
 
+    # Drop responses that were queued before this request was sent
+    dispatcher = get_dispatcher(bus, create=False)
+    if dispatcher is not None:
+        dispatcher.clear(response_id)
+
+    sent_at = time.monotonic()
     send_frame(bus, arb_id, data, is_extended=is_extended, is_fd=is_fd,
                bitrate_switch=bitrate_switch)
 
-    return receive_frame(bus, timeout=timeout, filter_id=response_id)
+    return receive_frame(bus, timeout=timeout, filter_id=response_id, since=sent_at)
 
 
-def bus_scan(bus, duration: float = 5.0) -> List[Any]:
+def bus_scan(bus, duration: float = 5.0,
+             bitrate: Optional[int] = None,
+             dbitrate: Optional[int] = None,
+             capture: Optional[CANCapture] = None) -> CANCapture:
     """Listen on the CAN bus and collect all traffic.
 
     Passively captures all CAN frames for the specified duration.
-    Useful for bus diagnostics and device discovery.
+    Useful for bus diagnostics and device discovery. Frames are stored
+    column-wise in a :class:`CANCapture` rather than as a list of
+    ``can.Message`` objects, so long scans stay compact and the per-ID
+    summary is computed in a single pass.
 
     Args:
         bus: python-can Bus instance.
         duration (float, optional): Capture duration in seconds. Defaults to 5.0.
+        bitrate (int, optional): Nominal bitrate, used to estimate bus load.
+        dbitrate (int, optional): CAN FD data bitrate, used for BRS frames.
+        capture (CANCapture, optional): Existing capture to append to.
 
     Returns:
-        List[can.Message]: All captured CAN messages.
+        CANCapture: All captured CAN frames. Supports ``len()``, indexing
+        and iteration (yielding ``can.Message`` objects) like the list
+        returned previously.
     """
     logger = get_active_logger()
 
@@ -413,27 +449,38 @@ def bus_scan(bus, duration: float = 5.0) -> List[Any]:
         logger.info(f"  Duration: {duration:.1f}s")
         logger.info("")
 
-    messages = []
+    if capture is None:
+        capture = CANCapture(channel=str(getattr(bus, "channel", None) or "can0"))
+    append = capture.append
     start = time.time()
+    deadline = start + duration
+    dispatcher = get_dispatcher(bus, create=False)
 
-    while (time.time() - start) < duration:
-        remaining = duration - (time.time() - start)
-        msg = bus.recv(timeout=min(remaining, 0.5))
-        if msg is not None:
-            messages.append(msg)
+    if dispatcher is not None:
+        # Observe the dispatcher's traffic without consuming queued frames
+        dispatcher.add_tap(append)
+        try:
+            time.sleep(duration)
+        finally:
+            dispatcher.remove_tap(append)
+    else:
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            msg = bus.recv(timeout=min(remaining, 0.5))
+            if msg is not None:
+                append(msg)
 
     # Log summary
     if logger:
-        unique_ids = set(m.arbitration_id for m in messages)
-        logger.info(f"  Total frames captured: {len(messages)}")
-        logger.info(f"  Unique IDs:            {len(unique_ids)}")
-        for uid in sorted(unique_ids):
-            count = sum(1 for m in messages if m.arbitration_id == uid)
-            logger.info(f"    0x{uid:03X}: {count} frames")
+        capture.log_summary(
+            capture.stats(bitrate=bitrate, dbitrate=dbitrate, window_s=duration)
+        )
         logger.info("=" * 80)
         logger.info("")
 
-    return messages
+    return capture
 
 
 def set_filters(bus, filters: List[Dict[str, int]]) -> None:
@@ -467,10 +514,131 @@ def set_filters(bus, filters: List[Dict[str, int]]) -> None:
 
 # ======================== Bus Context Manager ========================
 
+_BUS_RESOURCE_PREFIX = "can-bus:"
+_BUS_LOCK = threading.Lock()
+_BUS_CONFIGS: Dict[str, Tuple[int, bool, Optional[int]]] = {}
+
+
+def _bus_key(channel: str, bustype: Optional[str]) -> str:
+    """Build the framework resource key for a shared bus."""
+    if bustype is None:
+        bustype = _get_default_bustype()
+    return f"{_BUS_RESOURCE_PREFIX}{channel}|{bustype}"
+
+
+def _bus_config(bitrate: int, dbitrate: Optional[int], fd: bool) -> Tuple[int, bool, Optional[int]]:
+    """Timing configuration a shared bus was opened with."""
+    return (bitrate, fd, dbitrate if fd else None)
+
+
+def _describe_config(config: Tuple[int, bool, Optional[int]]) -> str:
+    bitrate, fd, dbitrate = config
+    text = f"{bitrate} bit/s {'FD' if fd else 'classic'}"
+    if fd and dbitrate is not None:
+        text += f", data {dbitrate} bit/s"
+    return text
+
+
+def acquire_bus(channel: str, bustype: Optional[str] = None,
+                bitrate: int = CAN_BITRATE_500K,
+                dbitrate: Optional[int] = None,
+                fd: bool = False, **kwargs) -> Any:
+    """Borrow a framework-scoped CAN bus, opening it on first use.
+
+    Buses are cached in the active TestFramework's resource registry keyed
+    by (channel, bustype) and shut down when the test finishes. Every user
+    of a channel must ask for the same bitrate/FD configuration: a request
+    with a different one raises instead of silently reopening the bus,
+    since the devices on the wire cannot follow a mid-test bitrate change.
+    Release the bus first (see :func:`release_bus`) to reconfigure it.
+
+    A background dispatcher is attached to the shared bus, so frames that
+    arrived while no step was listening are not returned as fresh replies.
+
+    Without an active framework this behaves like :func:`open_bus` and the
+    caller owns the returned bus.
+
+    Args:
+        channel (str): CAN interface name.
+        bustype (str, optional): python-can bus type. Auto-detected if None.
+        bitrate (int, optional): Nominal bitrate. Defaults to 500000.
+        dbitrate (int, optional): CAN FD data bitrate.
+        fd (bool, optional): CAN FD mode. Defaults to False.
+        **kwargs: Additional keyword arguments passed to python-can Bus().
+
+    Returns:
+        can.Bus: Shared (or newly opened) bus instance.
+
+    Raises:
+        PU2CANFDCANError: If the bus cannot be opened, or the channel is
+            already shared with a different bitrate/FD configuration.
+        PU2CANFDDispatcherError: If the receive dispatcher cannot be started.
+    """
+    fw = get_active_framework()
+    if fw is None:
+        return open_bus(channel, bustype, bitrate, dbitrate, fd, **kwargs)
+
+    key = _bus_key(channel, bustype)
+    config = _bus_config(bitrate, dbitrate, fd)
+    with _BUS_LOCK:
+        bus = fw.get_resource(key)
+        if bus is not None:
+            current = _BUS_CONFIGS.get(key)
+            if current is not None and current != config:
+                raise PU2CANFDCANError(
+                    f"CAN channel {channel} is already open at {_describe_config(current)}; "
+                    f"requested {_describe_config(config)}. Use the same bitrate for every "
+                    f"action on this channel or release the bus first."
+                )
+            return bus
+        bus = open_bus(channel, bustype, bitrate, dbitrate, fd, **kwargs)
+        # A shared bus keeps receiving between steps; reading it through the
+        # dispatcher lets receive_frame skip frames queued before its call.
+        try:
+            get_dispatcher(bus)
+        except Exception:
+            close_bus(bus)
+            raise
+        _BUS_CONFIGS[key] = config
+
+        def _close(shared_bus, _key=key):
+            _BUS_CONFIGS.pop(_key, None)
+            close_bus(shared_bus)
+
+        return fw.register_resource(key, bus, _close)
+
+
+def release_buses(channel: Optional[str] = None) -> int:
+    """Close shared buses held by the active framework.
+
+    Args:
+        channel (str, optional): Only release buses on this channel.
+            Defaults to all shared buses.
+
+    Returns:
+        int: Number of buses released.
+    """
+    fw = get_active_framework()
+    if fw is None:
+        return 0
+    with _BUS_LOCK:
+        prefix = _BUS_RESOURCE_PREFIX
+        if channel is not None:
+            prefix += f"{channel}|"
+        keys = fw.resource_keys(prefix)
+        for key in keys:
+            fw.release_resource(key)
+    return len(keys)
+
+
 class CANBus:
     """RAII context manager for CAN bus connections.
 
-    Opens the bus on entry and ensures clean shutdown on exit.
+    Inside a running TestFramework the bus is borrowed from the
+    framework-scoped registry (see :func:`acquire_bus`) and stays open
+    across steps; exiting the block does not close it. Outside a framework,
+    or with ``shared=False``, the bus is opened on entry and shut down on
+    exit.
 
     Usage:
         with CANBus("can0", bitrate=500000) as bus:
@@ -481,26 +649,72 @@ class CANBus:
     def __init__(self, channel: str, bustype: Optional[str] = None,
                  bitrate: int = CAN_BITRATE_500K,
                  dbitrate: Optional[int] = None,
-                 fd: bool = False, **kwargs):
+                 fd: bool = False, shared: bool = True, **kwargs):
         self.channel = channel
         self.bustype = bustype
         self.bitrate = bitrate
         self.dbitrate = dbitrate
         self.fd = fd
+        self.shared = shared
         self.kwargs = kwargs
         self._bus = None
+        self._owned = False
 
     def __enter__(self):
-        self._bus = open_bus(
-            self.channel, self.bustype, self.bitrate,
-            self.dbitrate, self.fd, **self.kwargs
-        )
+        if self.shared and get_active_framework() is not None:
+            self._bus = acquire_bus(
+                self.channel, self.bustype, self.bitrate,
+                self.dbitrate, self.fd, **self.kwargs
+            )
+            self._owned = False
+        else:
+            self._bus = open_bus(
+                self.channel, self.bustype, self.bitrate,
+                self.dbitrate, self.fd, **self.kwargs
+            )
+            self._owned = True
         return self._bus
 
     def __exit__(self, *_exc):
-        if self._bus is not None:
+        if self._bus is not None and self._owned:
             close_bus(self._bus)
-            self._bus = None
+        self._bus = None
+
+
+def release_bus(name: str, channel: Optional[str] = None,
+                negative_test: bool = False) -> TestAction:
+    """Create a TestAction that closes shared CAN buses before test end.
+
+    Useful before steps that reconfigure the interface (e.g. ``ip link``
+    bitrate changes) or that hand the adapter to an external tool.
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str, optional): Only release buses on this channel.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Configured test action.
+    """
+
+    def execute():
+        count = release_buses(channel)
+        logger = get_active_logger()
+        if logger:
+            logger.info(f"[PU2CANFD] Released {count} shared bus(es)")
+        return count
+
+    metadata = {
+        'display_command': f"Release CAN bus {channel or '(all)'}",
+        'display_expected': "Bus closed",
+    }
+
+    return TestAction(
+        name=name,
+        execute_func=execute,
+        negative_test=negative_test,
+        metadata=metadata,
+    )
 
 
 # ======================== Linux Interface Setup ========================
@@ -822,12 +1036,15 @@ def loopback(name: str, tx_channel: str, rx_channel: str,
             logger.info(f"  Data:       {' '.join(f'{b:02X}' for b in data_bytes)}")
             logger.info("")
 
-        tx_bus = open_bus(tx_channel, bustype, bitrate, dbitrate, is_fd)
-        rx_bus = open_bus(rx_channel, bustype, bitrate, dbitrate, is_fd)
-
-        try:
+        # Both ends come from the shared registry so loopback cannot reopen a
+        # channel another action holds at a different bitrate. A single
+        # channel looping back to itself still needs a second socket.
+        with CANBus(tx_channel, bustype, bitrate, dbitrate, is_fd) as tx_bus, \
+                CANBus(rx_channel, bustype, bitrate, dbitrate, is_fd,
+                       shared=rx_channel != tx_channel) as rx_bus:
+            sent_at = time.monotonic()
             send_frame(tx_bus, arb_id, data_bytes, is_fd=is_fd)
-            msg = receive_frame(rx_bus, timeout=timeout, filter_id=arb_id)
+            msg = receive_frame(rx_bus, timeout=timeout, filter_id=arb_id, since=sent_at)
 
             if msg is None:
                 raise PU2CANFDCANError(
@@ -850,9 +1067,6 @@ def loopback(name: str, tx_channel: str, rx_channel: str,
 
             return rx_data
 
-        finally:
-            close_bus(tx_bus)
-            close_bus(rx_bus)
 
     id_str = _format_can_id(arb_id, False)
     data_str = ' '.join(f'{b:02X}' for b in data_bytes)
@@ -877,11 +1091,13 @@ def scan(name: str, channel: str,
          duration: float = 5.0,
          is_fd: bool = False,
          dbitrate: Optional[int] = None,
+         save_path: Optional[str] = None,
          negative_test: bool = False) -> TestAction:
     """Create a TestAction that scans the CAN bus for traffic.
 
     Listens passively for the specified duration and returns a summary
-    of all captured traffic.
+    of all captured traffic, including per-ID period/jitter and an
+    estimated bus load.
 
     Args:
         name (str): Human-readable action name.
@@ -891,6 +1107,8 @@ def scan(name: str, channel: str,
         duration (float, optional): Scan duration. Defaults to 5.0.
         is_fd (bool, optional): CAN FD mode. Defaults to False.
         dbitrate (int, optional): CAN FD data bitrate.
+        save_path (str, optional): Export the capture to this log file
+            (``.log`` candump, ``.asc``, ``.blf``, ...).
         negative_test (bool, optional): Expect failure. Defaults to False.
 
     Returns:
@@ -899,19 +1117,26 @@ def scan(name: str, channel: str,
 
     def execute():
         with CANBus(channel, bustype, bitrate, dbitrate, is_fd) as bus:
-            messages = bus_scan(bus, duration=duration)
-            if not messages:
-                raise PU2CANFDCANError(
-                    f"No CAN traffic detected on {channel} in {duration:.1f}s"
-                )
+            capture = bus_scan(bus, duration=duration, bitrate=bitrate,
+                               dbitrate=dbitrate)
+        if save_path:
+            capture.save(save_path)
+        if not capture:
+            raise PU2CANFDCANError(
+                f"No CAN traffic detected on {channel} in {duration:.1f}s"
+            )
 
-            unique_ids = set(m.arbitration_id for m in messages)
-            return {
-                "total_frames": len(messages),
-                "unique_ids": sorted(unique_ids),
-                "duration": duration,
-                "frames_per_second": len(messages) / duration if duration > 0 else 0,
-            }
+        stats = capture.stats(bitrate=bitrate, dbitrate=dbitrate, window_s=duration)
+        return {
+            "total_frames": stats["total_frames"],
+            "unique_ids": stats["unique_ids"],
+            "duration": duration,
+            "frames_per_second": stats["frames_per_second"],
+            "bus_load": stats["bus_load"],
+            "error_frames": stats["error_frames"],
+            "per_id": stats["per_id"],
+            "save_path": save_path,
+        }
 
     metadata = {
         'display_command': f"CAN scan {channel} ({duration:.1f}s)",
@@ -926,6 +1151,397 @@ def scan(name: str, channel: str,
     )
 
 
+def replay(name: str, channel: str, log_path: str,
+           bitrate: int = CAN_BITRATE_500K,
+           bustype: Optional[str] = None,
+           speed: float = 1.0,
+           id_filter: Optional[List[int]] = None,
+           is_fd: bool = False,
+           dbitrate: Optional[int] = None,
+           negative_test: bool = False) -> TestAction:
+    """Create a TestAction that replays a recorded CAN log onto a bus.
+
+    The log is loaded into a :class:`CANCapture` (candump ``.log``,
+    ``.asc``, ``.blf``, ...) and re-transmitted with its original
+    relative timing scaled by ``speed``.
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str): CAN interface to transmit on.
+        log_path (str): Recorded log file.
+        bitrate (int, optional): Nominal bitrate. Defaults to 500000.
+        bustype (str, optional): Bus type. Auto-detected if None.
+        speed (float, optional): Playback speed factor, 0 for
+            back-to-back. Defaults to 1.0.
+        id_filter (List[int], optional): Only replay these IDs.
+        is_fd (bool, optional): CAN FD mode. Defaults to False.
+        dbitrate (int, optional): CAN FD data bitrate.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Configured test action for CAN log replay.
+    """
+
+    def execute():
+        logger = get_active_logger()
+        try:
+            capture = CANCapture.load(log_path)
+        except PU2CANFDCaptureError as e:
+            raise PU2CANFDCANError(str(e))
+
+        if logger:
+            logger.info("")
+            logger.info("=" * 80)
+            logger.info("[PU2CANFD] REPLAY")
+            logger.info("=" * 80)
+            logger.info(f"  Log:      {log_path}")
+            logger.info(f"  Frames:   {len(capture)}")
+            logger.info(f"  Duration: {capture.duration:.3f}s (speed x{speed})")
+
+        with CANBus(channel, bustype, bitrate, dbitrate, is_fd) as bus:
+            try:
+                sent = capture.replay(bus, speed=speed, id_filter=id_filter)
+            except PU2CANFDCaptureError as e:
+                raise PU2CANFDCANError(str(e))
+
+        if logger:
+            logger.info(f"  Sent:     {sent} frames")
+            logger.info("=" * 80)
+            logger.info("")
+
+        return {"frames_sent": sent, "log_path": log_path}
+
+    metadata = {
+        'display_command': f"CAN replay {log_path} → {channel}",
+        'display_expected': "Log replayed",
+    }
+
+    return TestAction(
+        name=name,
+        execute_func=execute,
+        negative_test=negative_test,
+        metadata=metadata,
+    )
+
+
+# ======================== Periodic Transmit ========================
+
+_PERIODIC_RESOURCE_PREFIX = "can-periodic:"
+_PERIODIC_SESSIONS: Dict[str, Dict[str, Any]] = {}
+
+
+def _add_periodic_messages(sched: PeriodicScheduler,
+                           messages: List[Dict[str, Any]]) -> None:
+    """Add message specs (``arb_id``, ``data``, ``period_ms``, ...) to a scheduler."""
+    for spec in messages:
+        try:
+            arb_id = spec["arb_id"]
+            period_ms = spec["period_ms"]
+        except KeyError as e:
+            raise PU2CANFDCANError(f"Periodic message spec is missing {e}: {spec}")
+        mutate = spec.get("mutate")
+        if mutate is None and spec.get("counter_byte") is not None:
+            mutate = counter_mutator(spec["counter_byte"],
+                                     spec.get("counter_modulo", 256),
+                                     spec.get("counter_mask", 0xFF))
+        sched.add(arb_id, spec.get("data", b""), period_ms / 1000.0,
+                  is_extended=spec.get("is_extended", False),
+                  is_fd=spec.get("is_fd", False),
+                  bitrate_switch=spec.get("bitrate_switch", False),
+                  count=spec.get("count"),
+                  mutate=mutate)
+
+
+def _check_periodic_stats(stats: Dict[int, Dict[str, Any]],
+                          max_jitter_ms: Optional[float],
+                          min_sent: Optional[int]) -> None:
+    """Raise if any message exceeded the jitter limit or sent too few frames.
+
+    Messages on the native backend have no measured statistics, so any
+    requested check fails for them as unmeasured rather than passing.
+    """
+    failures = []
+    checked = max_jitter_ms is not None or min_sent is not None
+    for st in stats.values():
+        id_str = f"0x{st['arb_id']:03X}"
+        if st["errors"]:
+            failures.append(f"{id_str}: {st['errors']} send error(s)")
+        if checked and not st["measured"]:
+            failures.append(f"{id_str}: unmeasured ({st['backend']} backend keeps no "
+                            f"per-frame statistics; use mode='software')")
+            continue
+        if min_sent is not None and st["sent"] < min_sent:
+            failures.append(f"{id_str}: sent {st['sent']} < {min_sent}")
+        if (max_jitter_ms is not None and st["jitter_s"] is not None
+                and st["jitter_s"] * 1000.0 > max_jitter_ms):
+            failures.append(
+                f"{id_str}: jitter {st['jitter_s'] * 1000.0:.3f} ms > {max_jitter_ms} ms"
+            )
+    if failures:
+        raise PU2CANFDCANError("Periodic transmit check failed:\n  " + "\n  ".join(failures))
+
+
+def _log_periodic_header(title: str, channel: str, sched: PeriodicScheduler) -> None:
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info(f"[PU2CANFD] {title}")
+        logger.info("=" * 80)
+        logger.info(f"  Channel:  {channel}")
+        logger.info(f"  Messages: {len(sched.stats())}")
+        logger.info(f"  Est. load: {sched.bus_load() * 100:.1f}%")
+
+
+def send_periodic(name: str, channel: str,
+                  messages: List[Dict[str, Any]],
+                  duration: float = 1.0,
+                  bitrate: int = CAN_BITRATE_500K,
+                  bustype: Optional[str] = None,
+                  is_fd: bool = False,
+                  dbitrate: Optional[int] = None,
+                  mode: str = "auto",
+                  load_percent: Optional[float] = None,
+                  max_jitter_ms: Optional[float] = None,
+                  min_sent: Optional[int] = None,
+                  negative_test: bool = False) -> TestAction:
+    """Create a TestAction that transmits cyclic frames for a fixed duration.
+
+    Each entry of ``messages`` is a dict with ``arb_id``, ``data`` and
+    ``period_ms`` plus optional ``is_extended``, ``is_fd``,
+    ``bitrate_switch``, ``count``, ``counter_byte`` (rolling counter byte,
+    with ``counter_modulo``/``counter_mask``) or ``mutate``
+    (``f(cycle, bytearray)``).
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str): CAN interface.
+        messages (List[Dict]): Cyclic message specs.
+        duration (float, optional): Transmit time in seconds. Defaults to 1.0.
+        bitrate (int, optional): Nominal bitrate. Defaults to 500000.
+        bustype (str, optional): Bus type. Auto-detected if None.
+        is_fd (bool, optional): CAN FD mode. Defaults to False.
+        dbitrate (int, optional): CAN FD data bitrate.
+        mode (str, optional): Scheduler backend ("auto", "native",
+            "software"). Defaults to "auto", which uses the software
+            scheduler whenever ``max_jitter_ms`` or ``min_sent`` is given.
+        load_percent (float, optional): Add a low-priority 0x7FF filler
+            so the estimated bus load reaches this percentage.
+        max_jitter_ms (float, optional): Fail if any message's period
+            jitter (std-dev) exceeds this.
+        min_sent (int, optional): Fail if any message sent fewer frames.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Configured test action for cyclic transmit.
+    """
+
+    checked = max_jitter_ms is not None or min_sent is not None
+    backend = "software" if checked and mode == "auto" else mode
+
+    def execute():
+        logger = get_active_logger()
+        with CANBus(channel, bustype, bitrate, dbitrate, is_fd) as bus:
+            try:
+                sched = PeriodicScheduler(bus, mode=backend, bitrate=bitrate, dbitrate=dbitrate)
+                _add_periodic_messages(sched, messages)
+                if load_percent is not None:
+                    sched.add_load(load_percent / 100.0)
+            except PU2CANFDPeriodicError as e:
+                raise PU2CANFDCANError(str(e))
+            _log_periodic_header("SEND PERIODIC", channel, sched)
+            bus_load = sched.bus_load()
+            try:
+                sched.start()
+                time.sleep(duration)
+            finally:
+                stats = sched.stop()
+        if logger:
+            sched.log_summary()
+            logger.info("=" * 80)
+            logger.info("")
+        _check_periodic_stats(stats, max_jitter_ms, min_sent)
+        return {"duration": duration, "bus_load": bus_load,
+                "messages": list(stats.values())}
+
+    metadata = {
+        'display_command': f"CAN periodic TX {len(messages)} msg(s) on {channel} ({duration:.1f}s)",
+        'display_expected': "Frames sent" if max_jitter_ms is None
+        else f"Jitter <= {max_jitter_ms} ms",
+    }
+
+    return TestAction(
+        name=name,
+        execute_func=execute,
+        negative_test=negative_test,
+        metadata=metadata,
+    )
+
+
+def start_periodic(name: str, channel: str,
+                   messages: List[Dict[str, Any]],
+                   session: str = "default",
+                   bitrate: int = CAN_BITRATE_500K,
+                   bustype: Optional[str] = None,
+                   is_fd: bool = False,
+                   dbitrate: Optional[int] = None,
+                   mode: str = "auto",
+                   load_percent: Optional[float] = None,
+                   negative_test: bool = False) -> TestAction:
+    """Create a TestAction that starts cyclic frames in the background.
+
+    Traffic keeps running across the following steps (e.g. SYNC or
+    cyclic PDOs while other steps exercise the device) until
+    :func:`stop_periodic` is called with the same ``session``, or the
+    test finishes. Message specs are the same as for :func:`send_periodic`.
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str): CAN interface.
+        messages (List[Dict]): Cyclic message specs.
+        session (str, optional): Session name used by stop_periodic.
+            Defaults to "default".
+        bitrate (int, optional): Nominal bitrate. Defaults to 500000.
+        bustype (str, optional): Bus type. Auto-detected if None.
+        is_fd (bool, optional): CAN FD mode. Defaults to False.
+        dbitrate (int, optional): CAN FD data bitrate.
+        mode (str, optional): Scheduler backend. Defaults to "auto".
+        load_percent (float, optional): Filler traffic up to this load.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Configured test action for starting cyclic transmit.
+    """
+
+    def execute():
+        if session in _PERIODIC_SESSIONS:
+            raise PU2CANFDCANError(f"Periodic session '{session}' is already running")
+
+        fw = get_active_framework()
+        bus = acquire_bus(channel, bustype, bitrate, dbitrate, is_fd)
+        try:
+            sched = PeriodicScheduler(bus, mode=mode, bitrate=bitrate, dbitrate=dbitrate)
+            _add_periodic_messages(sched, messages)
+            if load_percent is not None:
+                sched.add_load(load_percent / 100.0)
+            sched.start()
+        except Exception as e:
+            if fw is None:
+                close_bus(bus)
+            if isinstance(e, PU2CANFDPeriodicError):
+                raise PU2CANFDCANError(str(e))
+            raise
+
+        _PERIODIC_SESSIONS[session] = {
+            "scheduler": sched,
+            "bus": bus,
+            "owned": fw is None,
+            "channel": channel,
+        }
+        if fw is not None:
+            fw.register_resource(f"{_PERIODIC_RESOURCE_PREFIX}{session}", sched,
+                                 lambda _s: _end_periodic_session(session))
+
+        _log_periodic_header(f"START PERIODIC '{session}'", channel, sched)
+        logger = get_active_logger()
+        if logger:
+            logger.info("=" * 80)
+            logger.info("")
+        return {"session": session, "messages": len(sched.stats()),
+                "bus_load": sched.bus_load()}
+
+    metadata = {
+        'display_command': f"CAN periodic start '{session}' on {channel}",
+        'display_expected': "Cyclic transmit running",
+    }
+
+    return TestAction(
+        name=name,
+        execute_func=execute,
+        negative_test=negative_test,
+        metadata=metadata,
+    )
+
+
+def _end_periodic_session(session: str) -> Optional[Dict[int, Dict[str, Any]]]:
+    """Stop a periodic session, close its bus if owned and return its stats."""
+    entry = _PERIODIC_SESSIONS.pop(session, None)
+    if entry is None:
+        return None
+    stats = entry["scheduler"].stop()
+    if entry["owned"]:
+        close_bus(entry["bus"])
+    return stats
+
+
+def stop_periodic(name: str, session: str = "default",
+                  max_jitter_ms: Optional[float] = None,
+                  min_sent: Optional[int] = None,
+                  negative_test: bool = False) -> TestAction:
+    """Create a TestAction that stops a background periodic session.
+
+    Returns per-message statistics (frames sent, mean period, jitter,
+    maximum lateness, overruns) and optionally validates them.
+
+    Args:
+        name (str): Human-readable action name.
+        session (str, optional): Session started by start_periodic.
+            Defaults to "default".
+        max_jitter_ms (float, optional): Fail if any message's period
+            jitter (std-dev) exceeds this. Messages sent by the native
+            backend cannot be checked and fail as unmeasured; start the
+            session with ``mode="software"`` to validate them.
+        min_sent (int, optional): Fail if any message sent fewer frames.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Configured test action for stopping cyclic transmit.
+    """
+
+    def execute():
+        entry = _PERIODIC_SESSIONS.get(session)
+        if entry is None:
+            raise PU2CANFDCANError(f"No periodic session '{session}' is running")
+        sched = entry["scheduler"]
+
+        fw = get_active_framework()
+        if fw is not None:
+            fw.release_resource(f"{_PERIODIC_RESOURCE_PREFIX}{session}")
+        _end_periodic_session(session)
+        stats = sched.stats()
+
+        logger = get_active_logger()
+        if logger:
+            logger.info("")
+            logger.info("=" * 80)
+            logger.info(f"[PU2CANFD] STOP PERIODIC '{session}'")
+            logger.info("=" * 80)
+            sched.log_summary()
+            logger.info("=" * 80)
+            logger.info("")
+
+        _check_periodic_stats(stats, max_jitter_ms, min_sent)
+        return {"session": session, "messages": list(stats.values())}
+
+    expected = []
+    if max_jitter_ms is not None:
+        expected.append(f"jitter <= {max_jitter_ms} ms")
+    if min_sent is not None:
+        expected.append(f"sent >= {min_sent}")
+
+    metadata = {
+        'display_command': f"CAN periodic stop '{session}'",
+        'display_expected': ', '.join(expected) if expected else "Stopped",
+    }
+
+    return TestAction(
+        name=name,
+        execute_func=execute,
+        negative_test=negative_test,
+        metadata=metadata,
+    )
+
+
 def validate_last_frame(name: str, expected_id: Optional[int] = None,
                         expected_data: Optional[Union[bytes, List[int]]] = None,
                         negative_test: bool = False) -> TestAction:
@@ -13,6 +13,10 @@ using standard protocol operations.
 Supported CANopen Services:
 - NMT (Network Management): Start, Stop, Pre-Operational, Reset
 - SDO (Service Data Object): Read/write object dictionary entries
+  (expedited, segmented and block transfers, pipelined bulk reads
+  across nodes, object dictionary dump)
+- Object dictionary: read/write parameters by EDS/DCF name with
+  automatic typing and range checks (see od.py)
 - PDO (Process Data Object): Receive and parse process data
 - Heartbeat: Monitor node health
 - SYNC: Trigger synchronous PDO exchange
@@ -44,12 +48,16 @@ Usage:
 Author: DvidMakesThings
 """
 
+import binascii
+import json
 import struct
 import time
-from typing import Optional, Dict, List, Any, Union
+from collections import deque
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Union, Iterable, Tuple
 
 from ....core.logger import get_active_logger
-from ....core.core import TestAction
+from ....core.core import TestAction, get_active_framework
 from ._base import (
     PU2CANFDError,
     _format_hex_dump,
@@ -63,7 +71,10 @@ from .can import (
     CANBus,
     send_frame,
     receive_frame,
+    _set_last_message,
 )
+from .dispatcher import get_dispatcher
+from .od import ObjectDictionary, ODKey, PU2CANFDODError, resolve_od
 
 
 # ======================== CANopen Constants ========================
@@ -100,20 +111,35 @@ CANOPEN_SDO_RX = 0x600       # SDO request  (client → server)
 CANOPEN_HEARTBEAT = 0x700    # Heartbeat / NMT error control
 
 # SDO command specifiers (client → server)
+SDO_CCS_DOWNLOAD_SEGMENT = 0x00    # Write segment
 SDO_CCS_DOWNLOAD_INITIATE = 0x20   # Write (initiate)
 SDO_CCS_UPLOAD_INITIATE = 0x40     # Read (initiate)
+SDO_CCS_UPLOAD_SEGMENT = 0x60      # Read segment
 SDO_CCS_ABORT = 0x80               # Abort transfer
+SDO_CCS_BLOCK_UPLOAD = 0xA0        # Block read (cs in bits 0-1)
+SDO_CCS_BLOCK_DOWNLOAD = 0xC0      # Block write (cs in bit 0)
 
 # SDO command specifiers (server → client)
+SDO_SCS_UPLOAD_SEGMENT = 0x00      # Read segment response
+SDO_SCS_DOWNLOAD_SEGMENT = 0x20    # Write segment confirmation
 SDO_SCS_UPLOAD_INITIATE = 0x40     # Read response
 SDO_SCS_DOWNLOAD_INITIATE = 0x60   # Write confirmation
 SDO_SCS_ABORT = 0x80               # Abort from server
+SDO_SCS_BLOCK_DOWNLOAD = 0xA0      # Block write response (ss in bits 0-1)
+SDO_SCS_BLOCK_UPLOAD = 0xC0        # Block read response (ss in bits 0-1)
+
+# Block transfer limits
+SDO_BLOCK_MAX_BLKSIZE = 127
+SDO_SEGMENT_DATA = 7               # Payload bytes per segment
 
 # SDO abort codes
 SDO_ABORT_CODES = {
     0x05030000: "Toggle bit not alternated",
     0x05040000: "SDO protocol timed out",
     0x05040001: "Client/server specifier not valid",
+    0x05040002: "Invalid block size",
+    0x05040003: "Invalid sequence number",
+    0x05040004: "CRC error",
     0x05040005: "Out of memory",
     0x06010000: "Unsupported access to object",
     0x06010001: "Attempt to read a write-only object",
@@ -202,6 +228,10 @@ def nmt_command(bus, node_id: int, command: int) -> None:
         logger.info(f"  Command: 0x{command:02X} ({cmd_name})")
         logger.info("")
 
+    # Start queueing before the command so the node's boot-up / state
+    # heartbeat is kept for a later heartbeat(since=<this step>) action.
+    get_dispatcher(bus)
+
     try:
         send_frame(bus, CANOPEN_NMT, [command, node_id])
     except PU2CANFDCANError as e:
@@ -228,12 +258,40 @@ def sync(bus) -> None:
 
 # ======================== SDO Functions ========================
 
+def _sdo_transfer(bus, node_id: int, index: int, subindex: int,
+                  request: bytes, timeout: float):
+    """Send one SDO request and wait for the matching server response.
+
+    Uses the bus dispatcher: stale frames on the node's SDO response
+    COB-ID are discarded before sending, and only a response (or abort)
+    for the same index/sub-index is accepted, so concurrent traffic on
+    other COB-IDs is left untouched.
+    """
+    tx_cob_id = CANOPEN_SDO_RX + node_id
+    rx_cob_id = CANOPEN_SDO_TX + node_id
+    mux = bytes(request[1:4])
+
+    dispatcher = get_dispatcher(bus)
+    dispatcher.clear(rx_cob_id)
+    send_frame(bus, tx_cob_id, request)
+    response = dispatcher.wait_for(
+        rx_cob_id,
+        lambda m: len(m.data) >= 4 and bytes(m.data[1:4]) == mux,
+        timeout=timeout,
+    )
+    if response is not None:
+        _set_last_message(response)
+    return response
+
+
 def sdo_read_raw(bus, node_id: int, index: int, subindex: int,
                  timeout: float = DEFAULT_RECV_TIMEOUT) -> bytes:
-    """Read an SDO value from a CANopen node (expedited upload).
+    """Read an SDO value from a CANopen node.
 
     Sends an SDO upload initiate request and waits for the response.
-    Supports expedited transfers (up to 4 bytes).
+    Expedited responses (up to 4 bytes) are returned directly; if the
+    server answers with a segmented transfer the remaining segments are
+    uploaded as well.
 
     Args:
         bus: python-can Bus instance.
@@ -243,7 +301,7 @@ def sdo_read_raw(bus, node_id: int, index: int, subindex: int,
         timeout (float, optional): Response timeout. Defaults to 5.0.
 
     Returns:
-        bytes: Raw SDO value (1-4 bytes).
+        bytes: Raw SDO value.
 
     Raises:
         PU2CANFDCANopenError: If the read fails or is aborted.
@@ -267,11 +325,7 @@ def sdo_read_raw(bus, node_id: int, index: int, subindex: int,
     # Byte 4-7: reserved (zero)
     sdo_data = struct.pack('<BHBI', SDO_CCS_UPLOAD_INITIATE, index, subindex, 0)
 
-    tx_cob_id = CANOPEN_SDO_RX + node_id
-    rx_cob_id = CANOPEN_SDO_TX + node_id
-
-    send_frame(bus, tx_cob_id, sdo_data)
-    response = receive_frame(bus, timeout=timeout, filter_id=rx_cob_id)
+    response = _sdo_transfer(bus, node_id, index, subindex, sdo_data, timeout)
 
     if response is None:
         raise PU2CANFDCANopenError(
@@ -302,13 +356,17 @@ def sdo_read_raw(bus, node_id: int, index: int, subindex: int,
         data_len = 4 - n if size_indicated else 4
         value = rdata[4:4 + data_len]
     else:
-        # Non-expedited: for now, just take 4 bytes
-        value = rdata[4:8]
+        # Segmented: bytes 4-7 carry the total size when indicated
+        total = struct.unpack_from('<I', rdata, 4)[0] if size_indicated else None
+        value = _sdo_upload_segments(bus, node_id, index, subindex, total, timeout)
 
     _set_last_sdo(value)
 
     if logger:
-        logger.info(f"  [SDO OK] Value: {' '.join(f'{b:02X}' for b in value)}")
+        if len(value) <= 16:
+            logger.info(f"  [SDO OK] Value: {' '.join(f'{b:02X}' for b in value)}")
+        else:
+            logger.info(f"  [SDO OK] {len(value)} bytes")
         logger.info(f"           ({int.from_bytes(value, 'little') if len(value) <= 4 else 'multi-byte'})")
         logger.info("")
 
@@ -318,17 +376,18 @@ def sdo_read_raw(bus, node_id: int, index: int, subindex: int,
 def sdo_write_raw(bus, node_id: int, index: int, subindex: int,
                   data: Union[bytes, List[int]], size: int = 0,
                   timeout: float = DEFAULT_RECV_TIMEOUT) -> None:
-    """Write an SDO value to a CANopen node (expedited download).
+    """Write an SDO value to a CANopen node.
 
     Sends an SDO download initiate request with the given data and
-    waits for confirmation.
+    waits for confirmation. Values up to 4 bytes use an expedited
+    transfer; longer values are sent as a segmented download.
 
     Args:
         bus: python-can Bus instance.
         node_id (int): Target node ID (1-127).
         index (int): Object dictionary index (16-bit).
         subindex (int): Object dictionary sub-index (8-bit).
-        data (bytes or List[int]): Value to write (1-4 bytes for expedited).
+        data (bytes or List[int]): Value to write.
         size (int, optional): Explicit data size. If 0, inferred from data.
         timeout (float, optional): Response timeout. Defaults to 5.0.
 
@@ -349,9 +408,19 @@ def sdo_write_raw(bus, node_id: int, index: int, subindex: int,
         logger.info(f"  Node ID:  {node_id}")
         logger.info(f"  Index:    0x{index:04X}")
         logger.info(f"  SubIndex: 0x{subindex:02X}")
-        logger.info(f"  Value:    {' '.join(f'{b:02X}' for b in data_bytes)}")
+        if len(data_bytes) <= 16:
+            logger.info(f"  Value:    {' '.join(f'{b:02X}' for b in data_bytes)}")
+        else:
+            logger.info(f"  Value:    {len(data_bytes)} bytes")
         logger.info("")
 
+    if size > 4:
+        _sdo_download_segments(bus, node_id, index, subindex, data_bytes[:size], timeout)
+        if logger:
+            logger.info(f"  [SDO OK] Write confirmed ({size} bytes, segmented)")
+            logger.info("")
+        return
+
     # Build expedited download initiate
     # n = number of bytes in data part that do not contain data
     n = 4 - size
@@ -364,11 +433,7 @@ def sdo_write_raw(bus, node_id: int, index: int, subindex: int,
     sdo_frame[3] = subindex
     sdo_frame[4:4 + size] = data_bytes[:size]
 
-    tx_cob_id = CANOPEN_SDO_RX + node_id
-    rx_cob_id = CANOPEN_SDO_TX + node_id
-
-    send_frame(bus, tx_cob_id, bytes(sdo_frame))
-    response = receive_frame(bus, timeout=timeout, filter_id=rx_cob_id)
+    response = _sdo_transfer(bus, node_id, index, subindex, bytes(sdo_frame), timeout)
 
     if response is None:
         raise PU2CANFDCANopenError(
@@ -392,6 +457,578 @@ def sdo_write_raw(bus, node_id: int, index: int, subindex: int,
         logger.info("")
 
 
+# ======================== Segmented / Block SDO Transfers ========================
+
+def _sdo_send(bus, cob_id: int, payload: bytes) -> None:
+    """Send one SDO frame without per-frame logging.
+
+    Segment, block and bulk transfers emit hundreds of frames; they log a
+    summary instead of a hex dump per frame.
+    """
+    import can
+    try:
+        bus.send(can.Message(arbitration_id=cob_id, data=payload, is_extended_id=False))
+    except can.CanError as e:
+        raise PU2CANFDCANopenError(f"Failed to send SDO frame: {type(e).__name__}: {e}")
+
+
+def _sdo_abort_error(node_id: int, index: int, subindex: int,
+                     rdata: bytes) -> PU2CANFDCANopenError:
+    """Build the exception for a server abort frame."""
+    abort_code = struct.unpack_from('<I', rdata, 4)[0]
+    abort_msg = SDO_ABORT_CODES.get(abort_code, "Unknown")
+    return PU2CANFDCANopenError(
+        f"SDO abort from node {node_id} (0x{index:04X}:{subindex:02X}): "
+        f"0x{abort_code:08X} ({abort_msg})"
+    )
+
+
+def _sdo_send_abort(bus, node_id: int, index: int, subindex: int,
+                    abort_code: int) -> None:
+    """Abort a transfer from the client side (best effort)."""
+    frame = struct.pack('<BHBI', SDO_CCS_ABORT, index, subindex, abort_code)
+    try:
+        _sdo_send(bus, CANOPEN_SDO_RX + node_id, frame)
+    except PU2CANFDCANopenError:
+        pass
+
+
+def _sdo_next(bus, node_id: int, index: int, subindex: int,
+              timeout: float, what: str) -> bytes:
+    """Wait for the next server frame of an ongoing transfer.
+
+    Raises on timeout (after sending an abort) or on a server abort.
+    """
+    dispatcher = get_dispatcher(bus)
+    msg = dispatcher.wait_for(CANOPEN_SDO_TX + node_id, timeout=timeout)
+    if msg is None:
+        _sdo_send_abort(bus, node_id, index, subindex, 0x05040000)
+        raise PU2CANFDCANopenError(
+            f"SDO {what} timeout: node {node_id}, index 0x{index:04X}:{subindex:02X}"
+        )
+    rdata = bytes(msg.data).ljust(8, b'\x00')
+    if rdata[0] == SDO_SCS_ABORT:
+        raise _sdo_abort_error(node_id, index, subindex, rdata)
+    return rdata
+
+
+def _sdo_upload_segments(bus, node_id: int, index: int, subindex: int,
+                         total: Optional[int], timeout: float) -> bytes:
+    """Continue a segmented upload after the initiate response."""
+    tx_cob_id = CANOPEN_SDO_RX + node_id
+    out = bytearray()
+    toggle = 0
+
+    while True:
+        _sdo_send(bus, tx_cob_id, bytes([SDO_CCS_UPLOAD_SEGMENT | (toggle << 4)]) + bytes(7))
+        rdata = _sdo_next(bus, node_id, index, subindex, timeout, "upload segment")
+        if rdata[0] & 0xE0 != SDO_SCS_UPLOAD_SEGMENT:
+            _sdo_send_abort(bus, node_id, index, subindex, 0x05040001)
+            raise PU2CANFDCANopenError(
+                f"Unexpected SDO segment response 0x{rdata[0]:02X} from node {node_id}"
+            )
+        if (rdata[0] >> 4) & 0x01 != toggle:
+            _sdo_send_abort(bus, node_id, index, subindex, 0x05030000)
+            raise PU2CANFDCANopenError(f"SDO toggle bit error from node {node_id}")
+        n = (rdata[0] >> 1) & 0x07
+        out += rdata[1:8 - n]
+        if rdata[0] & 0x01:
+            break
+        toggle ^= 1
+
+    if total is not None and len(out) != total:
+        raise PU2CANFDCANopenError(
+            f"SDO upload size mismatch from node {node_id}: "
+            f"indicated {total}, received {len(out)}"
+        )
+    return bytes(out)
+
+
+def _sdo_download_segments(bus, node_id: int, index: int, subindex: int,
+                           data: bytes, timeout: float) -> None:
+    """Run a complete segmented download (initiate + segments)."""
+    tx_cob_id = CANOPEN_SDO_RX + node_id
+    initiate = struct.pack('<BHBI', SDO_CCS_DOWNLOAD_INITIATE | 0x01, index, subindex, len(data))
+    response = _sdo_transfer(bus, node_id, index, subindex, initiate, timeout)
+    if response is None:
+        raise PU2CANFDCANopenError(
+            f"SDO write timeout: node {node_id}, index 0x{index:04X}:{subindex:02X}"
+        )
+    rdata = bytes(response.data)
+    if rdata[0] == SDO_SCS_ABORT:
+        raise _sdo_abort_error(node_id, index, subindex, rdata)
+
+    view = memoryview(data)
+    toggle = 0
+    for offset in range(0, len(data), SDO_SEGMENT_DATA):
+        chunk = view[offset:offset + SDO_SEGMENT_DATA]
+        n = SDO_SEGMENT_DATA - len(chunk)
+        last = offset + SDO_SEGMENT_DATA >= len(data)
+        cmd = SDO_CCS_DOWNLOAD_SEGMENT | (toggle << 4) | (n << 1) | (1 if last else 0)
+        _sdo_send(bus, tx_cob_id, bytes([cmd]) + bytes(chunk) + bytes(n))
+        rdata = _sdo_next(bus, node_id, index, subindex, timeout, "download segment")
+        if rdata[0] & 0xEF != SDO_SCS_DOWNLOAD_SEGMENT or (rdata[0] >> 4) & 0x01 != toggle:
+            _sdo_send_abort(bus, node_id, index, subindex, 0x05030000)
+            raise PU2CANFDCANopenError(
+                f"Unexpected SDO segment confirmation 0x{rdata[0]:02X} from node {node_id}"
+            )
+        toggle ^= 1
+
+
+def sdo_block_upload(bus, node_id: int, index: int, subindex: int,
+                     blksize: int = SDO_BLOCK_MAX_BLKSIZE,
+                     crc: bool = True,
+                     timeout: float = DEFAULT_RECV_TIMEOUT) -> bytes:
+    """Read an object with an SDO block upload.
+
+    The server streams up to ``blksize`` 7-byte segments per
+    acknowledgement, which is much faster than segmented transfer for
+    large objects (strings, firmware images, logs). When both sides
+    support it the data is verified with the CRC-16-CCITT from the end
+    frame.
+
+    Args:
+        bus: python-can Bus instance.
+        node_id (int): Target node ID (1-127).
+        index (int): Object dictionary index (16-bit).
+        subindex (int): Object dictionary sub-index (8-bit).
+        blksize (int, optional): Segments per block (1-127). Defaults to 127.
+        crc (bool, optional): Request CRC verification. Defaults to True.
+        timeout (float, optional): Per-frame timeout. Defaults to 5.0.
+
+    Returns:
+        bytes: The uploaded object data.
+
+    Raises:
+        PU2CANFDCANopenError: On timeout, abort, sequence or CRC error.
+    """
+    if not 1 <= blksize <= SDO_BLOCK_MAX_BLKSIZE:
+        raise PU2CANFDCANopenError(f"Invalid SDO block size {blksize} (1-127)")
+
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("-" * 80)
+        logger.info("[CANopen SDO] BLOCK UPLOAD")
+        logger.info("-" * 80)
+        logger.info(f"  Node ID:  {node_id}")
+        logger.info(f"  Index:    0x{index:04X}")
+        logger.info(f"  SubIndex: 0x{subindex:02X}")
+        logger.info(f"  Blksize:  {blksize}")
+        logger.info("")
+
+    tx_cob_id = CANOPEN_SDO_RX + node_id
+    start = time.time()
+
+    # Initiate: ccs=5, cc=crc, cs=0; byte 4 = blksize, byte 5 = pst (0 = no switch)
+    initiate = struct.pack('<BHBBBH', SDO_CCS_BLOCK_UPLOAD | (0x04 if crc else 0),
+                           index, subindex, blksize, 0, 0)
+    response = _sdo_transfer(bus, node_id, index, subindex, initiate, timeout)
+    if response is None:
+        raise PU2CANFDCANopenError(
+            f"SDO block upload timeout: node {node_id}, index 0x{index:04X}:{subindex:02X}"
+        )
+    rdata = bytes(response.data).ljust(8, b'\x00')
+    if rdata[0] == SDO_SCS_ABORT:
+        raise _sdo_abort_error(node_id, index, subindex, rdata)
+    if rdata[0] & 0xE1 != SDO_SCS_BLOCK_UPLOAD:
+        _sdo_send_abort(bus, node_id, index, subindex, 0x05040001)
+        raise PU2CANFDCANopenError(
+            f"Node {node_id} does not support SDO block upload (0x{rdata[0]:02X})"
+        )
+    server_crc = bool(rdata[0] & 0x04)
+    total = struct.unpack_from('<I', rdata, 4)[0] if rdata[0] & 0x02 else None
+
+    out = bytearray()
+    _sdo_send(bus, tx_cob_id, bytes([SDO_CCS_BLOCK_UPLOAD | 0x03]) + bytes(7))
+
+    while True:
+        expected_seq = 1
+        last_accepted = False
+        while True:
+            seg = _sdo_next(bus, node_id, index, subindex, timeout, "block segment")
+            seqno = seg[0] & 0x7F
+            is_last = bool(seg[0] & 0x80)
+            if seqno == expected_seq:
+                out += seg[1:8]
+                expected_seq += 1
+                if is_last:
+                    last_accepted = True
+                    break
+            # Out-of-sequence segments are dropped; the ack below makes the
+            # server retransmit from the first missing one
+            if seqno >= blksize or is_last:
+                break
+        _sdo_send(bus, tx_cob_id,
+                  bytes([SDO_CCS_BLOCK_UPLOAD | 0x02, expected_seq - 1, blksize]) + bytes(5))
+        if last_accepted:
+            break
+
+    end = _sdo_next(bus, node_id, index, subindex, timeout, "block end")
+    if end[0] & 0xE3 != SDO_SCS_BLOCK_UPLOAD | 0x01:
+        _sdo_send_abort(bus, node_id, index, subindex, 0x05040001)
+        raise PU2CANFDCANopenError(f"Unexpected SDO block end 0x{end[0]:02X} from node {node_id}")
+    n = (end[0] >> 2) & 0x07
+    if n:
+        del out[-n:]
+
+    if crc and server_crc:
+        rx_crc = struct.unpack_from('<H', end, 1)[0]
+        calc = binascii.crc_hqx(bytes(out), 0)
+        if rx_crc != calc:
+            _sdo_send_abort(bus, node_id, index, subindex, 0x05040004)
+            raise PU2CANFDCANopenError(
+                f"SDO block upload CRC error from node {node_id}: "
+                f"received 0x{rx_crc:04X}, calculated 0x{calc:04X}"
+            )
+    _sdo_send(bus, tx_cob_id, bytes([SDO_CCS_BLOCK_UPLOAD | 0x01]) + bytes(7))
+
+    if total is not None and len(out) != total:
+        raise PU2CANFDCANopenError(
+            f"SDO block upload size mismatch from node {node_id}: "
+            f"indicated {total}, received {len(out)}"
+        )
+
+    value = bytes(out)
+    _set_last_sdo(value)
+    if logger:
+        elapsed = time.time() - start
+        logger.info(f"  [SDO OK] {len(value)} bytes in {elapsed:.3f}s"
+                    f"{' (CRC OK)' if crc and server_crc else ''}")
+        logger.info("")
+    return value
+
+
+def sdo_block_download(bus, node_id: int, index: int, subindex: int,
+                       data: Union[bytes, bytearray, memoryview],
+                       crc: bool = True,
+                       timeout: float = DEFAULT_RECV_TIMEOUT) -> None:
+    """Write an object with an SDO block download.
+
+    Segments are sent back-to-back in blocks of the size chosen by the
+    server; lost segments reported in the block acknowledgement are
+    retransmitted. The end frame carries a CRC-16-CCITT when both sides
+    support it.
+
+    Args:
+        bus: python-can Bus instance.
+        node_id (int): Target node ID (1-127).
+        index (int): Object dictionary index (16-bit).
+        subindex (int): Object dictionary sub-index (8-bit).
+        data (bytes): Data to write.
+        crc (bool, optional): Send a CRC. Defaults to True.
+        timeout (float, optional): Per-frame timeout. Defaults to 5.0.
+
+    Raises:
+        PU2CANFDCANopenError: On timeout, abort or protocol error.
+    """
+    data = bytes(data)
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("-" * 80)
+        logger.info("[CANopen SDO] BLOCK DOWNLOAD")
+        logger.info("-" * 80)
+        logger.info(f"  Node ID:  {node_id}")
+        logger.info(f"  Index:    0x{index:04X}")
+        logger.info(f"  SubIndex: 0x{subindex:02X}")
+        logger.info(f"  Size:     {len(data)} bytes")
+        logger.info("")
+
+    tx_cob_id = CANOPEN_SDO_RX + node_id
+    start = time.time()
+
+    # Initiate: ccs=6, cc=crc, s=1, cs=0; bytes 4-7 = size
+    initiate = struct.pack('<BHBI', SDO_CCS_BLOCK_DOWNLOAD | (0x04 if crc else 0) | 0x02,
+                           index, subindex, len(data))
+    response = _sdo_transfer(bus, node_id, index, subindex, initiate, timeout)
+    if response is None:
+        raise PU2CANFDCANopenError(
+            f"SDO block download timeout: node {node_id}, index 0x{index:04X}:{subindex:02X}"
+        )
+    rdata = bytes(response.data).ljust(8, b'\x00')
+    if rdata[0] == SDO_SCS_ABORT:
+        raise _sdo_abort_error(node_id, index, subindex, rdata)
+    if rdata[0] & 0xE3 != SDO_SCS_BLOCK_DOWNLOAD:
+        _sdo_send_abort(bus, node_id, index, subindex, 0x05040001)
+        raise PU2CANFDCANopenError(
+            f"Node {node_id} does not support SDO block download (0x{rdata[0]:02X})"
+        )
+    server_crc = bool(rdata[0] & 0x04)
+    blksize = rdata[4]
+    if not 1 <= blksize <= SDO_BLOCK_MAX_BLKSIZE:
+        _sdo_send_abort(bus, node_id, index, subindex, 0x05040002)
+        raise PU2CANFDCANopenError(f"Invalid block size {blksize} from node {node_id}")
+
+    nseg = max(1, -(-len(data) // SDO_SEGMENT_DATA))
+    seg_idx = 0
+    while seg_idx < nseg:
+        block_start = seg_idx
+        count = min(blksize, nseg - seg_idx)
+        for seqno in range(1, count + 1):
+            i = block_start + seqno - 1
+            chunk = data[i * SDO_SEGMENT_DATA:(i + 1) * SDO_SEGMENT_DATA]
+            last = 0x80 if i == nseg - 1 else 0
+            _sdo_send(bus, tx_cob_id, bytes([last | seqno]) + chunk.ljust(SDO_SEGMENT_DATA, b'\x00'))
+        ack = _sdo_next(bus, node_id, index, subindex, timeout, "block ack")
+        if ack[0] & 0xE3 != SDO_SCS_BLOCK_DOWNLOAD | 0x02:
+            _sdo_send_abort(bus, node_id, index, subindex, 0x05040001)
+            raise PU2CANFDCANopenError(f"Unexpected SDO block ack 0x{ack[0]:02X} from node {node_id}")
+        ackseq, blksize = ack[1], ack[2]
+        if ackseq > count or not 1 <= blksize <= SDO_BLOCK_MAX_BLKSIZE:
+            _sdo_send_abort(bus, node_id, index, subindex, 0x05040003)
+            raise PU2CANFDCANopenError(f"Invalid SDO block ack from node {node_id}")
+        # Resume after the last segment the server confirmed
+        seg_idx = block_start + ackseq
+
+    n = nseg * SDO_SEGMENT_DATA - len(data)
+    crc_val = binascii.crc_hqx(data, 0) if crc and server_crc else 0
+    _sdo_send(bus, tx_cob_id,
+               struct.pack('<BH', SDO_CCS_BLOCK_DOWNLOAD | (n << 2) | 0x01, crc_val) + bytes(5))
+    end = _sdo_next(bus, node_id, index, subindex, timeout, "block end")
+    if end[0] & 0xE3 != SDO_SCS_BLOCK_DOWNLOAD | 0x01:
+        raise PU2CANFDCANopenError(f"Unexpected SDO block end 0x{end[0]:02X} from node {node_id}")
+
+    if logger:
+        elapsed = time.time() - start
+        logger.info(f"  [SDO OK] {len(data)} bytes written in {elapsed:.3f}s")
+        logger.info("")
+
+
+# ======================== Bulk (Pipelined) SDO Reads ========================
+
+SDOObject = Tuple[int, int, int]   # (node_id, index, subindex)
+
+
+def sdo_read_many(bus, objects: Iterable[SDOObject],
+                  timeout: float = DEFAULT_RECV_TIMEOUT,
+                  max_total_s: Optional[float] = None
+                  ) -> Tuple[Dict[SDOObject, bytes], Dict[SDOObject, str]]:
+    """Read many objects from one or more nodes with pipelined SDO uploads.
+
+    CANopen allows one outstanding transfer per SDO channel, so requests
+    are pipelined across nodes: every node always has one request in
+    flight, and the next request for a node is sent as soon as its
+    previous response arrives. Expedited and segmented responses are both
+    handled. A timeout or abort only fails that object.
+
+    Args:
+        bus: python-can Bus instance.
+        objects (Iterable[Tuple[int, int, int]]): (node_id, index, subindex)
+            triples, read in order per node.
+        timeout (float, optional): Per-response timeout. Defaults to 5.0.
+        max_total_s (float, optional): Overall time limit; remaining
+            objects are reported as errors when it expires.
+
+    Returns:
+        Tuple[Dict, Dict]: ``(values, errors)`` keyed by the object triple.
+        ``values`` maps to raw bytes, ``errors`` to an error description.
+    """
+    pending: Dict[int, deque] = {}
+    for node_id, index, subindex in objects:
+        pending.setdefault(node_id, deque()).append((index, subindex))
+
+    values: Dict[SDOObject, bytes] = {}
+    errors: Dict[SDOObject, str] = {}
+    if not pending:
+        return values, errors
+
+    logger = get_active_logger()
+    total_objects = sum(len(q) for q in pending.values())
+    if logger:
+        logger.info("")
+        logger.info("-" * 80)
+        logger.info("[CANopen SDO] BULK READ")
+        logger.info("-" * 80)
+        logger.info(f"  Nodes:    {', '.join(str(n) for n in sorted(pending))}")
+        logger.info(f"  Objects:  {total_objects}")
+        logger.info("")
+
+    dispatcher = get_dispatcher(bus)
+    rx_to_node = {CANOPEN_SDO_TX + n: n for n in pending}
+    dispatcher.clear(rx_to_node.keys())
+    start = time.monotonic()
+    hard_deadline = start + max_total_s if max_total_s is not None else None
+
+    # node_id -> [index, subindex, mux, phase, toggle, buffer, size, deadline]
+    active: Dict[int, list] = {}
+
+    def _issue(node_id: int) -> None:
+        index, subindex = pending[node_id].popleft()
+        req = struct.pack('<BHBI', SDO_CCS_UPLOAD_INITIATE, index, subindex, 0)
+        active[node_id] = [index, subindex, req[1:4], "init", 0, bytearray(), None,
+                           time.monotonic() + timeout]
+        _sdo_send(bus, CANOPEN_SDO_RX + node_id, req)
+
+    def _finish(node_id: int, value: Optional[bytes] = None, error: Optional[str] = None) -> None:
+        st = active.pop(node_id)
+        key = (node_id, st[0], st[1])
+        if error is None:
+            values[key] = value
+        else:
+            errors[key] = error
+        if pending[node_id]:
+            _issue(node_id)
+
+    for node_id in pending:
+        _issue(node_id)
+
+    while active:
+        now = time.monotonic()
+        if hard_deadline is not None and now >= hard_deadline:
+            for node_id in list(active):
+                st = active.pop(node_id)
+                _sdo_send_abort(bus, node_id, st[0], st[1], 0x05040000)
+                errors[(node_id, st[0], st[1])] = "bulk read time limit exceeded"
+                for index, subindex in pending[node_id]:
+                    errors[(node_id, index, subindex)] = "bulk read time limit exceeded"
+                pending[node_id].clear()
+            break
+
+        for node_id in [n for n, st in active.items() if st[7] <= now]:
+            st = active[node_id]
+            _sdo_send_abort(bus, node_id, st[0], st[1], 0x05040000)
+            _finish(node_id, error="timeout")
+        if not active:
+            break
+
+        wait = min(st[7] for st in active.values()) - time.monotonic()
+        if hard_deadline is not None:
+            wait = min(wait, hard_deadline - time.monotonic())
+        msg = dispatcher.wait_for(list(CANOPEN_SDO_TX + n for n in active),
+                                  timeout=max(wait, 0.0))
+        if msg is None:
+            continue
+
+        node_id = rx_to_node[msg.arbitration_id]
+        st = active.get(node_id)
+        if st is None:
+            continue
+        rdata = bytes(msg.data).ljust(8, b'\x00')
+        index, subindex, mux, phase = st[0], st[1], st[2], st[3]
+
+        if rdata[0] == SDO_SCS_ABORT:
+            if rdata[1:4] == mux:
+                abort_code = struct.unpack_from('<I', rdata, 4)[0]
+                _finish(node_id, error=f"abort 0x{abort_code:08X} "
+                                       f"({SDO_ABORT_CODES.get(abort_code, 'Unknown')})")
+            continue
+
+        if phase == "init":
+            if rdata[1:4] != mux or rdata[0] & 0xE0 != SDO_SCS_UPLOAD_INITIATE:
+                continue  # stale response for an earlier request
+            scs = rdata[0]
+            if scs & 0x02:
+                n = (scs >> 2) & 0x03 if scs & 0x01 else 0
+                _finish(node_id, rdata[4:8 - n])
+            else:
+                st[3] = "segment"
+                st[6] = struct.unpack_from('<I', rdata, 4)[0] if scs & 0x01 else None
+                st[7] = time.monotonic() + timeout
+                _sdo_send(bus, CANOPEN_SDO_RX + node_id,
+                           bytes([SDO_CCS_UPLOAD_SEGMENT]) + bytes(7))
+            continue
+
+        # Segmented upload in progress
+        toggle = st[4]
+        if rdata[0] & 0xE0 != SDO_SCS_UPLOAD_SEGMENT or (rdata[0] >> 4) & 0x01 != toggle:
+            _sdo_send_abort(bus, node_id, index, subindex, 0x05030000)
+            _finish(node_id, error="segment toggle/protocol error")
+            continue
+        n = (rdata[0] >> 1) & 0x07
+        st[5] += rdata[1:8 - n]
+        if rdata[0] & 0x01:
+            data = bytes(st[5])
+            if st[6] is not None and len(data) != st[6]:
+                _finish(node_id, error=f"size mismatch: indicated {st[6]}, received {len(data)}")
+            else:
+                _finish(node_id, data)
+        else:
+            st[4] = toggle ^ 1
+            st[7] = time.monotonic() + timeout
+            _sdo_send(bus, CANOPEN_SDO_RX + node_id,
+                       bytes([SDO_CCS_UPLOAD_SEGMENT | (st[4] << 4)]) + bytes(7))
+
+    if logger:
+        elapsed = time.monotonic() - start
+        rate = total_objects / elapsed if elapsed > 0 else 0
+        logger.info(f"  [SDO BULK] {len(values)} OK, {len(errors)} failed "
+                    f"in {elapsed:.3f}s ({rate:.0f} obj/s)")
+        logger.info("")
+
+    return values, errors
+
+
+def od_scan(bus, node_ids: Iterable[int],
+            indices: Iterable[int],
+            timeout: float = 0.5,
+            max_subindex: int = 0xFE,
+            od: Optional[Union[str, ObjectDictionary]] = None) -> Dict[int, Dict[Tuple[int, int], bytes]]:
+    """Dump object dictionary entries from one or more nodes.
+
+    Pipelined passes: sub-index 0 of every candidate index is read first.
+    A 1-byte sub 0 is only taken as the entry count of an ARRAY/RECORD
+    once the object type is known: from ``od`` when the index is described
+    there, otherwise by probing sub-index 1 (a plain VAR aborts it). The
+    remaining sub-indices of confirmed arrays/records are then read in
+    bulk. Objects that abort are skipped.
+
+    Args:
+        bus: python-can Bus instance.
+        node_ids (Iterable[int]): Nodes to dump.
+        indices (Iterable[int]): Candidate OD indices to probe.
+        timeout (float, optional): Per-response timeout. Defaults to 0.5.
+        max_subindex (int, optional): Upper bound for sub-indices read
+            from a record. Defaults to 254.
+        od (ObjectDictionary or str, optional): Dictionary (or EDS/DCF path)
+            used to tell variables from arrays/records without probing.
+
+    Returns:
+        Dict[int, Dict[Tuple[int, int], bytes]]: Per node, raw values
+        keyed by (index, subindex).
+    """
+    node_ids = list(node_ids)
+    indices = list(indices)
+    dictionary = resolve_od(od) if od is not None else None
+    first = [(n, idx, 0) for n in node_ids for idx in indices]
+    sub0, _ = sdo_read_many(bus, first, timeout=timeout)
+
+    # Object type per index: True for ARRAY/RECORD, False for VAR, None
+    # when the dictionary does not describe it.
+    structured: Dict[int, Optional[bool]] = {}
+    for idx in indices:
+        described = dictionary.entries(idx) if dictionary is not None else []
+        structured[idx] = any(e.subindex > 0 for e in described) if described else None
+
+    counts: Dict[Tuple[int, int], int] = {}
+    for (n, idx, _sub), raw in sub0.items():
+        if len(raw) == 1 and raw[0] > 0 and structured[idx] is not False:
+            counts[(n, idx)] = min(raw[0], max_subindex)
+
+    # Undescribed objects: a VAR has no sub-index 1, so its sub 0 is a value
+    probe = [(n, idx, 1) for (n, idx) in counts if structured[idx] is None]
+    subs, _ = sdo_read_many(bus, probe, timeout=timeout)
+    for n, idx, _sub in probe:
+        if (n, idx, 1) not in subs:
+            del counts[(n, idx)]
+
+    rest = []
+    for (n, idx), count in counts.items():
+        start = 2 if structured[idx] is None else 1
+        rest.extend((n, idx, s) for s in range(start, count + 1))
+    more, _ = sdo_read_many(bus, rest, timeout=timeout)
+    subs.update(more)
+
+    result: Dict[int, Dict[Tuple[int, int], bytes]] = {n: {} for n in node_ids}
+    for (n, idx, sub), raw in sub0.items():
+        result[n][(idx, sub)] = raw
+    for (n, idx, sub), raw in subs.items():
+        result[n][(idx, sub)] = raw
+    for n in result:
+        result[n] = dict(sorted(result[n].items()))
+    return result
+
+
 # ======================== Typed SDO Helpers ========================
 
 def sdo_read_u8(bus, node_id: int, index: int, subindex: int,
@@ -449,11 +1086,110 @@ def sdo_write_float(bus, node_id: int, index: int, subindex: int,
                   struct.pack('<f', value), size=4, timeout=timeout)
 
 
+# ======================== Object Dictionary (EDS/DCF) Access ========================
+
+def sdo_read_param(bus, od: Union[str, ObjectDictionary], node_id: int,
+                   param: ODKey, timeout: float = DEFAULT_RECV_TIMEOUT) -> Any:
+    """Read an object by name (or address) and decode it using the EDS type.
+
+    Args:
+        bus: python-can Bus instance.
+        od (ObjectDictionary or str): Dictionary or path to an EDS/DCF file.
+        node_id (int): Target node ID (1-127).
+        param: Parameter name (``"Parent.Sub"``), ``"IIII:SS"`` or
+            ``(index, subindex)``.
+        timeout (float, optional): SDO timeout. Defaults to 5.0.
+
+    Returns:
+        Any: Decoded value (int, float, str or bytes).
+
+    Raises:
+        PU2CANFDCANopenError: If the object is unknown, write-only or the read fails.
+    """
+    try:
+        entry = resolve_od(od)[param]
+    except PU2CANFDODError as e:
+        raise PU2CANFDCANopenError(str(e))
+    if not entry.readable:
+        raise PU2CANFDCANopenError(f"{entry.name} ({entry.key}) is write-only")
+    raw = sdo_read_raw(bus, node_id, entry.index, entry.subindex, timeout)
+    try:
+        return entry.decode(raw)
+    except PU2CANFDODError as e:
+        raise PU2CANFDCANopenError(str(e))
+
+
+def sdo_write_param(bus, od: Union[str, ObjectDictionary], node_id: int,
+                    param: ODKey, value: Any,
+                    timeout: float = DEFAULT_RECV_TIMEOUT) -> None:
+    """Write an object by name (or address) with type and range checks.
+
+    The value is validated against the entry's data type, ``LowLimit``/
+    ``HighLimit`` and ``AccessType`` before anything is sent.
+
+    Args:
+        bus: python-can Bus instance.
+        od (ObjectDictionary or str): Dictionary or path to an EDS/DCF file.
+        node_id (int): Target node ID (1-127).
+        param: Parameter name, ``"IIII:SS"`` or ``(index, subindex)``.
+        value: Value to write.
+        timeout (float, optional): SDO timeout. Defaults to 5.0.
+
+    Raises:
+        PU2CANFDCANopenError: If validation or the write fails.
+    """
+    try:
+        entry = resolve_od(od)[param]
+        if not entry.writable:
+            raise PU2CANFDODError(f"{entry.name} ({entry.key}) is not writable (access '{entry.access}')")
+        raw = entry.encode(value, node_id)
+    except PU2CANFDODError as e:
+        raise PU2CANFDCANopenError(str(e))
+    sdo_write_raw(bus, node_id, entry.index, entry.subindex, raw, size=len(raw), timeout=timeout)
+
+
+def sdo_read_params(bus, od: Union[str, ObjectDictionary], node_id: int,
+                    params: Iterable[ODKey],
+                    timeout: float = DEFAULT_RECV_TIMEOUT) -> Dict[str, Any]:
+    """Read several objects by name with one pipelined bulk transfer.
+
+    Args:
+        bus: python-can Bus instance.
+        od (ObjectDictionary or str): Dictionary or path to an EDS/DCF file.
+        node_id (int): Target node ID (1-127).
+        params (Iterable): Parameter names or addresses.
+        timeout (float, optional): Per-response timeout. Defaults to 5.0.
+
+    Returns:
+        Dict[str, Any]: Decoded values keyed by qualified parameter name.
+
+    Raises:
+        PU2CANFDCANopenError: If any object is unknown or fails to read.
+    """
+    dictionary = resolve_od(od)
+    try:
+        entries = [dictionary[p] for p in params]
+    except PU2CANFDODError as e:
+        raise PU2CANFDCANopenError(str(e))
+
+    values, errors = sdo_read_many(
+        bus, [(node_id, e.index, e.subindex) for e in entries], timeout=timeout
+    )
+    if errors:
+        details = "; ".join(f"0x{i:04X}:{s:02X}: {err}" for (_n, i, s), err in errors.items())
+        raise PU2CANFDCANopenError(f"Reading {len(errors)} parameter(s) failed: {details}")
+    try:
+        return {e.name: e.decode(values[(node_id, e.index, e.subindex)]) for e in entries}
+    except PU2CANFDODError as e:
+        raise PU2CANFDCANopenError(str(e))
+
+
 # ======================== Heartbeat Monitoring ========================
 
 def wait_for_heartbeat(bus, node_id: int,
                        expected_state: Optional[int] = None,
-                       timeout: float = DEFAULT_RECV_TIMEOUT) -> Dict[str, Any]:
+                       timeout: float = DEFAULT_RECV_TIMEOUT,
+                       since: Optional[float] = None) -> Dict[str, Any]:
     """Wait for a heartbeat message from a CANopen node.
 
     Heartbeat messages are sent on COB-ID 0x700 + node_id, with a
@@ -465,6 +1201,10 @@ def wait_for_heartbeat(bus, node_id: int,
         expected_state (int, optional): If set, waits until this state
             is seen or timeout. Use HEARTBEAT_* constants.
         timeout (float, optional): Timeout in seconds. Defaults to 5.0.
+        since (float, optional): Only accept heartbeats received at or after
+            this ``time.monotonic()`` value. Defaults to the time of the
+            call; pass an earlier value (e.g. taken before an NMT reset) to
+            also accept a boot-up that arrived in between.
 
     Returns:
         Dict with keys: "node_id", "state", "state_name", "timestamp".
@@ -486,11 +1226,15 @@ def wait_for_heartbeat(bus, node_id: int,
             logger.info(f"  Expected: {HEARTBEAT_STATE_NAMES.get(expected_state, '?')}")
         logger.info("")
 
+    # Heartbeats queued before ``since`` are stale and never satisfy the wait
+    if since is None:
+        since = time.monotonic()
+    get_dispatcher(bus)
     start = time.time()
 
     while (time.time() - start) < timeout:
         remaining = timeout - (time.time() - start)
-        msg = receive_frame(bus, timeout=remaining, filter_id=hb_cob_id)
+        msg = receive_frame(bus, timeout=remaining, filter_id=hb_cob_id, since=since)
 
         if msg is None:
             break
@@ -514,6 +1258,17 @@ def wait_for_heartbeat(bus, node_id: int,
     )
 
 
+def _step_start_monotonic(step_id: str) -> float:
+    """Return when ``step_id`` (or its first sub-step) started, on the
+    ``time.monotonic()`` clock used by the receive dispatcher."""
+    fw = get_active_framework()
+    started = [t for s, t in (fw.step_started.items() if fw is not None else ())
+               if s == step_id or s.startswith(step_id + ".")]
+    if not started:
+        raise PU2CANFDCANopenError(f"Step {step_id} has not started")
+    return time.monotonic() - (time.time() - min(started))
+
+
 # ======================== eWald Object Dictionary Indices ========================
 # Mirrors CONFIG.h from the eWald firmware
 
@@ -755,11 +1510,337 @@ def sdo_write(name: str, channel: str, node_id: int,
                       negative_test=negative_test, metadata=metadata)
 
 
+def sdo_upload(name: str, channel: str, node_id: int,
+               index: int, subindex: int = 0,
+               mode: str = "auto",
+               output_path: Optional[str] = None,
+               blksize: int = SDO_BLOCK_MAX_BLKSIZE,
+               bitrate: int = CAN_BITRATE_1000K,
+               bustype: Optional[str] = None,
+               timeout: float = DEFAULT_RECV_TIMEOUT,
+               negative_test: bool = False) -> TestAction:
+    """Create a TestAction that uploads (reads) an object of any size.
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str): CAN interface.
+        node_id (int): Target node ID (1-127).
+        index (int): OD index (16-bit).
+        subindex (int, optional): OD sub-index. Defaults to 0.
+        mode (str, optional): "auto" (expedited/segmented, as the server
+            chooses) or "block" (block upload with CRC). Defaults to "auto".
+        output_path (str, optional): Also write the data to this file.
+        blksize (int, optional): Block size for block mode. Defaults to 127.
+        bitrate (int, optional): Bitrate. Defaults to 1000000.
+        bustype (str, optional): Bus type. Auto-detected if None.
+        timeout (float, optional): Per-frame timeout. Defaults to 5.0.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Action returning the uploaded bytes.
+    """
+
+    def execute():
+        with CANBus(channel, bustype, bitrate) as bus:
+            if mode == "block":
+                value = sdo_block_upload(bus, node_id, index, subindex, blksize,
+                                         timeout=timeout)
+            elif mode == "auto":
+                value = sdo_read_raw(bus, node_id, index, subindex, timeout)
+            else:
+                raise PU2CANFDCANopenError(f"Unknown SDO mode '{mode}'")
+        if output_path:
+            out = Path(output_path)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_bytes(value)
+        return value
+
+    metadata = {
+        'display_command': f"SDO Upload ({mode}) 0x{index:04X}:{subindex:02X} node {node_id}",
+        'display_expected': "Object data",
+    }
+
+    return TestAction(name=name, execute_func=execute,
+                      negative_test=negative_test, metadata=metadata)
+
+
+def sdo_download(name: str, channel: str, node_id: int,
+                 index: int, subindex: int = 0,
+                 data: Optional[Union[bytes, List[int]]] = None,
+                 input_path: Optional[str] = None,
+                 mode: str = "auto",
+                 bitrate: int = CAN_BITRATE_1000K,
+                 bustype: Optional[str] = None,
+                 timeout: float = DEFAULT_RECV_TIMEOUT,
+                 negative_test: bool = False) -> TestAction:
+    """Create a TestAction that downloads (writes) an object of any size.
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str): CAN interface.
+        node_id (int): Target node ID (1-127).
+        index (int): OD index (16-bit).
+        subindex (int, optional): OD sub-index. Defaults to 0.
+        data (bytes or List[int], optional): Data to write.
+        input_path (str, optional): Read the data from this file instead.
+        mode (str, optional): "auto" (expedited up to 4 bytes, segmented
+            above) or "block" (block download with CRC). Defaults to "auto".
+        bitrate (int, optional): Bitrate. Defaults to 1000000.
+        bustype (str, optional): Bus type. Auto-detected if None.
+        timeout (float, optional): Per-frame timeout. Defaults to 5.0.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Action returning the number of bytes written.
+    """
+    if (data is None) == (input_path is None):
+        raise PU2CANFDCANopenError("sdo_download needs exactly one of data or input_path")
+
+    def execute():
+        payload = Path(input_path).read_bytes() if input_path else bytes(data)
+        with CANBus(channel, bustype, bitrate) as bus:
+            if mode == "block":
+                sdo_block_download(bus, node_id, index, subindex, payload, timeout=timeout)
+            elif mode == "auto":
+                sdo_write_raw(bus, node_id, index, subindex, payload, timeout=timeout)
+            else:
+                raise PU2CANFDCANopenError(f"Unknown SDO mode '{mode}'")
+        return len(payload)
+
+    source = input_path if input_path else f"{len(bytes(data))} bytes"
+    metadata = {
+        'display_command': f"SDO Download ({mode}) 0x{index:04X}:{subindex:02X} ← {source}",
+        'display_expected': "Write confirmed",
+    }
+
+    return TestAction(name=name, execute_func=execute,
+                      negative_test=negative_test, metadata=metadata)
+
+
+def sdo_read_bulk(name: str, channel: str,
+                  objects: List[SDOObject],
+                  bitrate: int = CAN_BITRATE_1000K,
+                  bustype: Optional[str] = None,
+                  timeout: float = DEFAULT_RECV_TIMEOUT,
+                  allow_errors: bool = False,
+                  negative_test: bool = False) -> TestAction:
+    """Create a TestAction that reads many objects with pipelined SDO.
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str): CAN interface.
+        objects (List[Tuple[int, int, int]]): (node_id, index, subindex)
+            triples, possibly spanning several nodes.
+        bitrate (int, optional): Bitrate. Defaults to 1000000.
+        bustype (str, optional): Bus type. Auto-detected if None.
+        timeout (float, optional): Per-response timeout. Defaults to 5.0.
+        allow_errors (bool, optional): Do not fail when some objects abort
+            or time out. Defaults to False.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Action returning ``{"values": {...}, "errors": {...}}``
+        keyed by the object triple.
+    """
+
+    def execute():
+        with CANBus(channel, bustype, bitrate) as bus:
+            values, errors = sdo_read_many(bus, objects, timeout=timeout)
+        if errors and not allow_errors:
+            details = "; ".join(
+                f"node {n} 0x{i:04X}:{s:02X}: {err}" for (n, i, s), err in errors.items()
+            )
+            raise PU2CANFDCANopenError(f"SDO bulk read failed for {len(errors)} object(s): {details}")
+        return {"values": values, "errors": errors}
+
+    nodes = sorted({o[0] for o in objects})
+    metadata = {
+        'display_command': f"SDO Bulk Read {len(objects)} objects, nodes {nodes}",
+        'display_expected': "All objects read" if not allow_errors else "Objects read",
+    }
+
+    return TestAction(name=name, execute_func=execute,
+                      negative_test=negative_test, metadata=metadata)
+
+
+def od_dump(name: str, channel: str, node_ids: Union[int, List[int]],
+            indices: Optional[Iterable[int]] = None,
+            output_path: Optional[str] = None,
+            bitrate: int = CAN_BITRATE_1000K,
+            bustype: Optional[str] = None,
+            timeout: float = 0.5,
+            od: Optional[Union[str, ObjectDictionary]] = None,
+            negative_test: bool = False) -> TestAction:
+    """Create a TestAction that dumps object dictionaries over SDO.
+
+    Uses :func:`od_scan` (pipelined across nodes). By default the
+    communication profile area 0x1000-0x102F is probed.
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str): CAN interface.
+        node_ids (int or List[int]): Node(s) to dump.
+        indices (Iterable[int], optional): OD indices to probe.
+        output_path (str, optional): Write the dump as JSON
+            (``{node: {"IIII:SS": "hex"}}``).
+        bitrate (int, optional): Bitrate. Defaults to 1000000.
+        bustype (str, optional): Bus type. Auto-detected if None.
+        timeout (float, optional): Per-response timeout. Defaults to 0.5.
+        od (ObjectDictionary or str, optional): Dictionary (or EDS/DCF path)
+            giving the object types of the probed indices.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Action returning ``{node_id: {(index, sub): bytes}}``.
+    """
+    nodes = [node_ids] if isinstance(node_ids, int) else list(node_ids)
+    probe = list(indices) if indices is not None else list(range(0x1000, 0x1030))
+
+    def execute():
+        logger = get_active_logger()
+        with CANBus(channel, bustype, bitrate) as bus:
+            dump = od_scan(bus, nodes, probe, timeout=timeout, od=od)
+
+        if not any(dump.values()):
+            raise PU2CANFDCANopenError(f"No objects read from node(s) {nodes}")
+
+        if logger:
+            for n, entries in dump.items():
+                logger.info(f"[CANopen] OD dump node {n}: {len(entries)} entries")
+                for (idx, sub), raw in entries.items():
+                    logger.info(f"    0x{idx:04X}:{sub:02X}  {raw.hex(' ').upper()}")
+
+        if output_path:
+            out = Path(output_path)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            serialisable = {
+                str(n): {f"{idx:04X}:{sub:02X}": raw.hex() for (idx, sub), raw in entries.items()}
+                for n, entries in dump.items()
+            }
+            out.write_text(json.dumps(serialisable, indent=2), encoding="utf-8")
+
+        return dump
+
+    metadata = {
+        'display_command': f"OD dump nodes {nodes} ({len(probe)} indices)",
+        'display_expected': "Object dictionary",
+    }
+
+    return TestAction(name=name, execute_func=execute,
+                      negative_test=negative_test, metadata=metadata)
+
+
+def od_read(name: str, channel: str, node_id: int,
+            od: Union[str, ObjectDictionary],
+            param: Union[ODKey, List[ODKey]],
+            expected: Any = None,
+            bitrate: int = CAN_BITRATE_1000K,
+            bustype: Optional[str] = None,
+            timeout: float = DEFAULT_RECV_TIMEOUT,
+            negative_test: bool = False) -> TestAction:
+    """Create a TestAction that reads parameters by EDS/DCF name.
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str): CAN interface.
+        node_id (int): Target node ID (1-127).
+        od (ObjectDictionary or str): Dictionary or path to an EDS/DCF file.
+        param: Parameter name/address, or a list of them (read in bulk).
+        expected (optional): Expected value (single parameter) or dict of
+            expected values keyed by parameter name.
+        bitrate (int, optional): Bitrate. Defaults to 1000000.
+        bustype (str, optional): Bus type. Auto-detected if None.
+        timeout (float, optional): SDO timeout. Defaults to 5.0.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Action returning the decoded value, or a dict of values
+        for a list of parameters.
+    """
+    many = isinstance(param, list)
+
+    def execute():
+        dictionary = resolve_od(od)
+        with CANBus(channel, bustype, bitrate) as bus:
+            if many:
+                result = sdo_read_params(bus, dictionary, node_id, param, timeout)
+            else:
+                result = sdo_read_param(bus, dictionary, node_id, param, timeout)
+
+        if expected is not None:
+            if many:
+                for key, exp in expected.items():
+                    got = result.get(dictionary[key].name)
+                    if got != exp:
+                        raise PU2CANFDCANopenError(f"{key}: expected {exp!r}, got {got!r}")
+            elif result != expected:
+                raise PU2CANFDCANopenError(f"{param}: expected {expected!r}, got {result!r}")
+
+        logger = get_active_logger()
+        if logger:
+            items = result.items() if many else [(param, result)]
+            for key, val in items:
+                logger.info(f"[CANopen OD] node {node_id} {key} = {val!r}")
+        return result
+
+    label = f"{len(param)} parameters" if many else str(param)
+    metadata = {
+        'display_command': f"OD Read {label} node {node_id}",
+        'display_expected': repr(expected) if expected is not None else "Value",
+    }
+
+    return TestAction(name=name, execute_func=execute,
+                      negative_test=negative_test, metadata=metadata)
+
+
+def od_write(name: str, channel: str, node_id: int,
+             od: Union[str, ObjectDictionary],
+             param: ODKey, value: Any,
+             bitrate: int = CAN_BITRATE_1000K,
+             bustype: Optional[str] = None,
+             timeout: float = DEFAULT_RECV_TIMEOUT,
+             negative_test: bool = False) -> TestAction:
+    """Create a TestAction that writes a parameter by EDS/DCF name.
+
+    The value is type- and range-checked against the dictionary before
+    the SDO write is sent.
+
+    Args:
+        name (str): Human-readable action name.
+        channel (str): CAN interface.
+        node_id (int): Target node ID (1-127).
+        od (ObjectDictionary or str): Dictionary or path to an EDS/DCF file.
+        param: Parameter name, ``"IIII:SS"`` or ``(index, subindex)``.
+        value: Value to write.
+        bitrate (int, optional): Bitrate. Defaults to 1000000.
+        bustype (str, optional): Bus type. Auto-detected if None.
+        timeout (float, optional): SDO timeout. Defaults to 5.0.
+        negative_test (bool, optional): Expect failure. Defaults to False.
+
+    Returns:
+        TestAction: Configured write action.
+    """
+
+    def execute():
+        with CANBus(channel, bustype, bitrate) as bus:
+            sdo_write_param(bus, od, node_id, param, value, timeout)
+        return True
+
+    metadata = {
+        'display_command': f"OD Write {param} = {value!r} node {node_id}",
+        'display_expected': "Write confirmed",
+    }
+
+    return TestAction(name=name, execute_func=execute,
+                      negative_test=negative_test, metadata=metadata)
+
+
 def heartbeat(name: str, channel: str, node_id: int,
               expected_state: Optional[int] = None,
               bitrate: int = CAN_BITRATE_1000K,
               bustype: Optional[str] = None,
               timeout: float = DEFAULT_RECV_TIMEOUT,
+              since: Optional[str] = None,
               negative_test: bool = False) -> TestAction:
     """Create a TestAction that waits for a CANopen heartbeat.
 
@@ -772,6 +1853,10 @@ def heartbeat(name: str, channel: str, node_id: int,
         bitrate (int, optional): Bitrate. Defaults to 1000000.
         bustype (str, optional): Bus type. Auto-detected if None.
         timeout (float, optional): Timeout. Defaults to 5.0.
+        since (str, optional): Step ID (e.g. the NMT reset step) from whose
+            start heartbeats are accepted, so a boot-up sent before this
+            action runs still counts. Defaults to heartbeats received after
+            the action starts.
         negative_test (bool, optional): Expect failure. Defaults to False.
 
     Returns:
@@ -779,8 +1864,10 @@ def heartbeat(name: str, channel: str, node_id: int,
     """
 
     def execute():
+        since_t = _step_start_monotonic(since) if since is not None else None
         with CANBus(channel, bustype, bitrate) as bus:
-            result = wait_for_heartbeat(bus, node_id, expected_state, timeout)
+            result = wait_for_heartbeat(bus, node_id, expected_state, timeout,
+                                        since=since_t)
             return result
 
     state_str = (HEARTBEAT_STATE_NAMES.get(expected_state, "Any")
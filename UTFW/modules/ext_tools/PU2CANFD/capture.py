@@ -0,0 +1,585 @@
+# capture.py
+"""
+UTFW PU2CANFD Capture Module
+==============================
+Columnar, memory-efficient storage for captured CAN / CAN FD traffic.
+
+Long bus scans used to keep one ``can.Message`` object per frame, which
+costs several hundred bytes per frame and makes per-ID statistics an
+O(frames x IDs) loop. :class:`CANCapture` instead stores every frame
+column-wise in compact ``array`` buffers (timestamp, arbitration ID,
+length, flags, channel index) with all payload bytes packed into a
+single ``bytearray``. Statistics are computed in one pass over these
+columns.
+
+Captures can be exported to log files and loaded back for replay:
+- ``.log``: candump ``-L`` format (written/parsed natively)
+- ``.asc``: Vector ASCII log (via python-can)
+- ``.blf``: Vector binary log (via python-can)
+- anything else python-can's ``LogReader``/``Logger`` understands
+
+Usage:
+    import UTFW
+    pu2canfd = UTFW.modules.ext_tools.PU2CANFD
+
+    bus = pu2canfd.can.open_bus("can0")
+    cap = pu2canfd.can.bus_scan(bus, duration=10.0)
+    stats = cap.stats(bitrate=500000)
+    cap.save("scan.log")
+
+    cap2 = pu2canfd.capture.CANCapture.load("scan.log")
+    cap2.replay(bus, speed=1.0)
+
+Author: DvidMakesThings
+"""
+
+import math
+import time
+from array import array
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Union, Iterator, Tuple
+
+from ....core.logger import get_active_logger
+from ._base import PU2CANFDError, _ensure_python_can
+
+
+class PU2CANFDCaptureError(PU2CANFDError):
+    """Exception raised when a CAN capture cannot be stored, exported or replayed.
+
+    Args:
+        message (str): Description of the error that occurred.
+    """
+    pass
+
+
+# ======================== Frame Flags ========================
+
+FLAG_EXTENDED = 0x01
+FLAG_REMOTE = 0x02
+FLAG_FD = 0x04
+FLAG_BRS = 0x08
+FLAG_ESI = 0x10
+FLAG_ERROR = 0x20
+FLAG_RX = 0x40
+
+# Nominal frame overhead in bits (SOF..IFS, without stuff bits)
+_SFF_OVERHEAD_BITS = 47
+_EFF_OVERHEAD_BITS = 67
+# CAN FD: bits sent at nominal rate (arbitration + ACK/EOF/IFS) and
+# bits sent at data rate (ESI, DLC, stuff count, CRC) excluding payload
+_FD_SFF_ARB_BITS = 29
+_FD_EFF_ARB_BITS = 48
+_FD_DATA_OVERHEAD_BITS = 30
+
+
+def _msg_flags(msg) -> int:
+    """Pack the boolean attributes of a python-can Message into a flag byte."""
+    flags = 0
+    if getattr(msg, "is_extended_id", False):
+        flags |= FLAG_EXTENDED
+    if getattr(msg, "is_remote_frame", False):
+        flags |= FLAG_REMOTE
+    if getattr(msg, "is_fd", False):
+        flags |= FLAG_FD
+    if getattr(msg, "bitrate_switch", False):
+        flags |= FLAG_BRS
+    if getattr(msg, "error_state_indicator", False):
+        flags |= FLAG_ESI
+    if getattr(msg, "is_error_frame", False):
+        flags |= FLAG_ERROR
+    if getattr(msg, "is_rx", True):
+        flags |= FLAG_RX
+    return flags
+
+
+def _frame_bits(flags: int, length: int, bitrate: int,
+                dbitrate: Optional[int]) -> float:
+    """Estimate the on-wire length of one frame in nominal bit times."""
+    payload = 0 if flags & FLAG_REMOTE else length * 8
+    if flags & FLAG_FD:
+        arb = _FD_EFF_ARB_BITS if flags & FLAG_EXTENDED else _FD_SFF_ARB_BITS
+        data_bits = payload + _FD_DATA_OVERHEAD_BITS
+        if flags & FLAG_BRS and dbitrate:
+            data_bits = data_bits * bitrate / dbitrate
+        return arb + data_bits
+    overhead = _EFF_OVERHEAD_BITS if flags & FLAG_EXTENDED else _SFF_OVERHEAD_BITS
+    return overhead + payload
+
+
+class CANCapture:
+    """Column-oriented store of captured CAN frames.
+
+    Each frame occupies roughly 18 bytes of column storage plus its
+    payload, independent of python-can object overhead. Frames are
+    appended in capture order; timestamps are kept as absolute seconds.
+
+    Args:
+        channel (str, optional): Default channel name used when frames
+            do not carry one. Defaults to "can0".
+    """
+
+    def __init__(self, channel: str = "can0"):
+        self.channel = channel
+        self._ts = array("d")
+        self._ids = array("I")
+        self._len = array("B")
+        self._flags = array("B")
+        self._chan = array("B")
+        self._offsets = array("I")
+        self._data = bytearray()
+        self._channels: List[str] = [channel]
+        self._channel_index: Dict[str, int] = {channel: 0}
+
+    # ---------------- Population ----------------
+
+    def _chan_idx(self, channel: Optional[str]) -> int:
+        if channel is None:
+            return 0
+        channel = str(channel)
+        idx = self._channel_index.get(channel)
+        if idx is None:
+            if len(self._channels) >= 256:
+                raise PU2CANFDCaptureError("Too many distinct channels in capture (max 256)")
+            idx = len(self._channels)
+            self._channels.append(channel)
+            self._channel_index[channel] = idx
+        return idx
+
+    def append_raw(self, timestamp: float, arb_id: int, data: bytes,
+                   flags: int = FLAG_RX, channel: Optional[str] = None,
+                   length: Optional[int] = None) -> None:
+        """Append one frame from primitive values.
+
+        Args:
+            timestamp (float): Absolute timestamp in seconds.
+            arb_id (int): Arbitration ID (without flag bits).
+            data (bytes): Frame payload (empty for remote frames).
+            flags (int, optional): ``FLAG_*`` bitmask. Defaults to FLAG_RX.
+            channel (str, optional): Channel name. Defaults to the capture channel.
+            length (int, optional): Frame length, for remote frames whose
+                requested DLC is non-zero. Defaults to ``len(data)``.
+        """
+        self._ts.append(timestamp)
+        self._ids.append(arb_id)
+        self._len.append(len(data) if length is None else length)
+        self._flags.append(flags)
+        self._chan.append(self._chan_idx(channel))
+        self._offsets.append(len(self._data))
+        self._data += data
+
+    def append(self, msg) -> None:
+        """Append a python-can ``Message``."""
+        flags = _msg_flags(msg)
+        data = b"" if flags & FLAG_REMOTE else bytes(msg.data)
+        self.append_raw(
+            msg.timestamp,
+            msg.arbitration_id,
+            data,
+            flags,
+            getattr(msg, "channel", None),
+            msg.dlc if flags & FLAG_REMOTE else None,
+        )
+
+    def extend(self, messages) -> None:
+        """Append every message from an iterable of python-can Messages."""
+        for msg in messages:
+            self.append(msg)
+
+    def clear(self) -> None:
+        """Drop all stored frames (channel table is kept)."""
+        for col in (self._ts, self._ids, self._len, self._flags, self._chan, self._offsets):
+            del col[:]
+        del self._data[:]
+
+    # ---------------- Access ----------------
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def __bool__(self) -> bool:
+        return len(self._ts) > 0
+
+    def payload(self, index: int) -> bytes:
+        """Return the payload bytes of frame ``index``."""
+        if self._flags[index] & FLAG_REMOTE:
+            return b""
+        start = self._offsets[index]
+        return bytes(self._data[start:start + self._len[index]])
+
+    def frame(self, index: int) -> Tuple[float, int, bytes, int, str]:
+        """Return frame ``index`` as ``(timestamp, arb_id, data, flags, channel)``."""
+        return (
+            self._ts[index],
+            self._ids[index],
+            self.payload(index),
+            self._flags[index],
+            self._channels[self._chan[index]],
+        )
+
+    def frames(self) -> Iterator[Tuple[float, int, bytes, int, str]]:
+        """Iterate over frames as tuples without creating Message objects."""
+        data = self._data
+        channels = self._channels
+        for ts, arb_id, length, flags, chan, off in zip(
+                self._ts, self._ids, self._len, self._flags, self._chan, self._offsets):
+            payload = b"" if flags & FLAG_REMOTE else bytes(data[off:off + length])
+            yield ts, arb_id, payload, flags, channels[chan]
+
+    def to_message(self, index: int):
+        """Materialise frame ``index`` as a python-can ``Message``."""
+        _ensure_python_can()
+        import can
+        ts, arb_id, data, flags, channel = self.frame(index)
+        return can.Message(
+            timestamp=ts,
+            arbitration_id=arb_id,
+            data=data,
+            dlc=self._len[index],
+            is_extended_id=bool(flags & FLAG_EXTENDED),
+            is_remote_frame=bool(flags & FLAG_REMOTE),
+            is_error_frame=bool(flags & FLAG_ERROR),
+            is_fd=bool(flags & FLAG_FD),
+            bitrate_switch=bool(flags & FLAG_BRS),
+            error_state_indicator=bool(flags & FLAG_ESI),
+            is_rx=bool(flags & FLAG_RX),
+            channel=channel,
+        )
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("capture index out of range")
+        return self.to_message(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.to_message(i)
+
+    @property
+    def arbitration_ids(self) -> array:
+        """Arbitration ID column (read-only view by convention)."""
+        return self._ids
+
+    @property
+    def timestamps(self) -> array:
+        """Timestamp column in absolute seconds."""
+        return self._ts
+
+    def unique_ids(self) -> List[int]:
+        """Return the sorted list of distinct arbitration IDs."""
+        return sorted(set(self._ids))
+
+    @property
+    def duration(self) -> float:
+        """Time between first and last frame in seconds."""
+        if len(self._ts) < 2:
+            return 0.0
+        return self._ts[-1] - self._ts[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the column buffers in bytes."""
+        cols = (self._ts, self._ids, self._len, self._flags, self._chan, self._offsets)
+        return sum(c.itemsize * len(c) for c in cols) + len(self._data)
+
+    # ---------------- Statistics ----------------
+
+    def stats(self, bitrate: Optional[int] = None,
+              dbitrate: Optional[int] = None,
+              window_s: Optional[float] = None) -> Dict[str, Any]:
+        """Compute capture statistics in a single pass over the columns.
+
+        Per-ID period and jitter use Welford's running variance over the
+        inter-arrival times, so no intermediate lists are built.
+
+        Args:
+            bitrate (int, optional): Nominal bitrate. When given, the bus
+                load is estimated from nominal frame lengths (stuff bits
+                not included).
+            dbitrate (int, optional): CAN FD data bitrate for BRS frames.
+            window_s (float, optional): Observation window for the bus
+                load and frame rate. Defaults to the capture duration.
+
+        Returns:
+            Dict[str, Any]: ``total_frames``, ``duration``, ``frames_per_second``,
+            ``unique_ids``, ``error_frames``, ``bus_load`` (0.0-1.0 or None)
+            and ``per_id`` mapping each ID to ``count``, ``period_s``,
+            ``jitter_s`` (std-dev), ``min_period_s``, ``max_period_s``,
+            ``first_ts``, ``last_ts``.
+        """
+        # id -> [count, first, last, mean_dt, m2_dt, min_dt, max_dt]
+        per: Dict[int, List[float]] = {}
+        total_bits = 0.0
+        error_frames = 0
+        compute_load = bool(bitrate)
+
+        for ts, arb_id, length, flags in zip(self._ts, self._ids, self._len, self._flags):
+            if flags & FLAG_ERROR:
+                error_frames += 1
+            if compute_load:
+                total_bits += _frame_bits(flags, length, bitrate, dbitrate)
+            rec = per.get(arb_id)
+            if rec is None:
+                per[arb_id] = [1, ts, ts, 0.0, 0.0, math.inf, 0.0]
+                continue
+            dt = ts - rec[2]
+            n = rec[0]  # number of intervals after this one == n
+            delta = dt - rec[3]
+            rec[3] += delta / n
+            rec[4] += delta * (dt - rec[3])
+            if dt < rec[5]:
+                rec[5] = dt
+            if dt > rec[6]:
+                rec[6] = dt
+            rec[0] = n + 1
+            rec[2] = ts
+
+        duration = window_s if window_s is not None else self.duration
+        per_id: Dict[int, Dict[str, Any]] = {}
+        for arb_id in sorted(per):
+            count, first, last, mean_dt, m2, min_dt, max_dt = per[arb_id]
+            intervals = count - 1
+            per_id[arb_id] = {
+                "count": int(count),
+                "period_s": mean_dt if intervals else None,
+                "jitter_s": math.sqrt(m2 / intervals) if intervals else None,
+                "min_period_s": min_dt if intervals else None,
+                "max_period_s": max_dt if intervals else None,
+                "first_ts": first,
+                "last_ts": last,
+            }
+
+        total = len(self)
+        bus_load = None
+        if compute_load and duration > 0:
+            bus_load = total_bits / (duration * bitrate)
+
+        return {
+            "total_frames": total,
+            "duration": duration,
+            "frames_per_second": total / duration if duration > 0 else 0,
+            "unique_ids": list(per_id),
+            "error_frames": error_frames,
+            "bus_load": bus_load,
+            "per_id": per_id,
+        }
+
+    def log_summary(self, stats: Optional[Dict[str, Any]] = None) -> None:
+        """Write a per-ID summary table to the active logger."""
+        logger = get_active_logger()
+        if not logger:
+            return
+        if stats is None:
+            stats = self.stats()
+        logger.info(f"  Total frames captured: {stats['total_frames']}")
+        logger.info(f"  Unique IDs:            {len(stats['unique_ids'])}")
+        if stats.get("bus_load") is not None:
+            logger.info(f"  Bus load (est.):       {stats['bus_load'] * 100:.1f}%")
+        if stats.get("error_frames"):
+            logger.info(f"  Error frames:          {stats['error_frames']}")
+        for uid, rec in stats["per_id"].items():
+            line = f"    0x{uid:03X}: {rec['count']} frames"
+            if rec["period_s"] is not None:
+                line += (f"  period {rec['period_s'] * 1000:.3f} ms"
+                         f"  jitter {rec['jitter_s'] * 1000:.3f} ms")
+            logger.info(line)
+
+    # ---------------- Export ----------------
+
+    def _write_candump(self, path: Path) -> None:
+        with open(path, "w", encoding="ascii", newline="\n") as fh:
+            write = fh.write
+            for i, (ts, arb_id, data, flags, channel) in enumerate(self.frames()):
+                if flags & FLAG_EXTENDED:
+                    id_str = f"{arb_id:08X}"
+                else:
+                    id_str = f"{arb_id:03X}"
+                if flags & FLAG_ERROR:
+                    id_str = f"{arb_id | 0x20000000:08X}"
+                if flags & FLAG_FD:
+                    fd_flags = (1 if flags & FLAG_BRS else 0) | (2 if flags & FLAG_ESI else 0)
+                    body = f"{id_str}##{fd_flags:X}{data.hex().upper()}"
+                elif flags & FLAG_REMOTE:
+                    length = self._len[i]
+                    body = f"{id_str}#R{length:X}" if length else f"{id_str}#R"
+                else:
+                    body = f"{id_str}#{data.hex().upper()}"
+                write(f"({ts:.6f}) {channel} {body}\n")
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Export the capture to a log file, format chosen by suffix.
+
+        ``.log`` files are written natively in candump ``-L`` format; other
+        suffixes (``.asc``, ``.blf``, ``.csv``, ``.trc`` ...) are written
+        with python-can's ``can.Logger``.
+
+        Args:
+            path (str or Path): Output file path.
+
+        Returns:
+            Path: The written file.
+
+        Raises:
+            PU2CANFDCaptureError: If the file cannot be written.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if path.suffix.lower() == ".log":
+                self._write_candump(path)
+            else:
+                _ensure_python_can()
+                import can
+                writer = can.Logger(str(path))
+                try:
+                    for i in range(len(self)):
+                        writer.on_message_received(self.to_message(i))
+                finally:
+                    writer.stop()
+        except PU2CANFDCaptureError:
+            raise
+        except Exception as e:
+            raise PU2CANFDCaptureError(
+                f"Failed to write CAN log {path}: {type(e).__name__}: {e}"
+            )
+
+        logger = get_active_logger()
+        if logger:
+            logger.info(f"[PU2CANFD] Saved {len(self)} frames to {path}")
+        return path
+
+    # ---------------- Import / replay ----------------
+
+    @classmethod
+    def _parse_candump(cls, path: Path) -> "CANCapture":
+        cap = cls()
+        with open(path, "r", encoding="ascii", errors="replace") as fh:
+            for lineno, line in enumerate(fh, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    ts_part, channel, frame = line.split(None, 2)
+                    ts = float(ts_part.strip("()"))
+                    id_str, sep, rest = frame.partition("#")
+                    if not sep:
+                        raise ValueError("missing '#'")
+                    arb_id = int(id_str, 16)
+                    flags = FLAG_RX
+                    if len(id_str) > 3:
+                        flags |= FLAG_EXTENDED
+                    if arb_id & 0x20000000:
+                        flags |= FLAG_ERROR
+                        arb_id &= 0x1FFFFFFF
+                    length = None
+                    if rest.startswith("#"):
+                        fd_flags = int(rest[1], 16)
+                        flags |= FLAG_FD
+                        if fd_flags & 1:
+                            flags |= FLAG_BRS
+                        if fd_flags & 2:
+                            flags |= FLAG_ESI
+                        data = bytes.fromhex(rest[2:])
+                    elif rest[:1] in ("R", "r"):
+                        flags |= FLAG_REMOTE
+                        data = b""
+                        length = int(rest[1:], 16) if len(rest) > 1 else 0
+                    else:
+                        data = bytes.fromhex(rest.replace(".", ""))
+                except (ValueError, IndexError) as e:
+                    raise PU2CANFDCaptureError(
+                        f"{path}:{lineno}: malformed candump line: {line!r} ({e})"
+                    )
+                cap.append_raw(ts, arb_id, data, flags, channel, length)
+        return cap
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CANCapture":
+        """Load a capture from a log file, format chosen by suffix.
+
+        Args:
+            path (str or Path): ``.log`` (candump, parsed natively) or any
+                format readable by python-can's ``can.LogReader``.
+
+        Returns:
+            CANCapture: The loaded capture.
+
+        Raises:
+            PU2CANFDCaptureError: If the file is missing or cannot be parsed.
+        """
+        path = Path(path)
+        if not path.is_file():
+            raise PU2CANFDCaptureError(f"CAN log file not found: {path}")
+        if path.suffix.lower() == ".log":
+            return cls._parse_candump(path)
+
+        _ensure_python_can()
+        import can
+        cap = cls()
+        try:
+            for msg in can.LogReader(str(path)):
+                cap.append(msg)
+        except Exception as e:
+            raise PU2CANFDCaptureError(
+                f"Failed to read CAN log {path}: {type(e).__name__}: {e}"
+            )
+        return cap
+
+    def replay(self, bus, speed: float = 1.0,
+               id_filter: Optional[List[int]] = None,
+               skip_error_frames: bool = True) -> int:
+        """Re-transmit the captured frames on ``bus``.
+
+        Relative timing is preserved (scaled by ``speed``); absolute
+        timestamps are ignored. A ``speed`` of 0 sends back-to-back.
+
+        Args:
+            bus: python-can Bus instance.
+            speed (float, optional): Playback speed factor. Defaults to 1.0.
+            id_filter (List[int], optional): Only replay these IDs.
+            skip_error_frames (bool, optional): Do not send error frames.
+                Defaults to True.
+
+        Returns:
+            int: Number of frames transmitted.
+
+        Raises:
+            PU2CANFDCaptureError: If a frame cannot be sent.
+        """
+        if speed < 0:
+            raise PU2CANFDCaptureError(f"Replay speed must be >= 0, got {speed}")
+        _ensure_python_can()
+        import can
+
+        wanted = set(id_filter) if id_filter is not None else None
+        sent = 0
+        t0_cap = self._ts[0] if len(self) else 0.0
+        t0 = time.perf_counter()
+
+        for i, (ts, arb_id, data, flags, _channel) in enumerate(self.frames()):
+            if skip_error_frames and flags & FLAG_ERROR:
+                continue
+            if wanted is not None and arb_id not in wanted:
+                continue
+            if speed > 0:
+                delay = (ts - t0_cap) / speed - (time.perf_counter() - t0)
+                if delay > 0:
+                    time.sleep(delay)
+            msg = can.Message(
+                arbitration_id=arb_id,
+                data=data,
+                dlc=self._len[i],
+                is_extended_id=bool(flags & FLAG_EXTENDED),
+                is_remote_frame=bool(flags & FLAG_REMOTE),
+                is_fd=bool(flags & FLAG_FD),
+                bitrate_switch=bool(flags & FLAG_BRS),
+            )
+            try:
+                bus.send(msg)
+            except Exception as e:
+                raise PU2CANFDCaptureError(
+                    f"Replay failed at frame {i} (ID 0x{arb_id:X}): {type(e).__name__}: {e}"
+                )
+            sent += 1
+        return sent
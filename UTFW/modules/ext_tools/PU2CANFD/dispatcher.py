@@ -0,0 +1,319 @@
+# dispatcher.py
+"""
+UTFW PU2CANFD Dispatcher Module
+=================================
+Background CAN receive dispatcher with per-arbitration-ID queues.
+
+Without a dispatcher every helper (``receive_frame``, SDO, heartbeat)
+polls ``bus.recv`` itself and throws away frames it is not waiting for,
+so concurrent CANopen operations race each other and lose heartbeats or
+PDOs. A :class:`CANDispatcher` owns the receive side of one bus: a
+python-can ``Notifier`` thread reads every frame, stamps it with the
+local arrival time and routes it into a bounded queue for its
+arbitration ID, plus a bounded history ring of all traffic.
+
+Consumers then wait on their own queue with a predicate and deadline:
+
+    disp = get_dispatcher(bus)
+    disp.clear(0x585)
+    send_frame(bus, 0x605, request)
+    msg = disp.wait_for(0x585, lambda m: m.data[1:4] == request[1:4], timeout=1.0)
+
+Once a dispatcher is attached, ``receive_frame`` and ``bus_scan`` in the
+``can`` module read through it automatically; it is stopped by
+``close_bus``.
+
+Author: DvidMakesThings
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, List, Any, Callable, Iterable, Tuple, Union
+
+from ._base import PU2CANFDError, _ensure_python_can
+
+
+class PU2CANFDDispatcherError(PU2CANFDError):
+    """Exception raised when the receive dispatcher cannot be started or fails.
+
+    Args:
+        message (str): Description of the error that occurred.
+    """
+    pass
+
+
+DEFAULT_QUEUE_DEPTH = 256
+DEFAULT_HISTORY_DEPTH = 4096
+
+
+class CANDispatcher:
+    """Routes received frames from one bus into per-ID queues.
+
+    Args:
+        bus: python-can Bus instance. The dispatcher becomes its only reader.
+        queue_depth (int, optional): Frames kept per arbitration ID before
+            the oldest are dropped. Defaults to 256.
+        history_depth (int, optional): Frames kept in the all-traffic
+            history ring. Defaults to 4096.
+    """
+
+    def __init__(self, bus, queue_depth: int = DEFAULT_QUEUE_DEPTH,
+                 history_depth: int = DEFAULT_HISTORY_DEPTH):
+        self.bus = bus
+        self.queue_depth = queue_depth
+        self._queues: Dict[int, deque] = {}
+        self._history: deque = deque(maxlen=history_depth)
+        self._taps: List[Callable[[Any], None]] = []
+        self._cond = threading.Condition()
+        self._notifier = None
+        self._error: Optional[BaseException] = None
+        self.frames_received = 0
+        self.frames_dropped = 0
+
+    # ---------------- Lifecycle ----------------
+
+    def start(self) -> "CANDispatcher":
+        """Start the background reader (idempotent)."""
+        if self._notifier is not None:
+            return self
+        _ensure_python_can()
+        import can
+        try:
+            self._notifier = can.Notifier(self.bus, [self._on_message], timeout=0.1)
+        except Exception as e:
+            raise PU2CANFDDispatcherError(
+                f"Failed to start CAN receive dispatcher: {type(e).__name__}: {e}"
+            )
+        self._notifier.add_listener(_ErrorListener(self))
+        return self
+
+    def stop(self) -> None:
+        """Stop the background reader and wake all waiters (idempotent)."""
+        notifier, self._notifier = self._notifier, None
+        if notifier is not None:
+            try:
+                notifier.stop(timeout=1.0)
+            except Exception:
+                pass
+        with self._cond:
+            self._cond.notify_all()
+
+    @property
+    def running(self) -> bool:
+        """True while the background reader is active."""
+        return self._notifier is not None and self._error is None
+
+    # ---------------- Reader side ----------------
+
+    def _on_message(self, msg) -> None:
+        rx_time = time.monotonic()
+        with self._cond:
+            q = self._queues.get(msg.arbitration_id)
+            if q is None:
+                q = self._queues[msg.arbitration_id] = deque(maxlen=self.queue_depth)
+            if len(q) == q.maxlen:
+                self.frames_dropped += 1
+            q.append((rx_time, msg))
+            self._history.append((rx_time, msg))
+            self.frames_received += 1
+            taps = list(self._taps)
+            self._cond.notify_all()
+        for tap in taps:
+            tap(msg)
+
+    def _on_error(self, exc: BaseException) -> None:
+        with self._cond:
+            self._error = exc
+            self._cond.notify_all()
+
+    # ---------------- Consumer side ----------------
+
+    def add_tap(self, callback: Callable[[Any], None]) -> None:
+        """Call ``callback(msg)`` for every received frame (from the reader thread)."""
+        with self._cond:
+            self._taps.append(callback)
+
+    def remove_tap(self, callback: Callable[[Any], None]) -> None:
+        """Remove a callback registered with :meth:`add_tap`."""
+        with self._cond:
+            if callback in self._taps:
+                self._taps.remove(callback)
+
+    def clear(self, arb_ids: Union[None, int, Iterable[int]] = None) -> int:
+        """Discard queued frames.
+
+        Args:
+            arb_ids (int or Iterable[int], optional): IDs to clear.
+                Defaults to all queues (history is kept).
+
+        Returns:
+            int: Number of frames discarded.
+        """
+        with self._cond:
+            if arb_ids is None:
+                targets = list(self._queues.values())
+            else:
+                if isinstance(arb_ids, int):
+                    arb_ids = (arb_ids,)
+                targets = [self._queues[i] for i in arb_ids if i in self._queues]
+            dropped = sum(len(q) for q in targets)
+            for q in targets:
+                q.clear()
+        return dropped
+
+    def _take(self, ids: Optional[Tuple[int, ...]],
+              predicate: Optional[Callable[[Any], bool]],
+              since: Optional[float]):
+        """Remove and return the oldest matching frame (caller holds the lock)."""
+        if ids is None:
+            queues = self._queues.values()
+        else:
+            queues = [self._queues[i] for i in ids if i in self._queues]
+
+        best_q = best_pos = best_t = None
+        for q in queues:
+            for pos, (rx_time, msg) in enumerate(q):
+                if since is not None and rx_time < since:
+                    continue
+                if predicate is not None and not predicate(msg):
+                    continue
+                if best_t is None or rx_time < best_t:
+                    best_q, best_pos, best_t = q, pos, rx_time
+                break
+        if best_q is None:
+            return None
+        entry = best_q[best_pos]
+        del best_q[best_pos]
+        return entry[1]
+
+    def wait_for(self, arb_id: Union[None, int, Iterable[int]] = None,
+                 predicate: Optional[Callable[[Any], bool]] = None,
+                 timeout: float = 1.0,
+                 since: Optional[float] = None):
+        """Wait for and consume the oldest frame matching the criteria.
+
+        Frames that do not match stay queued for other consumers.
+
+        Args:
+            arb_id (int or Iterable[int], optional): Arbitration ID(s) to
+                wait on. Defaults to any ID.
+            predicate (Callable, optional): Extra filter ``f(msg) -> bool``.
+            timeout (float, optional): Maximum wait in seconds. Defaults to 1.0.
+            since (float, optional): Only accept frames that arrived at or
+                after this ``time.monotonic()`` value.
+
+        Returns:
+            can.Message or None: The matching frame, or None on timeout.
+
+        Raises:
+            PU2CANFDDispatcherError: If the reader thread has failed.
+        """
+        if isinstance(arb_id, int):
+            ids = (arb_id,)
+        elif arb_id is None:
+            ids = None
+        else:
+            ids = tuple(arb_id)
+        deadline = time.monotonic() + max(timeout, 0.0)
+
+        with self._cond:
+            while True:
+                msg = self._take(ids, predicate, since)
+                if msg is not None:
+                    return msg
+                if self._error is not None:
+                    raise PU2CANFDDispatcherError(
+                        f"CAN receive dispatcher stopped: "
+                        f"{type(self._error).__name__}: {self._error}"
+                    )
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._notifier is None:
+                    return None
+                self._cond.wait(remaining)
+
+    def history(self, arb_id: Optional[int] = None,
+                since: Optional[float] = None) -> List[Any]:
+        """Return a snapshot of recent traffic from the history ring.
+
+        Args:
+            arb_id (int, optional): Only frames with this ID.
+            since (float, optional): Only frames that arrived at or after
+                this ``time.monotonic()`` value.
+
+        Returns:
+            List[can.Message]: Frames in arrival order (not consumed).
+        """
+        with self._cond:
+            entries = list(self._history)
+        return [
+            msg for rx_time, msg in entries
+            if (arb_id is None or msg.arbitration_id == arb_id)
+            and (since is None or rx_time >= since)
+        ]
+
+    def pending(self, arb_id: Optional[int] = None) -> int:
+        """Return the number of queued frames (for one ID or all)."""
+        with self._cond:
+            if arb_id is not None:
+                q = self._queues.get(arb_id)
+                return len(q) if q else 0
+            return sum(len(q) for q in self._queues.values())
+
+
+class _ErrorListener:
+    """Notifier listener that forwards reader errors to the dispatcher."""
+
+    def __init__(self, dispatcher: CANDispatcher):
+        self._dispatcher = dispatcher
+
+    def __call__(self, msg) -> None:
+        pass
+
+    def on_error(self, exc: Exception) -> None:
+        self._dispatcher._on_error(exc)
+
+    def stop(self) -> None:
+        pass
+
+
+# ======================== Per-bus Registry ========================
+
+_DISPATCHERS: Dict[int, CANDispatcher] = {}
+_DISPATCHERS_LOCK = threading.Lock()
+
+
+def get_dispatcher(bus, create: bool = True,
+                   queue_depth: int = DEFAULT_QUEUE_DEPTH,
+                   history_depth: int = DEFAULT_HISTORY_DEPTH) -> Optional[CANDispatcher]:
+    """Return the dispatcher attached to ``bus``, starting one if needed.
+
+    Args:
+        bus: python-can Bus instance.
+        create (bool, optional): Start a dispatcher when none is attached.
+            Defaults to True.
+        queue_depth (int, optional): Per-ID queue depth for a new dispatcher.
+        history_depth (int, optional): History depth for a new dispatcher.
+
+    Returns:
+        CANDispatcher or None: The dispatcher, or None if ``create`` is
+        False and none is attached.
+    """
+    key = id(bus)
+    with _DISPATCHERS_LOCK:
+        disp = _DISPATCHERS.get(key)
+        if disp is not None and disp.bus is bus:
+            return disp
+        if not create:
+            return None
+        disp = CANDispatcher(bus, queue_depth, history_depth).start()
+        _DISPATCHERS[key] = disp
+        return disp
+
+
+def detach_dispatcher(bus) -> None:
+    """Stop and forget the dispatcher attached to ``bus`` (no-op if none)."""
+    with _DISPATCHERS_LOCK:
+        disp = _DISPATCHERS.pop(id(bus), None)
+    if disp is not None:
+        disp.stop()
@@ -0,0 +1,553 @@
+# od.py
+"""
+UTFW PU2CANFD Object Dictionary Module
+========================================
+EDS/DCF-driven CANopen object dictionary model.
+
+An EDS (Electronic Data Sheet) or DCF (Device Configuration File) is
+parsed once into an :class:`ObjectDictionary` indexed by (index,
+sub-index) and by parameter name. Every entry gets a precompiled codec
+(``struct.Struct`` for fixed-size types) at load time, so decoding an
+SDO response is a single ``unpack_from`` call, and writes are type- and
+range-checked against the file's ``LowLimit``/``HighLimit`` and
+``AccessType`` before anything is sent.
+
+Parsed dictionaries are cached in memory per file and on disk (JSON,
+keyed by the file's content hash) under the UTFW cache directory, so
+repeated test runs skip the INI parsing.
+
+Usage:
+    import UTFW
+    pu2canfd = UTFW.modules.ext_tools.PU2CANFD
+
+    od = pu2canfd.od.load_od("eWald.eds")
+    entry = od["Return status.Voltage"]      # or od[0x3000, 6] / od["0x3000:06"]
+    value = entry.decode(raw_bytes)
+
+    action = pu2canfd.canopen.od_read(
+        "Read voltage", "can0", node_id=5, od="eWald.eds",
+        param="Return status.Voltage"
+    )
+
+Author: DvidMakesThings
+"""
+
+import configparser
+import hashlib
+import json
+import re
+import struct
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Union, Tuple, Iterator
+
+from ....core.logger import get_active_logger
+from ....core.utilities import get_cache_dir
+from ._base import PU2CANFDError
+
+
+class PU2CANFDODError(PU2CANFDError):
+    """Exception raised for object dictionary parsing, lookup or value errors.
+
+    Args:
+        message (str): Description of the error that occurred.
+    """
+    pass
+
+
+# ======================== CANopen Data Types ========================
+
+DT_BOOLEAN = 0x0001
+DT_INTEGER8 = 0x0002
+DT_INTEGER16 = 0x0003
+DT_INTEGER32 = 0x0004
+DT_UNSIGNED8 = 0x0005
+DT_UNSIGNED16 = 0x0006
+DT_UNSIGNED32 = 0x0007
+DT_REAL32 = 0x0008
+DT_VISIBLE_STRING = 0x0009
+DT_OCTET_STRING = 0x000A
+DT_UNICODE_STRING = 0x000B
+DT_DOMAIN = 0x000F
+DT_INTEGER24 = 0x0010
+DT_REAL64 = 0x0011
+DT_INTEGER40 = 0x0012
+DT_INTEGER48 = 0x0013
+DT_INTEGER56 = 0x0014
+DT_INTEGER64 = 0x0015
+DT_UNSIGNED24 = 0x0016
+DT_UNSIGNED40 = 0x0018
+DT_UNSIGNED48 = 0x0019
+DT_UNSIGNED56 = 0x001A
+DT_UNSIGNED64 = 0x001B
+
+DATA_TYPE_NAMES = {
+    DT_BOOLEAN: "BOOLEAN",
+    DT_INTEGER8: "INTEGER8",
+    DT_INTEGER16: "INTEGER16",
+    DT_INTEGER32: "INTEGER32",
+    DT_UNSIGNED8: "UNSIGNED8",
+    DT_UNSIGNED16: "UNSIGNED16",
+    DT_UNSIGNED32: "UNSIGNED32",
+    DT_REAL32: "REAL32",
+    DT_VISIBLE_STRING: "VISIBLE_STRING",
+    DT_OCTET_STRING: "OCTET_STRING",
+    DT_UNICODE_STRING: "UNICODE_STRING",
+    DT_DOMAIN: "DOMAIN",
+    DT_INTEGER24: "INTEGER24",
+    DT_REAL64: "REAL64",
+    DT_INTEGER40: "INTEGER40",
+    DT_INTEGER48: "INTEGER48",
+    DT_INTEGER56: "INTEGER56",
+    DT_INTEGER64: "INTEGER64",
+    DT_UNSIGNED24: "UNSIGNED24",
+    DT_UNSIGNED40: "UNSIGNED40",
+    DT_UNSIGNED48: "UNSIGNED48",
+    DT_UNSIGNED56: "UNSIGNED56",
+    DT_UNSIGNED64: "UNSIGNED64",
+}
+
+# Fixed-size types with a native struct format (shared, compiled once)
+_STRUCTS: Dict[int, struct.Struct] = {
+    DT_BOOLEAN: struct.Struct('<?'),
+    DT_INTEGER8: struct.Struct('<b'),
+    DT_INTEGER16: struct.Struct('<h'),
+    DT_INTEGER32: struct.Struct('<i'),
+    DT_UNSIGNED8: struct.Struct('<B'),
+    DT_UNSIGNED16: struct.Struct('<H'),
+    DT_UNSIGNED32: struct.Struct('<I'),
+    DT_REAL32: struct.Struct('<f'),
+    DT_REAL64: struct.Struct('<d'),
+    DT_INTEGER64: struct.Struct('<q'),
+    DT_UNSIGNED64: struct.Struct('<Q'),
+}
+
+# Odd-width integers: (size in bytes, signed)
+_ODD_INTS: Dict[int, Tuple[int, bool]] = {
+    DT_INTEGER24: (3, True),
+    DT_INTEGER40: (5, True),
+    DT_INTEGER48: (6, True),
+    DT_INTEGER56: (7, True),
+    DT_UNSIGNED24: (3, False),
+    DT_UNSIGNED40: (5, False),
+    DT_UNSIGNED48: (6, False),
+    DT_UNSIGNED56: (7, False),
+}
+
+_FLOAT_TYPES = (DT_REAL32, DT_REAL64)
+_STRING_TYPES = (DT_VISIBLE_STRING, DT_UNICODE_STRING)
+_BYTES_TYPES = (DT_OCTET_STRING, DT_DOMAIN)
+
+# EDS ObjectType values
+OBJ_VAR = 0x07
+OBJ_ARRAY = 0x08
+OBJ_RECORD = 0x09
+
+_CACHE_VERSION = 1
+
+
+def _parse_int(text: Optional[str], node_id: Optional[int] = None) -> Optional[int]:
+    """Parse an EDS integer literal (decimal, 0x hex, optional $NODEID+...).
+
+    Raises:
+        PU2CANFDODError: If the literal references ``$NODEID`` and no
+            node ID is given.
+    """
+    if text is None:
+        return None
+    text = text.strip()
+    if not text:
+        return None
+    offset = 0
+    m = re.match(r'^\$NODEID\s*\+\s*(.+)$', text, re.IGNORECASE)
+    if m or text.upper() == "$NODEID":
+        if node_id is None:
+            raise PU2CANFDODError(f"'{text}' depends on $NODEID but no node ID was given")
+        if not m:
+            return node_id
+        offset, text = node_id, m.group(1)
+    return offset + int(text, 0)
+
+
+@dataclass
+class ODEntry:
+    """One object dictionary entry (a VAR or a sub-index of an ARRAY/RECORD).
+
+    ``name`` is the qualified name: ``"Parent.Sub"`` for sub-indices,
+    the plain ``ParameterName`` for top-level variables.
+    """
+    index: int
+    subindex: int
+    name: str
+    data_type: int
+    access: str = "rw"
+    default: Optional[str] = None
+    low: Optional[str] = None
+    high: Optional[str] = None
+    value: Optional[str] = None
+    pdo_mapping: bool = False
+    _codec: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._codec = _STRUCTS.get(self.data_type)
+
+    @property
+    def key(self) -> str:
+        """Canonical ``"IIII:SS"`` key."""
+        return f"{self.index:04X}:{self.subindex:02X}"
+
+    @property
+    def type_name(self) -> str:
+        return DATA_TYPE_NAMES.get(self.data_type, f"0x{self.data_type:04X}")
+
+    @property
+    def size(self) -> Optional[int]:
+        """Encoded size in bytes, or None for variable-length types."""
+        if self._codec is not None:
+            return self._codec.size
+        odd = _ODD_INTS.get(self.data_type)
+        return odd[0] if odd else None
+
+    @property
+    def readable(self) -> bool:
+        return self.access in ("ro", "rw", "rwr", "rww", "const")
+
+    @property
+    def writable(self) -> bool:
+        return self.access in ("wo", "rw", "rwr", "rww")
+
+    def _limit(self, text: Optional[str], node_id: Optional[int]):
+        if text is None or not text.strip():
+            return None
+        if self.data_type in _FLOAT_TYPES:
+            return float(text)
+        try:
+            return _parse_int(text, node_id)
+        except PU2CANFDODError as e:
+            raise PU2CANFDODError(f"{self.name} ({self.key}): limit {e}") from None
+
+    def limits(self, node_id: Optional[int] = None) -> Tuple[Any, Any]:
+        """Return ``(low, high)`` limits (None where not specified).
+
+        Raises:
+            PU2CANFDODError: If a limit uses ``$NODEID`` and ``node_id``
+                is None.
+        """
+        return self._limit(self.low, node_id), self._limit(self.high, node_id)
+
+    def decode(self, raw: bytes) -> Any:
+        """Decode raw SDO bytes into a Python value."""
+        codec = self._codec
+        if codec is not None:
+            if len(raw) < codec.size:
+                raise PU2CANFDODError(
+                    f"{self.name} ({self.key}): expected {codec.size} bytes "
+                    f"for {self.type_name}, got {len(raw)}"
+                )
+            return codec.unpack_from(raw)[0]
+        odd = _ODD_INTS.get(self.data_type)
+        if odd is not None:
+            return int.from_bytes(raw[:odd[0]], 'little', signed=odd[1])
+        if self.data_type == DT_VISIBLE_STRING:
+            return bytes(raw).rstrip(b'\x00').decode('latin-1')
+        if self.data_type == DT_UNICODE_STRING:
+            return bytes(raw).decode('utf-16-le').rstrip('\x00')
+        return bytes(raw)
+
+    def encode(self, value: Any, node_id: Optional[int] = None) -> bytes:
+        """Encode ``value`` for an SDO write, enforcing type and range limits.
+
+        Raises:
+            PU2CANFDODError: If the value has the wrong type or is out of range.
+        """
+        if self.data_type in _STRING_TYPES:
+            if not isinstance(value, str):
+                raise PU2CANFDODError(f"{self.name}: expected str, got {type(value).__name__}")
+            if self.data_type == DT_VISIBLE_STRING:
+                return value.encode('latin-1')
+            return value.encode('utf-16-le')
+        if self.data_type in _BYTES_TYPES:
+            if isinstance(value, (list, tuple)):
+                value = bytes(value)
+            if not isinstance(value, (bytes, bytearray, memoryview)):
+                raise PU2CANFDODError(f"{self.name}: expected bytes, got {type(value).__name__}")
+            return bytes(value)
+
+        if self.data_type in _FLOAT_TYPES:
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise PU2CANFDODError(f"{self.name}: expected a number, got {type(value).__name__}")
+            value = float(value)
+        elif self.data_type == DT_BOOLEAN:
+            value = bool(value)
+        else:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise PU2CANFDODError(f"{self.name}: expected int, got {type(value).__name__}")
+
+        low, high = self.limits(node_id)
+        if low is not None and value < low:
+            raise PU2CANFDODError(f"{self.name} ({self.key}): value {value} below LowLimit {low}")
+        if high is not None and value > high:
+            raise PU2CANFDODError(f"{self.name} ({self.key}): value {value} above HighLimit {high}")
+
+        try:
+            if self._codec is not None:
+                return self._codec.pack(value)
+            size, signed = _ODD_INTS[self.data_type]
+            return value.to_bytes(size, 'little', signed=signed)
+        except (struct.error, OverflowError, KeyError) as e:
+            raise PU2CANFDODError(f"{self.name} ({self.key}): cannot encode {value!r} as {self.type_name}: {e}")
+
+    def default_value(self, node_id: Optional[int] = None) -> Any:
+        """Return the DCF ``ParameterValue`` or EDS ``DefaultValue`` as a typed value."""
+        text = self.value if self.value is not None else self.default
+        if text is None:
+            return None
+        if self.data_type in _STRING_TYPES:
+            return text
+        if self.data_type in _BYTES_TYPES:
+            return bytes.fromhex(text) if text else b""
+        if self.data_type in _FLOAT_TYPES:
+            return float(text)
+        return _parse_int(text, node_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index, "subindex": self.subindex, "name": self.name,
+            "data_type": self.data_type, "access": self.access,
+            "default": self.default, "low": self.low, "high": self.high,
+            "value": self.value, "pdo_mapping": self.pdo_mapping,
+        }
+
+
+ODKey = Union[str, int, Tuple[int, int]]
+
+
+class ObjectDictionary:
+    """Indexed CANopen object dictionary.
+
+    Entries are reachable by ``(index, subindex)``, by ``"0xIIII:SS"`` /
+    ``"IIII:SS"`` strings, by qualified name (``"Parent.Sub"``) and, when
+    unambiguous, by the bare sub-entry or parameter name
+    (case-insensitive).
+
+    Args:
+        entries (List[ODEntry]): Dictionary entries.
+        node_id (int, optional): Node ID from the DCF, if any.
+        source (str, optional): Path of the file the dictionary came from.
+    """
+
+    def __init__(self, entries: List[ODEntry], node_id: Optional[int] = None,
+                 source: Optional[str] = None):
+        self.node_id = node_id
+        self.source = source
+        self._by_addr: Dict[Tuple[int, int], ODEntry] = {}
+        self._by_name: Dict[str, ODEntry] = {}
+        short_names: Dict[str, List[ODEntry]] = {}
+        for e in entries:
+            self._by_addr[(e.index, e.subindex)] = e
+            self._by_name[e.name.lower()] = e
+            if '.' in e.name:
+                short_names.setdefault(e.name.rsplit('.', 1)[-1].lower(), []).append(e)
+        # Bare sub-entry names only resolve when they are unique
+        for short, matches in short_names.items():
+            if len(matches) == 1 and short not in self._by_name:
+                self._by_name[short] = matches[0]
+
+    def __len__(self) -> int:
+        return len(self._by_addr)
+
+    def __iter__(self) -> Iterator[ODEntry]:
+        return iter(sorted(self._by_addr.values(), key=lambda e: (e.index, e.subindex)))
+
+    def __contains__(self, key: ODKey) -> bool:
+        try:
+            self[key]
+            return True
+        except PU2CANFDODError:
+            return False
+
+    def __getitem__(self, key: ODKey) -> ODEntry:
+        entry = None
+        if isinstance(key, tuple):
+            entry = self._by_addr.get((key[0], key[1]))
+        elif isinstance(key, int):
+            entry = self._by_addr.get((key, 0))
+        elif isinstance(key, str):
+            m = re.match(r'^(?:0x)?([0-9A-Fa-f]{4})(?::|sub)(?:0x)?([0-9A-Fa-f]{1,2})$', key.strip())
+            if m:
+                entry = self._by_addr.get((int(m.group(1), 16), int(m.group(2), 16)))
+            if entry is None:
+                entry = self._by_name.get(key.strip().lower())
+        if entry is None:
+            raise PU2CANFDODError(f"Object '{key}' not found in object dictionary"
+                                  f"{f' ({self.source})' if self.source else ''}")
+        return entry
+
+    def get(self, key: ODKey) -> Optional[ODEntry]:
+        try:
+            return self[key]
+        except PU2CANFDODError:
+            return None
+
+    def entries(self, index: Optional[int] = None) -> List[ODEntry]:
+        """Return all entries, or those of one index, sorted."""
+        return [e for e in self if index is None or e.index == index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": _CACHE_VERSION,
+            "node_id": self.node_id,
+            "source": self.source,
+            "entries": [e.to_dict() for e in self],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ObjectDictionary":
+        return cls([ODEntry(**e) for e in data["entries"]],
+                   node_id=data.get("node_id"), source=data.get("source"))
+
+
+# ======================== EDS / DCF Parsing ========================
+
+def parse_eds(text: str, source: Optional[str] = None) -> ObjectDictionary:
+    """Parse EDS/DCF text into an :class:`ObjectDictionary`.
+
+    Args:
+        text (str): File contents (INI format).
+        source (str, optional): Path used in error messages.
+
+    Returns:
+        ObjectDictionary: The parsed dictionary.
+
+    Raises:
+        PU2CANFDODError: If the text is not a valid EDS/DCF.
+    """
+    cp = configparser.RawConfigParser(strict=False, interpolation=None)
+    cp.optionxform = str.lower
+    try:
+        cp.read_string(text, source=source or "<eds>")
+    except configparser.Error as e:
+        raise PU2CANFDODError(f"Invalid EDS/DCF {source or ''}: {e}")
+
+    node_id = None
+    if cp.has_section("DeviceComissioning"):
+        node_id = _parse_int(cp.get("DeviceComissioning", "nodeid", fallback=None))
+
+    sections = {s.upper(): s for s in cp.sections()}
+    top = re.compile(r'^([0-9A-F]{4})$')
+    sub = re.compile(r'^([0-9A-F]{4})SUB([0-9A-F]{1,2})$')
+
+    def _entry(sec: str, index: int, subindex: int, name: str) -> ODEntry:
+        get = lambda k: cp.get(sec, k, fallback=None)  # noqa: E731
+        dt = _parse_int(get("datatype"))
+        return ODEntry(
+            index=index,
+            subindex=subindex,
+            name=name,
+            data_type=dt if dt is not None else DT_DOMAIN,
+            access=(get("accesstype") or "rw").strip().lower(),
+            default=get("defaultvalue"),
+            low=get("lowlimit"),
+            high=get("highlimit"),
+            value=get("parametervalue"),
+            pdo_mapping=(get("pdomapping") or "0").strip() in ("1", "true"),
+        )
+
+    subs_by_index: Dict[int, List[Tuple[int, str]]] = {}
+    for upper, sec in sections.items():
+        m2 = sub.match(upper)
+        if m2:
+            subs_by_index.setdefault(int(m2.group(1), 16), []).append((int(m2.group(2), 16), sec))
+
+    entries: List[ODEntry] = []
+    for upper, sec in sections.items():
+        m = top.match(upper)
+        if not m:
+            continue
+        index = int(m.group(1), 16)
+        name = cp.get(sec, "parametername", fallback=f"0x{index:04X}").strip()
+        obj_type = _parse_int(cp.get(sec, "objecttype", fallback=None)) or OBJ_VAR
+        if obj_type in (OBJ_ARRAY, OBJ_RECORD):
+            for subindex, sec2 in sorted(subs_by_index.get(index, [])):
+                sub_name = cp.get(sec2, "parametername", fallback=f"sub{subindex}").strip()
+                entries.append(_entry(sec2, index, subindex, f"{name}.{sub_name}"))
+        else:
+            entries.append(_entry(sec, index, 0, name))
+
+    if not entries:
+        raise PU2CANFDODError(f"No objects found in EDS/DCF {source or ''}")
+    return ObjectDictionary(entries, node_id=node_id, source=source)
+
+
+_OD_MEMO: Dict[str, Tuple[str, ObjectDictionary]] = {}
+_OD_MEMO_LOCK = threading.Lock()
+
+
+def load_od(path: Union[str, Path], use_cache: bool = True) -> ObjectDictionary:
+    """Load an EDS/DCF file, using the in-memory and on-disk caches.
+
+    The cache key is the SHA-256 of the file contents, so edits are picked
+    up automatically. The on-disk cache lives in
+    ``get_cache_dir("canopen_od")``.
+
+    Args:
+        path (str or Path): EDS or DCF file.
+        use_cache (bool, optional): Use and populate the caches. Defaults to True.
+
+    Returns:
+        ObjectDictionary: The parsed dictionary.
+
+    Raises:
+        PU2CANFDODError: If the file is missing or invalid.
+    """
+    path = Path(path)
+    try:
+        raw = path.read_bytes()
+    except OSError as e:
+        raise PU2CANFDODError(f"Cannot read EDS/DCF {path}: {e}")
+    digest = hashlib.sha256(raw).hexdigest()
+    memo_key = str(path.resolve())
+
+    if use_cache:
+        with _OD_MEMO_LOCK:
+            memo = _OD_MEMO.get(memo_key)
+        if memo is not None and memo[0] == digest:
+            return memo[1]
+
+    logger = get_active_logger()
+    od = None
+    cache_file = get_cache_dir("canopen_od") / f"{digest}.json" if use_cache else None
+
+    if cache_file is not None and cache_file.is_file():
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            if data.get("version") == _CACHE_VERSION:
+                od = ObjectDictionary.from_dict(data)
+                od.source = str(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            od = None
+
+    if od is None:
+        od = parse_eds(raw.decode("latin-1"), source=str(path))
+        if logger:
+            logger.info(f"[CANopen OD] Parsed {path.name}: {len(od)} entries")
+        if cache_file is not None:
+            try:
+                tmp = cache_file.with_suffix(".tmp")
+                tmp.write_text(json.dumps(od.to_dict()), encoding="utf-8")
+                tmp.replace(cache_file)
+            except OSError:
+                pass
+
+    if use_cache:
+        with _OD_MEMO_LOCK:
+            _OD_MEMO[memo_key] = (digest, od)
+    return od
+
+
+def resolve_od(od: Union[str, Path, ObjectDictionary]) -> ObjectDictionary:
+    """Accept an ObjectDictionary or a path to an EDS/DCF file."""
+    if isinstance(od, ObjectDictionary):
+        return od
+    return load_od(od)
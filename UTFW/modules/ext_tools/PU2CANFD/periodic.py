@@ -0,0 +1,442 @@
+# periodic.py
+"""
+UTFW PU2CANFD Periodic Transmit Module
+========================================
+Cyclic CAN transmission for load tests and cyclic PDO/SYNC generation.
+
+A :class:`PeriodicScheduler` drives any number of cyclic messages on one
+bus. Two backends are used:
+
+- native: python-can's ``bus.send_periodic`` when the interface does the
+  timing itself (SocketCAN broadcast manager). Cycle times are kept by
+  the kernel, so no per-frame statistics are available.
+- software: a single scheduler thread with a deadline heap. It sleeps
+  until shortly before each deadline and spins for the rest, sends, and
+  records the actual send time, so per-message period and jitter
+  statistics are available. Payloads can be mutated per cycle (rolling
+  counters, checksums) or replaced on the fly.
+
+Usage:
+    import UTFW
+    pu2canfd = UTFW.modules.ext_tools.PU2CANFD
+
+    sched = pu2canfd.periodic.PeriodicScheduler(bus)
+    sync = sched.add(0x080, b"", period_s=0.001)
+    pdo = sched.add(0x185, bytes(8), period_s=0.010,
+                    mutate=pu2canfd.periodic.counter_mutator(0))
+    sched.start()
+    ...
+    stats = sched.stop()
+
+Author: DvidMakesThings
+"""
+
+import heapq
+import math
+import threading
+import time
+from typing import Optional, Dict, List, Any, Callable, Union
+
+from ....core.logger import get_active_logger
+from ._base import PU2CANFDError, _ensure_python_can, CAN_BITRATE_500K
+from .capture import _frame_bits, FLAG_EXTENDED, FLAG_FD, FLAG_BRS
+
+
+class PU2CANFDPeriodicError(PU2CANFDError):
+    """Exception raised when cyclic transmission cannot be configured or fails.
+
+    Args:
+        message (str): Description of the error that occurred.
+    """
+    pass
+
+
+# Time before a deadline at which the scheduler stops sleeping and spins
+SPIN_THRESHOLD_S = 0.0015
+
+Mutator = Callable[[int, bytearray], Optional[bytes]]
+
+
+def counter_mutator(byte_index: int = 0, modulo: int = 256,
+                    mask: int = 0xFF) -> Mutator:
+    """Return a mutator that writes a rolling counter into one payload byte.
+
+    Args:
+        byte_index (int, optional): Byte position of the counter. Defaults to 0.
+        modulo (int, optional): Counter wrap value. Defaults to 256.
+        mask (int, optional): Bits of the byte owned by the counter
+            (e.g. 0x0F for a 4-bit alive counter). Defaults to 0xFF.
+    """
+    shift = (mask & -mask).bit_length() - 1
+
+    def _mutate(count: int, data: bytearray) -> None:
+        data[byte_index] = (data[byte_index] & ~mask & 0xFF) | (((count % modulo) << shift) & mask)
+
+    return _mutate
+
+
+class PeriodicMessage:
+    """One cyclic message and its transmit statistics.
+
+    Created by :meth:`PeriodicScheduler.add`; not instantiated directly.
+    """
+
+    def __init__(self, task_id: int, arb_id: int, data: bytes, period_s: float,
+                 is_extended: bool, is_fd: bool, bitrate_switch: bool,
+                 count: Optional[int], mutate: Optional[Mutator]):
+        self.task_id = task_id
+        self.arb_id = arb_id
+        self.period_s = period_s
+        self.is_extended = is_extended
+        self.is_fd = is_fd
+        self.bitrate_switch = bitrate_switch
+        self.limit = count
+        self.mutate = mutate
+        self.data = bytearray(data)
+        self.native_task = None
+        self.active = True
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        # statistics (software backend)
+        self.sent = 0
+        self.errors = 0
+        self.overruns = 0
+        self._last: Optional[float] = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = math.inf
+        self._max = 0.0
+        self._max_late = 0.0
+
+    def _record(self, due: float, actual: float) -> None:
+        late = actual - due
+        if late > self._max_late:
+            self._max_late = late
+        if self._last is not None:
+            dt = actual - self._last
+            n = self.sent - 1  # intervals so far, including this one
+            delta = dt - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (dt - self._mean)
+            if dt < self._min:
+                self._min = dt
+            if dt > self._max:
+                self._max = dt
+        self._last = actual
+
+    @property
+    def flags(self) -> int:
+        flags = 0
+        if self.is_extended:
+            flags |= FLAG_EXTENDED
+        if self.is_fd:
+            flags |= FLAG_FD
+        if self.bitrate_switch:
+            flags |= FLAG_BRS
+        return flags
+
+    def stats(self) -> Dict[str, Any]:
+        """Return transmit statistics for this message.
+
+        With the native backend nothing is measured: ``sent`` is the count
+        expected from the elapsed time and ``measured`` is False.
+        """
+        intervals = self.sent - 1
+        native = self.native_task is not None
+        sent = self.sent
+        if native and self.started_at is not None:
+            end = self.stopped_at or time.perf_counter()
+            sent = int((end - self.started_at) / self.period_s)
+        return {
+            "arb_id": self.arb_id,
+            "period_s": self.period_s,
+            "backend": "native" if native else "software",
+            "measured": not native,
+            "sent": sent,
+            "errors": self.errors,
+            "overruns": self.overruns,
+            "mean_period_s": self._mean if intervals > 0 else None,
+            "jitter_s": math.sqrt(self._m2 / intervals) if intervals > 0 else None,
+            "min_period_s": self._min if intervals > 0 else None,
+            "max_period_s": self._max if intervals > 0 else None,
+            "max_late_s": self._max_late if not native else None,
+        }
+
+
+class PeriodicScheduler:
+    """Runs many cyclic CAN messages on one bus.
+
+    Args:
+        bus: python-can Bus instance.
+        mode (str, optional): "auto" (native where the interface schedules
+            in hardware/kernel and no mutation is needed, software
+            otherwise), "native" or "software". Defaults to "auto".
+        bitrate (int, optional): Nominal bitrate for bus-load estimates.
+        dbitrate (int, optional): CAN FD data bitrate for BRS frames.
+    """
+
+    def __init__(self, bus, mode: str = "auto",
+                 bitrate: int = CAN_BITRATE_500K,
+                 dbitrate: Optional[int] = None):
+        if mode not in ("auto", "native", "software"):
+            raise PU2CANFDPeriodicError(f"Unknown periodic mode '{mode}'")
+        self.bus = bus
+        self.mode = mode
+        self.bitrate = bitrate
+        self.dbitrate = dbitrate
+        self._messages: Dict[int, PeriodicMessage] = {}
+        self._heap: List = []
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._next_id = 1
+        self._seq = 0
+
+    # ---------------- Configuration ----------------
+
+    def _native_supported(self) -> bool:
+        # SocketCAN uses the kernel broadcast manager; other interfaces
+        # fall back to one python thread per task inside python-can.
+        return type(self.bus).__name__.lower().startswith("socketcan")
+
+    def add(self, arb_id: int, data: Union[bytes, List[int]], period_s: float,
+            is_extended: bool = False, is_fd: bool = False,
+            bitrate_switch: bool = False, count: Optional[int] = None,
+            mutate: Optional[Mutator] = None) -> PeriodicMessage:
+        """Add a cyclic message (started immediately if the scheduler runs).
+
+        Args:
+            arb_id (int): Arbitration ID.
+            data (bytes or List[int]): Initial payload.
+            period_s (float): Cycle time in seconds.
+            is_extended (bool, optional): 29-bit ID. Defaults to False.
+            is_fd (bool, optional): CAN FD frame. Defaults to False.
+            bitrate_switch (bool, optional): CAN FD BRS. Defaults to False.
+            count (int, optional): Stop after this many frames (software only).
+            mutate (Callable, optional): ``f(cycle, payload_bytearray)`` called
+                before each send; may modify the payload in place or return
+                new bytes. Forces the software backend.
+
+        Returns:
+            PeriodicMessage: Handle for updates and statistics.
+        """
+        if period_s <= 0:
+            raise PU2CANFDPeriodicError(f"Period must be > 0, got {period_s}")
+        with self._cond:
+            msg = PeriodicMessage(self._next_id, arb_id, bytes(data), period_s,
+                                  is_extended, is_fd, bitrate_switch, count, mutate)
+            self._next_id += 1
+            self._messages[msg.task_id] = msg
+            if self._running:
+                self._start_message(msg, time.perf_counter())
+        return msg
+
+    def add_load(self, target_load: float, arb_id: int = 0x7FF,
+                 length: int = 8, is_extended: bool = False) -> Optional[PeriodicMessage]:
+        """Add a filler message that raises the estimated bus load to a target.
+
+        The filler period is derived from the frame size and the load of
+        the messages already configured. A low-priority ID is used so the
+        filler loses arbitration against real traffic.
+
+        Args:
+            target_load (float): Desired total bus load (0.0-1.0).
+            arb_id (int, optional): Filler arbitration ID. Defaults to 0x7FF.
+            length (int, optional): Filler payload length. Defaults to 8.
+            is_extended (bool, optional): 29-bit filler ID. Defaults to False.
+
+        Returns:
+            PeriodicMessage or None: The filler, or None if the configured
+            messages already reach the target.
+        """
+        if not 0.0 < target_load < 1.0:
+            raise PU2CANFDPeriodicError(
+                f"Target bus load must be between 0 and 1, got {target_load}"
+            )
+        missing = target_load - self.bus_load()
+        if missing <= 0:
+            return None
+        bits = _frame_bits(FLAG_EXTENDED if is_extended else 0, length,
+                           self.bitrate, self.dbitrate)
+        period_s = bits / (missing * self.bitrate)
+        return self.add(arb_id, bytes(length), period_s, is_extended=is_extended)
+
+    def update(self, msg: PeriodicMessage, data: Union[bytes, List[int]]) -> None:
+        """Replace the payload of a running message."""
+        data = bytes(data)
+        with self._cond:
+            msg.data[:] = data
+            if msg.native_task is not None:
+                msg.native_task.modify_data(self._build(msg))
+
+    def remove(self, msg: PeriodicMessage) -> None:
+        """Stop and remove one message."""
+        with self._cond:
+            self._stop_message(msg)
+            self._messages.pop(msg.task_id, None)
+
+    # ---------------- Lifecycle ----------------
+
+    def _build(self, msg: PeriodicMessage):
+        import can
+        return can.Message(arbitration_id=msg.arb_id, data=bytes(msg.data),
+                           is_extended_id=msg.is_extended, is_fd=msg.is_fd,
+                           bitrate_switch=msg.bitrate_switch)
+
+    def _use_native(self, msg: PeriodicMessage) -> bool:
+        if msg.mutate is not None or msg.limit is not None:
+            return False
+        if self.mode == "native":
+            return True
+        return self.mode == "auto" and self._native_supported()
+
+    def _start_message(self, msg: PeriodicMessage, now: float) -> None:
+        msg.started_at = now
+        if self._use_native(msg):
+            try:
+                msg.native_task = self.bus.send_periodic(self._build(msg), msg.period_s)
+                return
+            except Exception as e:
+                if self.mode == "native":
+                    raise PU2CANFDPeriodicError(
+                        f"Native periodic send failed for 0x{msg.arb_id:X}: {type(e).__name__}: {e}"
+                    )
+        self._seq += 1
+        heapq.heappush(self._heap, (now, self._seq, msg))
+        self._ensure_thread()
+        self._cond.notify_all()
+
+    def _stop_message(self, msg: PeriodicMessage) -> None:
+        if not msg.active:
+            return
+        msg.active = False
+        msg.stopped_at = time.perf_counter()
+        if msg.native_task is not None:
+            try:
+                msg.native_task.stop()
+            except Exception:
+                pass
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="can-periodic", daemon=True)
+            self._thread.start()
+
+    def start(self) -> "PeriodicScheduler":
+        """Start all configured messages (idempotent)."""
+        _ensure_python_can()
+        with self._cond:
+            if self._running:
+                return self
+            self._running = True
+            now = time.perf_counter()
+            for msg in self._messages.values():
+                if msg.active:
+                    self._start_message(msg, now)
+        return self
+
+    def stop(self) -> Dict[int, Dict[str, Any]]:
+        """Stop all messages and return their statistics keyed by task id."""
+        with self._cond:
+            self._running = False
+            for msg in self._messages.values():
+                self._stop_message(msg)
+            self._heap.clear()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        return self.stats()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ---------------- Software backend ----------------
+
+    def _run(self) -> None:
+        bus = self.bus
+        import can
+        while True:
+            with self._cond:
+                while self._running and not self._heap:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                due, _seq, msg = self._heap[0]
+                wait = due - time.perf_counter() - SPIN_THRESHOLD_S
+                if wait > 0:
+                    # Woken early when messages are added/removed
+                    self._cond.wait(wait)
+                    continue
+                heapq.heappop(self._heap)
+                if not msg.active:
+                    continue
+
+            while time.perf_counter() < due:
+                pass
+
+            cycle = msg.sent
+            if msg.mutate is not None:
+                replaced = msg.mutate(cycle, msg.data)
+                if replaced is not None:
+                    msg.data[:] = replaced
+            frame = can.Message(arbitration_id=msg.arb_id, data=bytes(msg.data),
+                                is_extended_id=msg.is_extended, is_fd=msg.is_fd,
+                                bitrate_switch=msg.bitrate_switch)
+            try:
+                bus.send(frame, timeout=msg.period_s)
+                actual = time.perf_counter()
+                msg.sent += 1
+                msg._record(due, actual)
+            except Exception:
+                actual = time.perf_counter()
+                msg.errors += 1
+
+            next_due = due + msg.period_s
+            if actual - next_due > msg.period_s:
+                # Fell more than a full cycle behind: resynchronise instead
+                # of bursting the backlog onto the bus
+                missed = int((actual - next_due) / msg.period_s)
+                msg.overruns += missed
+                next_due += missed * msg.period_s
+
+            with self._cond:
+                if msg.limit is not None and msg.sent >= msg.limit:
+                    self._stop_message(msg)
+                elif msg.active and self._running:
+                    self._seq += 1
+                    heapq.heappush(self._heap, (next_due, self._seq, msg))
+
+    # ---------------- Reporting ----------------
+
+    def stats(self) -> Dict[int, Dict[str, Any]]:
+        """Return per-message statistics keyed by task id."""
+        with self._cond:
+            return {tid: m.stats() for tid, m in self._messages.items()}
+
+    def bus_load(self) -> float:
+        """Estimated bus load (0.0-1.0) from configured periods and frame sizes."""
+        with self._cond:
+            bits_per_s = sum(
+                _frame_bits(m.flags, len(m.data), self.bitrate, self.dbitrate) / m.period_s
+                for m in self._messages.values() if m.active
+            )
+        return bits_per_s / self.bitrate
+
+    def log_summary(self) -> None:
+        """Write per-message statistics to the active logger."""
+        logger = get_active_logger()
+        if not logger:
+            return
+        for st in self.stats().values():
+            approx = "" if st["measured"] else "~"
+            line = (f"    0x{st['arb_id']:03X}: {approx}{st['sent']} frames @ "
+                    f"{st['period_s'] * 1000:.3f} ms ({st['backend']})")
+            if st["jitter_s"] is not None:
+                line += (f"  mean {st['mean_period_s'] * 1000:.3f} ms"
+                         f"  jitter {st['jitter_s'] * 1e6:.1f} us"
+                         f"  max late {st['max_late_s'] * 1e6:.1f} us")
+            if st["overruns"] or st["errors"]:
+                line += f"  overruns {st['overruns']}  errors {st['errors']}"
+            logger.info(line)
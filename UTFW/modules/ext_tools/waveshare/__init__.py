@@ -15,6 +15,10 @@ This package exposes seven protocol sub-modules accessible as:
     waveshare.swd.scan(...)             # SWD transport (convenience)
     waveshare.gpio.get_pins(...)
     waveshare.eeprom.read(...)
+    waveshare.sim.use_simulator()       # In-memory CH347 (no hardware)
+    waveshare.openocd_rpc.OpenOCDSession  # Persistent OpenOCD RPC session
+    waveshare.memory.verify_image(...)  # Binary target memory engine
+    waveshare.flash_cache.flash_image_cached(...)  # Skip/differential flashing
 
 Each sub-module provides:
 - Core communication functions for direct use
@@ -26,6 +30,11 @@ from the package level:
     waveshare.find_devices()
     waveshare.get_device_info(port)
 
+The SPI/I2C/GPIO/EEPROM modules talk to the CH347 through a selectable
+backend ("dll" on Windows, "linux" for the ch34x_pis driver, "sim" for
+the in-memory simulator), chosen by ``UTFW_CH347_BACKEND`` or:
+    waveshare.set_backend("sim")
+
 Author: DvidMakesThings
 """
 
@@ -53,6 +62,12 @@ from ._base import (
     OPENOCD_SWD_CFG,
     OPENOCD_SCRIPTS,
 )
+from ._backend import (
+    CH347Backend,
+    get_backend,
+    set_backend,
+    BACKEND_ENV_VAR,
+)
 
 __all__ = [
     # Sub-modules (lazy loaded)
@@ -63,6 +78,10 @@ __all__ = [
     "swd",
     "gpio",
     "eeprom",
+    "sim",
+    "openocd_rpc",
+    "memory",
+    "flash_cache",
 
     # Base exception
     "WaveshareError",
@@ -75,6 +94,12 @@ __all__ = [
     "get_current_mode_by_pid",
     "ensure_mode",
 
+    # CH347 backend selection
+    "CH347Backend",
+    "get_backend",
+    "set_backend",
+    "BACKEND_ENV_VAR",
+
     # Constants
     "CH347_VID",
     "CH347T_PID",
@@ -90,6 +115,7 @@ __all__ = [
 
 def __getattr__(name):  # pragma: no cover - simple delegation
     """Lazy-load protocol sub-modules on first access."""
-    if name in ("uart", "i2c", "spi", "jtag", "swd", "gpio", "eeprom"):
+    if name in ("uart", "i2c", "spi", "jtag", "swd", "gpio", "eeprom", "sim",
+                "openocd_rpc", "memory", "flash_cache"):
         return importlib.import_module(f"{__name__}.{name}")
     raise AttributeError(f"module {__name__} has no attribute {name}")
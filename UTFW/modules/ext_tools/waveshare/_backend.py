@@ -0,0 +1,195 @@
+# _backend.py
+"""
+UTFW Waveshare Adapter - CH347 Backend Selection
+=================================================
+Hardware-abstraction layer between the protocol modules (SPI, I2C, GPIO,
+EEPROM) and the CH347 driver that actually moves the bytes.
+
+The public functions in ``_dll`` (``open_device``, ``spi_write_read``,
+``i2c_stream``, ``gpio_get``, ``eeprom_read`` ...) delegate to the active
+backend, so the protocol modules do not care which one is in use:
+
+- ``dll``:   WCH CH347DLL / CH347DLLA64.DLL through ctypes (Windows)
+- ``linux``: WCH ``ch34x_pis`` kernel driver and its ``libch347.so``
+             userspace library (Linux)
+- ``sim``:   In-memory simulator with SPI flash, I2C EEPROM/register
+             models and GPIO (any platform, see the ``sim`` module)
+
+The backend is chosen on first use from the ``UTFW_CH347_BACKEND``
+environment variable, falling back to ``dll`` on Windows and ``linux``
+elsewhere. Tests can switch explicitly:
+
+    waveshare.set_backend("sim")
+    waveshare.set_backend(waveshare.sim.CH347Simulator())
+
+Author: DvidMakesThings
+"""
+
+import os
+import platform
+import threading
+from typing import Optional, List, Tuple, Union
+
+BACKEND_ENV_VAR = "UTFW_CH347_BACKEND"
+
+BACKEND_NAMES = ("dll", "linux", "sim")
+
+
+class CH347Backend:
+    """Interface implemented by every CH347 backend.
+
+    Devices are addressed by index (0-15), exactly as with the vendor DLL.
+    Transfer methods raise ``OSError`` on failure, which the protocol
+    modules translate into their own exception types.
+    """
+
+    name = "abstract"
+
+    def is_available(self) -> bool:
+        """Return True if the backend can be used on this host."""
+        raise NotImplementedError
+
+    def describe(self) -> str:
+        """Return a short human-readable backend description for logs."""
+        return self.name
+
+    # -- Device management --
+
+    def enumerate_devices(self) -> List[dict]:
+        raise NotImplementedError
+
+    def open_device(self, index: int) -> int:
+        raise NotImplementedError
+
+    def close_device(self, index: int) -> None:
+        raise NotImplementedError
+
+    # -- SPI --
+
+    def spi_init(self, index: int, mode: int, clock: int, byte_order: int,
+                 cs: int, auto_deassert_cs: bool) -> bool:
+        raise NotImplementedError
+
+    def spi_set_frequency(self, index: int, freq_hz: int) -> bool:
+        raise NotImplementedError
+
+    def spi_set_databits(self, index: int, bits_16: bool) -> bool:
+        raise NotImplementedError
+
+    def spi_write_read(self, index: int, data: bytes, chip_select: int) -> bytes:
+        raise NotImplementedError
+
+    def spi_write_read_into(self, index: int, buf, chip_select: int) -> None:
+        """Full-duplex transfer in place: MOSI from ``buf``, MISO back into it."""
+        buf[:] = self.spi_write_read(index, bytes(buf), chip_select)
+
+    def spi_stream4(self, index: int, data: bytes, chip_select: int) -> bytes:
+        return self.spi_write_read(index, data, chip_select)
+
+    def spi_write(self, index: int, data: bytes, chip_select: int,
+                  write_step: int) -> bool:
+        raise NotImplementedError
+
+    def spi_read(self, index: int, cmd_bytes: bytes, read_length: int,
+                 chip_select: int) -> bytes:
+        raise NotImplementedError
+
+    # -- I2C --
+
+    def i2c_set(self, index: int, mode: int) -> bool:
+        raise NotImplementedError
+
+    def i2c_set_stretch(self, index: int, enable: bool) -> bool:
+        raise NotImplementedError
+
+    def i2c_set_delay(self, index: int, delay_ms: int) -> bool:
+        raise NotImplementedError
+
+    def i2c_stream(self, index: int, write_data: bytes, read_length: int) -> bytes:
+        raise NotImplementedError
+
+    def i2c_probe(self, index: int, address: int) -> bool:
+        """Return True if a 7-bit address ACKs a zero-length write."""
+        try:
+            self.i2c_stream(index, bytes([(address << 1) & 0xFE]), 0)
+            return True
+        except OSError:
+            return False
+
+    # -- GPIO --
+
+    def gpio_get(self, index: int) -> Tuple[int, int]:
+        raise NotImplementedError
+
+    def gpio_set(self, index: int, enable_mask: int, direction: int, data: int) -> bool:
+        raise NotImplementedError
+
+    # -- EEPROM --
+
+    def eeprom_read(self, index: int, eeprom_type: int, addr: int, length: int) -> bytes:
+        raise NotImplementedError
+
+    def eeprom_write(self, index: int, eeprom_type: int, addr: int, data: bytes) -> bool:
+        raise NotImplementedError
+
+
+# ======================== Active Backend ========================
+
+_backend: Optional[CH347Backend] = None
+_backend_lock = threading.Lock()
+
+
+def default_backend_name() -> str:
+    """Return the backend name used when none was selected explicitly."""
+    name = os.environ.get(BACKEND_ENV_VAR, "").strip().lower()
+    if name:
+        return name
+    return "dll" if platform.system() == "Windows" else "linux"
+
+
+def create_backend(name: str) -> CH347Backend:
+    """Instantiate a backend by name ("dll", "linux" or "sim").
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    name = name.strip().lower()
+    if name == "dll":
+        from ._dll import CH347DLLBackend
+        return CH347DLLBackend()
+    if name == "linux":
+        from ._dll import CH347LinuxBackend
+        return CH347LinuxBackend()
+    if name == "sim":
+        from .sim import CH347Simulator
+        return CH347Simulator()
+    raise ValueError(
+        f"Unknown CH347 backend '{name}' (expected one of: {', '.join(BACKEND_NAMES)})"
+    )
+
+
+def get_backend() -> CH347Backend:
+    """Return the active backend, creating the default one on first use."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_backend(default_backend_name())
+        return _backend
+
+
+def set_backend(backend: Union[None, str, CH347Backend]) -> Optional[CH347Backend]:
+    """Select the backend used by all Waveshare protocol modules.
+
+    Args:
+        backend: Backend instance, backend name, or None to go back to the
+            default selection on next use.
+
+    Returns:
+        CH347Backend or None: The newly active backend.
+    """
+    global _backend
+    if isinstance(backend, str):
+        backend = create_backend(backend)
+    with _backend_lock:
+        _backend = backend
+    return backend
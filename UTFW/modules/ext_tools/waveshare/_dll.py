@@ -1,32 +1,38 @@
 # _dll.py
 """
-UTFW Waveshare Adapter - CH347 DLL Wrapper (Windows)
-=====================================================
-Low-level ctypes bindings for the WCH CH347 vendor DLL.
+UTFW Waveshare Adapter - CH347 DLL Wrapper
+===========================================
+Low-level ctypes bindings for the WCH CH347 vendor libraries.
 
-This module loads CH347DLLA64.DLL (64-bit) or CH347DLL.DLL (32-bit)
-from the system path and exposes the C API as typed Python functions.
-All higher-level modules (SPI, I2C, GPIO, EEPROM) call through this layer.
+On Windows this loads CH347DLLA64.DLL (64-bit) or CH347DLL.DLL (32-bit)
+from the system path; on Linux it loads ``libch347.so`` shipped with the
+WCH ``ch34x_pis`` kernel driver. Both are wrapped as CH347 backends
+(see ``_backend``), and the module-level functions below forward to the
+active backend. All higher-level modules (SPI, I2C, GPIO, EEPROM) call
+through this layer, so they also run against the in-memory simulator.
 
 Reference: CH347DLL_EN.H  V1.5
 Author: DvidMakesThings (auto-generated from vendor header)
 """
 
 import ctypes
+import ctypes.util
 import ctypes.wintypes as wt
+import glob
 import platform
 import struct as _struct
-from typing import Optional, List, Tuple
+from typing import Optional, Dict, List, Tuple
 
 from ....core.logger import get_active_logger
+from ._backend import CH347Backend, get_backend
 
 # --------------------------- DLL Loading ---------------------------
 
-_dll: Optional[ctypes.WinDLL] = None
+_dll: Optional["ctypes.WinDLL"] = None
 _dll_load_error: Optional[str] = None
 
 
-def _load_dll() -> ctypes.WinDLL:
+def _load_dll() -> "ctypes.WinDLL":
     """Load the CH347 vendor DLL, auto-detecting architecture."""
     global _dll, _dll_load_error
     if _dll is not None:
@@ -53,19 +59,50 @@ def _load_dll() -> ctypes.WinDLL:
 
 
 def is_available() -> bool:
-    """Return True if the CH347 DLL can be loaded on this platform."""
-    try:
-        _load_dll()
-        return True
-    except OSError:
-        return False
+    """Return True if the active CH347 backend can be used on this host."""
+    return get_backend().is_available()
 
 
-def get_dll() -> ctypes.WinDLL:
-    """Return the loaded DLL handle, raising OSError if unavailable."""
+def get_dll() -> "ctypes.WinDLL":
+    """Return the loaded Windows DLL handle, raising OSError if unavailable."""
     return _load_dll()
 
 
+# Linux: WCH ch34x_pis kernel driver + userspace library
+LINUX_LIB_NAMES = ("libch347.so", "libch347.so.1")
+LINUX_DEVICE_PATTERN = "/dev/ch34x_pis{index}"
+
+_linux_lib: Optional[ctypes.CDLL] = None
+
+
+def _load_linux_lib() -> ctypes.CDLL:
+    """Load the WCH CH347 Linux userspace library."""
+    global _linux_lib
+    if _linux_lib is not None:
+        return _linux_lib
+
+    candidates = list(LINUX_LIB_NAMES)
+    found = ctypes.util.find_library("ch347")
+    if found:
+        candidates.insert(0, found)
+
+    errors = []
+    for name in candidates:
+        try:
+            lib = ctypes.CDLL(name)
+        except OSError as exc:
+            errors.append(str(exc))
+            continue
+        _setup_linux_prototypes(lib)
+        _linux_lib = lib
+        return lib
+
+    raise OSError(
+        "Cannot load libch347.so: " + "; ".join(errors) + ". "
+        "Install the WCH ch34x_pis driver and library from http://wch.cn"
+    )
+
+
 # ----------------------- Packed Structures -------------------------
 
 class SpiConfig(ctypes.Structure):
@@ -77,13 +114,15 @@ class SpiConfig(ctypes.Structure):
         ("iByteOrder", ctypes.c_ubyte),        # 0=LSB, 1=MSB
         ("iSpiWriteReadInterval", ctypes.c_ushort),  # us
         ("iSpiOutDefaultData", ctypes.c_ubyte),      # MOSI default (reads)
-        ("iChipSelect", ctypes.c_ulong),       # bit7 enables CS control
+        ("iChipSelect", ctypes.c_uint32),      # bit7 enables CS control
         ("CS1Polarity", ctypes.c_ubyte),       # 0=active-low, 1=active-high
         ("CS2Polarity", ctypes.c_ubyte),       # 0=active-low, 1=active-high
         ("iIsAutoDeativeCS", ctypes.c_ushort), # auto-deassert CS after op
         ("iActiveDelay", ctypes.c_ushort),     # us delay after CS assert
-        ("iDelayDeactive", ctypes.c_ulong),    # us delay after CS deassert
+        ("iDelayDeactive", ctypes.c_uint32),   # us delay after CS deassert
     ]
+    # ULONG fields are declared as c_uint32 so the layout is also right
+    # for the LP64 Linux library (c_ulong is 64-bit there).
 
 
 class DeviceInfo(ctypes.Structure):
@@ -127,6 +166,25 @@ EEPROM_24C1024 = 10
 EEPROM_24C2048 = 11
 EEPROM_24C4096 = 12
 
+# EEPROM geometry: type -> (size in bytes, page size, address bytes).
+# Types up to 24C16 carry the upper address bits in the device address;
+# 24C1024 and larger do the same above 64 KB.
+EEPROM_GEOMETRY = {
+    EEPROM_24C01: (128, 8, 1),
+    EEPROM_24C02: (256, 8, 1),
+    EEPROM_24C04: (512, 16, 1),
+    EEPROM_24C08: (1024, 16, 1),
+    EEPROM_24C16: (2048, 16, 1),
+    EEPROM_24C32: (4096, 32, 2),
+    EEPROM_24C64: (8192, 32, 2),
+    EEPROM_24C128: (16384, 64, 2),
+    EEPROM_24C256: (32768, 64, 2),
+    EEPROM_24C512: (65536, 128, 2),
+    EEPROM_24C1024: (131072, 256, 2),
+    EEPROM_24C2048: (262144, 256, 2),
+    EEPROM_24C4096: (524288, 256, 2),
+}
+
 # Chip type constants
 CHIP_TYPE_CH341 = 0
 CHIP_TYPE_CH347T = 1
@@ -144,7 +202,7 @@ INVALID_HANDLE_VALUE = wt.HANDLE(-1).value
 
 # --------------------- Prototype Declarations ---------------------
 
-def _setup_prototypes(dll: ctypes.WinDLL):
+def _setup_prototypes(dll: "ctypes.WinDLL"):
     """Declare argument/return types for every DLL entry we use."""
 
     # -- Common --
@@ -288,43 +346,436 @@ def _setup_prototypes(dll: ctypes.WinDLL):
     dll.CH347Jtag_ByteReadIR.restype = wt.BOOL
 
 
+def _setup_linux_prototypes(lib: ctypes.CDLL):
+    """Declare argument/return types for the Linux libch347 entries we use.
+
+    The Linux API works on file descriptors and its SPI transfer calls take
+    explicit ``ignoreCS`` / chip-select arguments.
+    """
+    fd = ctypes.c_int
+
+    lib.CH347OpenDevice.argtypes = [ctypes.c_char_p]
+    lib.CH347OpenDevice.restype = ctypes.c_int
+
+    lib.CH347CloseDevice.argtypes = [fd]
+    lib.CH347CloseDevice.restype = ctypes.c_bool
+
+    # -- SPI --
+    lib.CH347SPI_Init.argtypes = [fd, ctypes.POINTER(SpiConfig)]
+    lib.CH347SPI_Init.restype = ctypes.c_bool
+
+    lib.CH347SPI_SetFrequency.argtypes = [fd, ctypes.c_uint32]
+    lib.CH347SPI_SetFrequency.restype = ctypes.c_bool
+
+    lib.CH347SPI_SetDataBits.argtypes = [fd, ctypes.c_uint8]
+    lib.CH347SPI_SetDataBits.restype = ctypes.c_bool
+
+    lib.CH347SPI_Write.argtypes = [
+        fd, ctypes.c_bool, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_void_p,
+    ]
+    lib.CH347SPI_Write.restype = ctypes.c_bool
+
+    lib.CH347SPI_Read.argtypes = [
+        fd, ctypes.c_bool, ctypes.c_int, ctypes.c_int,
+        ctypes.POINTER(ctypes.c_uint32), ctypes.c_void_p,
+    ]
+    lib.CH347SPI_Read.restype = ctypes.c_bool
+
+    lib.CH347SPI_WriteRead.argtypes = [
+        fd, ctypes.c_bool, ctypes.c_int, ctypes.c_int, ctypes.c_void_p,
+    ]
+    lib.CH347SPI_WriteRead.restype = ctypes.c_bool
+
+    lib.CH347StreamSPI4.argtypes = [
+        fd, ctypes.c_bool, ctypes.c_int, ctypes.c_int, ctypes.c_void_p,
+    ]
+    lib.CH347StreamSPI4.restype = ctypes.c_bool
+
+    # -- I2C --
+    lib.CH347I2C_Set.argtypes = [fd, ctypes.c_int]
+    lib.CH347I2C_Set.restype = ctypes.c_bool
+
+    lib.CH347I2C_SetStretch.argtypes = [fd, ctypes.c_bool]
+    lib.CH347I2C_SetStretch.restype = ctypes.c_bool
+
+    lib.CH347I2C_SetDelaymS.argtypes = [fd, ctypes.c_int]
+    lib.CH347I2C_SetDelaymS.restype = ctypes.c_bool
+
+    lib.CH347StreamI2C.argtypes = [
+        fd, ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p,
+    ]
+    lib.CH347StreamI2C.restype = ctypes.c_bool
+
+    # -- GPIO --
+    lib.CH347GPIO_Get.argtypes = [
+        fd, ctypes.POINTER(ctypes.c_ubyte), ctypes.POINTER(ctypes.c_ubyte),
+    ]
+    lib.CH347GPIO_Get.restype = ctypes.c_bool
+
+    lib.CH347GPIO_Set.argtypes = [fd, ctypes.c_ubyte, ctypes.c_ubyte, ctypes.c_ubyte]
+    lib.CH347GPIO_Set.restype = ctypes.c_bool
+
+    # -- EEPROM --
+    lib.CH347ReadEEPROM.argtypes = [
+        fd, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_ubyte),
+    ]
+    lib.CH347ReadEEPROM.restype = ctypes.c_bool
+
+    lib.CH347WriteEEPROM.argtypes = [
+        fd, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_ubyte),
+    ]
+    lib.CH347WriteEEPROM.restype = ctypes.c_bool
+
+
+def _spi_config(mode: int, clock: int, byte_order: int, cs: int,
+                auto_deassert_cs: bool) -> SpiConfig:
+    """Build the mSpiCfgS structure used by CH347SPI_Init."""
+    cfg = SpiConfig()
+    cfg.iMode = mode & 0x03
+    cfg.iClock = clock & 0x07
+    cfg.iByteOrder = byte_order & 0x01
+    cfg.iSpiWriteReadInterval = 0
+    cfg.iSpiOutDefaultData = 0xFF
+    cfg.iChipSelect = (cs & 0x01) | 0x80  # bit7=1 enables CS control
+    cfg.CS1Polarity = 0  # active-low
+    cfg.CS2Polarity = 0
+    cfg.iIsAutoDeativeCS = 1 if auto_deassert_cs else 0
+    cfg.iActiveDelay = 0
+    cfg.iDelayDeactive = 0
+    return cfg
+
+
+# ----------------------- Buffer Helpers ---------------------------
+# Build ctypes views with one memcpy (from_buffer_copy) or none
+# (from_buffer) instead of unpacking every byte into (c_ubyte * n)(*data).
+
+def _c_copy(data) -> ctypes.Array:
+    """Return a ctypes byte array holding a copy of *data*."""
+    n = len(data)
+    if n == 0:
+        return (ctypes.c_ubyte * 1)()
+    return (ctypes.c_ubyte * n).from_buffer_copy(data)
+
+
+def _c_view(buf) -> ctypes.Array:
+    """Return a ctypes byte array sharing memory with a writable buffer."""
+    n = len(buf)
+    if n == 0:
+        return (ctypes.c_ubyte * 1)()
+    return (ctypes.c_ubyte * n).from_buffer(buf)
+
+
+def _read_buffer(cmd_bytes: bytes, read_length: int) -> bytearray:
+    """Return ``cmd_bytes`` followed by ``read_length`` 0xFF filler bytes."""
+    buf = bytearray(cmd_bytes)
+    buf += b"\xFF" * read_length
+    return buf
+
+
+# ------------------------- DLL Backend ----------------------------
+
+class CH347DLLBackend(CH347Backend):
+    """CH347 backend on the WCH vendor DLL (Windows).
+
+    Devices are addressed by index; the DLL keeps the handles internally.
+    """
+
+    name = "dll"
+
+    def _lib(self):
+        return _load_dll()
+
+    def _handle(self, index: int):
+        return index
+
+    def is_available(self) -> bool:
+        try:
+            self._lib()
+            return True
+        except OSError:
+            return False
+
+    def describe(self) -> str:
+        return "CH347 vendor DLL (Windows)"
+
+    # -- Device management --
+
+    def enumerate_devices(self) -> List[dict]:
+        dll = self._lib()
+        devices = []
+        info = DeviceInfo()
+
+        for idx in range(16):
+            handle = dll.CH347OpenDevice(idx)
+            if handle == INVALID_HANDLE_VALUE:
+                continue
+            try:
+                if dll.CH347GetDeviceInfor(idx, ctypes.byref(info)):
+                    chip_type = dll.CH347GetChipType(idx)
+                    devices.append({
+                        "index": idx,
+                        "chip_type": chip_type,
+                        "chip_mode": info.ChipMode,
+                        "func_type": info.FuncType,
+                        "device_id": info.DeviceID.decode("utf-8", errors="replace").strip("\x00"),
+                        "usb_speed": ["FS", "HS", "SS"][info.UsbSpeedType] if info.UsbSpeedType < 3 else "?",
+                        "firmware_ver": info.FirewareVer,
+                        "func_desc": info.FuncDescStr.decode("utf-8", errors="replace").strip("\x00"),
+                        "product": info.ProductString.decode("utf-8", errors="replace").strip("\x00"),
+                        "manufacturer": info.ManufacturerString.decode("utf-8", errors="replace").strip("\x00"),
+                        "if_num": info.CH347IfNum,
+                    })
+            finally:
+                dll.CH347CloseDevice(idx)
+
+        return devices
+
+    def open_device(self, index: int) -> int:
+        dll = self._lib()
+        handle = dll.CH347OpenDevice(index)
+        if handle == INVALID_HANDLE_VALUE:
+            raise OSError(f"CH347OpenDevice({index}) failed - device not found or busy")
+        dll.CH347SetTimeout(index, 500, 500)
+        return index
+
+    def close_device(self, index: int) -> None:
+        try:
+            self._lib().CH347CloseDevice(index)
+        except OSError:
+            pass
+
+    # -- SPI --
+
+    def spi_init(self, index: int, mode: int, clock: int, byte_order: int,
+                 cs: int, auto_deassert_cs: bool) -> bool:
+        cfg = _spi_config(mode, clock, byte_order, cs, auto_deassert_cs)
+        return bool(self._lib().CH347SPI_Init(self._handle(index), ctypes.byref(cfg)))
+
+    def spi_set_frequency(self, index: int, freq_hz: int) -> bool:
+        return bool(self._lib().CH347SPI_SetFrequency(self._handle(index), freq_hz))
+
+    def spi_set_databits(self, index: int, bits_16: bool) -> bool:
+        return bool(self._lib().CH347SPI_SetDataBits(self._handle(index), 1 if bits_16 else 0))
+
+    def _spi_duplex(self, func: str, index: int, chip_select: int, buf) -> None:
+        """Run an in-place full-duplex DLL call on a writable buffer."""
+        ok = getattr(self._lib(), func)(index, chip_select, len(buf), _c_view(buf))
+        if not ok:
+            raise OSError(f"{func} failed")
+
+    def spi_write_read_into(self, index: int, buf, chip_select: int) -> None:
+        self._spi_duplex("CH347SPI_WriteRead", index, chip_select, buf)
+
+    def spi_write_read(self, index: int, data: bytes, chip_select: int) -> bytes:
+        buf = bytearray(data)
+        self._spi_duplex("CH347SPI_WriteRead", index, chip_select, buf)
+        return bytes(buf)
+
+    def spi_stream4(self, index: int, data: bytes, chip_select: int) -> bytes:
+        buf = bytearray(data)
+        self._spi_duplex("CH347StreamSPI4", index, chip_select, buf)
+        return bytes(buf)
+
+    def spi_write(self, index: int, data: bytes, chip_select: int,
+                  write_step: int) -> bool:
+        ok = self._lib().CH347SPI_Write(index, chip_select, len(data), write_step, _c_copy(data))
+        if not ok:
+            raise OSError("CH347SPI_Write failed")
+        return True
+
+    def spi_read(self, index: int, cmd_bytes: bytes, read_length: int,
+                 chip_select: int) -> bytes:
+        buf = _read_buffer(cmd_bytes, read_length)
+        in_len = ctypes.c_ulong(read_length)
+        ok = self._lib().CH347SPI_Read(index, chip_select, len(cmd_bytes),
+                                       ctypes.byref(in_len), _c_view(buf))
+        if not ok:
+            raise OSError("CH347SPI_Read failed")
+        return bytes(memoryview(buf)[:in_len.value])
+
+    # -- I2C --
+
+    def i2c_set(self, index: int, mode: int) -> bool:
+        return bool(self._lib().CH347I2C_Set(self._handle(index), mode & 0x03))
+
+    def i2c_set_stretch(self, index: int, enable: bool) -> bool:
+        return bool(self._lib().CH347I2C_SetStretch(self._handle(index), 1 if enable else 0))
+
+    def i2c_set_delay(self, index: int, delay_ms: int) -> bool:
+        return bool(self._lib().CH347I2C_SetDelaymS(self._handle(index), delay_ms))
+
+    def i2c_stream(self, index: int, write_data: bytes, read_length: int) -> bytes:
+        w_len = len(write_data)
+        w_buf = _c_copy(write_data)
+        r_buf = bytearray(read_length) if read_length > 0 else None
+
+        ok = self._lib().CH347StreamI2C(self._handle(index), w_len, w_buf, read_length,
+                                        _c_view(r_buf) if r_buf is not None else None)
+        if not ok:
+            raise OSError("CH347StreamI2C failed")
+
+        return bytes(r_buf) if r_buf is not None else b""
+
+    # -- GPIO --
+
+    def gpio_get(self, index: int) -> Tuple[int, int]:
+        dir_byte = ctypes.c_ubyte(0)
+        data_byte = ctypes.c_ubyte(0)
+        ok = self._lib().CH347GPIO_Get(self._handle(index), ctypes.byref(dir_byte),
+                                       ctypes.byref(data_byte))
+        if not ok:
+            raise OSError("CH347GPIO_Get failed")
+        return dir_byte.value, data_byte.value
+
+    def gpio_set(self, index: int, enable_mask: int, direction: int, data: int) -> bool:
+        ok = self._lib().CH347GPIO_Set(self._handle(index), enable_mask & 0xFF,
+                                       direction & 0xFF, data & 0xFF)
+        if not ok:
+            raise OSError("CH347GPIO_Set failed")
+        return True
+
+    # -- EEPROM --
+
+    def eeprom_read(self, index: int, eeprom_type: int, addr: int, length: int) -> bytes:
+        buf = bytearray(length)
+        ok = self._lib().CH347ReadEEPROM(self._handle(index), eeprom_type, addr, length,
+                                         _c_view(buf))
+        if not ok:
+            raise OSError("CH347ReadEEPROM failed")
+        return bytes(buf)
+
+    def eeprom_write(self, index: int, eeprom_type: int, addr: int, data: bytes) -> bool:
+        ok = self._lib().CH347WriteEEPROM(self._handle(index), eeprom_type, addr, len(data),
+                                          _c_copy(data))
+        if not ok:
+            raise OSError("CH347WriteEEPROM failed")
+        return True
+
+
+# ------------------------ Linux Backend ---------------------------
+
+class CH347LinuxBackend(CH347DLLBackend):
+    """CH347 backend on the WCH Linux driver (``ch34x_pis``) and ``libch347.so``.
+
+    The kernel driver exposes one ``/dev/ch34x_pisN`` node per SPI/I2C/GPIO
+    interface; the userspace library mirrors the Windows DLL API but works
+    on file descriptors, and its SPI calls take an explicit chip select.
+    Device *index* N maps to ``/dev/ch34x_pisN``.
+    """
+
+    name = "linux"
+
+    def __init__(self):
+        self._fds: Dict[int, int] = {}
+        self._chip_selects: Dict[int, int] = {}
+
+    def _lib(self):
+        return _load_linux_lib()
+
+    def _handle(self, index: int) -> int:
+        fd = self._fds.get(index)
+        if fd is None:
+            raise OSError(f"CH347 device {index} is not open")
+        return fd
+
+    def describe(self) -> str:
+        return f"CH347 Linux driver ({LINUX_DEVICE_PATTERN.format(index='N')})"
+
+    # -- Device management --
+
+    def enumerate_devices(self) -> List[dict]:
+        devices = []
+        prefix = LINUX_DEVICE_PATTERN.format(index="")
+        for path in sorted(glob.glob(prefix + "*")):
+            suffix = path[len(prefix):]
+            if not suffix.isdigit():
+                continue
+            devices.append({
+                "index": int(suffix),
+                "chip_type": None,
+                "chip_mode": None,
+                "func_type": CH347_FUNC_SPI_IIC,
+                "device_id": path,
+                "usb_speed": "?",
+                "firmware_ver": None,
+                "func_desc": "SPI/I2C/GPIO",
+                "product": "CH347",
+                "manufacturer": "WCH",
+                "if_num": None,
+            })
+        return devices
+
+    def open_device(self, index: int) -> int:
+        if index in self._fds:
+            return index
+        path = LINUX_DEVICE_PATTERN.format(index=index)
+        fd = self._lib().CH347OpenDevice(path.encode())
+        if fd < 0:
+            raise OSError(f"CH347OpenDevice({path}) failed - device not found or busy")
+        self._fds[index] = fd
+        return index
+
+    def close_device(self, index: int) -> None:
+        fd = self._fds.pop(index, None)
+        if fd is None:
+            return
+        try:
+            self._lib().CH347CloseDevice(fd)
+        except OSError:
+            pass
+
+    # -- SPI (explicit ignoreCS / chip-select arguments) --
+
+    def spi_init(self, index: int, mode: int, clock: int, byte_order: int,
+                 cs: int, auto_deassert_cs: bool) -> bool:
+        self._chip_selects[index] = cs & 0x01
+        return super().spi_init(index, mode, clock, byte_order, cs, auto_deassert_cs)
+
+    def _cs_args(self, index: int, chip_select: int) -> Tuple[bool, int]:
+        # DLL convention: bit7 set = drive CS as configured by spi_init
+        ignore_cs = not (chip_select & 0x80)
+        return ignore_cs, self._chip_selects.get(index, 0)
+
+    def _spi_duplex(self, func: str, index: int, chip_select: int, buf) -> None:
+        ignore_cs, cs = self._cs_args(index, chip_select)
+        ok = getattr(self._lib(), func)(self._handle(index), ignore_cs, cs, len(buf),
+                                        _c_view(buf))
+        if not ok:
+            raise OSError(f"{func} failed")
+
+    def spi_write(self, index: int, data: bytes, chip_select: int,
+                  write_step: int) -> bool:
+        ignore_cs, cs = self._cs_args(index, chip_select)
+        ok = self._lib().CH347SPI_Write(self._handle(index), ignore_cs, cs, len(data),
+                                        write_step, _c_copy(data))
+        if not ok:
+            raise OSError("CH347SPI_Write failed")
+        return True
+
+    def spi_read(self, index: int, cmd_bytes: bytes, read_length: int,
+                 chip_select: int) -> bytes:
+        ignore_cs, cs = self._cs_args(index, chip_select)
+        buf = _read_buffer(cmd_bytes, read_length)
+        in_len = ctypes.c_uint32(read_length)
+        ok = self._lib().CH347SPI_Read(self._handle(index), ignore_cs, cs, len(cmd_bytes),
+                                       ctypes.byref(in_len), _c_view(buf))
+        if not ok:
+            raise OSError("CH347SPI_Read failed")
+        return bytes(memoryview(buf)[:in_len.value])
+
+
 # ------------------- Device Management Helpers --------------------
+# Public entry points used by the protocol modules. Each call goes to the
+# active backend (see _backend.get_backend / set_backend).
 
 def enumerate_devices() -> List[dict]:
-    """Enumerate all CH347 devices visible through the vendor driver.
+    """Enumerate all CH347 devices visible through the active backend.
 
     Returns a list of dicts with keys:
         index, chip_type, chip_mode, func_type, device_id,
         usb_speed, firmware_ver, func_desc, product, manufacturer
     """
-    dll = get_dll()
-    devices = []
-    info = DeviceInfo()
-
-    for idx in range(16):
-        handle = dll.CH347OpenDevice(idx)
-        if handle == INVALID_HANDLE_VALUE:
-            continue
-        try:
-            if dll.CH347GetDeviceInfor(idx, ctypes.byref(info)):
-                chip_type = dll.CH347GetChipType(idx)
-                devices.append({
-                    "index": idx,
-                    "chip_type": chip_type,
-                    "chip_mode": info.ChipMode,
-                    "func_type": info.FuncType,
-                    "device_id": info.DeviceID.decode("utf-8", errors="replace").strip("\x00"),
-                    "usb_speed": ["FS", "HS", "SS"][info.UsbSpeedType] if info.UsbSpeedType < 3 else "?",
-                    "firmware_ver": info.FirewareVer,
-                    "func_desc": info.FuncDescStr.decode("utf-8", errors="replace").strip("\x00"),
-                    "product": info.ProductString.decode("utf-8", errors="replace").strip("\x00"),
-                    "manufacturer": info.ManufacturerString.decode("utf-8", errors="replace").strip("\x00"),
-                    "if_num": info.CH347IfNum,
-                })
-        finally:
-            dll.CH347CloseDevice(idx)
-
-    return devices
+    return get_backend().enumerate_devices()
 
 
 def open_device(index: int) -> int:
@@ -332,21 +783,12 @@ def open_device(index: int) -> int:
 
     Raises OSError if the device cannot be opened.
     """
-    dll = get_dll()
-    handle = dll.CH347OpenDevice(index)
-    if handle == INVALID_HANDLE_VALUE:
-        raise OSError(f"CH347OpenDevice({index}) failed - device not found or busy")
-    dll.CH347SetTimeout(index, 500, 500)
-    return index
+    return get_backend().open_device(index)
 
 
 def close_device(index: int) -> None:
     """Close a previously opened CH347 device."""
-    try:
-        dll = get_dll()
-        dll.CH347CloseDevice(index)
-    except OSError:
-        pass
+    get_backend().close_device(index)
 
 
 # ------------------------ SPI Primitives --------------------------
@@ -367,32 +809,17 @@ def spi_init(index: int, mode: int = 0, clock: int = 1,
     Returns:
         True on success.
     """
-    dll = get_dll()
-    cfg = SpiConfig()
-    cfg.iMode = mode & 0x03
-    cfg.iClock = clock & 0x07
-    cfg.iByteOrder = byte_order & 0x01
-    cfg.iSpiWriteReadInterval = 0
-    cfg.iSpiOutDefaultData = 0xFF
-    cfg.iChipSelect = (cs & 0x01) | 0x80  # bit7=1 enables CS control
-    cfg.CS1Polarity = 0  # active-low
-    cfg.CS2Polarity = 0
-    cfg.iIsAutoDeativeCS = 1 if auto_deassert_cs else 0
-    cfg.iActiveDelay = 0
-    cfg.iDelayDeactive = 0
-    return bool(dll.CH347SPI_Init(index, ctypes.byref(cfg)))
+    return get_backend().spi_init(index, mode, clock, byte_order, cs, auto_deassert_cs)
 
 
 def spi_set_frequency(index: int, freq_hz: int) -> bool:
     """Set SPI clock frequency in Hz. Call spi_init() again after this."""
-    dll = get_dll()
-    return bool(dll.CH347SPI_SetFrequency(index, freq_hz))
+    return get_backend().spi_set_frequency(index, freq_hz)
 
 
 def spi_set_databits(index: int, bits_16: bool = False) -> bool:
     """Set SPI data width (8 or 16 bit). CH347F only for 16-bit."""
-    dll = get_dll()
-    return bool(dll.CH347SPI_SetDataBits(index, 1 if bits_16 else 0))
+    return get_backend().spi_set_databits(index, bits_16)
 
 
 def spi_write_read(index: int, data: bytes, chip_select: int = 0x80) -> bytes:
@@ -409,36 +836,33 @@ def spi_write_read(index: int, data: bytes, chip_select: int = 0x80) -> bytes:
     Returns:
         Received bytes from MISO.
     """
-    dll = get_dll()
-    length = len(data)
-    buf = (ctypes.c_ubyte * length)(*data)
-    ok = dll.CH347SPI_WriteRead(index, chip_select, length, buf)
-    if not ok:
-        raise OSError("CH347SPI_WriteRead failed")
-    return bytes(buf)
+    return get_backend().spi_write_read(index, data, chip_select)
+
+
+def spi_write_read_into(index: int, buf, chip_select: int = 0x80) -> None:
+    """In-place full-duplex SPI transfer on a writable buffer.
+
+    MOSI bytes are taken from *buf* and replaced by the MISO bytes without
+    intermediate copies (``bytearray`` or a writable ``memoryview`` slice
+    of one), which is what chunked bulk transfers use.
+
+    Args:
+        index: Device index.
+        buf: Writable buffer holding the bytes to clock out.
+        chip_select: CS control byte (0x80 = use CS per init config).
+    """
+    get_backend().spi_write_read_into(index, buf, chip_select)
 
 
 def spi_stream4(index: int, data: bytes, chip_select: int = 0x80) -> bytes:
     """Full-duplex SPI4 stream via CH347StreamSPI4."""
-    dll = get_dll()
-    length = len(data)
-    buf = (ctypes.c_ubyte * length)(*data)
-    ok = dll.CH347StreamSPI4(index, chip_select, length, buf)
-    if not ok:
-        raise OSError("CH347StreamSPI4 failed")
-    return bytes(buf)
+    return get_backend().spi_stream4(index, data, chip_select)
 
 
 def spi_write(index: int, data: bytes, chip_select: int = 0x80,
               write_step: int = 512) -> bool:
     """SPI write-only via CH347SPI_Write (TX data, ignore MISO)."""
-    dll = get_dll()
-    length = len(data)
-    buf = (ctypes.c_ubyte * length)(*data)
-    ok = dll.CH347SPI_Write(index, chip_select, length, write_step, buf)
-    if not ok:
-        raise OSError("CH347SPI_Write failed")
-    return True
+    return get_backend().spi_write(index, data, chip_select, write_step)
 
 
 def spi_read(index: int, cmd_bytes: bytes, read_length: int,
@@ -454,15 +878,7 @@ def spi_read(index: int, cmd_bytes: bytes, read_length: int,
     Returns:
         Read data bytes.
     """
-    dll = get_dll()
-    total = len(cmd_bytes) + read_length
-    buf = (ctypes.c_ubyte * total)(*cmd_bytes, *([0xFF] * read_length))
-    out_len = ctypes.c_ulong(len(cmd_bytes))
-    in_len = ctypes.c_ulong(read_length)
-    ok = dll.CH347SPI_Read(index, chip_select, out_len.value, ctypes.byref(in_len), buf)
-    if not ok:
-        raise OSError("CH347SPI_Read failed")
-    return bytes(buf[:in_len.value])
+    return get_backend().spi_read(index, cmd_bytes, read_length, chip_select)
 
 
 # ------------------------ I2C Primitives --------------------------
@@ -472,20 +888,17 @@ def i2c_set(index: int, mode: int = 1) -> bool:
 
     mode bits 1-0: 00=20KHz, 01=100KHz, 10=400KHz, 11=750KHz
     """
-    dll = get_dll()
-    return bool(dll.CH347I2C_Set(index, mode & 0x03))
+    return get_backend().i2c_set(index, mode & 0x03)
 
 
 def i2c_set_stretch(index: int, enable: bool = True) -> bool:
     """Enable/disable I2C clock stretching."""
-    dll = get_dll()
-    return bool(dll.CH347I2C_SetStretch(index, 1 if enable else 0))
+    return get_backend().i2c_set_stretch(index, enable)
 
 
 def i2c_set_delay(index: int, delay_ms: int) -> bool:
     """Set I2C inter-operation delay in milliseconds."""
-    dll = get_dll()
-    return bool(dll.CH347I2C_SetDelaymS(index, delay_ms))
+    return get_backend().i2c_set_delay(index, delay_ms)
 
 
 def i2c_stream(index: int, write_data: bytes,
@@ -503,20 +916,12 @@ def i2c_stream(index: int, write_data: bytes,
     Returns:
         Read data bytes (empty if read_length == 0).
     """
-    dll = get_dll()
-    w_len = len(write_data)
-    w_buf = (ctypes.c_ubyte * max(w_len, 1))(*write_data)
-
-    if read_length > 0:
-        r_buf = (ctypes.c_ubyte * read_length)()
-    else:
-        r_buf = None
+    return get_backend().i2c_stream(index, write_data, read_length)
 
-    ok = dll.CH347StreamI2C(index, w_len, w_buf, read_length, r_buf)
-    if not ok:
-        raise OSError("CH347StreamI2C failed")
 
-    return bytes(r_buf) if r_buf is not None else b""
+def i2c_probe(index: int, address: int) -> bool:
+    """Return True if the 7-bit *address* ACKs an address-only write."""
+    return get_backend().i2c_probe(index, address)
 
 
 # ------------------------ GPIO Primitives -------------------------
@@ -529,13 +934,7 @@ def gpio_get(index: int) -> Tuple[int, int]:
         direction: 0 = input, 1 = output.
         data: 0 = low, 1 = high.
     """
-    dll = get_dll()
-    dir_byte = ctypes.c_ubyte(0)
-    data_byte = ctypes.c_ubyte(0)
-    ok = dll.CH347GPIO_Get(index, ctypes.byref(dir_byte), ctypes.byref(data_byte))
-    if not ok:
-        raise OSError("CH347GPIO_Get failed")
-    return dir_byte.value, data_byte.value
+    return get_backend().gpio_get(index)
 
 
 def gpio_set(index: int, enable_mask: int, direction: int, data: int) -> bool:
@@ -550,11 +949,7 @@ def gpio_set(index: int, enable_mask: int, direction: int, data: int) -> bool:
     Returns:
         True on success.
     """
-    dll = get_dll()
-    ok = dll.CH347GPIO_Set(index, enable_mask & 0xFF, direction & 0xFF, data & 0xFF)
-    if not ok:
-        raise OSError("CH347GPIO_Set failed")
-    return True
+    return get_backend().gpio_set(index, enable_mask, direction, data)
 
 
 # ------------------------ EEPROM Primitives -----------------------
@@ -571,12 +966,7 @@ def eeprom_read(index: int, eeprom_type: int, addr: int, length: int) -> bytes:
     Returns:
         Read data bytes.
     """
-    dll = get_dll()
-    buf = (ctypes.c_ubyte * length)()
-    ok = dll.CH347ReadEEPROM(index, eeprom_type, addr, length, buf)
-    if not ok:
-        raise OSError("CH347ReadEEPROM failed")
-    return bytes(buf)
+    return get_backend().eeprom_read(index, eeprom_type, addr, length)
 
 
 def eeprom_write(index: int, eeprom_type: int, addr: int, data: bytes) -> bool:
@@ -591,10 +981,4 @@ def eeprom_write(index: int, eeprom_type: int, addr: int, data: bytes) -> bool:
     Returns:
         True on success.
     """
-    dll = get_dll()
-    length = len(data)
-    buf = (ctypes.c_ubyte * length)(*data)
-    ok = dll.CH347WriteEEPROM(index, eeprom_type, addr, length, buf)
-    if not ok:
-        raise OSError("CH347WriteEEPROM failed")
-    return True
+    return get_backend().eeprom_write(index, eeprom_type, addr, data)
@@ -21,13 +21,21 @@ Usage:
         dev_index=0, eeprom_type=waveshare.eeprom.TYPE_24C256,
         addr=0x0000, length=256)
 
+    # Differential programming: only pages that differ are written
+    action = waveshare.eeprom.program_image("Program config",
+        dev_index=0, eeprom_type=waveshare.eeprom.TYPE_24C256,
+        input_path="config.bin")
+
 Author: DvidMakesThings
 """
 
-from typing import Optional
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
 
 from ....core.logger import get_active_logger
-from ....core.core import TestAction
+from ....core.core import TestAction, get_active_framework
 from ._base import WaveshareError, _format_hex_dump
 from . import _dll
 
@@ -166,6 +174,7 @@ def _write_eeprom(dev_index: int, eeprom_type: int, addr: int,
             logger.info(f"    {line}")
         logger.info("")
 
+    clear_image_cache(dev_index)
     with _EEPROMDevice(dev_index):
         try:
             _dll.eeprom_write(dev_index, eeprom_type, addr, data)
@@ -233,6 +242,291 @@ def _verify_eeprom(dev_index: int, eeprom_type: int, addr: int,
     return True
 
 
+# ======================== Page-Aware Image Programming ========================
+
+# Maximum self-timed write cycle (tWR) per type, from common 24Cxx datasheets.
+# Used as the ACK-polling budget, not as a fixed delay.
+WRITE_CYCLE_S = {
+    TYPE_24C01: 0.005,
+    TYPE_24C02: 0.005,
+    TYPE_24C04: 0.005,
+    TYPE_24C08: 0.005,
+    TYPE_24C16: 0.005,
+    TYPE_24C32: 0.005,
+    TYPE_24C64: 0.005,
+    TYPE_24C128: 0.005,
+    TYPE_24C256: 0.005,
+    TYPE_24C512: 0.005,
+    TYPE_24C1024: 0.005,
+    TYPE_24C2048: 0.010,
+    TYPE_24C4096: 0.010,
+}
+
+# Polling budget = tWR * factor, so slow parts and USB latency do not
+# turn into spurious timeouts.
+ACK_POLL_FACTOR = 4
+
+# Framework resource holding {(dev_index, eeprom_type, base_address, addr,
+# length): SHA-256} for content written and verified by EEPROMImage during
+# the running test.
+_CACHE_RESOURCE_KEY = "waveshare-eeprom-image-cache"
+
+
+def _image_cache(create: bool = False) -> Optional[Dict[Tuple[int, int, int, int, int], str]]:
+    """Return the active test's image checksum cache (None outside a test)."""
+    fw = get_active_framework()
+    if fw is None:
+        return None
+    cache = fw.get_resource(_CACHE_RESOURCE_KEY)
+    if cache is None and create:
+        cache = fw.register_resource(_CACHE_RESOURCE_KEY, {}, lambda c: c.clear())
+    return cache
+
+
+def clear_image_cache(dev_index: Optional[int] = None) -> None:
+    """Forget cached image checksums (all devices when ``dev_index`` is None).
+
+    Call this when the EEPROM may have been changed behind the framework's
+    back, e.g. by the DUT firmware or after swapping the board.
+    """
+    cache = _image_cache()
+    if not cache:
+        return
+    if dev_index is None:
+        cache.clear()
+        return
+    for key in [k for k in cache if k[0] == dev_index]:
+        del cache[key]
+
+
+def _forget_overlapping(cache: Dict[Tuple[int, int, int, int, int], str],
+                        dev_index: int, addr: int, length: int) -> None:
+    """Drop cached images of ``dev_index`` that overlap ``[addr, addr + length)``."""
+    end = addr + length
+    for key in [k for k in cache
+                if k[0] == dev_index and k[3] < end and addr < k[3] + k[4]]:
+        del cache[key]
+
+
+def _geometry(eeprom_type: int) -> Tuple[int, int, int]:
+    try:
+        return _dll.EEPROM_GEOMETRY[eeprom_type]
+    except KeyError:
+        raise WaveshareEEPROMError(f"Unknown EEPROM type {eeprom_type}") from None
+
+
+class EEPROMImage:
+    """Page-aware image programmer for one 24Cxx EEPROM.
+
+    ``program`` reads the current content once, diffs it against the
+    target image page by page, writes only the dirty pages with raw I2C
+    page writes (ACK polling instead of fixed delays) and reads back only
+    those pages. Images already written and verified during the running
+    test are recognised by checksum and skipped without touching the bus;
+    programming any range drops the cached images it overlaps.
+
+    Args:
+        dev_index: CH347 device index.
+        eeprom_type: EEPROM type constant (TYPE_24C01 ... TYPE_24C4096).
+        base_address: 7-bit device address of the first block.
+        write_cycle_s: tWR override (defaults to ``WRITE_CYCLE_S``).
+    """
+
+    def __init__(self, dev_index: int, eeprom_type: int, base_address: int = 0x50,
+                 write_cycle_s: Optional[float] = None):
+        self.dev_index = dev_index
+        self.eeprom_type = eeprom_type
+        self.size, self.page_size, self.addr_bytes = _geometry(eeprom_type)
+        self.base_address = base_address
+        self.write_cycle_s = (write_cycle_s if write_cycle_s is not None
+                              else WRITE_CYCLE_S.get(eeprom_type, 0.010))
+
+    # -- Addressing --
+
+    def _target(self, addr: int) -> Tuple[int, bytes]:
+        """Return (7-bit device address, memory address bytes) for ``addr``."""
+        if self.addr_bytes == 1:
+            dev_addr = self.base_address | ((addr >> 8) & 0x07)
+            offset = addr & 0xFF
+        else:
+            dev_addr = self.base_address | ((addr >> 16) & 0x07)
+            offset = addr & 0xFFFF
+        return dev_addr, offset.to_bytes(self.addr_bytes, "big")
+
+    def _check_range(self, addr: int, length: int) -> None:
+        if addr < 0 or length < 0 or addr + length > self.size:
+            raise WaveshareEEPROMError(
+                f"EEPROM range 0x{addr:04X}+{length} exceeds {self.size} bytes"
+            )
+
+    def _cache_key(self, addr: int, length: int) -> Tuple[int, int, int, int, int]:
+        return (self.dev_index, self.eeprom_type, self.base_address, addr, length)
+
+    # -- Bus primitives (device must be open) --
+
+    def _wait_ack(self, dev_addr: int) -> None:
+        deadline = time.monotonic() + self.write_cycle_s * ACK_POLL_FACTOR
+        while not _dll.i2c_probe(self.dev_index, dev_addr):
+            if time.monotonic() > deadline:
+                raise WaveshareEEPROMError(
+                    f"EEPROM at 0x{dev_addr:02X} did not ACK within "
+                    f"{self.write_cycle_s * ACK_POLL_FACTOR * 1000:.0f} ms after page write"
+                )
+
+    def _write_page(self, addr: int, data) -> None:
+        dev_addr, offset = self._target(addr)
+        frame = bytes([(dev_addr << 1) & 0xFE]) + offset + bytes(data)
+        try:
+            _dll.i2c_stream(self.dev_index, frame, read_length=0)
+        except OSError as exc:
+            raise WaveshareEEPROMError(
+                f"EEPROM page write failed at 0x{addr:04X}: {exc}"
+            ) from exc
+        self._wait_ack(dev_addr)
+
+    def _read(self, addr: int, length: int) -> bytes:
+        # Random reads on the same device address the page writes use; the
+        # upper address bits select the block, so a read never crosses one.
+        block = 1 << (8 * self.addr_bytes)
+        out = bytearray()
+        while len(out) < length:
+            pos = addr + len(out)
+            n = min(length - len(out), block - pos % block)
+            dev_addr, offset = self._target(pos)
+            try:
+                out += _dll.i2c_stream(self.dev_index,
+                                       bytes([(dev_addr << 1) & 0xFE]) + offset,
+                                       read_length=n)
+            except OSError as exc:
+                raise WaveshareEEPROMError(
+                    f"EEPROM read failed at 0x{pos:04X}: {exc}"
+                ) from exc
+        return bytes(out)
+
+    # -- Diff --
+
+    def dirty_pages(self, current: bytes, image: bytes, addr: int = 0) -> List[Tuple[int, int]]:
+        """Return ``(address, length)`` page segments where ``image`` differs.
+
+        Segments never cross a page boundary; the first and last may be
+        partial when the image is not page aligned.
+        """
+        dirty = []
+        page = self.page_size
+        pos = 0
+        while pos < len(image):
+            n = min(page - (addr + pos) % page, len(image) - pos)
+            if current[pos:pos + n] != image[pos:pos + n]:
+                dirty.append((addr + pos, n))
+            pos += n
+        return dirty
+
+    @staticmethod
+    def _runs(segments: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        runs: List[Tuple[int, int]] = []
+        for start, n in segments:
+            if runs and runs[-1][0] + runs[-1][1] == start:
+                runs[-1] = (runs[-1][0], runs[-1][1] + n)
+            else:
+                runs.append((start, n))
+        return runs
+
+    # -- Programming --
+
+    def program(self, image: bytes, addr: int = 0, verify: bool = True,
+                force: bool = False) -> Dict[str, Any]:
+        """Bring the EEPROM range starting at ``addr`` to ``image``.
+
+        Args:
+            image: Target content.
+            addr: Start address inside the EEPROM.
+            verify: Read back the written pages.
+            force: Ignore the checksum cache and re-check the device.
+
+        Returns:
+            Dict with pages_total, pages_dirty, bytes_written, cached and
+            seconds.
+        """
+        image = bytes(image)
+        self._check_range(addr, len(image))
+        digest = hashlib.sha256(image).hexdigest()
+        key = self._cache_key(addr, len(image))
+        page = self.page_size
+        pages_total = ((addr + len(image) - 1) // page - addr // page + 1) if image else 0
+        result = {"address": addr, "length": len(image), "sha256": digest,
+                  "pages_total": pages_total, "pages_dirty": 0,
+                  "bytes_written": 0, "cached": False, "seconds": 0.0}
+
+        cache = _image_cache(create=True)
+        if cache is not None:
+            if not force and cache.get(key) == digest:
+                result["cached"] = True
+                return result
+            _forget_overlapping(cache, self.dev_index, addr, len(image))
+
+        start = time.perf_counter()
+        with _EEPROMDevice(self.dev_index):
+            current = self._read(addr, len(image))
+            dirty = self.dirty_pages(current, image, addr)
+            for seg_addr, n in dirty:
+                off = seg_addr - addr
+                self._write_page(seg_addr, image[off:off + n])
+            if verify and dirty:
+                for run_addr, n in self._runs(dirty):
+                    off = run_addr - addr
+                    readback = self._read(run_addr, n)
+                    if readback != image[off:off + n]:
+                        bad = next(i for i in range(n) if readback[i] != image[off + i])
+                        raise WaveshareEEPROMError(
+                            f"EEPROM verify failed at 0x{run_addr + bad:04X}: "
+                            f"expected 0x{image[off + bad]:02X}, got 0x{readback[bad]:02X}"
+                        )
+        result["seconds"] = time.perf_counter() - start
+        result["pages_dirty"] = len(dirty)
+        result["bytes_written"] = sum(n for _a, n in dirty)
+        if cache is not None and (verify or not dirty):
+            cache[key] = digest
+        return result
+
+
+def _program_image(dev_index: int, eeprom_type: int, image: bytes, addr: int = 0,
+                   verify: bool = True, force: bool = False,
+                   base_address: int = 0x50) -> Dict[str, Any]:
+    """Differentially program an image and log a summary."""
+    logger = get_active_logger()
+    type_name = _TYPE_NAMES.get(eeprom_type, f"type={eeprom_type}")
+    manager = EEPROMImage(dev_index, eeprom_type, base_address)
+
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info("[WAVESHARE EEPROM] PROGRAM IMAGE")
+        logger.info("=" * 80)
+        logger.info(f"  Device: #{dev_index}  EEPROM: {type_name}  Base: 0x{base_address:02X}")
+        logger.info(f"  Addr:   0x{addr:04X}  Length: {len(image)}  "
+                    f"Page: {manager.page_size}B  tWR: {manager.write_cycle_s * 1000:.0f} ms")
+        logger.info("")
+
+    try:
+        result = manager.program(image, addr, verify=verify, force=force)
+    except WaveshareEEPROMError as exc:
+        if logger:
+            logger.error(f"[WAVESHARE EEPROM ERROR] {exc}")
+        raise
+
+    if logger:
+        logger.info(f"  SHA-256: {result['sha256']}")
+        if result["cached"]:
+            logger.info("  [OK] Image already programmed (checksum cache hit), skipped")
+        else:
+            logger.info(f"  Dirty pages:   {result['pages_dirty']}/{result['pages_total']}")
+            logger.info(f"  Bytes written: {result['bytes_written']}")
+            logger.info(f"  [OK] Image programmed in {result['seconds']:.3f}s"
+                        + (" (dirty pages verified)" if verify and result['pages_dirty'] else ""))
+        logger.info("=" * 80)
+    return result
+
+
 # ======================== TestAction Factories ========================
 
 def read(
@@ -308,3 +602,41 @@ def verify(
         'display_expected': 'match',
     }
     return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def program_image(
+        name: str,
+        dev_index: int,
+        eeprom_type: int,
+        image: Optional[bytes] = None,
+        input_path: Optional[str] = None,
+        addr: int = 0,
+        verify: bool = True,
+        force: bool = False,
+        base_address: int = 0x50,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that brings the EEPROM to an image, writing only dirty pages.
+
+    The image is given as ``image`` bytes or read from ``input_path`` at
+    execution time. See :class:`EEPROMImage`.
+
+    Returns:
+        TestAction that returns the programming summary dict.
+    """
+    if (image is None) == (input_path is None):
+        raise WaveshareEEPROMError("Provide exactly one of image or input_path")
+
+    def execute():
+        data = image if image is not None else Path(input_path).read_bytes()
+        return _program_image(dev_index, eeprom_type, data, addr, verify, force,
+                              base_address)
+
+    type_name = _TYPE_NAMES.get(eeprom_type, f"type={eeprom_type}")
+    source = input_path if input_path else f"{len(image)}B"
+    metadata = {
+        'display_command': f"EEPROM program {type_name} 0x{addr:04X} [{source}]",
+        'display_expected': 'match' if verify else 'OK',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
@@ -0,0 +1,501 @@
+# flash_cache.py
+"""
+UTFW Waveshare Flash Image Cache
+=================================
+Skip-if-identical and sector-differential flash programming for JTAG/SWD
+targets.
+
+``jtag.flash_image`` always erases, programs and verifies the whole
+image. :func:`flash_image_cached` first asks the target whether it
+already holds the image (OpenOCD ``verify_image_checksum``, which runs
+the CRC on the target, or a read-back CRC) and skips programming when it
+does. Otherwise only the flash sectors whose content changes are erased
+and rewritten.
+
+A local cache keyed by target ID remembers the last image flashed onto
+each target (manifest plus image data under ``get_cache_dir("flash")``).
+When the target still holds that image, the changed sectors are found by
+diffing old and new image on the host; only when the target content is
+unknown is the image range read back for the diff.
+
+Sector geometry comes from OpenOCD ``flash banks``/``flash info`` (and is
+cached per target), or from a uniform ``sector_size``.
+
+Usage:
+    import UTFW
+    waveshare = UTFW.modules.ext_tools.waveshare
+
+    action = waveshare.flash_cache.flash_image_cached(
+        "Flash firmware (skip if current)", image="firmware.elf",
+        target_cfg="stm32f4x", target_id="board-17", session="default",
+    )
+
+Author: DvidMakesThings
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple
+
+from ....core.logger import get_active_logger
+from ....core.core import TestAction
+from ....core.utilities import get_cache_dir
+from .jtag import (
+    WaveshareJTAGError,
+    _run_target,
+    get_session,
+)
+from .memory import (
+    WaveshareMemoryError,
+    load_image_segments,
+    read_region,
+    crc32,
+    _halt_commands,
+)
+
+_CACHE_VERSION = 1
+
+_BANK_RE = re.compile(r"#(\d+)\s*:\s*\S+.*?\bat\s+0x([0-9A-Fa-f]+),\s*size\s+0x([0-9A-Fa-f]+)")
+_SECTOR_RE = re.compile(r"#\s*(\d+)\s*:\s*0x([0-9A-Fa-f]+)\s*\(0x([0-9A-Fa-f]+)")
+
+Segment = Tuple[int, bytes]
+Sector = Tuple[int, int]
+
+
+class WaveshareFlashCacheError(WaveshareJTAGError):
+    """Exception raised when cached/differential flash programming fails."""
+    pass
+
+
+# ======================== Local Cache ========================
+
+def _cache_paths(target_id: str) -> Tuple[Path, Path]:
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", target_id)
+    base = get_cache_dir("flash")
+    return base / f"{safe}.json", base / f"{safe}.img"
+
+
+def load_cache_entry(target_id: str) -> Optional[Dict[str, Any]]:
+    """Return the cached manifest for a target, with ``segments`` loaded, or None."""
+    manifest_path, blob_path = _cache_paths(target_id)
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("version") != _CACHE_VERSION:
+            return None
+        blob = blob_path.read_bytes()
+    except (OSError, ValueError):
+        return None
+    if hashlib.sha256(blob).hexdigest() != manifest.get("blob_sha256"):
+        return None
+    segments, pos = [], 0
+    for seg in manifest["segments"]:
+        segments.append((seg["address"], blob[pos:pos + seg["length"]]))
+        pos += seg["length"]
+    manifest["segments"] = segments
+    manifest["sectors"] = [tuple(s) for s in manifest.get("sectors") or []]
+    return manifest
+
+
+def _save_cache_entry(target_id: str, image: str, image_sha256: str,
+                      segments: List[Segment], sectors: List[Sector]) -> None:
+    manifest_path, blob_path = _cache_paths(target_id)
+    blob = b"".join(data for _addr, data in segments)
+    manifest = {
+        "version": _CACHE_VERSION,
+        "target_id": target_id,
+        "image": str(image),
+        "image_sha256": image_sha256,
+        "blob_sha256": hashlib.sha256(blob).hexdigest(),
+        "segments": [{"address": a, "length": len(d), "crc32": crc32(d)} for a, d in segments],
+        "sectors": [list(s) for s in sectors],
+        "flashed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    try:
+        tmp = blob_path.with_suffix(".tmp")
+        tmp.write_bytes(blob)
+        tmp.replace(blob_path)
+        tmp = manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        tmp.replace(manifest_path)
+    except OSError:
+        pass
+
+
+def clear_cache_entry(target_id: str) -> None:
+    """Forget the last image recorded for a target."""
+    for path in _cache_paths(target_id):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _image_digest(segments: List[Segment]) -> str:
+    digest = hashlib.sha256()
+    for addr, data in segments:
+        digest.update(addr.to_bytes(8, "little"))
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+# ======================== Sector Geometry ========================
+
+def _query_sectors(target_cfg: str, transport: str, adapter_speed: Optional[int],
+                   timeout: float, config_file: Optional[str],
+                   session: Optional[str]) -> List[Sector]:
+    """Read the sector map of every flash bank from OpenOCD."""
+    output = _run_target(["flash banks"], target_cfg, transport, adapter_speed,
+                         timeout, config_file, session)
+    banks = [(int(n), int(base, 16)) for n, base, _size in _BANK_RE.findall(output)]
+    if not banks:
+        raise WaveshareFlashCacheError("OpenOCD reported no flash banks")
+    output = _run_target([f"flash info {n}" for n, _base in banks], target_cfg, transport,
+                         adapter_speed, timeout, config_file, session)
+    sectors: List[Sector] = []
+    base = None
+    # Each `flash info` block starts with the bank line, sector offsets are bank-relative
+    for line in output.splitlines():
+        bank = _BANK_RE.search(line)
+        if bank:
+            base = int(bank.group(2), 16)
+            continue
+        sec = _SECTOR_RE.search(line)
+        if sec and base is not None:
+            sectors.append((base + int(sec.group(2), 16), int(sec.group(3), 16)))
+    if not sectors:
+        raise WaveshareFlashCacheError("Could not parse the flash sector map from OpenOCD")
+    return sorted(set(sectors))
+
+
+def _uniform_sectors(segments: List[Segment], sector_size: int) -> List[Sector]:
+    starts = set()
+    for addr, data in segments:
+        first = addr - addr % sector_size
+        for start in range(first, addr + len(data), sector_size):
+            starts.add(start)
+    return [(s, sector_size) for s in sorted(starts)]
+
+
+def _covered(sector: Sector, segments: List[Segment]) -> List[Tuple[int, int, int]]:
+    """Return ``(segment index, start, end)`` parts of segments inside a sector."""
+    s_start, s_end = sector[0], sector[0] + sector[1]
+    parts = []
+    for i, (addr, data) in enumerate(segments):
+        start, end = max(addr, s_start), min(addr + len(data), s_end)
+        if start < end:
+            parts.append((i, start, end))
+    return parts
+
+
+def _uncovered(segments: List[Segment], sectors: List[Sector]) -> List[Tuple[int, int]]:
+    """Return ``(start, end)`` image ranges that fall outside every sector."""
+    gaps = []
+    for addr, data in segments:
+        pos, end = addr, addr + len(data)
+        for s_start, s_size in sorted(sectors):
+            if s_start + s_size <= pos:
+                continue
+            if s_start > pos:
+                gaps.append((pos, min(s_start, end)))
+            pos = max(pos, s_start + s_size)
+            if pos >= end:
+                break
+        if pos < end:
+            gaps.append((pos, end))
+    return gaps
+
+
+def _slice(segments: List[Segment], index: int, start: int, end: int) -> bytes:
+    addr, data = segments[index]
+    return data[start - addr:end - addr]
+
+
+def _region_bytes(segments: List[Segment], start: int, end: int) -> Optional[bytes]:
+    """Bytes of ``[start, end)`` if one segment covers all of it, else None."""
+    for addr, data in segments:
+        if addr <= start and end <= addr + len(data):
+            return data[start - addr:end - addr]
+    return None
+
+
+# ======================== Target Checks ========================
+
+def _write_temp(data: bytes) -> str:
+    fd, tmp = tempfile.mkstemp(prefix="utfw_flash_", suffix=".bin")
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(data)
+    return tmp
+
+
+def _unlink(paths: List[str]) -> None:
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _target_holds(segments: List[Segment], check: str, target_cfg: str,
+                  transport: str, adapter_speed: Optional[int], timeout: float,
+                  config_file: Optional[str], session: Optional[str]) -> bool:
+    """Return True if target memory equals every segment."""
+    if check == "readback":
+        for addr, data in segments:
+            actual = read_region(addr, len(data), target_cfg, transport, adapter_speed,
+                                 timeout, config_file, session, halt=False)
+            if crc32(actual) != crc32(data):
+                return False
+        return True
+
+    # The checksum algorithm runs on the target, which must be halted
+    pre = _halt_commands(transport, session, True)
+    tmps = [_write_temp(data) for _addr, data in segments]
+    try:
+        commands = [f"verify_image_checksum {{{Path(t).as_posix()}}} 0x{addr:08X} bin"
+                    for t, (addr, _data) in zip(tmps, segments)]
+        if session is not None:
+            results = get_session(session).execute(pre + commands, timeout)
+            return all(status == 0 for status, _text in results[len(pre):])
+        try:
+            _run_target(pre + commands, target_cfg, transport, adapter_speed, timeout,
+                        config_file, session)
+            return True
+        except WaveshareJTAGError:
+            return False
+    finally:
+        _unlink(tmps)
+
+
+def _changed_sectors(new: List[Segment], base: List[Segment], sectors: List[Sector]
+                     ) -> List[Sector]:
+    """Sectors where the bytes of ``new`` differ from ``base`` (same address ranges)."""
+    changed = []
+    for sector in sectors:
+        for i, start, end in _covered(sector, new):
+            old = _region_bytes(base, start, end)
+            if old is None or old != _slice(new, i, start, end):
+                changed.append(sector)
+                break
+    return changed
+
+
+def _merge_runs(sectors: List[Sector]) -> List[Sector]:
+    runs: List[Sector] = []
+    for start, size in sorted(sectors):
+        if runs and runs[-1][0] + runs[-1][1] == start:
+            runs[-1] = (runs[-1][0], runs[-1][1] + size)
+        else:
+            runs.append((start, size))
+    return runs
+
+
+# ======================== Programming ========================
+
+def _program_runs(runs: List[Sector], segments: List[Segment], target_cfg: str,
+                  transport: str, adapter_speed: Optional[int], timeout: float,
+                  config_file: Optional[str], session: Optional[str],
+                  reset_after: bool) -> None:
+    """Erase each run of sectors once, then write the image parts inside it."""
+    commands = _halt_commands(transport, session, True)
+    tmps = []
+    try:
+        for run in runs:
+            commands.append(f"flash erase_address 0x{run[0]:08X} 0x{run[1]:X}")
+            for i, start, end in _covered(run, segments):
+                tmp = _write_temp(_slice(segments, i, start, end))
+                tmps.append(tmp)
+                commands.append(f"flash write_image {{{Path(tmp).as_posix()}}} 0x{start:08X} bin")
+        if reset_after:
+            commands.append("reset run")
+        _run_target(commands, target_cfg, transport, adapter_speed, timeout,
+                    config_file, session, pipeline=False)
+    finally:
+        _unlink(tmps)
+
+
+def _flash_image_cached(image: str, target_cfg: str, base_address: Optional[int] = None,
+                        target_id: Optional[str] = None, sector_size: Optional[int] = None,
+                        check: str = "checksum", force: bool = False, verify: bool = True,
+                        reset_after: bool = True, transport: str = "jtag",
+                        adapter_speed: Optional[int] = None, timeout: float = 120,
+                        config_file: Optional[str] = None,
+                        session: Optional[str] = None) -> Dict[str, Any]:
+    """Bring the target flash to ``image``, doing as little work as possible.
+
+    Returns:
+        Dict with action ("skipped", "differential" or "full"), image_sha256,
+        sectors_total, sectors_programmed, bytes_programmed, diff_source
+        and seconds.
+    """
+    if check not in ("checksum", "readback"):
+        raise WaveshareFlashCacheError(f"Unknown check method '{check}'")
+    logger = get_active_logger()
+    start_t = time.perf_counter()
+    segments = load_image_segments(image, base_address)
+    if not segments:
+        raise WaveshareFlashCacheError(f"Image {image} has no loadable segments")
+    image_sha = _image_digest(segments)
+    target_id = target_id or target_cfg
+    args = (target_cfg, transport, adapter_speed, timeout, config_file, session)
+    cached = load_cache_entry(target_id)
+
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info("[WAVESHARE JTAG] CACHED FLASH")
+        logger.info("=" * 80)
+        logger.info(f"  Image:     {image}")
+        logger.info(f"  SHA-256:   {image_sha}")
+        logger.info(f"  Target ID: {target_id}")
+        if cached:
+            logger.info(f"  Cached:    {cached['image']} ({cached['image_sha256'][:16]}..., "
+                        f"{cached['flashed_at']})")
+        logger.info("")
+
+    # The manifest keeps the whole bank map; only the sectors this image
+    # touches are diffed and programmed.
+    bank_map = cached["sectors"] if cached else []
+    if sector_size:
+        sectors = _uniform_sectors(segments, sector_size)
+    else:
+        if not bank_map or _uncovered(segments, bank_map):
+            bank_map = _query_sectors(*args)
+        sectors = bank_map
+    sectors = [s for s in sectors if _covered(s, segments)]
+    gaps = _uncovered(segments, sectors)
+    if gaps:
+        ranges = ", ".join(f"0x{a:08X}-0x{b - 1:08X}" for a, b in gaps[:4])
+        raise WaveshareFlashCacheError(
+            f"Image {image} has data outside the flash sector map ({ranges}"
+            f"{', ...' if len(gaps) > 4 else ''}); check base_address or sector_size"
+        )
+
+    result: Dict[str, Any] = {
+        "image_sha256": image_sha, "target_id": target_id,
+        "sectors_total": len(sectors), "sectors_programmed": 0,
+        "bytes_programmed": 0, "diff_source": None,
+    }
+
+    if not force and _target_holds(segments, check, *args):
+        result["action"] = "skipped"
+        result["diff_source"] = "target"
+        _save_cache_entry(target_id, image, image_sha, segments, bank_map)
+        result["seconds"] = time.perf_counter() - start_t
+        if logger:
+            logger.info("  Target already holds this image, programming skipped")
+            logger.info(f"[OK] Done in {result['seconds']:.2f}s")
+            logger.info("=" * 80)
+        return result
+
+    if force:
+        changed = sectors
+        result["diff_source"] = "forced"
+    elif cached and _target_holds(cached["segments"], check, *args):
+        changed = _changed_sectors(segments, cached["segments"], sectors)
+        result["diff_source"] = "cache"
+    else:
+        current = []
+        for addr, data in segments:
+            current.append((addr, read_region(addr, len(data), target_cfg, transport,
+                                              adapter_speed, timeout, config_file,
+                                              session, halt=False)))
+        changed = _changed_sectors(segments, current, sectors)
+        result["diff_source"] = "readback"
+
+    result["action"] = "full" if len(changed) == len(sectors) else "differential"
+    runs = _merge_runs(changed)
+    if logger:
+        logger.info(f"  Diff source:     {result['diff_source']}")
+        logger.info(f"  Changed sectors: {len(changed)}/{len(sectors)}")
+        for run_start, run_len in runs:
+            logger.info(f"    0x{run_start:08X} - 0x{run_start + run_len - 1:08X}")
+        logger.info("")
+
+    if runs:
+        _program_runs(runs, segments, *args, reset_after=reset_after)
+        result["sectors_programmed"] = len(changed)
+        result["bytes_programmed"] = sum(
+            end - start for run in runs for _i, start, end in _covered(run, segments))
+
+        if verify:
+            parts = [(start, _slice(segments, i, start, end))
+                     for run in runs for i, start, end in _covered(run, segments)]
+            if not _target_holds(parts, check, *args):
+                clear_cache_entry(target_id)
+                raise WaveshareFlashCacheError(
+                    f"Verify failed after programming {len(changed)} sector(s) of {image}"
+                )
+
+    _save_cache_entry(target_id, image, image_sha, segments, bank_map)
+    result["seconds"] = time.perf_counter() - start_t
+    if logger:
+        logger.info(f"  Programmed {result['bytes_programmed']} bytes in "
+                    f"{result['sectors_programmed']} sector(s)")
+        logger.info(f"[OK] Flash up to date in {result['seconds']:.2f}s")
+        logger.info("=" * 80)
+    return result
+
+
+# ======================== TestAction Factories ========================
+
+def flash_image_cached(
+        name: str,
+        image: str,
+        target_cfg: str,
+        address: Optional[int] = None,
+        target_id: Optional[str] = None,
+        sector_size: Optional[int] = None,
+        check: str = "checksum",
+        force: bool = False,
+        verify: bool = True,
+        reset_after: bool = True,
+        transport: str = "jtag",
+        adapter_speed: Optional[int] = None,
+        timeout: float = 120,
+        config_file: Optional[str] = None,
+        session: Optional[str] = None,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that flashes an image only where the target differs.
+
+    Args:
+        name: Human-readable name.
+        image: Path to firmware file (.elf, .hex, .bin).
+        target_cfg: Target config ("stm32f4x", path, etc.).
+        address: Base address for .bin files.
+        target_id: Cache key for this target (board serial, UID...);
+            defaults to ``target_cfg``.
+        sector_size: Uniform sector size; None queries OpenOCD.
+        check: "checksum" (verify_image_checksum on the target) or
+            "readback" (read the range and CRC it on the host).
+        force: Program every sector of the image regardless.
+        verify: Check the programmed sectors afterwards.
+        reset_after: Issue "reset run" after programming.
+        transport: "jtag" or "swd".
+        session: Run on this persistent session (see jtag.start_session).
+        negative_test: Mark as negative test.
+
+    Returns:
+        TestAction returning the summary dict (action "skipped",
+        "differential" or "full").
+    """
+
+    def execute():
+        try:
+            return _flash_image_cached(image, target_cfg, address, target_id, sector_size,
+                                       check, force, verify, reset_after, transport,
+                                       adapter_speed, timeout, config_file, session)
+        except WaveshareMemoryError as exc:
+            raise WaveshareFlashCacheError(str(exc)) from exc
+
+    metadata = {
+        'display_command': f"Flash (cached) {Path(image).name} -> {target_cfg}",
+        'display_expected': 'up to date',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
@@ -5,7 +5,8 @@ UTFW Waveshare I2C Module
 High-level I2C master test functions and TestAction factories for the
 Waveshare USB TO UART/I2C/SPI/JTAG adapter (WCH CH347 chipset).
 
-This module communicates through the CH347 vendor DLL (Windows) using
+This module communicates through the active CH347 backend (vendor DLL on
+Windows, ``ch34x_pis`` driver on Linux, or the ``sim`` simulator) using
 ``CH347StreamI2C`` for all bus transactions.  The CH347 I2C master supports:
 - Clock speeds: 20 KHz, 50 KHz, 100 KHz, 200 KHz, 400 KHz, 750 KHz, 1 MHz
 - 7-bit addressing
@@ -28,10 +29,22 @@ Usage:
         register=0x00, length=2,
     )
 
+    # Batched access: contiguous registers share one transaction
+    action = waveshare.i2c.read_registers(
+        "Read config block", dev_index=0, address=0x68,
+        registers=range(0x19, 0x1D),
+    )
+
+    # Register map with a shadow of confirmed values
+    imu = waveshare.i2c.RegisterMap(0, 0x68, names={"PWR_MGMT_1": 0x6B})
+    action = waveshare.i2c.write_map("Wake IMU", imu, {"PWR_MGMT_1": 0x00})
+    action = waveshare.i2c.verify_map("Check IMU", imu, {"PWR_MGMT_1": 0x00})
+
 Author: DvidMakesThings
 """
 
-from typing import Optional, List
+import time
+from typing import Optional, List, Dict, Iterable, Tuple, Union
 
 from ....core.logger import get_active_logger
 from ....core.core import TestAction
@@ -84,20 +97,43 @@ class _I2CDevice:
 
 # ======================== Core I2C Functions ========================
 
-def _scan_bus(dev_index: int, speed: int = I2C_SPEED_100KHZ) -> List[int]:
+def _scan_addresses(addresses: Optional[Iterable[int]] = None,
+                    skip_ranges: Optional[Iterable[Tuple[int, int]]] = None) -> List[int]:
+    """Build the sorted probe list from candidates and skipped ranges."""
+    if addresses is None:
+        candidates = range(I2C_ADDR_MIN, I2C_ADDR_MAX + 1)
+    else:
+        candidates = addresses
+    skipped = set()
+    for lo, hi in (skip_ranges or ()):
+        skipped.update(range(lo, hi + 1))
+    probe = sorted({a for a in candidates
+                    if I2C_ADDR_MIN <= a <= I2C_ADDR_MAX and a not in skipped})
+    return probe
+
+
+def _scan_bus(dev_index: int, speed: int = I2C_SPEED_100KHZ,
+              addresses: Optional[Iterable[int]] = None,
+              skip_ranges: Optional[Iterable[Tuple[int, int]]] = None,
+              stop_after: Optional[Iterable[int]] = None) -> List[int]:
     """Scan the I2C bus for connected devices.
 
-    Probes all valid 7-bit addresses (0x03-0x77) using a single-byte
-    write with the address.  Devices that ACK are recorded.
+    Probes valid 7-bit addresses (0x03-0x77) using an address-only write.
+    Devices that ACK are recorded.
 
     Args:
         dev_index: CH347 device index (0-15).
         speed: I2C clock speed constant.
+        addresses: Candidate addresses to probe (None = full range).
+        skip_ranges: Inclusive ``(low, high)`` ranges known to be empty.
+        stop_after: Stop probing as soon as all of these addresses ACKed.
 
     Returns:
         List of responding 7-bit I2C addresses.
     """
     logger = get_active_logger()
+    probe = _scan_addresses(addresses, skip_ranges)
+    wanted = set(stop_after) if stop_after else None
 
     if logger:
         logger.info("")
@@ -105,28 +141,35 @@ def _scan_bus(dev_index: int, speed: int = I2C_SPEED_100KHZ) -> List[int]:
         logger.info("[WAVESHARE I2C] BUS SCAN")
         logger.info("=" * 80)
         logger.info(f"  Device:  #{dev_index}")
-        logger.info(f"  Range:   0x{I2C_ADDR_MIN:02X}-0x{I2C_ADDR_MAX:02X}")
+        if addresses is None and not skip_ranges:
+            logger.info(f"  Range:   0x{I2C_ADDR_MIN:02X}-0x{I2C_ADDR_MAX:02X}")
+        else:
+            logger.info(f"  Probing: {len(probe)} address(es)")
+        if skip_ranges:
+            logger.info("  Skipped: " + ", ".join(f"0x{lo:02X}-0x{hi:02X}" for lo, hi in skip_ranges))
         logger.info("")
 
     found: List[int] = []
+    probed = 0
+    start = time.perf_counter()
 
     with _I2CDevice(dev_index, speed):
-        dll = _dll.get_dll()
-        for addr in range(I2C_ADDR_MIN, I2C_ADDR_MAX + 1):
-            # Probe with a zero-length read after the address byte
-            write_addr = (addr << 1) & 0xFE
-            write_buf = ((_dll.ctypes.c_ubyte) * 1)(write_addr)
-            ok = dll.CH347StreamI2C(dev_index, 1, write_buf, 0, None)
-            if ok:
+        for addr in probe:
+            # Probe with an address-only write; ACK means a device is present
+            probed += 1
+            if _dll.i2c_probe(dev_index, addr):
                 found.append(addr)
-                if logger:
-                    logger.info(f"  0x{addr:02X} ({addr:3d})  ACK")
+                if wanted is not None and wanted.issubset(found):
+                    break
+    elapsed = time.perf_counter() - start
 
     if logger:
-        logger.info("")
         logger.info(f"  Devices found: {len(found)}")
         if found:
             logger.info(f"  Addresses: {', '.join(f'0x{a:02X}' for a in found)}")
+        per_probe = elapsed / probed * 1000 if probed else 0.0
+        logger.info(f"  Probed {probed} address(es) in {elapsed * 1000:.1f} ms "
+                    f"({per_probe:.2f} ms/probe)")
         logger.info("=" * 80)
         logger.info("")
 
@@ -317,6 +360,357 @@ def _read_register(dev_index: int, address: int, register: int,
     return result
 
 
+# ======================== Batched Register Access ========================
+
+RegisterValue = Union[int, bytes]
+
+
+def _register_runs(registers: Iterable[int],
+                   max_burst: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Group register numbers into contiguous ``(start, count)`` runs."""
+    runs: List[Tuple[int, int]] = []
+    for reg in sorted(set(registers)):
+        if not 0 <= reg <= 0xFF:
+            raise WaveshareI2CError(f"Invalid register: 0x{reg:X} (must be 0x00-0xFF)")
+        if runs:
+            start, count = runs[-1]
+            if reg == start + count and (not max_burst or count < max_burst):
+                runs[-1] = (start, count + 1)
+                continue
+        runs.append((reg, 1))
+    return runs
+
+
+def _encode_register(register: int, value: RegisterValue, width: int,
+                     byteorder: str) -> bytes:
+    if isinstance(value, int):
+        try:
+            return value.to_bytes(width, byteorder)
+        except OverflowError:
+            raise WaveshareI2CError(
+                f"Value 0x{value:X} for register 0x{register:02X} does not fit in {width} byte(s)"
+            ) from None
+    value = bytes(value)
+    if len(value) != width:
+        raise WaveshareI2CError(
+            f"Register 0x{register:02X} value must be {width} byte(s), got {len(value)}"
+        )
+    return value
+
+
+def _check_address(address: int) -> None:
+    if not (I2C_ADDR_MIN <= address <= I2C_ADDR_MAX):
+        raise WaveshareI2CError(
+            f"Invalid I2C address: 0x{address:02X} "
+            f"(must be 0x{I2C_ADDR_MIN:02X}-0x{I2C_ADDR_MAX:02X})"
+        )
+
+
+def _stream_read_registers(dev_index: int, address: int, registers: Iterable[int],
+                           width: int = 1, auto_increment: bool = True,
+                           max_burst: Optional[int] = None) -> Dict[int, bytes]:
+    """Read registers on an already opened device.
+
+    With ``auto_increment`` each contiguous run costs one write-then-read
+    stream call; otherwise every register is its own transaction.
+    """
+    write_addr = (address << 1) & 0xFE
+    values: Dict[int, bytes] = {}
+    runs = _register_runs(registers, max_burst if auto_increment else 1)
+    for start, count in runs:
+        try:
+            data = _dll.i2c_stream(dev_index, bytes([write_addr, start]),
+                                   read_length=count * width)
+        except OSError as exc:
+            raise WaveshareI2CError(
+                f"I2C read registers 0x{start:02X}+{count} at 0x{address:02X} failed: {exc}"
+            ) from exc
+        for i in range(count):
+            values[start + i] = bytes(data[i * width:(i + 1) * width])
+    return values
+
+
+def _stream_write_registers(dev_index: int, address: int,
+                            values: Dict[int, RegisterValue], width: int = 1,
+                            auto_increment: bool = True,
+                            max_burst: Optional[int] = None,
+                            byteorder: str = "big") -> Dict[int, bytes]:
+    """Write registers on an already opened device, one stream call per run.
+
+    Returns:
+        Dict of register -> encoded bytes that were written.
+    """
+    write_addr = (address << 1) & 0xFE
+    encoded = {reg: _encode_register(reg, val, width, byteorder)
+               for reg, val in values.items()}
+    for start, count in _register_runs(encoded, max_burst if auto_increment else 1):
+        payload = bytearray((write_addr, start))
+        for reg in range(start, start + count):
+            payload += encoded[reg]
+        try:
+            _dll.i2c_stream(dev_index, bytes(payload), read_length=0)
+        except OSError as exc:
+            raise WaveshareI2CError(
+                f"I2C write registers 0x{start:02X}+{count} at 0x{address:02X} failed: {exc}"
+            ) from exc
+    return encoded
+
+
+def _log_register_table(logger, values: Dict[int, bytes]) -> None:
+    for reg in sorted(values):
+        logger.info(f"    0x{reg:02X}: {values[reg].hex(' ').upper()}")
+
+
+def _read_registers(dev_index: int, address: int, registers: Iterable[int],
+                    width: int = 1, auto_increment: bool = True,
+                    max_burst: Optional[int] = None,
+                    speed: int = I2C_SPEED_100KHZ) -> Dict[int, bytes]:
+    """Read a list or range of registers in as few transactions as possible.
+
+    Args:
+        dev_index: CH347 device index.
+        address: 7-bit I2C device address.
+        registers: Register numbers (e.g. ``range(0x00, 0x10)``).
+        width: Bytes per register.
+        auto_increment: Device advances its register pointer on reads.
+        max_burst: Longest run of registers per transaction (None = no limit).
+        speed: I2C clock speed constant.
+
+    Returns:
+        Dict of register -> value bytes.
+    """
+    _check_address(address)
+    registers = list(registers)
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info("[WAVESHARE I2C] READ REGISTERS")
+        logger.info("=" * 80)
+        logger.info(f"  Device:    #{dev_index}  Address: 0x{address:02X}")
+        logger.info(f"  Registers: {len(registers)}  Width: {width}  "
+                    f"Auto-increment: {auto_increment}")
+        logger.info("")
+
+    start = time.perf_counter()
+    with _I2CDevice(dev_index, speed):
+        values = _stream_read_registers(dev_index, address, registers, width,
+                                        auto_increment, max_burst)
+    elapsed = time.perf_counter() - start
+
+    if logger:
+        _log_register_table(logger, values)
+        logger.info("")
+        runs = len(_register_runs(registers, max_burst if auto_increment else 1))
+        logger.info(f"[OK] Read {len(values)} register(s) in {runs} transaction(s), "
+                    f"{elapsed * 1000:.1f} ms")
+        logger.info("=" * 80)
+    return values
+
+
+def _write_registers(dev_index: int, address: int,
+                     values: Dict[int, RegisterValue], width: int = 1,
+                     auto_increment: bool = True,
+                     max_burst: Optional[int] = None,
+                     byteorder: str = "big",
+                     speed: int = I2C_SPEED_100KHZ) -> Dict[int, bytes]:
+    """Write a set of registers, merging contiguous ones into one transaction.
+
+    Integer values are encoded as ``width`` bytes in ``byteorder``.
+
+    Returns:
+        Dict of register -> encoded bytes that were written.
+    """
+    _check_address(address)
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info("[WAVESHARE I2C] WRITE REGISTERS")
+        logger.info("=" * 80)
+        logger.info(f"  Device:    #{dev_index}  Address: 0x{address:02X}")
+        logger.info(f"  Registers: {len(values)}  Width: {width}  "
+                    f"Auto-increment: {auto_increment}")
+        logger.info("")
+
+    start = time.perf_counter()
+    with _I2CDevice(dev_index, speed):
+        written = _stream_write_registers(dev_index, address, values, width,
+                                          auto_increment, max_burst, byteorder)
+    elapsed = time.perf_counter() - start
+
+    if logger:
+        _log_register_table(logger, written)
+        logger.info("")
+        runs = len(_register_runs(written, max_burst if auto_increment else 1))
+        logger.info(f"[OK] Wrote {len(written)} register(s) in {runs} transaction(s), "
+                    f"{elapsed * 1000:.1f} ms")
+        logger.info("=" * 80)
+    return written
+
+
+# ======================== Register Map ========================
+
+class RegisterMap:
+    """Register map of one I2C device with a shadow of confirmed values.
+
+    A register value is *confirmed* once it has been read from the bus
+    (directly, or as the read-back of a verified write). Verify steps
+    compare against confirmed values without touching the bus and only
+    read the registers that are not confirmed yet, in batched runs.
+    Registers listed as ``volatile`` (status, counters, FIFOs) are never
+    served from the shadow.
+
+    Args:
+        dev_index: CH347 device index.
+        address: 7-bit I2C device address.
+        names: Optional ``{name: register}`` aliases.
+        width: Bytes per register.
+        auto_increment: Device advances its register pointer.
+        max_burst: Longest run of registers per transaction.
+        volatile: Registers that must always be read from the bus.
+        byteorder: Byte order for integer values.
+        speed: I2C clock speed constant.
+
+    Example:
+        >>> regs = RegisterMap(0, 0x48, names={"CONFIG": 0x01}, volatile=[0x00])
+        >>> regs.write({"CONFIG": 0x60}, verify=True)
+        >>> regs.verify({"CONFIG": 0x60})   # served from the shadow
+    """
+
+    def __init__(self, dev_index: int, address: int,
+                 names: Optional[Dict[str, int]] = None, width: int = 1,
+                 auto_increment: bool = True, max_burst: Optional[int] = None,
+                 volatile: Iterable[int] = (), byteorder: str = "big",
+                 speed: int = I2C_SPEED_100KHZ):
+        _check_address(address)
+        self.dev_index = dev_index
+        self.address = address
+        self.names = dict(names or {})
+        self.width = width
+        self.auto_increment = auto_increment
+        self.max_burst = max_burst
+        self.byteorder = byteorder
+        self.speed = speed
+        self.volatile = {self.resolve(r) for r in volatile}
+        self._shadow: Dict[int, bytes] = {}
+        self.bus_reads = 0
+        self.bus_writes = 0
+
+    def resolve(self, register: Union[int, str]) -> int:
+        """Translate a register name to its number."""
+        if isinstance(register, str):
+            try:
+                return self.names[register]
+            except KeyError:
+                raise WaveshareI2CError(f"Unknown register name '{register}'") from None
+        return register
+
+    def _label(self, register: int) -> str:
+        for name, reg in self.names.items():
+            if reg == register:
+                return f"{name} (0x{register:02X})"
+        return f"0x{register:02X}"
+
+    def encode(self, register: int, value: RegisterValue) -> bytes:
+        return _encode_register(register, value, self.width, self.byteorder)
+
+    def cached(self, register: Union[int, str]) -> Optional[bytes]:
+        """Return the confirmed shadow value, or None."""
+        return self._shadow.get(self.resolve(register))
+
+    def invalidate(self, registers: Optional[Iterable[Union[int, str]]] = None) -> None:
+        """Drop shadow values (all of them when ``registers`` is None)."""
+        if registers is None:
+            self._shadow.clear()
+            return
+        for reg in registers:
+            self._shadow.pop(self.resolve(reg), None)
+
+    def read(self, registers: Iterable[Union[int, str]],
+             refresh: bool = False) -> Dict[int, bytes]:
+        """Return register values, reading only what the shadow lacks."""
+        regs = [self.resolve(r) for r in registers]
+        missing = [r for r in regs
+                   if refresh or r in self.volatile or r not in self._shadow]
+        fresh: Dict[int, bytes] = {}
+        if missing:
+            with _I2CDevice(self.dev_index, self.speed):
+                fresh = _stream_read_registers(self.dev_index, self.address, missing,
+                                               self.width, self.auto_increment,
+                                               self.max_burst)
+            self.bus_reads += len(fresh)
+            for reg, value in fresh.items():
+                if reg not in self.volatile:
+                    self._shadow[reg] = value
+        return {r: fresh[r] if r in fresh else self._shadow[r] for r in regs}
+
+    def read_int(self, register: Union[int, str], refresh: bool = False) -> int:
+        reg = self.resolve(register)
+        return int.from_bytes(self.read([reg], refresh)[reg], self.byteorder)
+
+    def write(self, values: Dict[Union[int, str], RegisterValue],
+              verify: bool = False) -> Dict[int, bytes]:
+        """Write registers in batched runs.
+
+        Written values are not trusted until read back: with ``verify`` the
+        registers are read back in the same device session and confirmed
+        on match; otherwise their shadow entries are dropped.
+        """
+        resolved = {self.resolve(r): v for r, v in values.items()}
+        with _I2CDevice(self.dev_index, self.speed):
+            written = _stream_write_registers(self.dev_index, self.address, resolved,
+                                              self.width, self.auto_increment,
+                                              self.max_burst, self.byteorder)
+            self.bus_writes += len(written)
+            readback = {}
+            if verify:
+                readback = _stream_read_registers(self.dev_index, self.address,
+                                                  written, self.width,
+                                                  self.auto_increment, self.max_burst)
+                self.bus_reads += len(readback)
+
+        self.invalidate(written)
+        if verify:
+            bad = [r for r in written if readback[r] != written[r]]
+            if bad:
+                detail = ", ".join(
+                    f"{self._label(r)} wrote {written[r].hex().upper()} "
+                    f"read {readback[r].hex().upper()}" for r in bad)
+                raise WaveshareI2CError(
+                    f"I2C register write verify failed at 0x{self.address:02X}: {detail}"
+                )
+            for reg, value in readback.items():
+                if reg not in self.volatile:
+                    self._shadow[reg] = value
+        return written
+
+    def compare(self, expected: Dict[Union[int, str], RegisterValue],
+                refresh: bool = False, masks: Optional[Dict[Union[int, str], int]] = None
+                ) -> List[Tuple[int, bytes, bytes]]:
+        """Return ``(register, expected, actual)`` for every mismatch.
+
+        ``masks`` limits the comparison of a register to the given bits.
+        """
+        resolved = {self.resolve(r): self.encode(self.resolve(r), v)
+                    for r, v in expected.items()}
+        mask_map = {self.resolve(r): m for r, m in (masks or {}).items()}
+        actual = self.read(resolved, refresh)
+        mismatches = []
+        for reg, exp in resolved.items():
+            act = actual[reg]
+            mask = mask_map.get(reg)
+            if mask is not None:
+                mask_b = mask.to_bytes(self.width, self.byteorder)
+                equal = bytes(a & m for a, m in zip(act, mask_b)) == \
+                    bytes(e & m for e, m in zip(exp, mask_b))
+            else:
+                equal = act == exp
+            if not equal:
+                mismatches.append((reg, exp, act))
+        return mismatches
+
+
 # ======================== TestAction Factories ========================
 
 def scan(
@@ -324,6 +718,9 @@ def scan(
         dev_index: int,
         expected_addresses: Optional[List[int]] = None,
         speed: int = I2C_SPEED_100KHZ,
+        addresses: Optional[List[int]] = None,
+        skip_ranges: Optional[List[Tuple[int, int]]] = None,
+        stop_when_found: bool = False,
         negative_test: bool = False
 ) -> TestAction:
     """Create a TestAction that scans the I2C bus for devices.
@@ -333,6 +730,9 @@ def scan(
         dev_index: CH347 device index.
         expected_addresses: Addresses that must be found (None = no check).
         speed: I2C clock speed constant.
+        addresses: Only probe these addresses (None = full range).
+        skip_ranges: Inclusive ``(low, high)`` ranges known to be empty.
+        stop_when_found: Stop probing once all expected addresses ACKed.
         negative_test: Mark as negative test.
 
     Returns:
@@ -341,7 +741,8 @@ def scan(
 
     def execute():
         logger = get_active_logger()
-        found = _scan_bus(dev_index, speed)
+        stop_after = expected_addresses if stop_when_found else None
+        found = _scan_bus(dev_index, speed, addresses, skip_ranges, stop_after)
 
         if expected_addresses is not None:
             missing = [a for a in expected_addresses if a not in found]
@@ -363,8 +764,12 @@ def scan(
     if expected_addresses:
         exp_str = ", ".join(f"0x{a:02X}" for a in expected_addresses)
 
+    if addresses is None and not skip_ranges:
+        scope = f"0x{I2C_ADDR_MIN:02X}-0x{I2C_ADDR_MAX:02X}"
+    else:
+        scope = f"{len(_scan_addresses(addresses, skip_ranges))} addr"
     metadata = {
-        'display_command': f"I2C scan dev#{dev_index} 0x{I2C_ADDR_MIN:02X}-0x{I2C_ADDR_MAX:02X}",
+        'display_command': f"I2C scan dev#{dev_index} {scope}",
         'display_expected': exp_str,
     }
     return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
@@ -525,3 +930,194 @@ def verify_device(
         'display_expected': expected_id.hex(' ').upper(),
     }
     return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def _format_expected(values: Dict[int, bytes]) -> str:
+    return ", ".join(f"0x{r:02X}={v.hex().upper()}" for r, v in sorted(values.items()))
+
+
+def read_registers(
+        name: str,
+        dev_index: int,
+        address: int,
+        registers: Iterable[int],
+        expected: Optional[Dict[int, RegisterValue]] = None,
+        width: int = 1,
+        auto_increment: bool = True,
+        max_burst: Optional[int] = None,
+        speed: int = I2C_SPEED_100KHZ,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that reads a list or range of registers.
+
+    Contiguous registers are read with one write-then-read transaction
+    when the device auto-increments its register pointer.
+
+    Returns:
+        TestAction that returns a dict of register -> value bytes.
+    """
+    registers = list(registers)
+    expected_b = ({r: _encode_register(r, v, width, "big") for r, v in expected.items()}
+                  if expected else None)
+
+    def execute():
+        logger = get_active_logger()
+        values = _read_registers(dev_index, address, registers, width,
+                                 auto_increment, max_burst, speed)
+        if expected_b:
+            bad = {r: v for r, v in expected_b.items() if values.get(r) != v}
+            if bad:
+                actual = {r: values.get(r, b"") for r in bad}
+                if logger:
+                    logger.error("[WAVESHARE I2C] REGISTER READ VALIDATION FAILED")
+                    logger.error(f"  Expected: {_format_expected(bad)}")
+                    logger.error(f"  Actual:   {_format_expected(actual)}")
+                raise WaveshareI2CError(
+                    f"I2C register mismatch at 0x{address:02X}: expected "
+                    f"{_format_expected(bad)}, got {_format_expected(actual)}"
+                )
+        return values
+
+    regs = _register_runs(registers)
+    span = ", ".join(f"0x{s:02X}" + (f"-0x{s + n - 1:02X}" if n > 1 else "") for s, n in regs)
+    metadata = {
+        'display_command': f"I2C rregs dev#{dev_index} 0x{address:02X}[{span}]",
+        'display_expected': _format_expected(expected_b) if expected_b else '',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def write_registers(
+        name: str,
+        dev_index: int,
+        address: int,
+        values: Dict[int, RegisterValue],
+        width: int = 1,
+        auto_increment: bool = True,
+        max_burst: Optional[int] = None,
+        verify: bool = False,
+        speed: int = I2C_SPEED_100KHZ,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that writes several registers in batched runs.
+
+    With ``verify`` the registers are read back (also batched) and compared.
+    """
+
+    def execute():
+        written = _write_registers(dev_index, address, values, width,
+                                   auto_increment, max_burst, speed=speed)
+        if verify:
+            readback = _read_registers(dev_index, address, written, width,
+                                       auto_increment, max_burst, speed)
+            bad = {r: v for r, v in written.items() if readback[r] != v}
+            if bad:
+                raise WaveshareI2CError(
+                    f"I2C register write verify failed at 0x{address:02X}: expected "
+                    f"{_format_expected(bad)}, got "
+                    f"{_format_expected({r: readback[r] for r in bad})}"
+                )
+        return written
+
+    metadata = {
+        'display_command': f"I2C wregs dev#{dev_index} 0x{address:02X} [{len(values)} regs]",
+        'display_expected': 'Verified' if verify else 'ACK',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def write_map(
+        name: str,
+        regmap: RegisterMap,
+        values: Dict[Union[int, str], RegisterValue],
+        verify: bool = True,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that writes registers through a :class:`RegisterMap`.
+
+    Verified values are confirmed in the map's shadow, so later
+    :func:`verify_map` steps do not read them again.
+    """
+
+    def execute():
+        logger = get_active_logger()
+        if logger:
+            logger.info("")
+            logger.info("=" * 80)
+            logger.info("[WAVESHARE I2C] WRITE REGISTER MAP")
+            logger.info("=" * 80)
+            logger.info(f"  Device: #{regmap.dev_index}  Address: 0x{regmap.address:02X}")
+            logger.info("")
+        written = regmap.write(values, verify=verify)
+        if logger:
+            for reg in sorted(written):
+                logger.info(f"    {regmap._label(reg)}: {written[reg].hex(' ').upper()}")
+            logger.info("")
+            logger.info(f"[OK] Wrote {len(written)} register(s)"
+                        + (" (verified)" if verify else ""))
+            logger.info("=" * 80)
+        return written
+
+    metadata = {
+        'display_command': f"I2C map write dev#{regmap.dev_index} 0x{regmap.address:02X} "
+                           f"[{len(values)} regs]",
+        'display_expected': 'Verified' if verify else 'ACK',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def verify_map(
+        name: str,
+        regmap: RegisterMap,
+        expected: Dict[Union[int, str], RegisterValue],
+        masks: Optional[Dict[Union[int, str], int]] = None,
+        refresh: bool = False,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that checks register values through a :class:`RegisterMap`.
+
+    Confirmed values come from the shadow; only unconfirmed or volatile
+    registers are read from the bus (``refresh`` forces a full re-read).
+    """
+
+    def execute():
+        logger = get_active_logger()
+        if logger:
+            logger.info("")
+            logger.info("=" * 80)
+            logger.info("[WAVESHARE I2C] VERIFY REGISTER MAP")
+            logger.info("=" * 80)
+            logger.info(f"  Device: #{regmap.dev_index}  Address: 0x{regmap.address:02X}")
+            logger.info("")
+        reads_before = regmap.bus_reads
+        mismatches = regmap.compare(expected, refresh=refresh, masks=masks)
+        bus_reads = regmap.bus_reads - reads_before
+        if mismatches:
+            detail = ", ".join(
+                f"{regmap._label(r)} expected {e.hex().upper()} got {a.hex().upper()}"
+                for r, e, a in mismatches)
+            if logger:
+                logger.error("[WAVESHARE I2C] REGISTER MAP VALIDATION FAILED")
+                for r, e, a in mismatches:
+                    logger.error(f"  {regmap._label(r)}: expected {e.hex(' ').upper()}, "
+                                 f"got {a.hex(' ').upper()}")
+            raise WaveshareI2CError(
+                f"I2C register map mismatch at 0x{regmap.address:02X}: {detail}"
+            )
+        if logger:
+            logger.info(f"  Checked {len(expected)} register(s), "
+                        f"{bus_reads} read from bus, {len(expected) - bus_reads} from shadow")
+            logger.info(f"[OK] Register map verified")
+            logger.info("=" * 80)
+        return True
+
+    metadata = {
+        'display_command': f"I2C map verify dev#{regmap.dev_index} 0x{regmap.address:02X} "
+                           f"[{len(expected)} regs]",
+        'display_expected': ", ".join(
+            f"{k if isinstance(k, str) else f'0x{k:02X}'}="
+            f"{v.hex().upper() if isinstance(v, bytes) else f'0x{v:X}'}"
+            for k, v in expected.items()),
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
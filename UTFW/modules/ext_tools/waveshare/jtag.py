@@ -40,6 +40,14 @@ Usage:
         target_cfg="stm32f4x",
     )
 
+    # Persistent session: OpenOCD starts once, actions talk to it over
+    # the TCL RPC port and it is shut down at teardown
+    action = waveshare.jtag.start_session("Start OpenOCD", target_cfg="stm32f4x")
+    action = waveshare.jtag.read_memory(
+        "Peek SRAM", target_cfg="stm32f4x", address=0x20000000,
+        length=4, session="default",
+    )
+
 Author: DvidMakesThings
 """
 
@@ -48,10 +56,10 @@ import subprocess
 import time
 import re
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 
 from ....core.logger import get_active_logger
-from ....core.core import TestAction
+from ....core.core import TestAction, get_active_framework
 from ._base import (
     WaveshareError,
     OPENOCD_BIN,
@@ -60,6 +68,7 @@ from ._base import (
     OPENOCD_SWD_CFG,
     OPENOCD_DIR,
 )
+from .openocd_rpc import OpenOCDSession, WaveshareRPCError, OPENOCD_TCL_PORT
 
 DEBUG = False  # Set to True to enable debug prints
 
@@ -296,7 +305,8 @@ def _parse_idcodes(output: str) -> List[str]:
 # ======================== Core JTAG Functions ========================
 
 def scan_chain(timeout: float = OPENOCD_TIMEOUT,
-               config_file: Optional[str] = None) -> List[str]:
+               config_file: Optional[str] = None,
+               session: Optional[str] = None) -> List[str]:
     """Scan the JTAG chain and return detected device IDCODEs.
 
     Uses OpenOCD to initialise the CH347 adapter, perform a JTAG chain
@@ -305,6 +315,8 @@ def scan_chain(timeout: float = OPENOCD_TIMEOUT,
     Args:
         timeout (float, optional): OpenOCD execution timeout. Defaults to OPENOCD_TIMEOUT.
         config_file (Optional[str], optional): Override default ch347.cfg.
+        session (Optional[str], optional): Scan on this persistent session
+            instead of launching OpenOCD.
 
     Returns:
         List[str]: List of IDCODE strings found on the chain.
@@ -321,12 +333,14 @@ def scan_chain(timeout: float = OPENOCD_TIMEOUT,
         logger.info("=" * 80)
         logger.info("")
 
-    commands = [
-        "init",
-        "scan_chain",
-    ]
-
-    output = _run_openocd(commands, timeout, config_file=config_file)
+    if session is not None:
+        output = _run_session_commands(session, ["scan_chain"], timeout)
+    else:
+        commands = [
+            "init",
+            "scan_chain",
+        ]
+        output = _run_openocd(commands, timeout, config_file=config_file)
     idcodes = _parse_idcodes(output)
 
     if logger:
@@ -360,7 +374,8 @@ def run_openocd_command(commands: List[str], timeout: float = OPENOCD_TIMEOUT,
 
 
 def _read_idcode(timeout: float = OPENOCD_TIMEOUT,
-                 config_file: Optional[str] = None) -> Optional[str]:
+                 config_file: Optional[str] = None,
+                 session: Optional[str] = None) -> Optional[str]:
     """Read the IDCODE of the first device on the JTAG chain.
 
     Convenience function that scans the chain and returns the first
@@ -385,7 +400,7 @@ def _read_idcode(timeout: float = OPENOCD_TIMEOUT,
         logger.info("=" * 80)
         logger.info("")
 
-    idcodes = scan_chain(timeout, config_file)
+    idcodes = scan_chain(timeout, config_file, session)
 
     if not idcodes:
         if logger:
@@ -483,6 +498,7 @@ def scan(
         expected_count: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False
 ) -> TestAction:
     """Create a TestAction that scans the JTAG chain.
@@ -493,6 +509,7 @@ def scan(
             If None, count is not validated.
         timeout (float, optional): OpenOCD timeout. Defaults to OPENOCD_TIMEOUT.
         config_file (Optional[str], optional): Override default ch347.cfg.
+        session (Optional[str], optional): Persistent session to run on.
         negative_test (bool, optional): Mark as negative test. Defaults to False.
 
     Returns:
@@ -506,7 +523,7 @@ def scan(
 
     def execute():
         logger = get_active_logger()
-        idcodes = scan_chain(timeout, config_file)
+        idcodes = scan_chain(timeout, config_file, session)
 
         if expected_count is not None and len(idcodes) != expected_count:
             if logger:
@@ -541,6 +558,7 @@ def read_idcode(
         expected_idcode: Optional[str] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False
 ) -> TestAction:
     """Create a TestAction that reads and optionally verifies the JTAG IDCODE.
@@ -554,6 +572,7 @@ def read_idcode(
             (e.g., "0x0362D093"). If None, no validation is performed.
         timeout (float, optional): OpenOCD timeout. Defaults to OPENOCD_TIMEOUT.
         config_file (Optional[str], optional): Override default ch347.cfg.
+        session (Optional[str], optional): Persistent session to run on.
         negative_test (bool, optional): Mark as negative test. Defaults to False.
 
     Returns:
@@ -567,7 +586,7 @@ def read_idcode(
 
     def execute():
         logger = get_active_logger()
-        idcode = _read_idcode(timeout, config_file)
+        idcode = _read_idcode(timeout, config_file, session)
 
         if idcode is None:
             if logger:
@@ -778,36 +797,17 @@ def _resolve_target_cfg(target_cfg: str) -> Path:
     )
 
 
-def _run_openocd_with_target(
-        commands: List[str],
+def _openocd_target_argv(
         target_cfg: str,
         transport: str = "jtag",
         adapter_speed: Optional[int] = None,
-        timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
-) -> str:
-    """Run OpenOCD with adapter + target config and given commands.
-
-    Builds the full command line:
-      openocd -s <scripts>
-              -f <ch347.cfg>
-              [-c "transport select <transport>"]
-              [-c "adapter speed <khz>"]
-              -f <target.cfg>
-              -c "init" -c <commands...> -c "shutdown"
-
-    Args:
-        commands: OpenOCD TCL commands to execute after init.
-        target_cfg: Target config name/path (see _resolve_target_cfg).
-        transport: "jtag" or "swd" (overrides the default in ch347.cfg).
-        adapter_speed: Clock speed in kHz, or None for default.
-        timeout: Execution timeout.
-        config_file: Override ch347.cfg path.
+) -> Tuple[List[str], Path, Path]:
+    """Build the OpenOCD command line up to (not including) ``init``.
 
     Returns:
-        Combined stdout+stderr output.
+        Tuple of (argv, adapter config path, target config path).
     """
-    logger = get_active_logger()
     openocd_bin = _check_openocd()
 
     # Select the right adapter config for the transport
@@ -839,6 +839,44 @@ def _run_openocd_with_target(
     if transport.lower() == "swd":
         cmd.extend(["-c", "reset_config none"])
 
+    return cmd, cfg, target_path
+
+
+def _run_openocd_with_target(
+        commands: List[str],
+        target_cfg: str,
+        transport: str = "jtag",
+        adapter_speed: Optional[int] = None,
+        timeout: float = OPENOCD_TIMEOUT,
+        config_file: Optional[str] = None,
+) -> str:
+    """Run OpenOCD with adapter + target config and given commands.
+
+    Builds the full command line:
+      openocd -s <scripts>
+              -f <ch347.cfg>
+              [-c "transport select <transport>"]
+              [-c "adapter speed <khz>"]
+              -f <target.cfg>
+              -c "init" -c <commands...> -c "shutdown"
+
+    Args:
+        commands: OpenOCD TCL commands to execute after init.
+        target_cfg: Target config name/path (see _resolve_target_cfg).
+        transport: "jtag" or "swd" (overrides the default in ch347.cfg).
+        adapter_speed: Clock speed in kHz, or None for default.
+        timeout: Execution timeout.
+        config_file: Override ch347.cfg path.
+
+    Returns:
+        Combined stdout+stderr output.
+    """
+    logger = get_active_logger()
+    openocd_bin = _check_openocd()
+    cmd, cfg, target_path = _openocd_target_argv(
+        target_cfg, transport, adapter_speed, config_file,
+    )
+
     # init + user commands + shutdown
     cmd.extend(["-c", "init"])
     for c in commands:
@@ -907,6 +945,240 @@ def _run_openocd_with_target(
         raise WaveshareJTAGError(f"OpenOCD execution failed: {type(e).__name__}: {e}")
 
 
+# ======================== Persistent Sessions ========================
+
+_SESSION_RESOURCE_PREFIX = "openocd-session:"
+_SESSIONS: Dict[str, OpenOCDSession] = {}
+
+
+def open_session(
+        target_cfg: Optional[str] = None,
+        transport: str = "jtag",
+        adapter_speed: Optional[int] = None,
+        config_file: Optional[str] = None,
+        session: str = "default",
+        host: str = "127.0.0.1",
+        port: int = OPENOCD_TCL_PORT,
+        attach: bool = False,
+        startup_timeout: float = 10.0,
+        timeout: float = OPENOCD_TIMEOUT,
+) -> OpenOCDSession:
+    """Start (or attach to) a persistent OpenOCD server and register it.
+
+    The server is started once with the adapter and, if given, target
+    configuration, initialised, and then driven over its TCL RPC port.
+    Inside a running test the session is registered with the framework
+    and shut down automatically at teardown.
+
+    Args:
+        target_cfg: Target config (None = adapter only, e.g. chain scans).
+        transport: "jtag" or "swd".
+        adapter_speed: Clock speed in kHz.
+        config_file: Override ch347.cfg.
+        session: Session name used by the ``session=`` action parameter.
+        host: RPC host.
+        port: TCL RPC port.
+        attach: Connect to an already running server instead of starting one.
+        startup_timeout: Seconds to wait for the RPC port.
+        timeout: Default per-command timeout.
+
+    Returns:
+        OpenOCDSession: The running session.
+    """
+    if session in _SESSIONS:
+        raise WaveshareJTAGError(f"OpenOCD session '{session}' is already open")
+
+    argv = None
+    if not attach:
+        if target_cfg is not None:
+            argv, _cfg, _target = _openocd_target_argv(
+                target_cfg, transport, adapter_speed, config_file,
+            )
+        else:
+            argv = [str(_check_openocd())]
+            if OPENOCD_SCRIPTS.exists():
+                argv.extend(["-s", str(OPENOCD_SCRIPTS)])
+            argv.extend(["-f", str(Path(config_file) if config_file else _check_config())])
+            if adapter_speed is not None:
+                argv.extend(["-c", f"adapter speed {adapter_speed}"])
+
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info(f"[WAVESHARE JTAG] OPENOCD SESSION '{session}' START")
+        logger.info("=" * 80)
+        logger.info(f"  Mode:      {'attach' if attach else 'spawn'}")
+        logger.info(f"  RPC:       {host}:{port}")
+        logger.info(f"  Target:    {target_cfg or '-'}")
+        logger.info(f"  Transport: {transport}")
+        logger.info("")
+
+    sess = OpenOCDSession(argv, host=host, port=port, cwd=str(OPENOCD_DIR),
+                          startup_timeout=startup_timeout, command_timeout=timeout,
+                          name=session)
+    start = time.perf_counter()
+    try:
+        sess.start()
+    except WaveshareRPCError as exc:
+        if logger:
+            logger.error(f"[WAVESHARE JTAG ERROR] {exc}")
+        raise WaveshareJTAGError(str(exc)) from exc
+
+    _SESSIONS[session] = sess
+    fw = get_active_framework()
+    if fw is not None:
+        fw.register_resource(f"{_SESSION_RESOURCE_PREFIX}{session}", sess,
+                             lambda _s: _end_session(session))
+
+    if logger:
+        logger.info(f"[OK] Session ready in {time.perf_counter() - start:.2f}s")
+        logger.info("=" * 80)
+        logger.info("")
+    return sess
+
+
+def get_session(session: str = "default") -> OpenOCDSession:
+    """Return an open session by name.
+
+    Raises:
+        WaveshareJTAGError: If no such session is open.
+    """
+    try:
+        return _SESSIONS[session]
+    except KeyError:
+        raise WaveshareJTAGError(f"No OpenOCD session '{session}' is open") from None
+
+
+def _end_session(session: str) -> Optional[OpenOCDSession]:
+    sess = _SESSIONS.pop(session, None)
+    if sess is not None:
+        sess.close()
+    return sess
+
+
+def close_session(session: str = "default") -> None:
+    """Shut down a session (no-op if it is not open)."""
+    fw = get_active_framework()
+    if fw is not None:
+        fw.release_resource(f"{_SESSION_RESOURCE_PREFIX}{session}")
+    _end_session(session)
+
+
+def _run_session_commands(session: str, commands: List[str],
+                          timeout: Optional[float] = None,
+                          pipeline: bool = True) -> str:
+    """Run commands on an open session and return their joined output."""
+    logger = get_active_logger()
+    sess = get_session(session)
+
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info(f"[WAVESHARE JTAG] OPENOCD SESSION '{session}'")
+        logger.info("=" * 80)
+        logger.info("  Commands:")
+        for i, c in enumerate(commands, 1):
+            logger.info(f"    [{i}] {c}")
+        logger.info("")
+
+    start = time.perf_counter()
+    try:
+        outputs = sess.commands(commands, timeout, pipeline=pipeline)
+    except WaveshareRPCError as exc:
+        if logger:
+            logger.error(f"[WAVESHARE JTAG ERROR] {exc}")
+            if not sess.is_healthy():
+                logger.error("  Session is no longer healthy. OpenOCD output (tail):")
+                for line in sess.output_tail(20).split('\n'):
+                    logger.error(f"    {line}")
+        raise WaveshareJTAGError(str(exc)) from exc
+    output = "\n".join(o.rstrip("\n") for o in outputs if o)
+
+    if logger:
+        logger.info("-" * 80)
+        logger.info("  OpenOCD Output:")
+        logger.info("-" * 80)
+        for line in output.strip().split('\n'):
+            logger.info(f"    {line}")
+        logger.info("-" * 80)
+        logger.info(f"  {len(commands)} command(s) in {(time.perf_counter() - start) * 1000:.1f} ms")
+        logger.info("=" * 80)
+    return output
+
+
+def _run_target(commands: List[str], target_cfg: str, transport: str = "jtag",
+                adapter_speed: Optional[int] = None,
+                timeout: float = OPENOCD_TIMEOUT,
+                config_file: Optional[str] = None,
+                session: Optional[str] = None,
+                pipeline: bool = True) -> str:
+    """Run target commands on a session if given, else in a one-shot OpenOCD."""
+    if session is not None:
+        return _run_session_commands(session, commands, timeout, pipeline)
+    return _run_openocd_with_target(
+        commands, target_cfg, transport, adapter_speed, timeout, config_file,
+    )
+
+
+def start_session(
+        name: str,
+        target_cfg: Optional[str] = None,
+        transport: str = "jtag",
+        adapter_speed: Optional[int] = None,
+        config_file: Optional[str] = None,
+        session: str = "default",
+        port: int = OPENOCD_TCL_PORT,
+        attach: bool = False,
+        startup_timeout: float = 10.0,
+        timeout: float = OPENOCD_TIMEOUT,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that starts a persistent OpenOCD session.
+
+    Later actions given ``session=<name>`` run their commands on this
+    server over the TCL RPC port instead of launching OpenOCD each time.
+    The session is shut down by :func:`stop_session` or at teardown.
+    """
+
+    def execute():
+        sess = open_session(target_cfg, transport, adapter_speed, config_file,
+                            session, port=port, attach=attach,
+                            startup_timeout=startup_timeout, timeout=timeout)
+        return {"session": session, "port": sess.port, "spawned": sess.owns_process}
+
+    metadata = {
+        'display_command': f"OpenOCD session '{session}' start ({target_cfg or 'adapter'}, {transport})",
+        'display_expected': 'RPC ready',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def stop_session(
+        name: str,
+        session: str = "default",
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that shuts down a persistent OpenOCD session."""
+
+    def execute():
+        sess = get_session(session)
+        stats = {"session": session, "round_trips": sess.round_trips,
+                 "commands": sess.commands_sent, "busy_s": sess.busy_s}
+        close_session(session)
+        logger = get_active_logger()
+        if logger:
+            logger.info(f"[OK] OpenOCD session '{session}' closed "
+                        f"({stats['commands']} commands, {stats['round_trips']} round trips)")
+        return stats
+
+    metadata = {
+        'display_command': f"OpenOCD session '{session}' stop",
+        'display_expected': 'closed',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
 # ======================== Flash / Target TestActions ========================
 
 def flash_image(
@@ -921,6 +1193,7 @@ def flash_image(
         adapter_speed: Optional[int] = None,
         timeout: float = 120,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False
 ) -> TestAction:
     """Create a TestAction that flashes a firmware image via JTAG/SWD.
@@ -934,6 +1207,7 @@ def flash_image(
         erase: Erase sectors before write. Defaults to True.
         reset_after: Issue "reset run" after programming.
         transport: "jtag" or "swd".
+        session: Run on this persistent session (see start_session).
         adapter_speed: Clock speed in kHz.
         timeout: OpenOCD timeout (flashing can be slow).
         config_file: Override ch347.cfg.
@@ -977,9 +1251,9 @@ def flash_image(
         if reset_after:
             commands.append("reset run")
 
-        output = _run_openocd_with_target(
+        output = _run_target(
             commands, target_cfg, transport, adapter_speed,
-            timeout, config_file,
+            timeout, config_file, session, pipeline=False,
         )
 
         if logger:
@@ -1003,6 +1277,7 @@ def flash_verify(
         adapter_speed: Optional[int] = None,
         timeout: float = 60,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False
 ) -> TestAction:
     """Create a TestAction that verifies flash contents against an image."""
@@ -1019,9 +1294,9 @@ def flash_verify(
             verify_cmd += f" 0x{address:08X}"
         commands.append(verify_cmd)
 
-        output = _run_openocd_with_target(
+        output = _run_target(
             commands, target_cfg, transport, adapter_speed,
-            timeout, config_file,
+            timeout, config_file, session,
         )
 
         logger = get_active_logger()
@@ -1043,15 +1318,16 @@ def reset_halt(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False
 ) -> TestAction:
     """Create a TestAction that resets and halts the target."""
 
     def execute():
         halt_cmd = "halt" if transport.lower() == "swd" else "reset halt"
-        output = _run_openocd_with_target(
+        output = _run_target(
             [halt_cmd], target_cfg, transport, adapter_speed,
-            timeout, config_file,
+            timeout, config_file, session,
         )
         logger = get_active_logger()
         if logger:
@@ -1076,6 +1352,7 @@ def read_memory(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False
 ) -> TestAction:
     """Create a TestAction that reads memory from the target.
@@ -1088,6 +1365,7 @@ def read_memory(
         width: Access width in bits (8, 16, or 32).
         expected: Optional substring that must appear in output.
         transport: "jtag" or "swd".
+        session: Run on this persistent session (see start_session).
     """
 
     def execute():
@@ -1096,15 +1374,16 @@ def read_memory(
         cmd_map = {32: "mdw", 16: "mdh", 8: "mdb"}
         md_cmd = cmd_map.get(width, "mdw")
 
-        halt_cmd = "halt" if transport.lower() == "swd" else "reset halt"
+        # A persistent session keeps target state: halt, never reset
+        halt_cmd = "halt" if transport.lower() == "swd" or session else "reset halt"
         commands = [
             halt_cmd,
             f"{md_cmd} 0x{address:08X} {length}",
         ]
 
-        output = _run_openocd_with_target(
+        output = _run_target(
             commands, target_cfg, transport, adapter_speed,
-            timeout, config_file,
+            timeout, config_file, session,
         )
 
         if expected is not None and expected not in output:
@@ -1136,6 +1415,7 @@ def write_memory(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False
 ) -> TestAction:
     """Create a TestAction that writes values to target memory.
@@ -1147,6 +1427,7 @@ def write_memory(
         values: List of integer values to write.
         width: Access width in bits (8, 16, or 32).
         transport: "jtag" or "swd".
+        session: Run on this persistent session (see start_session).
     """
 
     def execute():
@@ -1155,15 +1436,16 @@ def write_memory(
         cmd_map = {32: "mww", 16: "mwh", 8: "mwb"}
         mw_cmd = cmd_map.get(width, "mww")
 
-        halt_cmd = "halt" if transport.lower() == "swd" else "reset halt"
+        # A persistent session keeps target state: halt, never reset
+        halt_cmd = "halt" if transport.lower() == "swd" or session else "reset halt"
         commands = [halt_cmd]
         for i, val in enumerate(values):
             addr = address + i * (width // 8)
             commands.append(f"{mw_cmd} 0x{addr:08X} 0x{val:X}")
 
-        output = _run_openocd_with_target(
+        output = _run_target(
             commands, target_cfg, transport, adapter_speed,
-            timeout, config_file,
+            timeout, config_file, session,
         )
 
         if logger:
@@ -1190,6 +1472,7 @@ def run_target_command(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False
 ) -> TestAction:
     """Create a TestAction that runs OpenOCD commands with a target config.
@@ -1203,13 +1486,14 @@ def run_target_command(
         commands: OpenOCD TCL commands (init is added automatically).
         expected_output: Substring that must appear in output.
         transport: "jtag" or "swd".
+        session: Run on this persistent session (see start_session).
     """
 
     def execute():
         logger = get_active_logger()
-        output = _run_openocd_with_target(
+        output = _run_target(
             commands, target_cfg, transport, adapter_speed,
-            timeout, config_file,
+            timeout, config_file, session,
         )
 
         if expected_output is not None and expected_output not in output:
@@ -0,0 +1,607 @@
+# memory.py
+"""
+UTFW Waveshare Target Memory Module
+====================================
+Binary memory engine for JTAG/SWD targets behind the CH347 adapter.
+
+``jtag.read_memory`` prints ``mdw``/``mdh``/``mdb`` text and matches
+substrings, which is slow for large regions and cannot be compared
+numerically. This module moves regions as raw bytes instead:
+
+- Reads use OpenOCD ``dump_image`` into a temp file (one transfer for the
+  whole region). On a persistent session whose server is not on this
+  host, ``read_memory`` over the RPC port is used instead.
+- Writes use ``load_image`` from a temp file.
+- Results are plain ``bytes``; :func:`as_words` gives a numeric view as
+  a stdlib ``array`` of 8/16/32-bit values.
+- Comparisons support per-byte masks (a short mask such as a 4-byte word
+  mask is repeated over the region), CRC32 and diffing against the
+  loadable segments of an ELF, Intel HEX or raw BIN image.
+
+All actions accept ``session=`` to run on a persistent OpenOCD session
+(see ``jtag.start_session``).
+
+Usage:
+    import UTFW
+    waveshare = UTFW.modules.ext_tools.waveshare
+
+    action = waveshare.memory.dump_memory(
+        "Check SRAM pattern", target_cfg="stm32f4x",
+        address=0x20000000, length=0x1000, expected_crc32=0x1C291CA3,
+    )
+    action = waveshare.memory.verify_image(
+        "Verify flash against ELF", image="firmware.elf",
+        target_cfg="stm32f4x", session="default",
+    )
+
+Author: DvidMakesThings
+"""
+
+import os
+import struct
+import tempfile
+import time
+import zlib
+from array import array
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple, Union
+
+from ....core.logger import get_active_logger
+from ....core.core import TestAction
+from .jtag import (
+    WaveshareJTAGError,
+    OPENOCD_TIMEOUT,
+    _run_target,
+    get_session,
+)
+from .openocd_rpc import WaveshareRPCError
+
+# Words per ``read_memory`` RPC command
+RPC_READ_WORDS = 1024
+
+# Mismatches listed in errors and results
+MAX_REPORTED_MISMATCHES = 16
+
+# Compare granularity used to locate differences
+_COMPARE_BLOCK = 4096
+
+_LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+class WaveshareMemoryError(WaveshareJTAGError):
+    """Exception raised when a target memory operation or comparison fails."""
+    pass
+
+
+# ======================== Image Loading ========================
+
+def _parse_ihex(path: Path) -> List[Tuple[int, bytes]]:
+    segments: List[Tuple[int, bytearray]] = []
+    base = 0
+    for lineno, line in enumerate(path.read_text().splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith(":"):
+            raise WaveshareMemoryError(f"{path}:{lineno}: not an Intel HEX record")
+        try:
+            rec = bytes.fromhex(line[1:])
+        except ValueError:
+            raise WaveshareMemoryError(f"{path}:{lineno}: invalid hex digits") from None
+        if len(rec) < 5 or len(rec) != rec[0] + 5 or sum(rec) & 0xFF:
+            raise WaveshareMemoryError(f"{path}:{lineno}: bad length or checksum")
+        count, offset, rtype = rec[0], (rec[1] << 8) | rec[2], rec[3]
+        payload = rec[4:4 + count]
+        if rtype == 0x00:
+            addr = base + offset
+            if segments and segments[-1][0] + len(segments[-1][1]) == addr:
+                segments[-1][1].extend(payload)
+            else:
+                segments.append((addr, bytearray(payload)))
+        elif rtype == 0x01:
+            break
+        elif rtype == 0x02:
+            base = int.from_bytes(payload, "big") << 4
+        elif rtype == 0x04:
+            base = int.from_bytes(payload, "big") << 16
+    return [(a, bytes(d)) for a, d in segments]
+
+
+def _parse_elf(path: Path) -> List[Tuple[int, bytes]]:
+    raw = path.read_bytes()
+    if raw[:4] != b"\x7fELF":
+        raise WaveshareMemoryError(f"{path}: not an ELF file")
+    is64 = raw[4] == 2
+    endian = "<" if raw[5] == 1 else ">"
+    if is64:
+        phoff, = struct.unpack_from(endian + "Q", raw, 0x20)
+        phentsize, phnum = struct.unpack_from(endian + "HH", raw, 0x36)
+        fmt = endian + "IIQQQQQQ"
+    else:
+        phoff, = struct.unpack_from(endian + "I", raw, 0x1C)
+        phentsize, phnum = struct.unpack_from(endian + "HH", raw, 0x2A)
+        fmt = endian + "IIIIIIII"
+    segments = []
+    for i in range(phnum):
+        fields = struct.unpack_from(fmt, raw, phoff + i * phentsize)
+        if is64:
+            p_type, _flags, p_offset, _vaddr, p_paddr, p_filesz = fields[:6]
+        else:
+            p_type, p_offset, _vaddr, p_paddr, p_filesz = fields[:5]
+        # PT_LOAD with file content; paddr is the load (flash) address
+        if p_type == 1 and p_filesz:
+            segments.append((p_paddr, raw[p_offset:p_offset + p_filesz]))
+    return sorted(segments)
+
+
+def load_image_segments(image: str, base_address: Optional[int] = None
+                        ) -> List[Tuple[int, bytes]]:
+    """Return the ``(address, data)`` segments an image occupies in target memory.
+
+    Args:
+        image: Path to a .elf, .hex/.ihex or .bin file.
+        base_address: Load address for .bin files (required for them).
+
+    Returns:
+        Sorted list of (address, bytes) segments.
+    """
+    path = Path(image)
+    if not path.exists():
+        raise WaveshareMemoryError(f"Image file not found: {path}")
+    suffix = path.suffix.lower()
+    if suffix in (".hex", ".ihex"):
+        return _parse_ihex(path)
+    if suffix == ".elf" or path.read_bytes()[:4] == b"\x7fELF":
+        return _parse_elf(path)
+    if base_address is None:
+        raise WaveshareMemoryError(f"base_address is required for binary image {path.name}")
+    return [(base_address, path.read_bytes())]
+
+
+# ======================== Comparison ========================
+
+def as_words(data: bytes, width: int = 32, byteorder: str = "little") -> array:
+    """Return ``data`` as an array of unsigned ``width``-bit values."""
+    codes = {8: "B", 16: "H", 32: "I", 64: "Q"}
+    code = codes.get(width)
+    if code is None or array(code).itemsize * 8 != width:
+        raise WaveshareMemoryError(f"Unsupported word width: {width}")
+    if len(data) % (width // 8):
+        raise WaveshareMemoryError(f"Length {len(data)} is not a multiple of {width // 8} bytes")
+    words = array(code, data)
+    if (byteorder == "little") != (struct.pack("=H", 1) == b"\x01\x00"):
+        words.byteswap()
+    return words
+
+
+def _expand_mask(mask: Union[bytes, int, None], length: int) -> Optional[bytes]:
+    if mask is None:
+        return None
+    if isinstance(mask, int):
+        mask = mask.to_bytes(4, "little")
+    mask = bytes(mask)
+    if not mask:
+        return None
+    reps = -(-length // len(mask))
+    return (mask * reps)[:length]
+
+
+def compare_region(actual: bytes, expected: bytes,
+                   mask: Union[bytes, int, None] = None,
+                   max_report: int = MAX_REPORTED_MISMATCHES
+                   ) -> Tuple[int, List[Tuple[int, int, int]]]:
+    """Compare two regions, optionally under a mask.
+
+    Args:
+        actual: Bytes read from the target.
+        expected: Reference bytes (same length).
+        mask: Per-byte mask, repeated over the region; an int is taken as
+            a 32-bit little-endian word mask. Only set bits are compared.
+        max_report: Mismatching bytes to list.
+
+    Returns:
+        Tuple of (number of mismatching bytes, [(offset, expected, actual)]).
+    """
+    if len(actual) != len(expected):
+        raise WaveshareMemoryError(
+            f"Length mismatch: read {len(actual)} bytes, expected {len(expected)}"
+        )
+    mask_b = _expand_mask(mask, len(actual))
+    if mask_b is None:
+        if actual == expected:
+            return 0, []
+    else:
+        # Whole-region test with big-int XOR/AND before locating anything
+        diff = (int.from_bytes(actual, "little") ^ int.from_bytes(expected, "little")) \
+            & int.from_bytes(mask_b, "little")
+        if not diff:
+            return 0, []
+
+    count = 0
+    report: List[Tuple[int, int, int]] = []
+    a_view, e_view = memoryview(actual), memoryview(expected)
+    for start in range(0, len(actual), _COMPARE_BLOCK):
+        end = min(start + _COMPARE_BLOCK, len(actual))
+        if mask_b is None and a_view[start:end] == e_view[start:end]:
+            continue
+        for i in range(start, end):
+            a, e = actual[i], expected[i]
+            if mask_b is not None:
+                m = mask_b[i]
+                if not (a ^ e) & m:
+                    continue
+            elif a == e:
+                continue
+            count += 1
+            if len(report) < max_report:
+                report.append((i, e, a))
+    return count, report
+
+
+def crc32(data: bytes) -> int:
+    """Return the standard (zlib/IEEE 802.3) CRC32 of ``data``."""
+    return zlib.crc32(data) & 0xFFFFFFFF
+
+
+# ======================== Target Access ========================
+
+def _halt_commands(transport: str, session: Optional[str], halt: bool) -> List[str]:
+    if not halt:
+        return []
+    # Same policy as jtag.read_memory: sessions and SWD never reset
+    return ["halt" if transport.lower() == "swd" or session else "reset halt"]
+
+
+def _use_rpc(session: Optional[str], method: str) -> bool:
+    if method == "rpc":
+        if session is None:
+            raise WaveshareMemoryError("method='rpc' requires a session")
+        return True
+    if method == "dump" or session is None:
+        return False
+    return get_session(session).host not in _LOCAL_HOSTS
+
+
+def _rpc_read(session: str, address: int, length: int,
+              timeout: Optional[float]) -> bytes:
+    """Read with ``read_memory`` over the RPC port (32-bit words, pipelined)."""
+    sess = get_session(session)
+    head = (-address) % 4
+    head = min(head, length)
+    words = (length - head) // 4
+    tail = length - head - words * 4
+    commands = []
+    if head:
+        commands.append(f"read_memory 0x{address:08X} 8 {head}")
+    pos = address + head
+    for i in range(0, words, RPC_READ_WORDS):
+        n = min(RPC_READ_WORDS, words - i)
+        commands.append(f"read_memory 0x{pos:08X} 32 {n}")
+        pos += n * 4
+    if tail:
+        commands.append(f"read_memory 0x{pos:08X} 8 {tail}")
+    try:
+        replies = sess.commands(commands, timeout)
+    except WaveshareRPCError as exc:
+        raise WaveshareMemoryError(str(exc)) from exc
+
+    out = bytearray()
+    for command, reply in zip(commands, replies):
+        values = [int(tok, 16) for tok in reply.split()]
+        if " 32 " in command:
+            out += struct.pack(f"<{len(values)}I", *values)
+        else:
+            out += bytes(values)
+    return bytes(out)
+
+
+def read_region(address: int, length: int, target_cfg: str,
+                transport: str = "jtag", adapter_speed: Optional[int] = None,
+                timeout: float = OPENOCD_TIMEOUT, config_file: Optional[str] = None,
+                session: Optional[str] = None, halt: bool = True,
+                method: str = "auto") -> bytes:
+    """Read a target memory region as bytes.
+
+    Args:
+        address: Start address.
+        length: Number of bytes.
+        target_cfg: Target config (ignored on a session).
+        transport: "jtag" or "swd".
+        session: Persistent OpenOCD session to use.
+        halt: Halt the target first.
+        method: "dump" (dump_image to a temp file), "rpc" (read_memory over
+            the session socket) or "auto" (dump unless the session server
+            is remote).
+
+    Returns:
+        The region contents.
+    """
+    pre = _halt_commands(transport, session, halt)
+    if _use_rpc(session, method):
+        if pre:
+            _run_target(pre, target_cfg, transport, adapter_speed, timeout,
+                        config_file, session)
+        return _rpc_read(session, address, length, timeout)
+
+    fd, tmp = tempfile.mkstemp(prefix="utfw_dump_", suffix=".bin")
+    os.close(fd)
+    try:
+        tmp_tcl = Path(tmp).as_posix()
+        _run_target(pre + [f"dump_image {{{tmp_tcl}}} 0x{address:08X} {length}"],
+                    target_cfg, transport, adapter_speed, timeout, config_file,
+                    session, pipeline=False)
+        data = Path(tmp).read_bytes()
+    finally:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    if len(data) != length:
+        raise WaveshareMemoryError(
+            f"dump_image returned {len(data)} bytes, expected {length}"
+        )
+    return data
+
+
+def write_region(address: int, data: bytes, target_cfg: str,
+                 transport: str = "jtag", adapter_speed: Optional[int] = None,
+                 timeout: float = OPENOCD_TIMEOUT, config_file: Optional[str] = None,
+                 session: Optional[str] = None, halt: bool = True) -> None:
+    """Write bytes to target RAM/registers with ``load_image`` (not flash)."""
+    fd, tmp = tempfile.mkstemp(prefix="utfw_load_", suffix=".bin")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        tmp_tcl = Path(tmp).as_posix()
+        _run_target(_halt_commands(transport, session, halt)
+                    + [f"load_image {{{tmp_tcl}}} 0x{address:08X} bin"],
+                    target_cfg, transport, adapter_speed, timeout, config_file,
+                    session, pipeline=False)
+    finally:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _format_mismatches(mismatches: List[Tuple[int, int, int]], base: int) -> List[str]:
+    return [f"0x{base + off:08X}: expected 0x{e:02X}, read 0x{a:02X}"
+            for off, e, a in mismatches]
+
+
+def _log_banner(title: str) -> Any:
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info(f"[WAVESHARE MEMORY] {title}")
+        logger.info("=" * 80)
+    return logger
+
+
+# ======================== TestAction Factories ========================
+
+def dump_memory(
+        name: str,
+        target_cfg: str,
+        address: int,
+        length: int,
+        output_path: Optional[str] = None,
+        expected: Optional[bytes] = None,
+        mask: Union[bytes, int, None] = None,
+        expected_crc32: Optional[int] = None,
+        transport: str = "jtag",
+        adapter_speed: Optional[int] = None,
+        timeout: float = OPENOCD_TIMEOUT,
+        config_file: Optional[str] = None,
+        session: Optional[str] = None,
+        halt: bool = True,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that reads a memory region as bytes and checks it.
+
+    Args:
+        name: Human-readable name.
+        target_cfg: Target config.
+        address: Start address.
+        length: Number of bytes.
+        output_path: Also save the region to this file.
+        expected: Reference bytes (compared under ``mask`` if given).
+        mask: Per-byte mask or 32-bit word mask (int) for ``expected``.
+        expected_crc32: Required CRC32 of the region.
+        transport: "jtag" or "swd".
+        session: Run on this persistent session (see jtag.start_session).
+        halt: Halt the target before reading.
+
+    Returns:
+        TestAction returning a dict with address, length, crc32, seconds,
+        data and output_path.
+    """
+
+    def execute():
+        logger = _log_banner("DUMP REGION")
+        if logger:
+            logger.info(f"  Range: 0x{address:08X} - 0x{address + length - 1:08X} ({length} bytes)")
+            logger.info("")
+        start = time.perf_counter()
+        data = read_region(address, length, target_cfg, transport, adapter_speed,
+                           timeout, config_file, session, halt)
+        elapsed = time.perf_counter() - start
+        crc = crc32(data)
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            Path(output_path).write_bytes(data)
+
+        result = {"address": address, "length": length, "crc32": crc,
+                  "seconds": elapsed, "data": data, "output_path": output_path}
+        if logger:
+            logger.info(f"  CRC32: 0x{crc:08X}")
+            logger.info(f"  Read {length} bytes in {elapsed:.3f}s")
+
+        if expected_crc32 is not None and crc != expected_crc32:
+            if logger:
+                logger.error(f"  CRC32 mismatch: expected 0x{expected_crc32:08X}")
+            raise WaveshareMemoryError(
+                f"Region 0x{address:08X}+{length} CRC32 0x{crc:08X}, "
+                f"expected 0x{expected_crc32:08X}"
+            )
+        if expected is not None:
+            count, mismatches = compare_region(data, expected, mask)
+            result["mismatches"] = count
+            if count:
+                lines = _format_mismatches(mismatches, address)
+                if logger:
+                    logger.error(f"  {count} mismatching byte(s):")
+                    for line in lines:
+                        logger.error(f"    {line}")
+                raise WaveshareMemoryError(
+                    f"Region 0x{address:08X}+{length}: {count} mismatching byte(s), "
+                    f"first {lines[0]}"
+                )
+        if logger:
+            logger.info("[OK] Memory region read" + (" and verified" if expected is not None
+                                                      or expected_crc32 is not None else ""))
+            logger.info("=" * 80)
+        return result
+
+    exp_str = ""
+    if expected_crc32 is not None:
+        exp_str = f"CRC32 0x{expected_crc32:08X}"
+    elif expected is not None:
+        exp_str = f"{len(expected)} bytes match" + (" (masked)" if mask is not None else "")
+    metadata = {
+        'display_command': f"Dump 0x{address:08X} [{length}B]",
+        'display_expected': exp_str,
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def load_memory(
+        name: str,
+        target_cfg: str,
+        address: int,
+        data: Optional[bytes] = None,
+        input_path: Optional[str] = None,
+        verify: bool = True,
+        transport: str = "jtag",
+        adapter_speed: Optional[int] = None,
+        timeout: float = OPENOCD_TIMEOUT,
+        config_file: Optional[str] = None,
+        session: Optional[str] = None,
+        halt: bool = True,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that writes a byte buffer or file into target RAM.
+
+    With ``verify`` the region is read back in one dump and compared.
+    """
+    if (data is None) == (input_path is None):
+        raise WaveshareMemoryError("Provide exactly one of data or input_path")
+
+    def execute():
+        payload = data if data is not None else Path(input_path).read_bytes()
+        logger = _log_banner("LOAD REGION")
+        if logger:
+            logger.info(f"  Range: 0x{address:08X} - 0x{address + len(payload) - 1:08X} "
+                        f"({len(payload)} bytes)")
+            logger.info("")
+        write_region(address, payload, target_cfg, transport, adapter_speed,
+                     timeout, config_file, session, halt)
+        if verify:
+            readback = read_region(address, len(payload), target_cfg, transport,
+                                   adapter_speed, timeout, config_file, session,
+                                   halt=False)
+            count, mismatches = compare_region(readback, payload)
+            if count:
+                raise WaveshareMemoryError(
+                    f"Load verify failed: {count} mismatching byte(s), first "
+                    f"{_format_mismatches(mismatches, address)[0]}"
+                )
+        if logger:
+            logger.info(f"[OK] Loaded {len(payload)} bytes (CRC32 0x{crc32(payload):08X})"
+                        + (", verified" if verify else ""))
+            logger.info("=" * 80)
+        return {"address": address, "length": len(payload), "crc32": crc32(payload)}
+
+    source = input_path if input_path else f"{len(data)}B"
+    metadata = {
+        'display_command': f"Load {source} -> 0x{address:08X}",
+        'display_expected': 'verified' if verify else 'OK',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def verify_image(
+        name: str,
+        image: str,
+        target_cfg: str,
+        base_address: Optional[int] = None,
+        mask: Union[bytes, int, None] = None,
+        transport: str = "jtag",
+        adapter_speed: Optional[int] = None,
+        timeout: float = OPENOCD_TIMEOUT,
+        config_file: Optional[str] = None,
+        session: Optional[str] = None,
+        halt: bool = True,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that diffs target memory against an ELF/HEX/BIN image.
+
+    Every loadable segment is read with one dump and compared byte by
+    byte (under ``mask`` if given), so whole flash and RAM regions are
+    verified in a single step with exact mismatch addresses.
+
+    Args:
+        name: Human-readable name.
+        image: Path to .elf, .hex or .bin.
+        target_cfg: Target config.
+        base_address: Load address for .bin images.
+        mask: Optional per-byte / word mask.
+        session: Run on this persistent session (see jtag.start_session).
+
+    Returns:
+        TestAction returning a list of per-segment dicts (address, length,
+        crc32, mismatches).
+    """
+
+    def execute():
+        segments = load_image_segments(image, base_address)
+        logger = _log_banner("VERIFY IMAGE")
+        if logger:
+            logger.info(f"  Image:    {image}")
+            logger.info(f"  Segments: {len(segments)}")
+            logger.info("")
+
+        results: List[Dict[str, Any]] = []
+        failures: List[str] = []
+        for i, (addr, expected) in enumerate(segments):
+            actual = read_region(addr, len(expected), target_cfg, transport,
+                                 adapter_speed, timeout, config_file, session,
+                                 halt=halt and i == 0)
+            count, mismatches = compare_region(actual, expected, mask)
+            results.append({"address": addr, "length": len(expected),
+                            "crc32": crc32(actual), "mismatches": count})
+            if logger:
+                status = "OK" if not count else f"{count} mismatching byte(s)"
+                logger.info(f"  0x{addr:08X} [{len(expected):>8}B] CRC32 0x{crc32(actual):08X}  {status}")
+            if count:
+                lines = _format_mismatches(mismatches, addr)
+                failures.append(f"segment 0x{addr:08X}: {count} byte(s), first {lines[0]}")
+                if logger:
+                    for line in lines:
+                        logger.error(f"    {line}")
+
+        if failures:
+            raise WaveshareMemoryError("Image verify failed: " + "; ".join(failures))
+        if logger:
+            total = sum(r["length"] for r in results)
+            logger.info("")
+            logger.info(f"[OK] Image verified ({total} bytes in {len(results)} segment(s))")
+            logger.info("=" * 80)
+        return results
+
+    metadata = {
+        'display_command': f"Diff {Path(image).name} @ {target_cfg}",
+        'display_expected': 'match' + (" (masked)" if mask is not None else ""),
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
@@ -0,0 +1,409 @@
+# openocd_rpc.py
+"""
+UTFW Waveshare OpenOCD RPC Session
+===================================
+Persistent OpenOCD server session driven over the TCL RPC socket.
+
+The one-shot helpers in ``jtag`` launch a fresh OpenOCD process per
+action, which re-initialises the adapter and target every time and
+makes every memory peek cost seconds. An :class:`OpenOCDSession` starts
+OpenOCD once (or attaches to one that is already running), keeps the
+target initialised and sends commands over the TCL RPC port (6666 by
+default). Commands are framed with the ``0x1A`` terminator and can be
+pipelined: a batch is written in one go and the replies are read back
+in order, so N commands cost one round trip instead of N.
+
+Each command is wrapped as ``catch {capture {...}}`` so the reply carries
+both the Tcl status and the text the command printed, which lets the
+session raise on errors instead of scraping log output.
+
+The session objects are transport agnostic; ``jtag.start_session`` /
+``swd.start_session`` build the OpenOCD command line and register the
+session for teardown. Any server that speaks the same framing (for
+example a local stand-in used in tests) can be attached with
+``OpenOCDSession(argv=None, port=...)``.
+
+Usage:
+    from UTFW.modules.ext_tools.waveshare.openocd_rpc import OpenOCDSession
+
+    session = OpenOCDSession(argv=None, port=6666)   # attach to a server
+    session.start()
+    print(session.command("mdw 0x08000000 4"))
+    session.commands(["halt", "reg pc", "resume"])
+    session.close()
+
+Author: DvidMakesThings
+"""
+
+import collections
+import socket
+import subprocess
+import threading
+import time
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from ._base import WaveshareError
+
+# Default OpenOCD TCL RPC port
+OPENOCD_TCL_PORT = 6666
+
+# Message terminator of the TCL RPC protocol
+RPC_TERMINATOR = b"\x1a"
+
+# Commands in flight per pipelined window
+PIPELINE_DEPTH = 64
+
+# Lines of OpenOCD console output kept for error reports
+OUTPUT_TAIL_LINES = 200
+
+
+class WaveshareRPCError(WaveshareError):
+    """Exception raised when an OpenOCD RPC session fails.
+
+    Raised when the server cannot be started or reached, when the socket
+    times out or closes, and when a command returns a Tcl error.
+    """
+    pass
+
+
+# ======================== RPC Client ========================
+
+class OpenOCDRPCClient:
+    """Minimal TCL RPC client: ``0x1A``-terminated requests and replies.
+
+    Args:
+        host (str): Server host.
+        port (int): TCL RPC port.
+        timeout (float): Socket timeout per reply in seconds.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = OPENOCD_TCL_PORT,
+                 timeout: float = 30.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._buf = bytearray()
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    def connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self._buf.clear()
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+    def send(self, commands: Sequence[str]) -> None:
+        """Write a batch of commands in a single ``sendall``."""
+        if self._sock is None:
+            raise WaveshareRPCError("RPC client is not connected")
+        payload = b"".join(c.encode("utf-8") + RPC_TERMINATOR for c in commands)
+        try:
+            self._sock.sendall(payload)
+        except OSError as exc:
+            self.close()
+            raise WaveshareRPCError(f"RPC send failed: {exc}") from exc
+
+    def receive(self, timeout: Optional[float] = None) -> str:
+        """Read one reply (without the terminator).
+
+        A timeout drops the connection: the server may still answer the
+        command later, and that late reply must not be read as the reply
+        to the next one.
+        """
+        if self._sock is None:
+            raise WaveshareRPCError("RPC client is not connected")
+        deadline = time.monotonic() + (timeout if timeout is not None else self.timeout)
+        while True:
+            end = self._buf.find(RPC_TERMINATOR)
+            if end >= 0:
+                reply = bytes(self._buf[:end])
+                del self._buf[:end + 1]
+                return reply.decode("utf-8", errors="replace")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.close()
+                raise WaveshareRPCError("Timed out waiting for OpenOCD RPC reply")
+            self._sock.settimeout(remaining)
+            try:
+                chunk = self._sock.recv(65536)
+            except socket.timeout:
+                self.close()
+                raise WaveshareRPCError("Timed out waiting for OpenOCD RPC reply") from None
+            except OSError as exc:
+                self.close()
+                raise WaveshareRPCError(f"RPC receive failed: {exc}") from exc
+            if not chunk:
+                self.close()
+                raise WaveshareRPCError("OpenOCD closed the RPC connection")
+            self._buf += chunk
+
+    def request(self, commands: Sequence[str], timeout: Optional[float] = None,
+                depth: int = 0) -> List[str]:
+        """Send a pipelined batch and return the replies in order.
+
+        Args:
+            commands: Raw Tcl commands.
+            timeout: Reply timeout per command.
+            depth: Commands in flight at once (0 = ``PIPELINE_DEPTH``). The
+                window keeps both socket buffers from filling up on large
+                batches, which would otherwise deadlock client and server.
+        """
+        depth = depth or PIPELINE_DEPTH
+        replies: List[str] = []
+        for i in range(0, len(commands), depth):
+            window = commands[i:i + depth]
+            self.send(window)
+            replies.extend(self.receive(timeout) for _ in window)
+        return replies
+
+
+def _wrap(command: str) -> str:
+    """Wrap a command so the reply is ``"<status> <captured output>"``."""
+    return f'format "%d %s" [catch {{capture {{{command}}}}} _utfw_r] $_utfw_r'
+
+
+def _unwrap(reply: str) -> Tuple[int, str]:
+    status, _sep, text = reply.partition(" ")
+    try:
+        return int(status), text
+    except ValueError:
+        # Not a wrapped reply (e.g. server without capture support)
+        return 0, reply
+
+
+# ======================== Session ========================
+
+class OpenOCDSession:
+    """One OpenOCD server plus an RPC connection to it.
+
+    Args:
+        argv (Sequence[str], optional): OpenOCD command line (adapter and
+            target configs, no ``init``). None attaches to a server that is
+            already listening on ``host``/``port``.
+        host (str): RPC host. Defaults to 127.0.0.1.
+        port (int): TCL RPC port. Defaults to 6666.
+        cwd (str, optional): Working directory for the OpenOCD process.
+        startup_timeout (float): Seconds to wait for the RPC port.
+        command_timeout (float): Default per-command reply timeout.
+        name (str): Label used in logs and errors.
+    """
+
+    def __init__(self, argv: Optional[Sequence[str]] = None, host: str = "127.0.0.1",
+                 port: int = OPENOCD_TCL_PORT, cwd: Optional[str] = None,
+                 startup_timeout: float = 10.0, command_timeout: float = 30.0,
+                 name: str = "default"):
+        self.argv = list(argv) if argv is not None else None
+        self.host = host
+        self.port = port
+        self.cwd = cwd
+        self.startup_timeout = startup_timeout
+        self.command_timeout = command_timeout
+        self.name = name
+        self.client = OpenOCDRPCClient(host, port, command_timeout)
+        self.process: Optional[subprocess.Popen] = None
+        self._output: Deque[str] = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+        self._drain: Optional[threading.Thread] = None
+        self._lock = threading.RLock()
+        self.round_trips = 0
+        self.commands_sent = 0
+        self.busy_s = 0.0
+
+    # -- Lifecycle --
+
+    @property
+    def owns_process(self) -> bool:
+        return self.argv is not None
+
+    def server_argv(self) -> List[str]:
+        """Full OpenOCD command line used to start the server."""
+        return self.argv + [
+            "-c", "gdb_port disabled",
+            "-c", "telnet_port disabled",
+            "-c", f"tcl_port {self.port}",
+            "-c", "init",
+        ]
+
+    def start(self) -> "OpenOCDSession":
+        """Start the server (when owned) and connect to its RPC port."""
+        if self.owns_process and self.process is None:
+            try:
+                self.process = subprocess.Popen(
+                    self.server_argv(), cwd=self.cwd,
+                    stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT, text=True, errors="replace",
+                )
+            except OSError as exc:
+                raise WaveshareRPCError(f"Cannot start OpenOCD: {exc}") from exc
+            self._drain = threading.Thread(target=self._drain_output, daemon=True,
+                                           name=f"openocd-{self.name}")
+            self._drain.start()
+
+        try:
+            deadline = time.monotonic() + self.startup_timeout
+            while True:
+                if self.process is not None and self.process.poll() is not None:
+                    raise WaveshareRPCError(
+                        f"OpenOCD exited with status {self.process.returncode} during startup:\n"
+                        f"{self.output_tail(20)}"
+                    )
+                try:
+                    self.client.connect()
+                    break
+                except OSError as exc:
+                    if time.monotonic() >= deadline:
+                        raise WaveshareRPCError(
+                            f"OpenOCD RPC port {self.host}:{self.port} not reachable "
+                            f"after {self.startup_timeout}s: {exc}"
+                        ) from exc
+                    time.sleep(0.05)
+            self.check_health()
+        except BaseException:
+            # Never leave a half-started server behind
+            self.close(shutdown=False)
+            raise
+        return self
+
+    def _ensure_connected(self) -> None:
+        """Reconnect after a dropped connection (e.g. a reply timeout)."""
+        if self.client.connected:
+            return
+        if self.process is not None and self.process.poll() is not None:
+            raise WaveshareRPCError(
+                f"OpenOCD session '{self.name}' exited with status "
+                f"{self.process.returncode}:\n{self.output_tail(20)}"
+            )
+        try:
+            self.client.connect()
+        except OSError as exc:
+            raise WaveshareRPCError(
+                f"Cannot reconnect to OpenOCD RPC port {self.host}:{self.port}: {exc}"
+            ) from exc
+
+    def _drain_output(self) -> None:
+        for line in self.process.stdout:
+            self._output.append(line.rstrip("\n"))
+
+    def output_tail(self, lines: int = 50) -> str:
+        """Return the last lines of OpenOCD console output."""
+        return "\n".join(list(self._output)[-lines:])
+
+    def close(self, shutdown: bool = True, timeout: float = 5.0) -> None:
+        """Shut the server down (when owned) and drop the connection.
+
+        An owned server that cannot be asked to shut down over RPC is
+        terminated instead.
+        """
+        with self._lock:
+            asked = False
+            if shutdown and self.owns_process and self.client.connected:
+                try:
+                    self.client.send(["shutdown"])
+                    asked = True
+                except WaveshareRPCError:
+                    pass
+            self.client.close()
+            if self.process is not None:
+                if not asked and self.process.poll() is None:
+                    self.process.terminate()
+                try:
+                    self.process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+                    self.process.wait(timeout=timeout)
+                self.process = None
+            if self._drain is not None:
+                self._drain.join(timeout=1.0)
+                self._drain = None
+
+    def __enter__(self) -> "OpenOCDSession":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    # -- Health --
+
+    def is_healthy(self) -> bool:
+        """Return True if the process (when owned) runs and the RPC answers."""
+        try:
+            self.check_health()
+            return True
+        except WaveshareRPCError:
+            return False
+
+    def check_health(self, timeout: float = 2.0) -> None:
+        """Raise WaveshareRPCError unless the server answers a trivial command."""
+        if self.process is not None and self.process.poll() is not None:
+            raise WaveshareRPCError(
+                f"OpenOCD session '{self.name}' exited with status "
+                f"{self.process.returncode}:\n{self.output_tail(20)}"
+            )
+        with self._lock:
+            self._ensure_connected()
+            reply = self.client.request(["expr {6 * 7}"], timeout)[0]
+        if reply.strip() != "42":
+            raise WaveshareRPCError(
+                f"OpenOCD session '{self.name}' health check failed (reply {reply!r})"
+            )
+
+    # -- Commands --
+
+    def raw(self, commands: Sequence[str], timeout: Optional[float] = None) -> List[str]:
+        """Send commands unwrapped and return the raw Tcl results."""
+        with self._lock:
+            self._ensure_connected()
+            start = time.perf_counter()
+            replies = self.client.request(list(commands), timeout)
+            self.busy_s += time.perf_counter() - start
+            self.round_trips += 1
+            self.commands_sent += len(commands)
+        return replies
+
+    def execute(self, commands: Sequence[str],
+                timeout: Optional[float] = None) -> List[Tuple[int, str]]:
+        """Pipeline commands and return ``(status, output)`` per command."""
+        return [_unwrap(r) for r in self.raw([_wrap(c) for c in commands], timeout)]
+
+    def commands(self, commands: Sequence[str], timeout: Optional[float] = None,
+                 check: bool = True, pipeline: bool = True) -> List[str]:
+        """Run commands and return their output.
+
+        Pipelined batches run every command even if an earlier one fails;
+        use ``pipeline=False`` for sequences where a failure must stop the
+        rest (e.g. halt before flash programming).
+
+        Args:
+            commands: OpenOCD/Tcl commands.
+            timeout: Reply timeout per command (None = session default).
+            check: Raise on the first command that returned a Tcl error.
+            pipeline: Send the whole batch in one round trip.
+        """
+        if pipeline:
+            results = self.execute(commands, timeout)
+        else:
+            results = []
+            for command in commands:
+                results.extend(self.execute([command], timeout))
+                if check and results[-1][0] != 0:
+                    break
+        if check:
+            for command, (status, text) in zip(commands, results):
+                if status != 0:
+                    raise WaveshareRPCError(
+                        f"OpenOCD command failed: {command}: {text.strip()}"
+                    )
+        return [text for _status, text in results]
+
+    def command(self, command: str, timeout: Optional[float] = None) -> str:
+        """Run a single command and return its output."""
+        return self.commands([command], timeout)[0]
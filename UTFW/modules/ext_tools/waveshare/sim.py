@@ -0,0 +1,726 @@
+# sim.py
+"""
+UTFW Waveshare CH347 Simulator
+===============================
+In-memory CH347 backend for running and profiling the SPI, I2C, GPIO and
+EEPROM modules without the adapter (e.g. on Linux CI).
+
+The simulator implements the same index-based API as the vendor DLL
+(see ``_backend.CH347Backend``) and routes transfers to device models:
+
+- :class:`SimSPIFlash`: JEDEC NOR flash (W25Qxx command set: read, fast
+  read, page program, 4K/32K/64K/chip erase, status, WEL/WIP timing)
+- :class:`SimSPIRegisterDevice`: register-mapped SPI peripheral
+  (``reg | 0x80`` read, ``reg & 0x7F`` write, auto-increment)
+- :class:`SimI2CEEPROM`: 24Cxx EEPROM with page wrap, address
+  bits in the device address and NACK during the write cycle
+- :class:`SimI2CRegisterDevice`: register-pointer I2C peripheral
+- :class:`SimGPIO`: 8 pins with external input levels and loopbacks
+
+Every call is counted in :attr:`CH347Simulator.stats` (calls, bytes,
+simulated time), and an optional per-call USB latency can be configured
+to make batching effects visible when profiling.
+
+Usage:
+    import UTFW
+    waveshare = UTFW.modules.ext_tools.waveshare
+
+    sim = waveshare.sim.use_simulator()          # flash on CS0, 24C02 @ 0x50
+    flash = sim.spi_device(0, cs=0)
+    waveshare.spi.verify_jedec("JEDEC", dev_index=0, expected_manufacturer=0xEF)
+
+    sim = waveshare.sim.CH347Simulator(usb_latency_s=0.000125)
+    sim.attach_i2c(waveshare.sim.SimI2CEEPROM(waveshare.eeprom.TYPE_24C256))
+    waveshare.set_backend(sim)
+
+Author: DvidMakesThings
+"""
+
+import threading
+import time
+from typing import Optional, Dict, List, Any, Tuple
+
+from ._backend import CH347Backend, set_backend
+from ._dll import (
+    EEPROM_GEOMETRY,
+    EEPROM_24C02,
+    CHIP_TYPE_CH347T,
+    CH347_FUNC_SPI_IIC,
+)
+
+
+# ======================== SPI Device Models ========================
+
+# SPI NOR command set (W25Q / MX25 / GD25 compatible subset)
+CMD_WRITE_ENABLE = 0x06
+CMD_WRITE_DISABLE = 0x04
+CMD_READ_STATUS = 0x05
+CMD_READ = 0x03
+CMD_FAST_READ = 0x0B
+CMD_PAGE_PROGRAM = 0x02
+CMD_SECTOR_ERASE_4K = 0x20
+CMD_BLOCK_ERASE_32K = 0x52
+CMD_BLOCK_ERASE_64K = 0xD8
+CMD_CHIP_ERASE = 0xC7
+CMD_CHIP_ERASE_ALT = 0x60
+CMD_JEDEC_ID = 0x9F
+CMD_RELEASE_POWER_DOWN = 0xAB
+
+STATUS_WIP = 0x01
+STATUS_WEL = 0x02
+
+
+class SimSPIFlash:
+    """SPI NOR flash model.
+
+    Programming only clears bits (``old & new``), erases set bytes to 0xFF,
+    page programs wrap inside the page, and program/erase require a prior
+    WRITE ENABLE. With non-zero timings the WIP status bit stays set for
+    the simulated busy time and further program/erase commands are ignored.
+
+    Args:
+        size (int, optional): Capacity in bytes. Defaults to 16 MiB.
+        jedec_id (bytes, optional): 3-byte JEDEC ID. Defaults to W25Q128
+            (EF 40 18).
+        page_size (int, optional): Program page size. Defaults to 256.
+        page_program_s (float, optional): Simulated page program time.
+        sector_erase_s (float, optional): Simulated 4K erase time.
+        block_erase_s (float, optional): Simulated 32K/64K erase time.
+        chip_erase_s (float, optional): Simulated chip erase time.
+    """
+
+    def __init__(self, size: int = 16 * 1024 * 1024,
+                 jedec_id: bytes = b"\xEF\x40\x18",
+                 page_size: int = 256,
+                 page_program_s: float = 0.0,
+                 sector_erase_s: float = 0.0,
+                 block_erase_s: float = 0.0,
+                 chip_erase_s: float = 0.0):
+        self.size = size
+        self.jedec_id = bytes(jedec_id)
+        self.page_size = page_size
+        self.page_program_s = page_program_s
+        self.sector_erase_s = sector_erase_s
+        self.block_erase_s = block_erase_s
+        self.chip_erase_s = chip_erase_s
+        self.memory = bytearray(b"\xFF" * size)
+        self.wel = False
+        self.busy_until = 0.0
+        self.counters: Dict[str, int] = {
+            "read_bytes": 0, "program_bytes": 0, "page_programs": 0, "erases": 0,
+        }
+
+    @property
+    def busy(self) -> bool:
+        return time.monotonic() < self.busy_until
+
+    def _status(self) -> int:
+        return (STATUS_WIP if self.busy else 0) | (STATUS_WEL if self.wel else 0)
+
+    def _start_busy(self, duration: float) -> None:
+        self.wel = False
+        if duration > 0:
+            self.busy_until = time.monotonic() + duration
+
+    def _addr(self, tx: bytes) -> int:
+        return int.from_bytes(tx[1:4], "big") % self.size
+
+    def transfer(self, tx: bytes) -> bytes:
+        """Process one chip-select framed transaction and return MISO bytes."""
+        rx = bytearray(b"\xFF" * len(tx))
+        if not tx:
+            return bytes(rx)
+        cmd = tx[0]
+
+        if cmd == CMD_JEDEC_ID:
+            ident = self.jedec_id
+            for i in range(1, len(tx)):
+                rx[i] = ident[(i - 1) % len(ident)]
+        elif cmd == CMD_READ_STATUS:
+            for i in range(1, len(tx)):
+                rx[i] = self._status()
+        elif cmd == CMD_RELEASE_POWER_DOWN:
+            for i in range(4, len(tx)):
+                rx[i] = self.jedec_id[2] - 1
+        elif cmd == CMD_WRITE_ENABLE:
+            if not self.busy:
+                self.wel = True
+        elif cmd == CMD_WRITE_DISABLE:
+            self.wel = False
+        elif cmd in (CMD_READ, CMD_FAST_READ):
+            start = 4 if cmd == CMD_READ else 5
+            if len(tx) > start and not self.busy:
+                addr = self._addr(tx)
+                n = len(tx) - start
+                self._read_into(rx, start, addr, n)
+                self.counters["read_bytes"] += n
+        elif cmd == CMD_PAGE_PROGRAM:
+            if self.wel and not self.busy and len(tx) > 4:
+                self._program(self._addr(tx), tx[4:])
+                self._start_busy(self.page_program_s)
+        elif cmd in (CMD_SECTOR_ERASE_4K, CMD_BLOCK_ERASE_32K, CMD_BLOCK_ERASE_64K):
+            if self.wel and not self.busy and len(tx) >= 4:
+                span = {CMD_SECTOR_ERASE_4K: 4096, CMD_BLOCK_ERASE_32K: 32768,
+                        CMD_BLOCK_ERASE_64K: 65536}[cmd]
+                base = self._addr(tx) - self._addr(tx) % span
+                self.memory[base:base + span] = b"\xFF" * min(span, self.size - base)
+                self.counters["erases"] += 1
+                self._start_busy(self.sector_erase_s if span == 4096 else self.block_erase_s)
+        elif cmd in (CMD_CHIP_ERASE, CMD_CHIP_ERASE_ALT):
+            if self.wel and not self.busy:
+                self.memory[:] = b"\xFF" * self.size
+                self.counters["erases"] += 1
+                self._start_busy(self.chip_erase_s)
+        return bytes(rx)
+
+    def _read_into(self, rx: bytearray, start: int, addr: int, n: int) -> None:
+        end = addr + n
+        if end <= self.size:
+            rx[start:start + n] = self.memory[addr:end]
+        else:
+            # Sequential reads wrap at the end of the array
+            first = self.size - addr
+            rx[start:start + first] = self.memory[addr:]
+            for i in range(first, n):
+                rx[start + i] = self.memory[(addr + i) % self.size]
+
+    def _program(self, addr: int, data: bytes) -> None:
+        page_base = addr - addr % self.page_size
+        offset = addr - page_base
+        # Data beyond the page boundary wraps to the page start; only the
+        # last page_size bytes are kept, like real devices
+        if len(data) > self.page_size:
+            data = data[-self.page_size:]
+        mem = self.memory
+        for i, value in enumerate(data):
+            pos = page_base + (offset + i) % self.page_size
+            mem[pos] &= value
+        self.counters["program_bytes"] += len(data)
+        self.counters["page_programs"] += 1
+
+
+class SimSPIRegisterDevice:
+    """Register-mapped SPI peripheral (address byte, then data).
+
+    Bit 7 of the first byte selects read (1) or write (0); the register
+    pointer auto-increments across the transfer.
+
+    Args:
+        size (int, optional): Number of registers. Defaults to 128.
+        registers (bytes, optional): Initial register contents.
+        read_only (Iterable[int], optional): Registers that ignore writes.
+    """
+
+    def __init__(self, size: int = 128, registers: Optional[bytes] = None,
+                 read_only=()):
+        self.registers = bytearray(size)
+        if registers:
+            self.registers[:len(registers)] = registers
+        self.read_only = set(read_only)
+
+    def transfer(self, tx: bytes) -> bytes:
+        rx = bytearray(b"\xFF" * len(tx))
+        if not tx:
+            return bytes(rx)
+        reg = tx[0] & 0x7F
+        size = len(self.registers)
+        if tx[0] & 0x80:
+            for i in range(1, len(tx)):
+                rx[i] = self.registers[(reg + i - 1) % size]
+        else:
+            for i, value in enumerate(tx[1:]):
+                r = (reg + i) % size
+                if r not in self.read_only:
+                    self.registers[r] = value
+        return bytes(rx)
+
+
+# ======================== I2C Device Models ========================
+
+class SimI2CEEPROM:
+    """24Cxx I2C EEPROM model.
+
+    Occupies one or more 7-bit addresses starting at ``base_address``
+    (small types and the 1-4 Mbit parts carry upper memory address bits
+    in the device address). Page writes wrap inside the page; while the
+    internal write cycle runs the device NACKs, so ACK polling works.
+
+    Args:
+        eeprom_type (int, optional): EEPROM_24Cxx type constant.
+            Defaults to EEPROM_24C02.
+        base_address (int, optional): 7-bit base address. Defaults to 0x50.
+        write_cycle_s (float, optional): Simulated tWR. Defaults to 0.
+        fill (int, optional): Initial byte value. Defaults to 0xFF.
+    """
+
+    def __init__(self, eeprom_type: int = EEPROM_24C02, base_address: int = 0x50,
+                 write_cycle_s: float = 0.0, fill: int = 0xFF):
+        if eeprom_type not in EEPROM_GEOMETRY:
+            raise ValueError(f"Unknown EEPROM type {eeprom_type}")
+        self.eeprom_type = eeprom_type
+        self.size, self.page_size, self.addr_bytes = EEPROM_GEOMETRY[eeprom_type]
+        self.base_address = base_address
+        self.write_cycle_s = write_cycle_s
+        self.memory = bytearray([fill & 0xFF] * self.size)
+        span = self.size // (256 if self.addr_bytes == 1 else 65536)
+        self.address_span = max(span, 1)
+        self.pointer = 0
+        self.busy_until = 0.0
+        self.counters: Dict[str, int] = {"read_bytes": 0, "write_bytes": 0, "page_writes": 0}
+
+    @property
+    def busy(self) -> bool:
+        return time.monotonic() < self.busy_until
+
+    def claims(self, address: int) -> bool:
+        return self.base_address <= address < self.base_address + self.address_span
+
+    def _block(self, address: int) -> int:
+        return (address - self.base_address) << (8 * self.addr_bytes)
+
+    def ack(self, address: int) -> bool:
+        return not self.busy
+
+    def write(self, address: int, data: bytes) -> bool:
+        if self.busy:
+            return False
+        if len(data) < self.addr_bytes:
+            return True  # address-only probe
+        offset = int.from_bytes(data[:self.addr_bytes], "big")
+        self.pointer = (self._block(address) | offset) % self.size
+        payload = data[self.addr_bytes:]
+        if payload:
+            page_base = self.pointer - self.pointer % self.page_size
+            start = self.pointer - page_base
+            if len(payload) > self.page_size:
+                payload = payload[-self.page_size:]
+            for i, value in enumerate(payload):
+                self.memory[page_base + (start + i) % self.page_size] = value
+            self.pointer = page_base + (start + len(payload)) % self.page_size
+            self.counters["write_bytes"] += len(payload)
+            self.counters["page_writes"] += 1
+            if self.write_cycle_s > 0:
+                self.busy_until = time.monotonic() + self.write_cycle_s
+        return True
+
+    def read(self, address: int, length: int) -> Optional[bytes]:
+        if self.busy:
+            return None
+        start = self.pointer
+        end = start + length
+        if end <= self.size:
+            out = bytes(self.memory[start:end])
+        else:
+            out = bytes(self.memory[(start + i) % self.size] for i in range(length))
+        self.pointer = end % self.size
+        self.counters["read_bytes"] += length
+        return out
+
+
+class SimI2CRegisterDevice:
+    """Register-pointer I2C peripheral (sensor, port expander, PMIC).
+
+    The first written byte sets the register pointer; following bytes are
+    written with auto-increment. Reads continue from the pointer.
+
+    Args:
+        address (int): 7-bit I2C address.
+        size (int, optional): Number of registers. Defaults to 256.
+        registers (bytes, optional): Initial register contents.
+        read_only (Iterable[int], optional): Registers that ignore writes.
+    """
+
+    def __init__(self, address: int, size: int = 256,
+                 registers: Optional[bytes] = None, read_only=()):
+        self.address = address
+        self.registers = bytearray(size)
+        if registers:
+            self.registers[:len(registers)] = registers
+        self.read_only = set(read_only)
+        self.pointer = 0
+
+    def claims(self, address: int) -> bool:
+        return address == self.address
+
+    def ack(self, address: int) -> bool:
+        return True
+
+    def write(self, address: int, data: bytes) -> bool:
+        if not data:
+            return True
+        size = len(self.registers)
+        self.pointer = data[0] % size
+        for value in data[1:]:
+            if self.pointer not in self.read_only:
+                self.registers[self.pointer] = value
+            self.pointer = (self.pointer + 1) % size
+        return True
+
+    def read(self, address: int, length: int) -> Optional[bytes]:
+        size = len(self.registers)
+        out = bytes(self.registers[(self.pointer + i) % size] for i in range(length))
+        self.pointer = (self.pointer + length) % size
+        return out
+
+
+# ======================== GPIO Model ========================
+
+class SimGPIO:
+    """Eight CH347 GPIO pins.
+
+    Input pins read ``inputs`` (externally driven levels, default low)
+    unless a loopback connects them to an output pin.
+
+    Attributes:
+        direction (int): Direction bits (1 = output).
+        output (int): Output latch bits.
+        inputs (int): Externally driven levels for input pins.
+        loopbacks (Dict[int, int]): ``{input_pin: output_pin}`` wiring.
+    """
+
+    def __init__(self):
+        self.direction = 0
+        self.output = 0
+        self.inputs = 0
+        self.loopbacks: Dict[int, int] = {}
+
+    def connect(self, output_pin: int, input_pin: int) -> None:
+        """Wire an output pin to an input pin."""
+        self.loopbacks[input_pin] = output_pin
+
+    def set_input(self, pin: int, level: int) -> None:
+        """Drive an input pin from outside."""
+        if level:
+            self.inputs |= 1 << pin
+        else:
+            self.inputs &= ~(1 << pin) & 0xFF
+
+    def levels(self) -> int:
+        value = 0
+        for pin in range(8):
+            bit = 1 << pin
+            if self.direction & bit:
+                level = self.output & bit
+            elif pin in self.loopbacks:
+                src = 1 << self.loopbacks[pin]
+                level = (self.output & src) if self.direction & src else (self.inputs & bit)
+            else:
+                level = self.inputs & bit
+            if level:
+                value |= bit
+        return value
+
+
+# ======================== Simulator Backend ========================
+
+class _SimDevice:
+    """State of one simulated CH347 interface."""
+
+    def __init__(self):
+        self.opened = False
+        self.spi: Dict[int, Any] = {}
+        self.spi_cs = 0
+        self.spi_ready = False
+        self.i2c: List[Any] = []
+        self.i2c_mode = 1
+        self.gpio = SimGPIO()
+
+
+class CH347Simulator(CH347Backend):
+    """In-memory CH347 backend.
+
+    Args:
+        device_count (int, optional): Number of simulated adapters
+            (indices 0..N-1). Defaults to 1.
+        usb_latency_s (float, optional): Sleep added to every transfer
+            call to model USB round trips. Defaults to 0.
+        eeprom_poll_timeout_s (float, optional): How long EEPROM writes
+            ACK-poll a busy device before failing. Defaults to 0.1.
+    """
+
+    name = "sim"
+
+    def __init__(self, device_count: int = 1, usb_latency_s: float = 0.0,
+                 eeprom_poll_timeout_s: float = 0.1):
+        self.devices = [_SimDevice() for _ in range(device_count)]
+        self.usb_latency_s = usb_latency_s
+        self.eeprom_poll_timeout_s = eeprom_poll_timeout_s
+        self._lock = threading.RLock()
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    # ---------------- Configuration ----------------
+
+    def attach_spi(self, model, cs: int = 0, index: int = 0):
+        """Connect an SPI device model (anything with ``transfer(tx)``) to a CS line."""
+        self.devices[index].spi[cs] = model
+        return model
+
+    def attach_i2c(self, model, index: int = 0):
+        """Connect an I2C device model to the bus of adapter ``index``."""
+        self.devices[index].i2c.append(model)
+        return model
+
+    def spi_device(self, index: int = 0, cs: int = 0):
+        """Return the SPI model on a chip select, or None."""
+        return self.devices[index].spi.get(cs)
+
+    def i2c_device(self, address: int, index: int = 0):
+        """Return the I2C model answering at a 7-bit address, or None."""
+        for model in self.devices[index].i2c:
+            if model.claims(address):
+                return model
+        return None
+
+    def gpio(self, index: int = 0) -> SimGPIO:
+        """Return the GPIO model of adapter ``index``."""
+        return self.devices[index].gpio
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats.clear()
+
+    # ---------------- Internals ----------------
+
+    def _call(self, op: str, index: int, nbytes: int = 0) -> _SimDevice:
+        if not 0 <= index < len(self.devices):
+            raise OSError(f"CH347 device {index} not found (simulator has {len(self.devices)})")
+        dev = self.devices[index]
+        if not dev.opened:
+            raise OSError(f"CH347 device {index} is not open")
+        entry = self.stats.get(op)
+        if entry is None:
+            entry = self.stats[op] = {"calls": 0, "bytes": 0, "latency_s": 0.0}
+        entry["calls"] += 1
+        entry["bytes"] += nbytes
+        if self.usb_latency_s > 0:
+            entry["latency_s"] += self.usb_latency_s
+            time.sleep(self.usb_latency_s)
+        return dev
+
+    def _i2c_find(self, dev: _SimDevice, address: int):
+        for model in dev.i2c:
+            if model.claims(address) and model.ack(address):
+                return model
+        return None
+
+    # ---------------- Backend API ----------------
+
+    def is_available(self) -> bool:
+        return True
+
+    def describe(self) -> str:
+        return f"CH347 simulator ({len(self.devices)} device(s))"
+
+    def enumerate_devices(self) -> List[dict]:
+        return [{
+            "index": idx,
+            "chip_type": CHIP_TYPE_CH347T,
+            "chip_mode": 1,
+            "func_type": CH347_FUNC_SPI_IIC,
+            "device_id": f"SIM#{idx}",
+            "usb_speed": "HS",
+            "firmware_ver": 0,
+            "func_desc": "SPI/I2C/GPIO (simulated)",
+            "product": "CH347 Simulator",
+            "manufacturer": "UTFW",
+            "if_num": 2,
+        } for idx in range(len(self.devices))]
+
+    def open_device(self, index: int) -> int:
+        with self._lock:
+            if not 0 <= index < len(self.devices):
+                raise OSError(f"CH347OpenDevice({index}) failed - device not found or busy")
+            self.devices[index].opened = True
+        return index
+
+    def close_device(self, index: int) -> None:
+        with self._lock:
+            if 0 <= index < len(self.devices):
+                dev = self.devices[index]
+                dev.opened = False
+                dev.spi_ready = False
+
+    # -- SPI --
+
+    def spi_init(self, index: int, mode: int, clock: int, byte_order: int,
+                 cs: int, auto_deassert_cs: bool) -> bool:
+        with self._lock:
+            dev = self._call("spi_init", index)
+            dev.spi_cs = cs & 0x01
+            dev.spi_ready = True
+        return True
+
+    def spi_set_frequency(self, index: int, freq_hz: int) -> bool:
+        with self._lock:
+            self._call("spi_set_frequency", index)
+        return True
+
+    def spi_set_databits(self, index: int, bits_16: bool) -> bool:
+        with self._lock:
+            self._call("spi_set_databits", index)
+        return True
+
+    def _spi_xfer(self, op: str, index: int, data: bytes) -> bytes:
+        with self._lock:
+            dev = self._call(op, index, len(data))
+            if not dev.spi_ready:
+                raise OSError("SPI not initialised (call spi_init first)")
+            model = dev.spi.get(dev.spi_cs)
+            if model is None:
+                return b"\xFF" * len(data)
+            return model.transfer(bytes(data))
+
+    def spi_write_read(self, index: int, data: bytes, chip_select: int) -> bytes:
+        return self._spi_xfer("spi_write_read", index, data)
+
+    def spi_write_read_into(self, index: int, buf, chip_select: int) -> None:
+        buf[:] = self._spi_xfer("spi_write_read", index, buf)
+
+    def spi_stream4(self, index: int, data: bytes, chip_select: int) -> bytes:
+        return self._spi_xfer("spi_stream4", index, data)
+
+    def spi_write(self, index: int, data: bytes, chip_select: int,
+                  write_step: int) -> bool:
+        self._spi_xfer("spi_write", index, data)
+        return True
+
+    def spi_read(self, index: int, cmd_bytes: bytes, read_length: int,
+                 chip_select: int) -> bytes:
+        rx = self._spi_xfer("spi_read", index, bytes(cmd_bytes) + b"\xFF" * read_length)
+        return rx[len(cmd_bytes):]
+
+    # -- I2C --
+
+    def i2c_set(self, index: int, mode: int) -> bool:
+        with self._lock:
+            self._call("i2c_set", index).i2c_mode = mode & 0x03
+        return True
+
+    def i2c_set_stretch(self, index: int, enable: bool) -> bool:
+        with self._lock:
+            self._call("i2c_set_stretch", index)
+        return True
+
+    def i2c_set_delay(self, index: int, delay_ms: int) -> bool:
+        with self._lock:
+            self._call("i2c_set_delay", index)
+        return True
+
+    def i2c_stream(self, index: int, write_data: bytes, read_length: int) -> bytes:
+        with self._lock:
+            dev = self._call("i2c_stream", index, len(write_data) + read_length)
+            if not write_data:
+                if read_length:
+                    raise OSError("CH347StreamI2C failed")
+                return b""
+            address = write_data[0] >> 1
+            model = self._i2c_find(dev, address)
+            if model is None:
+                raise OSError("CH347StreamI2C failed")
+            if not write_data[0] & 0x01:
+                if not model.write(address, bytes(write_data[1:])):
+                    raise OSError("CH347StreamI2C failed")
+            if read_length <= 0:
+                return b""
+            data = model.read(address, read_length)
+            if data is None:
+                raise OSError("CH347StreamI2C failed")
+            return data
+
+    # -- GPIO --
+
+    def gpio_get(self, index: int) -> Tuple[int, int]:
+        with self._lock:
+            gpio = self._call("gpio_get", index).gpio
+            return gpio.direction, gpio.levels()
+
+    def gpio_set(self, index: int, enable_mask: int, direction: int, data: int) -> bool:
+        with self._lock:
+            gpio = self._call("gpio_set", index).gpio
+            mask = enable_mask & 0xFF
+            gpio.direction = (gpio.direction & ~mask | direction & mask) & 0xFF
+            gpio.output = (gpio.output & ~mask | data & mask) & 0xFF
+        return True
+
+    # -- EEPROM (as the vendor DLL: device 0x50 + type-specific addressing) --
+
+    def _eeprom_target(self, eeprom_type: int, addr: int) -> Tuple[int, bytes]:
+        size, _page, addr_bytes = EEPROM_GEOMETRY[eeprom_type]
+        if addr_bytes == 1:
+            dev_addr = 0x50 | ((addr >> 8) & 0x07)
+        else:
+            dev_addr = 0x50 | ((addr >> 16) & 0x07)
+        return dev_addr, (addr & (0xFF if addr_bytes == 1 else 0xFFFF)).to_bytes(addr_bytes, "big")
+
+    def _eeprom_check(self, eeprom_type: int, addr: int, length: int) -> None:
+        if eeprom_type not in EEPROM_GEOMETRY:
+            raise OSError(f"Unknown EEPROM type {eeprom_type}")
+        size = EEPROM_GEOMETRY[eeprom_type][0]
+        if addr < 0 or addr + length > size:
+            raise OSError(f"EEPROM range 0x{addr:X}+{length} exceeds {size} bytes")
+
+    def eeprom_read(self, index: int, eeprom_type: int, addr: int, length: int) -> bytes:
+        self._eeprom_check(eeprom_type, addr, length)
+        out = bytearray()
+        size = EEPROM_GEOMETRY[eeprom_type][0]
+        block = 256 if EEPROM_GEOMETRY[eeprom_type][2] == 1 else 65536
+        while len(out) < length:
+            pos = addr + len(out)
+            n = min(length - len(out), block - pos % block, size - pos)
+            dev_addr, offset = self._eeprom_target(eeprom_type, pos)
+            out += self.i2c_stream(index, bytes([dev_addr << 1]) + offset, n)
+        return bytes(out)
+
+    def eeprom_write(self, index: int, eeprom_type: int, addr: int, data: bytes) -> bool:
+        self._eeprom_check(eeprom_type, addr, len(data))
+        page = EEPROM_GEOMETRY[eeprom_type][1]
+        pos = 0
+        while pos < len(data):
+            cur = addr + pos
+            n = min(len(data) - pos, page - cur % page)
+            dev_addr, offset = self._eeprom_target(eeprom_type, cur)
+            frame = bytes([dev_addr << 1]) + offset + bytes(data[pos:pos + n])
+            self._eeprom_poll(index, frame)
+            pos += n
+        # Like the DLL, return only once the last write cycle has finished
+        self._eeprom_poll(index, bytes([dev_addr << 1]))
+        return True
+
+    def _eeprom_poll(self, index: int, frame: bytes) -> None:
+        """Send ``frame``, retrying while the EEPROM NACKs its write cycle."""
+        deadline = time.monotonic() + self.eeprom_poll_timeout_s
+        while True:
+            try:
+                self.i2c_stream(index, frame, 0)
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise OSError("CH347WriteEEPROM failed")
+                time.sleep(0.0002)
+
+
+# ======================== Convenience ========================
+
+def use_simulator(flash: bool = True, eeprom_type: Optional[int] = EEPROM_24C02,
+                  device_count: int = 1, usb_latency_s: float = 0.0) -> CH347Simulator:
+    """Create a simulator with common parts and make it the active backend.
+
+    Args:
+        flash (bool, optional): Attach a W25Q128 model on CS0 of every
+            adapter. Defaults to True.
+        eeprom_type (int, optional): Attach a 24Cxx EEPROM at 0x50 on
+            every adapter (None for none). Defaults to EEPROM_24C02.
+        device_count (int, optional): Number of adapters. Defaults to 1.
+        usb_latency_s (float, optional): Per-call latency. Defaults to 0.
+
+    Returns:
+        CH347Simulator: The active simulator.
+    """
+    sim = CH347Simulator(device_count=device_count, usb_latency_s=usb_latency_s)
+    for idx in range(device_count):
+        if flash:
+            sim.attach_spi(SimSPIFlash(), cs=0, index=idx)
+        if eeprom_type is not None:
+            sim.attach_i2c(SimI2CEEPROM(eeprom_type), index=idx)
+    set_backend(sim)
+    return sim
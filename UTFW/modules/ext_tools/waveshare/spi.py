@@ -5,7 +5,8 @@ UTFW Waveshare SPI Module
 High-level SPI master test functions and TestAction factories for the
 Waveshare USB TO UART/I2C/SPI/JTAG adapter (WCH CH347 chipset).
 
-This module communicates through the CH347 vendor DLL (Windows) for proper
+This module communicates through the active CH347 backend (vendor DLL on
+Windows, ``ch34x_pis`` driver on Linux, or the ``sim`` simulator) for
 hardware SPI transactions.  The CH347 SPI controller supports:
 - SPI modes 0-3 (CPOL/CPHA combinations)
 - Clock speeds from 468.75 KHz to 60 MHz
@@ -31,10 +32,23 @@ Usage:
         expected_manufacturer=0xEF,
     )
 
+    # SPI NOR flash bulk operations (chunked, streamed to/from files)
+    action = waveshare.spi.flash_read(
+        "Dump boot area", dev_index=0, address=0, length=0x100000,
+        output_path="boot.bin",
+    )
+    action = waveshare.spi.flash_program(
+        "Program firmware", dev_index=0, address=0x10000,
+        input_path="fw.bin", erase=True, verify=True,
+    )
+
 Author: DvidMakesThings
 """
 
-from typing import Optional
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator
 
 from ....core.logger import get_active_logger
 from ....core.core import TestAction
@@ -61,6 +75,33 @@ SPI_CLK_468KHZ = 7
 CS0 = 0
 CS1 = 1
 
+# Largest payload handed to the adapter in one CH347SPI_WriteRead call
+SPI_MAX_CHUNK = 4096
+
+# SPI NOR flash commands and geometry (W25Q / MX25 / GD25 compatible)
+FLASH_CMD_WRITE_ENABLE = 0x06
+FLASH_CMD_READ_STATUS = 0x05
+FLASH_CMD_READ = 0x03
+FLASH_CMD_FAST_READ = 0x0B
+FLASH_CMD_PAGE_PROGRAM = 0x02
+FLASH_CMD_SECTOR_ERASE = 0x20   # 4 KB
+FLASH_CMD_BLOCK_ERASE = 0xD8    # 64 KB
+FLASH_STATUS_WIP = 0x01
+FLASH_STATUS_WEL = 0x02
+FLASH_PAGE_SIZE = 256
+FLASH_SECTOR_SIZE = 4096
+FLASH_BLOCK_SIZE = 65536
+FLASH_MAX_ADDRESS = 1 << 24     # 3-byte addressing
+
+# Worst-case busy times (datasheet maxima of common 25-series parts)
+FLASH_PAGE_PROGRAM_TIMEOUT_S = 0.01
+FLASH_SECTOR_ERASE_TIMEOUT_S = 0.5
+FLASH_BLOCK_ERASE_TIMEOUT_S = 3.0
+
+# Busy polling backoff (page program ~1 ms, erases tens of ms to seconds)
+FLASH_POLL_INTERVAL_S = 0.0001
+FLASH_POLL_MAX_INTERVAL_S = 0.01
+
 
 class WaveshareSPIError(WaveshareError):
     """Exception raised when Waveshare SPI operations fail."""
@@ -264,6 +305,371 @@ def _read_register(dev_index: int, register: int, length: int,
     return result
 
 
+# ======================== SPI NOR Flash Engine ========================
+
+class _SPIFlash:
+    """Chunked SPI NOR flash access on an open :class:`_SPIDevice`.
+
+    All transfers go through one reusable scratch buffer with
+    ``spi_write_read_into``, so command, address and payload are laid out
+    in place and MISO data is sliced out with memoryviews instead of being
+    copied byte by byte. Each chunk is a complete CS-framed command, which
+    keeps chunks independent of the adapter's CS handling.
+    """
+
+    def __init__(self, dev_index: int, chunk_size: int = SPI_MAX_CHUNK,
+                 fast_read: bool = False):
+        self.dev_index = dev_index
+        self.fast_read = fast_read
+        self.header = 5 if fast_read else 4
+        self.chunk_size = max(chunk_size - self.header, FLASH_PAGE_SIZE)
+        self._buf = bytearray(self.header + max(self.chunk_size, FLASH_PAGE_SIZE))
+        self._view = memoryview(self._buf)
+
+    def _xfer(self, n: int) -> memoryview:
+        view = self._view[:n]
+        try:
+            _dll.spi_write_read_into(self.dev_index, view, chip_select=0x80)
+        except OSError as exc:
+            raise WaveshareSPIError(f"SPI transfer failed: {exc}") from exc
+        return view
+
+    def _command(self, cmd: int, addr: Optional[int] = None) -> int:
+        buf = self._buf
+        buf[0] = cmd
+        if addr is None:
+            return 1
+        buf[1] = (addr >> 16) & 0xFF
+        buf[2] = (addr >> 8) & 0xFF
+        buf[3] = addr & 0xFF
+        return 4
+
+    # -- Status --
+
+    def read_status(self) -> int:
+        self._command(FLASH_CMD_READ_STATUS)
+        return self._xfer(2)[1]
+
+    def wait_ready(self, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        interval = FLASH_POLL_INTERVAL_S
+        while self.read_status() & FLASH_STATUS_WIP:
+            now = time.monotonic()
+            if now > deadline:
+                raise WaveshareSPIError(f"Flash still busy after {timeout:.2f}s")
+            # Back off so long erases do not saturate the bridge with polls
+            time.sleep(min(interval, max(deadline - now, 0.0)))
+            interval = min(interval * 2, FLASH_POLL_MAX_INTERVAL_S)
+
+    def write_enable(self) -> None:
+        self._command(FLASH_CMD_WRITE_ENABLE)
+        self._xfer(1)
+        if not self.read_status() & FLASH_STATUS_WEL:
+            raise WaveshareSPIError("Flash did not set WEL (write protected?)")
+
+    # -- Read --
+
+    def iter_read(self, addr: int, length: int) -> Iterator[memoryview]:
+        """Yield the range as consecutive chunks (views into the scratch buffer).
+
+        Each view is only valid until the next iteration.
+        """
+        _check_flash_range(addr, length)
+        cmd = FLASH_CMD_FAST_READ if self.fast_read else FLASH_CMD_READ
+        hdr = self.header
+        pos = 0
+        while pos < length:
+            n = min(self.chunk_size, length - pos)
+            self._command(cmd, addr + pos)
+            view = self._xfer(hdr + n)
+            yield view[hdr:hdr + n]
+            pos += n
+
+    def read_into(self, addr: int, out) -> None:
+        """Read ``len(out)`` bytes into a writable buffer."""
+        out = memoryview(out)
+        pos = 0
+        for chunk in self.iter_read(addr, len(out)):
+            out[pos:pos + len(chunk)] = chunk
+            pos += len(chunk)
+
+    def read(self, addr: int, length: int) -> bytes:
+        out = bytearray(length)
+        self.read_into(addr, out)
+        return bytes(out)
+
+    # -- Erase / program --
+
+    def erase(self, addr: int, length: int) -> int:
+        """Erase a sector-aligned range with 64 KB blocks where possible.
+
+        Returns:
+            Number of erase commands issued.
+        """
+        _check_flash_range(addr, length)
+        if addr % FLASH_SECTOR_SIZE or length % FLASH_SECTOR_SIZE:
+            raise WaveshareSPIError(
+                f"Erase range 0x{addr:06X}+0x{length:X} is not {FLASH_SECTOR_SIZE}-byte aligned"
+            )
+        end = addr + length
+        count = 0
+        while addr < end:
+            if addr % FLASH_BLOCK_SIZE == 0 and end - addr >= FLASH_BLOCK_SIZE:
+                cmd, span, timeout = (FLASH_CMD_BLOCK_ERASE, FLASH_BLOCK_SIZE,
+                                      FLASH_BLOCK_ERASE_TIMEOUT_S)
+            else:
+                cmd, span, timeout = (FLASH_CMD_SECTOR_ERASE, FLASH_SECTOR_SIZE,
+                                      FLASH_SECTOR_ERASE_TIMEOUT_S)
+            self.write_enable()
+            self._xfer(self._command(cmd, addr))
+            self.wait_ready(timeout)
+            addr += span
+            count += 1
+        return count
+
+    def program(self, addr: int, data) -> int:
+        """Page-program ``data`` (pages that are all 0xFF are skipped).
+
+        Returns:
+            Number of pages programmed.
+        """
+        data = memoryview(data)
+        _check_flash_range(addr, len(data))
+        pages = 0
+        pos = 0
+        while pos < len(data):
+            # First write may start mid-page; never cross a page boundary
+            n = min(FLASH_PAGE_SIZE - (addr + pos) % FLASH_PAGE_SIZE, len(data) - pos)
+            chunk = data[pos:pos + n]
+            if chunk.tobytes().count(0xFF) != n:
+                self.write_enable()
+                hdr = self._command(FLASH_CMD_PAGE_PROGRAM, addr + pos)
+                self._view[hdr:hdr + n] = chunk
+                self._xfer(hdr + n)
+                self.wait_ready(FLASH_PAGE_PROGRAM_TIMEOUT_S)
+                pages += 1
+            pos += n
+        return pages
+
+    def verify(self, addr: int, data) -> Optional[int]:
+        """Compare flash contents with ``data``.
+
+        Returns:
+            Offset of the first mismatching byte, or None if equal.
+        """
+        data = memoryview(data)
+        pos = 0
+        for chunk in self.iter_read(addr, len(data)):
+            n = len(chunk)
+            if chunk != data[pos:pos + n]:
+                expected = data[pos:pos + n]
+                for i in range(n):
+                    if chunk[i] != expected[i]:
+                        return pos + i
+            pos += n
+        return None
+
+
+def _check_flash_range(addr: int, length: int) -> None:
+    if addr < 0 or length < 0 or addr + length > FLASH_MAX_ADDRESS:
+        raise WaveshareSPIError(
+            f"Flash range 0x{addr:X}+0x{length:X} outside 3-byte address space"
+        )
+
+
+def _rate(nbytes: int, seconds: float) -> str:
+    return f"{nbytes / seconds / 1024:.1f} KB/s" if seconds > 0 else "-"
+
+
+def _flash_read_range(dev_index: int, address: int, length: int,
+                      output_path: Optional[str] = None,
+                      cs: int = CS0, mode: int = SPI_MODE_0,
+                      clock: int = SPI_CLK_30MHZ,
+                      fast_read: bool = False) -> Dict[str, Any]:
+    """Read a flash range into memory or stream it to a file.
+
+    Returns:
+        Dict with length, sha256, seconds, bytes_per_s, output_path and
+        (when not written to a file) data.
+    """
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info("[WAVESHARE SPI] FLASH READ")
+        logger.info("=" * 80)
+        logger.info(f"  Device:  #{dev_index}  CS: CS{cs}")
+        logger.info(f"  Range:   0x{address:06X} - 0x{address + length - 1:06X} ({length} bytes)")
+        if output_path:
+            logger.info(f"  Output:  {output_path}")
+        logger.info("")
+
+    digest = hashlib.sha256()
+    data = None
+    start = time.perf_counter()
+    with _SPIDevice(dev_index, mode, clock, cs=cs):
+        flash = _SPIFlash(dev_index, fast_read=fast_read)
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "wb") as fh:
+                for chunk in flash.iter_read(address, length):
+                    digest.update(chunk)
+                    fh.write(chunk)
+        else:
+            data = bytearray(length)
+            flash.read_into(address, data)
+            digest.update(data)
+            data = bytes(data)
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "address": address,
+        "length": length,
+        "sha256": digest.hexdigest(),
+        "seconds": elapsed,
+        "bytes_per_s": length / elapsed if elapsed > 0 else None,
+        "output_path": output_path,
+    }
+    if data is not None:
+        result["data"] = data
+
+    if logger:
+        logger.info(f"  SHA-256: {result['sha256']}")
+        logger.info(f"[OK] Read {length} bytes in {elapsed:.3f}s ({_rate(length, elapsed)})")
+        logger.info("=" * 80)
+        logger.info("")
+    return result
+
+
+def _flash_erase_range(dev_index: int, address: int, length: int,
+                       verify_blank: bool = False,
+                       cs: int = CS0, mode: int = SPI_MODE_0,
+                       clock: int = SPI_CLK_30MHZ) -> Dict[str, Any]:
+    """Erase a sector-aligned range, optionally checking it reads back blank."""
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info("[WAVESHARE SPI] FLASH ERASE")
+        logger.info("=" * 80)
+        logger.info(f"  Device:  #{dev_index}  CS: CS{cs}")
+        logger.info(f"  Range:   0x{address:06X} - 0x{address + length - 1:06X} ({length} bytes)")
+        logger.info("")
+
+    start = time.perf_counter()
+    with _SPIDevice(dev_index, mode, clock, cs=cs):
+        flash = _SPIFlash(dev_index)
+        erases = flash.erase(address, length)
+        if verify_blank:
+            pos = 0
+            for chunk in flash.iter_read(address, length):
+                n = len(chunk)
+                if chunk.tobytes().count(0xFF) != n:
+                    bad = next(i for i in range(n) if chunk[i] != 0xFF)
+                    raise WaveshareSPIError(
+                        f"Flash not blank after erase at 0x{address + pos + bad:06X} "
+                        f"(read 0x{chunk[bad]:02X})"
+                    )
+                pos += n
+    elapsed = time.perf_counter() - start
+
+    if logger:
+        logger.info(f"  Erase commands: {erases}")
+        if verify_blank:
+            logger.info(f"  Blank check:    OK")
+        logger.info(f"[OK] Erased {length} bytes in {elapsed:.3f}s")
+        logger.info("=" * 80)
+        logger.info("")
+    return {"address": address, "length": length, "erase_commands": erases,
+            "seconds": elapsed}
+
+
+def _flash_program_range(dev_index: int, address: int,
+                         data: Optional[bytes] = None,
+                         input_path: Optional[str] = None,
+                         erase: bool = True, verify: bool = True,
+                         cs: int = CS0, mode: int = SPI_MODE_0,
+                         clock: int = SPI_CLK_30MHZ,
+                         block_size: int = FLASH_BLOCK_SIZE) -> Dict[str, Any]:
+    """Erase, program and verify an image block by block.
+
+    The image comes from ``data`` or is streamed from ``input_path`` one
+    block at a time, so large files are never held in memory. With
+    ``erase`` the sectors covering each block are erased first (the image
+    start must then be sector aligned).
+    """
+    if (data is None) == (input_path is None):
+        raise WaveshareSPIError("Provide exactly one of data or input_path")
+    if erase and address % FLASH_SECTOR_SIZE:
+        raise WaveshareSPIError(
+            f"Program address 0x{address:06X} must be {FLASH_SECTOR_SIZE}-byte aligned when erasing"
+        )
+    block_size -= block_size % FLASH_SECTOR_SIZE
+    total = len(data) if data is not None else Path(input_path).stat().st_size
+    _check_flash_range(address, total)
+
+    logger = get_active_logger()
+    if logger:
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info("[WAVESHARE SPI] FLASH PROGRAM")
+        logger.info("=" * 80)
+        logger.info(f"  Device:  #{dev_index}  CS: CS{cs}")
+        logger.info(f"  Source:  {input_path or 'memory'} ({total} bytes)")
+        logger.info(f"  Range:   0x{address:06X} - 0x{address + max(total, 1) - 1:06X}")
+        logger.info(f"  Erase:   {erase}  Verify: {verify}")
+        logger.info("")
+
+    digest = hashlib.sha256()
+    erases = pages = 0
+    start = time.perf_counter()
+    fh = open(input_path, "rb") if input_path else None
+    try:
+        with _SPIDevice(dev_index, mode, clock, cs=cs):
+            flash = _SPIFlash(dev_index)
+            block = bytearray(block_size)
+            source = memoryview(data) if data is not None else None
+            pos = 0
+            while pos < total:
+                n = min(block_size, total - pos)
+                if fh is not None:
+                    view = memoryview(block)[:n]
+                    got = fh.readinto(view)
+                    if got != n:
+                        raise WaveshareSPIError(f"Short read from {input_path} at {pos}")
+                else:
+                    view = source[pos:pos + n]
+                digest.update(view)
+                target = address + pos
+                if erase:
+                    span = -(-n // FLASH_SECTOR_SIZE) * FLASH_SECTOR_SIZE
+                    erases += flash.erase(target, span)
+                pages += flash.program(target, view)
+                if verify:
+                    bad = flash.verify(target, view)
+                    if bad is not None:
+                        raise WaveshareSPIError(
+                            f"Verify failed at 0x{target + bad:06X}: "
+                            f"expected 0x{view[bad]:02X}, read back differs"
+                        )
+                pos += n
+    finally:
+        if fh is not None:
+            fh.close()
+    elapsed = time.perf_counter() - start
+
+    if logger:
+        logger.info(f"  Erase commands:   {erases}")
+        logger.info(f"  Pages programmed: {pages}")
+        logger.info(f"  SHA-256:          {digest.hexdigest()}")
+        logger.info(f"[OK] Programmed {total} bytes in {elapsed:.3f}s ({_rate(total, elapsed)})")
+        logger.info("=" * 80)
+        logger.info("")
+    return {"address": address, "length": total, "erase_commands": erases,
+            "pages_programmed": pages, "verified": verify,
+            "sha256": digest.hexdigest(), "seconds": elapsed}
+
+
 # ======================== TestAction Factories ========================
 
 def transfer(
@@ -478,3 +884,123 @@ def verify_jedec(
         'display_expected': exp_str,
     }
     return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def flash_read(
+        name: str,
+        dev_index: int,
+        address: int,
+        length: int,
+        output_path: Optional[str] = None,
+        expected: Optional[bytes] = None,
+        expected_sha256: Optional[str] = None,
+        cs: int = CS0,
+        mode: int = SPI_MODE_0,
+        clock: int = SPI_CLK_30MHZ,
+        fast_read: bool = False,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that reads a SPI NOR flash range (cmd 0x03/0x0B).
+
+    The range is split into adapter-sized chunks read through one reusable
+    buffer. With ``output_path`` the data is streamed to a file instead of
+    being kept in memory. Optionally compares against ``expected`` bytes or
+    a SHA-256 hex digest.
+
+    Returns a dict with address, length, sha256, seconds, bytes_per_s,
+    output_path and (when not writing to a file) data.
+    """
+
+    def execute():
+        result = _flash_read_range(dev_index, address, length, output_path,
+                                   cs, mode, clock, fast_read)
+        if expected is not None:
+            data = result.get("data")
+            if data is None:
+                data = Path(output_path).read_bytes()
+            if data != expected:
+                n = min(len(data), len(expected))
+                bad = next((i for i in range(n) if data[i] != expected[i]), n)
+                raise WaveshareSPIError(
+                    f"Flash content mismatch at 0x{address + bad:06X} "
+                    f"({length} bytes read, {len(expected)} expected)"
+                )
+        if expected_sha256 is not None and result["sha256"] != expected_sha256.lower():
+            raise WaveshareSPIError(
+                f"Flash SHA-256 mismatch: expected {expected_sha256.lower()}, "
+                f"got {result['sha256']}"
+            )
+        return result
+
+    if expected_sha256:
+        exp_str = f"SHA-256 {expected_sha256[:16]}..."
+    elif expected is not None:
+        exp_str = f"{len(expected)} bytes match"
+    else:
+        exp_str = output_path or ""
+
+    metadata = {
+        'display_command': f"SPI flash read 0x{address:06X}+{length} dev#{dev_index} CS{cs}",
+        'display_expected': exp_str,
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def flash_erase(
+        name: str,
+        dev_index: int,
+        address: int,
+        length: int,
+        verify_blank: bool = True,
+        cs: int = CS0,
+        mode: int = SPI_MODE_0,
+        clock: int = SPI_CLK_30MHZ,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that erases a sector-aligned SPI NOR flash range.
+
+    Uses 64 KB block erase (0xD8) where the range allows it and 4 KB sector
+    erase (0x20) elsewhere, polling the status register after each command.
+    """
+
+    def execute():
+        return _flash_erase_range(dev_index, address, length, verify_blank,
+                                  cs, mode, clock)
+
+    metadata = {
+        'display_command': f"SPI flash erase 0x{address:06X}+{length} dev#{dev_index} CS{cs}",
+        'display_expected': "Blank (0xFF)" if verify_blank else "",
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def flash_program(
+        name: str,
+        dev_index: int,
+        address: int,
+        data: Optional[bytes] = None,
+        input_path: Optional[str] = None,
+        erase: bool = True,
+        verify: bool = True,
+        cs: int = CS0,
+        mode: int = SPI_MODE_0,
+        clock: int = SPI_CLK_30MHZ,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that programs an image into SPI NOR flash.
+
+    The image (``data`` or a file streamed from ``input_path``) is handled
+    in 64 KB blocks: erase, page program (0x02, all-0xFF pages skipped) and
+    read-back verify per block.
+    """
+
+    def execute():
+        return _flash_program_range(dev_index, address, data, input_path,
+                                    erase, verify, cs, mode, clock)
+
+    source = input_path if input_path else f"{len(data) if data else 0} bytes"
+    metadata = {
+        'display_command': f"SPI flash program {source} @0x{address:06X} dev#{dev_index} CS{cs}",
+        'display_expected': "Verified" if verify else "",
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
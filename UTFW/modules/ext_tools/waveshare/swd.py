@@ -22,11 +22,18 @@ import re
 from typing import Dict, List, Optional
 
 from ._base import OPENOCD_SWD_CFG
+from .openocd_rpc import OPENOCD_TCL_PORT
 from .jtag import (                    # noqa: F401 - re-export public API
     # Exceptions (pass-through)
     WaveshareJTAGError,
     # Internal helpers for SWD-native implementations
     _run_openocd_with_target,
+    _run_target,
+    # Persistent OpenOCD sessions (transport-independent)
+    open_session,
+    get_session,
+    close_session,
+    stop_session,
     # Direct (non-TestAction) helpers - re-export for convenience
     run_openocd_command,
     detect_device,
@@ -34,6 +41,7 @@ from .jtag import (                    # noqa: F401 - re-export public API
     OPENOCD_TIMEOUT,
 )
 from .jtag import (
+    start_session as _start_session,
     run_openocd as _run_openocd,
     detect as _detect,
     flash_image as _flash_image,
@@ -63,6 +71,7 @@ def scan(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False,
 ) -> TestAction:
     """Scan for a device over SWD using ``dap info``.
@@ -78,14 +87,15 @@ def scan(
         adapter_speed: Optional clock speed in kHz.
         timeout: OpenOCD timeout.
         config_file: Override SWD adapter config.
+        session: Persistent OpenOCD session to run on.
         negative_test: Mark as negative test.
     """
 
     def execute():
         logger = get_active_logger()
-        output = _run_openocd_with_target(
+        output = _run_target(
             ["dap info"],
-            target_cfg, "swd", adapter_speed, timeout, config_file,
+            target_cfg, "swd", adapter_speed, timeout, config_file, session,
         )
 
         # Extract DPIDR(s) from the output
@@ -127,6 +137,7 @@ def read_idcode(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False,
 ) -> TestAction:
     """Read the SWD DPIDR (the SWD equivalent of JTAG IDCODE).
@@ -138,14 +149,15 @@ def read_idcode(
         adapter_speed: Optional clock speed in kHz.
         timeout: OpenOCD timeout.
         config_file: Override SWD adapter config.
+        session: Persistent OpenOCD session to run on.
         negative_test: Mark as negative test.
     """
 
     def execute():
         logger = get_active_logger()
-        output = _run_openocd_with_target(
+        output = _run_target(
             ["dap info"],
-            target_cfg, "swd", adapter_speed, timeout, config_file,
+            target_cfg, "swd", adapter_speed, timeout, config_file, session,
         )
 
         dpidrs = _DPIDR_RE.findall(output)
@@ -234,6 +246,7 @@ def flash_image(
         adapter_speed: Optional[int] = None,
         timeout: float = 120,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False,
 ) -> TestAction:
     """Flash firmware via SWD.  See :func:`jtag.flash_image`."""
@@ -242,7 +255,38 @@ def flash_image(
         address=address, verify=verify, erase=erase,
         reset_after=reset_after, transport=transport,
         adapter_speed=adapter_speed, timeout=timeout,
-        config_file=config_file, negative_test=negative_test,
+        config_file=config_file, session=session,
+        negative_test=negative_test,
+    )
+
+
+def flash_image_cached(
+        name: str,
+        image: str,
+        target_cfg: str,
+        address: Optional[int] = None,
+        target_id: Optional[str] = None,
+        sector_size: Optional[int] = None,
+        check: str = "checksum",
+        force: bool = False,
+        verify: bool = True,
+        reset_after: bool = True,
+        transport: str = "swd",
+        adapter_speed: Optional[int] = None,
+        timeout: float = 120,
+        config_file: Optional[str] = None,
+        session: Optional[str] = None,
+        negative_test: bool = False,
+) -> TestAction:
+    """Flash only changed sectors via SWD.  See :func:`flash_cache.flash_image_cached`."""
+    from .flash_cache import flash_image_cached as _flash_image_cached
+    return _flash_image_cached(
+        name=name, image=image, target_cfg=target_cfg, address=address,
+        target_id=target_id, sector_size=sector_size, check=check,
+        force=force, verify=verify, reset_after=reset_after,
+        transport=transport, adapter_speed=adapter_speed, timeout=timeout,
+        config_file=config_file, session=session,
+        negative_test=negative_test,
     )
 
 
@@ -255,6 +299,7 @@ def flash_verify(
         adapter_speed: Optional[int] = None,
         timeout: float = 60,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False,
 ) -> TestAction:
     """Verify flash via SWD.  See :func:`jtag.flash_verify`."""
@@ -262,7 +307,8 @@ def flash_verify(
         name=name, image=image, target_cfg=target_cfg,
         address=address, transport=transport,
         adapter_speed=adapter_speed, timeout=timeout,
-        config_file=config_file, negative_test=negative_test,
+        config_file=config_file, session=session,
+        negative_test=negative_test,
     )
 
 
@@ -273,13 +319,15 @@ def reset_halt(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False,
 ) -> TestAction:
     """Reset-halt via SWD.  See :func:`jtag.reset_halt`."""
     return _reset_halt(
         name=name, target_cfg=target_cfg, transport=transport,
         adapter_speed=adapter_speed, timeout=timeout,
-        config_file=config_file, negative_test=negative_test,
+        config_file=config_file, session=session,
+        negative_test=negative_test,
     )
 
 
@@ -294,6 +342,7 @@ def read_memory(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False,
 ) -> TestAction:
     """Read target memory via SWD.  See :func:`jtag.read_memory`."""
@@ -302,7 +351,7 @@ def read_memory(
         length=length, width=width, expected=expected,
         transport=transport, adapter_speed=adapter_speed,
         timeout=timeout, config_file=config_file,
-        negative_test=negative_test,
+        session=session, negative_test=negative_test,
     )
 
 
@@ -316,6 +365,7 @@ def write_memory(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False,
 ) -> TestAction:
     """Write target memory via SWD.  See :func:`jtag.write_memory`."""
@@ -323,7 +373,8 @@ def write_memory(
         name=name, target_cfg=target_cfg, address=address,
         values=values, width=width, transport=transport,
         adapter_speed=adapter_speed, timeout=timeout,
-        config_file=config_file, negative_test=negative_test,
+        config_file=config_file, session=session,
+        negative_test=negative_test,
     )
 
 
@@ -336,6 +387,7 @@ def run_target_command(
         adapter_speed: Optional[int] = None,
         timeout: float = OPENOCD_TIMEOUT,
         config_file: Optional[str] = None,
+        session: Optional[str] = None,
         negative_test: bool = False,
 ) -> TestAction:
     """Run target-aware OpenOCD commands via SWD.  See :func:`jtag.run_target_command`."""
@@ -343,5 +395,32 @@ def run_target_command(
         name=name, target_cfg=target_cfg, commands=commands,
         expected_output=expected_output, transport=transport,
         adapter_speed=adapter_speed, timeout=timeout,
-        config_file=config_file, negative_test=negative_test,
+        config_file=config_file, session=session,
+        negative_test=negative_test,
+    )
+
+
+# -- Persistent session ------------------------------------------------
+
+def start_session(
+        name: str,
+        target_cfg: Optional[str] = None,
+        transport: str = "swd",
+        adapter_speed: Optional[int] = None,
+        config_file: Optional[str] = None,
+        session: str = "default",
+        port: int = OPENOCD_TCL_PORT,
+        attach: bool = False,
+        startup_timeout: float = 10.0,
+        timeout: float = OPENOCD_TIMEOUT,
+        negative_test: bool = False,
+) -> TestAction:
+    """Start a persistent OpenOCD session over SWD.  See :func:`jtag.start_session`."""
+    return _start_session(
+        name=name, target_cfg=target_cfg, transport=transport,
+        adapter_speed=adapter_speed,
+        config_file=config_file or (None if target_cfg else _SWD_CFG),
+        session=session, port=port, attach=attach,
+        startup_timeout=startup_timeout, timeout=timeout,
+        negative_test=negative_test,
     )
@@ -25,14 +25,23 @@ Usage:
         "Query firmware version", "COM3", "SYSINFO"
     )
 
+    # PRBS bit-error-rate / throughput sweep over a TX-RX jumper
+    action = waveshare.uart.bert(
+        "UART BERT", "/dev/ttyACM0", baudrates=[115200, 921600],
+        formats=["8N1", "8E1"], duration_s=5,
+    )
+
 Author: DvidMakesThings
 """
 
+import bisect
+import threading
 import time
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 
 from ....core.logger import get_active_logger
 from ....core.core import TestAction
+from ...serial.monitor import borrow_port, get_monitor
 from ._base import WaveshareError, _format_hex_dump, _ensure_pyserial
 
 DEBUG = False  # Set to True to enable debug prints
@@ -109,11 +118,30 @@ def open_connection(port: str, baudrate: int = 115200, timeout: float = 2.0,
             If None, defaults to pyserial behaviour (no inter-byte timeout).
 
     Returns:
-        serial.Serial: Configured and opened serial port object.
+        serial.Serial: Configured and opened serial port object. If a
+        serial monitor owns the port (``UTFW.modules.serial.monitor``) the
+        port is borrowed from it and a ``PortLease`` is returned instead.
 
     Raises:
-        WaveshareUARTError: If the port cannot be opened or configured.
+        WaveshareUARTError: If the port cannot be opened or configured, or
+            a serial monitor holds it with different line settings.
     """
+    monitor = get_monitor(port)
+    if monitor is not None and (baudrate, databits, parity.upper(), stopbits) != \
+            (monitor.baudrate, 8, "N", 1):
+        # The monitor's port cannot be reconfigured under it
+        raise WaveshareUARTError(
+            f"{port} is held by a serial monitor at {monitor.baudrate} 8N1, "
+            f"requested {baudrate} {databits}{parity.upper()}{stopbits:g}; "
+            f"stop the monitor before using other line settings"
+        )
+    lease = borrow_port(port, timeout=timeout)
+    if lease is not None:
+        logger = get_active_logger()
+        if logger:
+            logger.info(f"[WAVESHARE UART] Borrowing {port} from the running monitor")
+        return lease
+
     _ensure_pyserial()
     import serial as pyserial
 
@@ -702,6 +730,484 @@ def cross_loopback(
     return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
 
 
+# ======================== BERT / Throughput ========================
+
+# PRBS generator taps (ITU-T O.150 style): s[n] = s[n - order] ^ s[n - tap]
+PRBS_TAPS = {7: 6, 9: 5, 11: 9, 15: 14, 20: 17, 23: 18, 31: 28}
+
+BERT_BLOCK_SIZE = 4096
+BERT_RESYNC_WINDOW = 16
+BERT_RESYNC_SPAN = 65536
+
+_PRBS_CACHE: Dict[Tuple[int, int], bytes] = {}
+
+
+def prbs_bytes(length: int, order: int = 15) -> bytes:
+    """Return ``length`` bytes of a PRBS sequence (bits packed MSB first).
+
+    The register starts all ones. Only the first ``order`` bytes are
+    generated bit by bit; the rest uses the identity
+    ``s[n] = s[n - order*2^k] ^ s[n - tap*2^k]`` on whole byte ranges,
+    so megabytes are produced with a few big-integer XORs.
+
+    Args:
+        length: Number of bytes.
+        order: PRBS order (one of ``PRBS_TAPS``).
+
+    Returns:
+        bytes: The sequence, identical for identical arguments.
+    """
+    tap = PRBS_TAPS.get(order)
+    if tap is None:
+        raise WaveshareUARTError(
+            f"Unsupported PRBS order {order}. Must be one of: {sorted(PRBS_TAPS)}"
+        )
+    key = (order, length)
+    if key in _PRBS_CACHE:
+        return _PRBS_CACHE[key]
+
+    bits = [1] * order
+    while len(bits) < 8 * order:
+        bits.append(bits[-order] ^ bits[-tap])
+    buf = bytearray(int("".join(map(str, bits)), 2).to_bytes(order, "big"))
+
+    # Byte-aligned recurrence: with M = 2^k bytes, B[i] = B[i - order*M] ^ B[i - tap*M]
+    span = 1
+    while len(buf) < length:
+        while order * span * 2 <= len(buf):
+            span *= 2
+        pos = len(buf)
+        count = (order - tap) * span
+        a = int.from_bytes(buf[pos - order * span:pos - order * span + count], "big")
+        b = int.from_bytes(buf[pos - tap * span:pos - tap * span + count], "big")
+        buf += (a ^ b).to_bytes(count, "big")
+
+    data = bytes(buf[:length])
+    if length <= 1 << 20:
+        _PRBS_CACHE[key] = data
+    return data
+
+
+def _parse_uart_format(fmt: str) -> Tuple[int, str, float]:
+    """Parse a frame format like "8N1", "7E2" or "8N1.5"."""
+    fmt = fmt.strip().upper()
+    if len(fmt) < 3 or not fmt[0].isdigit() or fmt[1] not in "NOEMS":
+        raise WaveshareUARTError(f"Invalid UART format '{fmt}' (expected e.g. 8N1, 7E2)")
+    stop = float(fmt[2:])
+    return int(fmt[0]), fmt[1], int(stop) if stop.is_integer() else stop
+
+
+def _frame_bits(databits: int, parity: str, stopbits: float) -> float:
+    return 1 + databits + (0 if parity.upper() == "N" else 1) + stopbits
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _scale(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000.0, 3)
+
+
+def _first_difference(a, b) -> int:
+    """Index of the first differing byte of two equal-length buffers."""
+    diff = int.from_bytes(a, "big") ^ int.from_bytes(b, "big")
+    return len(a) - 1 - (diff.bit_length() - 1) // 8
+
+
+def _bert_compare(tx, rx, mask: int = 0xFF,
+                  span: int = BERT_RESYNC_SPAN) -> Dict[str, Any]:
+    """Align the received stream against the transmitted one.
+
+    Equal stretches are compared block-wise; at a mismatch the next
+    ``BERT_RESYNC_WINDOW`` bytes decide between a corrupted byte (streams
+    realign right after it), dropped bytes (received window found ahead in
+    the transmitted stream) and inserted bytes (the reverse). ``span``
+    limits the search and must stay below the PRBS period.
+
+    Returns:
+        Dict with corrupted/dropped/inserted byte counts, bit_errors,
+        first_error_offset, first_loss_offset (TX stream offsets) and
+        ``shifts``: list of ``(tx_offset, rx_minus_tx)`` alignment changes.
+    """
+    tx_bytes, rx_bytes = bytes(tx), bytes(rx)
+    if mask != 0xFF:
+        # Fewer than 8 data bits: the line carries only the low bits of each byte
+        table = bytes(b & mask for b in range(256))
+        tx_bytes, rx_bytes = tx_bytes.translate(table), rx_bytes.translate(table)
+    tx_view, rx_view = memoryview(tx_bytes), memoryview(rx_bytes)
+
+    i = j = 0
+    corrupted = dropped = inserted = bit_errors = 0
+    first_error = first_loss = None
+    shifts: List[Tuple[int, int]] = [(0, 0)]
+    n_tx, n_rx = len(tx_view), len(rx_view)
+
+    while i < n_tx and j < n_rx:
+        n = min(BERT_BLOCK_SIZE, n_tx - i, n_rx - j)
+        if tx_view[i:i + n] == rx_view[j:j + n]:
+            i += n
+            j += n
+            continue
+        k = _first_difference(tx_view[i:i + n], rx_view[j:j + n])
+        i += k
+        j += k
+        if first_error is None:
+            first_error = i
+
+        nxt = BERT_RESYNC_WINDOW + 1
+        if len(rx_bytes) - j >= nxt and tx_view[i + 1:i + nxt] == rx_view[j + 1:j + nxt]:
+            pass  # single corrupted byte, streams still aligned
+        elif len(rx_bytes) - j >= BERT_RESYNC_WINDOW:
+            probe = rx_bytes[j:j + BERT_RESYNC_WINDOW]
+            drop = tx_bytes.find(probe, i + 1, i + span)
+            insert = rx_bytes.find(tx_bytes[i:i + BERT_RESYNC_WINDOW], j + 1, j + span)
+            if drop > i and (insert < 0 or drop - i <= insert - j):
+                dropped += drop - i
+                if first_loss is None:
+                    first_loss = i
+                i = drop
+                shifts.append((i, j - i))
+                continue
+            if insert > j:
+                inserted += insert - j
+                j = insert
+                shifts.append((i, j - i))
+                continue
+
+        corrupted += 1
+        bit_errors += bin(tx_view[i] ^ rx_view[j]).count("1")
+        i += 1
+        j += 1
+
+    if i < n_tx:
+        # Never arrived
+        dropped += n_tx - i
+        if first_loss is None:
+            first_loss = i
+    inserted += n_rx - j
+
+    return {
+        "corrupted_bytes": corrupted,
+        "dropped_bytes": dropped,
+        "inserted_bytes": inserted,
+        "bit_errors": bit_errors,
+        "first_error_offset": first_error if first_error is not None else first_loss,
+        "first_loss_offset": first_loss,
+        "shifts": shifts,
+    }
+
+
+def _bert_latencies(writes: List[Tuple[int, float]], arrivals: List[Tuple[int, float]],
+                    shifts: List[Tuple[int, int]], rx_len: int) -> List[float]:
+    """Per-block latency: write() start until the block's last byte was read."""
+    arrival_offsets = [offset for offset, _t in arrivals]
+    shift_offsets = [offset for offset, _d in shifts]
+    latencies = []
+    for end, t_write in writes:
+        delta = shifts[bisect.bisect_right(shift_offsets, end - 1) - 1][1]
+        rx_end = end + delta
+        if rx_end <= 0 or rx_end > rx_len:
+            continue
+        index = bisect.bisect_left(arrival_offsets, rx_end)
+        if index < len(arrivals):
+            latencies.append(arrivals[index][1] - t_write)
+    return latencies
+
+
+def _bert_stream(ser_tx, ser_rx, payload: bytes, duration_s: Optional[float],
+                 block_size: int, idle_timeout: float) -> Dict[str, Any]:
+    """Stream ``payload`` on ``ser_tx`` while a reader thread drains ``ser_rx``.
+
+    Both sides work on preallocated buffers; the hot loops only move
+    bytes and record ``(offset, time)`` pairs, all checking happens after
+    the run.
+    """
+    rx_buf = bytearray(len(payload) + block_size)
+    rx_view = memoryview(rx_buf)
+    tx_view = memoryview(payload)
+    writes: List[Tuple[int, float]] = []
+    arrivals: List[Tuple[int, float]] = []
+    state: Dict[str, Any] = {"sent": 0, "received": 0, "tx_done": False,
+                             "tx_error": None, "rx_error": None}
+
+    def reader():
+        pos = 0
+        last_data = time.perf_counter()
+        try:
+            while pos < len(rx_buf):
+                want = min(max(ser_rx.in_waiting, 1), len(rx_buf) - pos)
+                n = ser_rx.readinto(rx_view[pos:pos + want])
+                now = time.perf_counter()
+                if n:
+                    pos += n
+                    arrivals.append((pos, now))
+                    last_data = now
+                elif state["tx_done"] and (pos >= state["sent"]
+                                           or now - last_data > idle_timeout):
+                    break
+        except Exception as exc:
+            state["rx_error"] = f"{type(exc).__name__}: {exc}"
+        state["received"] = pos
+
+    thread = threading.Thread(target=reader, name="utfw-uart-bert-rx", daemon=True)
+    thread.start()
+
+    start = time.perf_counter()
+    deadline = start + duration_s if duration_s else None
+    sent = 0
+    try:
+        while sent < len(payload):
+            if deadline and time.perf_counter() >= deadline:
+                break
+            t_write = time.perf_counter()
+            n = ser_tx.write(tx_view[sent:sent + block_size]) or 0
+            if n <= 0:
+                break
+            sent += n
+            state["sent"] = sent
+            writes.append((sent, t_write))
+        ser_tx.flush()
+    except Exception as exc:
+        state["tx_error"] = f"{type(exc).__name__}: {exc}"
+    tx_end = time.perf_counter()
+    state["tx_done"] = True
+
+    thread.join()
+    end = arrivals[-1][1] if arrivals else time.perf_counter()
+    rx_view.release()
+    return {
+        "sent": sent,
+        "received": state["received"],
+        "rx": bytes(rx_buf[:state["received"]]),
+        "writes": writes,
+        "arrivals": arrivals,
+        "tx_seconds": tx_end - start,
+        "seconds": end - start,
+        "tx_error": state["tx_error"],
+        "rx_error": state["rx_error"],
+    }
+
+
+def run_bert(tx_port: str, rx_port: Optional[str] = None, baudrate: int = 115200,
+             databits: int = 8, parity: str = "N", stopbits: float = 1,
+             duration_s: Optional[float] = 5.0, total_bytes: Optional[int] = None,
+             prbs_order: int = 15, block_size: int = BERT_BLOCK_SIZE,
+             idle_timeout: float = 1.0) -> Dict[str, Any]:
+    """Run a bit-error-rate / throughput test for one baud and frame format.
+
+    PRBS data is written on ``tx_port`` by the calling thread while a
+    reader thread drains ``rx_port`` (same port if None, i.e. a TX-RX
+    jumper). Works with any pyserial port, including Linux pty pairs and
+    socat virtual ports.
+
+    Args:
+        tx_port: Transmitting port.
+        rx_port: Receiving port (None = ``tx_port``).
+        baudrate: Baud rate for both ports.
+        databits, parity, stopbits: Frame format.
+        duration_s: Stream for this long (None = until ``total_bytes``).
+        total_bytes: Stream at most this many bytes. Defaults to what the
+            line can carry in ``duration_s`` plus 10 %.
+        prbs_order: PRBS order (see ``PRBS_TAPS``). Losses longer than the
+            pattern period (2^order - 1 bytes) cannot be located, so keep
+            order >= 15 for real links.
+        block_size: Bytes per write() call; latency is measured per block.
+        idle_timeout: Stop reading this long after the last byte once the
+            writer has finished.
+
+    Returns:
+        Dict with bytes_sent, bytes_received, throughput_bps (payload
+        bytes/s), line_utilization, latency_ms (p50/p90/p99/max),
+        corrupted/dropped/inserted byte counts, bit_errors, ber,
+        first_error_offset, first_loss_offset, and tx_error/rx_error (None
+        unless the port failed mid-run; ber is meaningless then, and also
+        when bytes_sent is 0).
+    """
+    if duration_s is None and total_bytes is None:
+        raise WaveshareUARTError("run_bert needs duration_s or total_bytes")
+    frame_bits = _frame_bits(databits, parity, stopbits)
+    line_rate = baudrate / frame_bits
+    if total_bytes is None:
+        total_bytes = int(line_rate * duration_s * 1.1) + block_size
+    payload = prbs_bytes(total_bytes, prbs_order)
+
+    same_port = rx_port is None or rx_port == tx_port
+    ser_rx = open_connection(rx_port or tx_port, baudrate, timeout=0.05,
+                             databits=databits, parity=parity, stopbits=stopbits)
+    try:
+        ser_tx = ser_rx if same_port else open_connection(
+            tx_port, baudrate, timeout=0.05, databits=databits,
+            parity=parity, stopbits=stopbits)
+        try:
+            run = _bert_stream(ser_tx, ser_rx, payload, duration_s, block_size, idle_timeout)
+        finally:
+            if not same_port:
+                try:
+                    ser_tx.close()
+                except Exception:
+                    pass
+    finally:
+        try:
+            ser_rx.close()
+        except Exception:
+            pass
+
+    sent, rx = run["sent"], run["rx"]
+    span = min(BERT_RESYNC_SPAN, (1 << prbs_order) - 2)
+    cmp = _bert_compare(payload[:sent], rx, (1 << databits) - 1, span)
+    latencies = sorted(_bert_latencies(run["writes"], run["arrivals"], cmp["shifts"], len(rx)))
+    good = max(0, sent - cmp["dropped_bytes"] - cmp["corrupted_bytes"])
+    seconds = run["seconds"] or 1e-9
+    compared_bits = max(1, (sent - cmp["dropped_bytes"]) * databits)
+
+    return {
+        "tx_port": tx_port,
+        "rx_port": rx_port or tx_port,
+        "baudrate": baudrate,
+        "format": f"{databits}{parity.upper()}{stopbits}",
+        "prbs_order": prbs_order,
+        "bytes_sent": sent,
+        "bytes_received": len(rx),
+        "seconds": seconds,
+        "throughput_bps": good / seconds,
+        "tx_rate_bps": sent / (run["tx_seconds"] or 1e-9),
+        "line_utilization": good / seconds / line_rate,
+        "latency_ms": {
+            "p50": _scale(_percentile(latencies, 50)),
+            "p90": _scale(_percentile(latencies, 90)),
+            "p99": _scale(_percentile(latencies, 99)),
+            "max": _scale(latencies[-1] if latencies else None),
+            "samples": len(latencies),
+        },
+        "corrupted_bytes": cmp["corrupted_bytes"],
+        "dropped_bytes": cmp["dropped_bytes"],
+        "inserted_bytes": cmp["inserted_bytes"],
+        "bit_errors": cmp["bit_errors"],
+        "ber": (cmp["bit_errors"] + cmp["dropped_bytes"] * databits) / compared_bits
+        if sent else 0.0,
+        "first_error_offset": cmp["first_error_offset"],
+        "first_loss_offset": cmp["first_loss_offset"],
+        "tx_error": run["tx_error"],
+        "rx_error": run["rx_error"],
+    }
+
+
+def bert(
+        name: str,
+        tx_port: str,
+        rx_port: Optional[str] = None,
+        baudrates: Optional[List[int]] = None,
+        formats: Optional[List[str]] = None,
+        duration_s: Optional[float] = 5.0,
+        total_bytes: Optional[int] = None,
+        prbs_order: int = 15,
+        block_size: int = BERT_BLOCK_SIZE,
+        max_ber: float = 0.0,
+        min_utilization: Optional[float] = None,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that runs a BERT/throughput sweep.
+
+    Every baud rate is combined with every frame format; each combination
+    runs :func:`run_bert` and is logged with throughput, latency
+    percentiles and error counts.
+
+    Args:
+        name: Human-readable name for the test action.
+        tx_port: Transmitting port.
+        rx_port: Receiving port (None = loopback on ``tx_port``).
+        baudrates: Baud rates to test. Defaults to [115200].
+        formats: Frame formats ("8N1", "7E1", ...). Defaults to ["8N1"].
+        duration_s: Streaming time per combination.
+        total_bytes: Byte limit per combination.
+        prbs_order: PRBS order.
+        block_size: Bytes per write() call.
+        max_ber: Fail if any combination exceeds this bit error rate.
+            A combination that sent nothing or hit a port error always
+            fails.
+        min_utilization: Fail if payload throughput falls below this
+            fraction of the line rate (e.g. 0.9).
+        negative_test: Mark as negative test.
+
+    Returns:
+        TestAction that returns the list of per-combination result dicts.
+    """
+    rates = list(baudrates or [115200])
+    fmts = list(formats or ["8N1"])
+
+    def execute():
+        logger = get_active_logger()
+        if logger:
+            logger.info("")
+            logger.info("=" * 80)
+            logger.info("[WAVESHARE UART] BERT / THROUGHPUT")
+            logger.info("=" * 80)
+            logger.info(f"  TX Port:  {tx_port}")
+            logger.info(f"  RX Port:  {rx_port or tx_port}")
+            logger.info(f"  Bauds:    {', '.join(str(b) for b in rates)}")
+            logger.info(f"  Formats:  {', '.join(fmts)}")
+            logger.info(f"  Pattern:  PRBS{prbs_order}")
+            logger.info("")
+
+        results, failures = [], []
+        for fmt in fmts:
+            databits, parity, stopbits = _parse_uart_format(fmt)
+            for baud in rates:
+                res = run_bert(tx_port, rx_port, baud, databits, parity, stopbits,
+                               duration_s, total_bytes, prbs_order, block_size)
+                results.append(res)
+                lat = res["latency_ms"]
+                if logger:
+                    logger.info(f"  {baud:>8} {res['format']:<6} "
+                                f"{res['throughput_bps']:>10.0f} B/s "
+                                f"({res['line_utilization'] * 100:5.1f}%)  "
+                                f"lat p50/p99 {lat['p50']}/{lat['p99']} ms  "
+                                f"BER {res['ber']:.2e}  "
+                                f"drop {res['dropped_bytes']} corrupt {res['corrupted_bytes']}")
+                    if res["first_error_offset"] is not None:
+                        logger.info(f"           first error @ {res['first_error_offset']}, "
+                                    f"loss starts @ {res['first_loss_offset']}")
+                    for key in ("tx_error", "rx_error"):
+                        if res[key]:
+                            logger.info(f"           {key}: {res[key]}")
+                for key in ("tx_error", "rx_error"):
+                    if res[key]:
+                        failures.append(f"{baud} {res['format']}: {key} {res[key]}")
+                if res["bytes_sent"] == 0:
+                    failures.append(f"{baud} {res['format']}: no bytes sent")
+                elif res["ber"] > max_ber:
+                    failures.append(f"{baud} {res['format']}: BER {res['ber']:.2e} > {max_ber:.2e}")
+                if min_utilization is not None and res["line_utilization"] < min_utilization:
+                    failures.append(f"{baud} {res['format']}: utilization "
+                                    f"{res['line_utilization']:.2f} < {min_utilization:.2f}")
+
+        if failures:
+            if logger:
+                logger.error("")
+                logger.error("[WAVESHARE UART] BERT FAILED")
+                for failure in failures:
+                    logger.error(f"  {failure}")
+                logger.error("-" * 80)
+            raise WaveshareUARTError("UART BERT failed: " + "; ".join(failures))
+
+        if logger:
+            logger.info("")
+            logger.info(f"[OK] {len(results)} combination(s) within limits")
+            logger.info("=" * 80)
+        return results
+
+    metadata = {
+        'display_command': f"UART BERT {tx_port}->{rx_port or tx_port} "
+                           f"[{', '.join(str(b) for b in rates)}] {'/'.join(fmts)}",
+        'display_expected': f"BER <= {max_ber:g}",
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
 # ======================== TestAction Factories ========================
 
 def send(
@@ -8,6 +8,7 @@ This module provides comprehensive failure memory testing capabilities including
 - Decoding 16-bit error codes
 - Clearing failure memory regions
 - Validating error presence/absence
+- Tracking new entries between steps without clearing the log
 - Generating test errors
 - Comprehensive reporting
 
@@ -22,7 +23,11 @@ from .failure_memory import (
     decode_error_code,
     extract_eeprom_bytes_from_dump,
     decode_event_log_region,
+    decode_event_log_from_image,
+    decode_event_log_regions,
+    summarize_error_codes,
     read_failure_memory_uart,
+    read_failure_memory,
     clear_failure_memory_uart,
     
     # TestAction factories
@@ -31,6 +36,17 @@ from .failure_memory import (
     verify_error_present,
     verify_log_empty,
     
+    # Delta tracking
+    FailureLogSnapshot,
+    FailureLogDelta,
+    take_failure_snapshot,
+    get_failure_snapshot,
+    failure_log_delta,
+    read_failure_delta,
+    snapshot_failure_log,
+    verify_no_new_errors,
+    verify_new_errors,
+    
     # Constants
     EVENT_LOG_BLOCK_SIZE,
     FAILURE_MEM_TIMEOUT,
@@ -49,7 +65,11 @@ __all__ = [
     "decode_error_code",
     "extract_eeprom_bytes_from_dump",
     "decode_event_log_region",
+    "decode_event_log_from_image",
+    "decode_event_log_regions",
+    "summarize_error_codes",
     "read_failure_memory_uart",
+    "read_failure_memory",
     "clear_failure_memory_uart",
     
     # TestAction factories
@@ -58,6 +78,17 @@ __all__ = [
     "verify_error_present",
     "verify_log_empty",
     
+    # Delta tracking
+    "FailureLogSnapshot",
+    "FailureLogDelta",
+    "take_failure_snapshot",
+    "get_failure_snapshot",
+    "failure_log_delta",
+    "read_failure_delta",
+    "snapshot_failure_log",
+    "verify_no_new_errors",
+    "verify_new_errors",
+    
     # Constants
     "EVENT_LOG_BLOCK_SIZE",
     "FAILURE_MEM_TIMEOUT",
@@ -26,17 +26,31 @@ TestAction Factories:
     - verify_log_empty: Verify log is empty
     - generate_test_error: Trigger errors by sending invalid commands
     - decode_and_report: Full decode with detailed reporting
+    - snapshot_failure_log: Remember the log state for delta checks
+    - verify_no_new_errors: No entries logged since a snapshot
+    - verify_new_errors: Exactly (or at least) these entries logged since a snapshot
 
 Author: DvidMakesThings
 """
 
-import re
+import sys
 import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple, Any, Union
 
 from ...core.logger import get_active_logger
-from ...core.core import TestAction
+from ...core.core import TestAction, get_active_framework
+from ..serial.serial import MarkerScanner
+from ..serial.monitor import borrow_port
+from ..serial.eeprom_dump import (
+    EepromImage,
+    parse_hex_dump,
+    cached_eeprom_image,
+    note_command,
+)
 
 # Import error code decoding tables
 from ._error_tables import MODULE_NAMES, SEVERITY_NAMES, FID_NAMES
@@ -48,6 +62,22 @@ DEBUG = False  # Set to True for debug prints
 EVENT_LOG_BLOCK_SIZE = 0x0200  # 512 bytes per log region
 FAILURE_MEM_TIMEOUT = 5.0      # Default timeout for reading dumps
 
+_HOST_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# Dense decode tables, indexed by nibble / (module << 4 | fid) / full code
+_MODULE_NAME_TABLE = [MODULE_NAMES.get(m, f"UNKNOWN(0x{m:X})") for m in range(16)]
+_SEVERITY_NAME_TABLE = [SEVERITY_NAMES.get(s, f"0x{s:X}") for s in range(16)]
+_FID_NAME_TABLE = [FID_NAMES.get(mf >> 4, {}).get(mf & 0xF, f"FID 0x{mf & 0xF:X}")
+                   for mf in range(256)]
+_DESCRIPTIONS: Dict[int, str] = {
+    (module << 12) | (severity << 8) | (fid << 4) | eid: text
+    for module, fids in EID_NAMES.items()
+    for fid, severities in fids.items()
+    for severity, eids in severities.items()
+    for eid, text in eids.items()
+}
+_DECODED: List[Optional[Dict[str, Any]]] = [None] * 0x10000
+
 
 class FailureMemoryError(Exception):
     """Exception raised when failure memory operations fail.
@@ -64,6 +94,13 @@ class FailureMemoryError(Exception):
 
 # ======================== Core Helper Functions ========================
 
+def _code_names(code: int) -> Tuple[str, str, str]:
+    """Return (module_name, severity_name, fid_name) for a code."""
+    return (_MODULE_NAME_TABLE[(code >> 12) & 0xF],
+            _SEVERITY_NAME_TABLE[(code >> 8) & 0xF],
+            _FID_NAME_TABLE[((code >> 8) & 0xF0) | ((code >> 4) & 0xF)])
+
+
 def _ensure_pyserial():
     """Ensure pyserial is installed, raise clear error if not."""
     try:
@@ -122,7 +159,12 @@ def _open_serial_connection(port: str, baudrate: int, timeout: float):
             logger.info(f"[FAILMEM] Opening serial port: {port}")
             logger.info(f"[FAILMEM]   Baudrate: {baudrate}, Timeout: {timeout}s")
         
-        ser = serial.Serial(port=port, baudrate=baudrate, timeout=timeout)
+        ser = borrow_port(port, owner="failuremem", timeout=timeout)
+        if ser is not None:
+            if logger:
+                logger.info(f"[FAILMEM] Borrowing {port} from the running monitor")
+        else:
+            ser = serial.Serial(port=port, baudrate=baudrate, timeout=timeout)
         
         # Clear any pending data
         ser.reset_input_buffer()
@@ -151,6 +193,9 @@ def decode_error_code(code: int) -> Dict[str, Any]:
     - C (bits 7..4): File ID within module
     - C (bits 3..0): Error ID within file
     
+    Results come from a dense per-code table, so repeated codes in a large
+    log cost one list lookup each.
+    
     Args:
         code (int): 16-bit error code to decode.
         
@@ -166,42 +211,33 @@ def decode_error_code(code: int) -> Dict[str, Any]:
             - eid: Error ID (0-F)
             - description: Detailed description from EID_NAMES
     """
-    logger = get_active_logger()
-    
-    # Extract bitfields
-    module = (code >> 12) & 0xF
-    severity = (code >> 8) & 0xF
-    fid = (code >> 4) & 0xF
-    eid = code & 0xF
-    
-    # Look up names
-    module_name = MODULE_NAMES.get(module, f"UNKNOWN(0x{module:X})")
-    severity_name = SEVERITY_NAMES.get(severity, f"0x{severity:X}")
-    fid_name = FID_NAMES.get(module, {}).get(fid, f"FID 0x{fid:X}")
-    
-    # Look up description from EID_NAMES (includes severity in the lookup chain)
-    eid_desc = EID_NAMES.get(module, {}).get(fid, {}).get(severity, {}).get(eid, "")
-    description = f"{module_name}: {eid_desc}" if eid_desc else ""
+    code &= 0xFFFF
+    entry = _DECODED[code]
+    if entry is None:
+        module_name, severity_name, fid_name = _code_names(code)
+        eid_desc = _DESCRIPTIONS.get(code, "")
+        entry = _DECODED[code] = {
+            "code": code,
+            "module": code >> 12,
+            "module_name": module_name,
+            "severity": (code >> 8) & 0xF,
+            "severity_name": severity_name,
+            "fid": (code >> 4) & 0xF,
+            "fid_name": fid_name,
+            "eid": code & 0xF,
+            "description": f"{module_name}: {eid_desc}" if eid_desc else "",
+        }
     
+    logger = get_active_logger()
     if logger and DEBUG:
         logger.debug(f"[FAILMEM DECODE] Code 0x{code:04X}:")
-        logger.debug(f"[FAILMEM DECODE]   Module: 0x{module:X} ({module_name})")
-        logger.debug(f"[FAILMEM DECODE]   Severity: 0x{severity:X} ({severity_name})")
-        logger.debug(f"[FAILMEM DECODE]   File ID: 0x{fid:X} ({fid_name})")
-        logger.debug(f"[FAILMEM DECODE]   Error ID: 0x{eid:X}")
-        logger.debug(f"[FAILMEM DECODE]   Description: {description}")
+        logger.debug(f"[FAILMEM DECODE]   Module: 0x{entry['module']:X} ({entry['module_name']})")
+        logger.debug(f"[FAILMEM DECODE]   Severity: 0x{entry['severity']:X} ({entry['severity_name']})")
+        logger.debug(f"[FAILMEM DECODE]   File ID: 0x{entry['fid']:X} ({entry['fid_name']})")
+        logger.debug(f"[FAILMEM DECODE]   Error ID: 0x{entry['eid']:X}")
+        logger.debug(f"[FAILMEM DECODE]   Description: {entry['description']}")
     
-    return {
-        "code": code,
-        "module": module,
-        "module_name": module_name,
-        "severity": severity,
-        "severity_name": severity_name,
-        "fid": fid,
-        "fid_name": fid_name,
-        "eid": eid,
-        "description": description,
-    }
+    return dict(entry)
 
 
 def extract_eeprom_bytes_from_dump(dump_text: str) -> List[int]:
@@ -210,6 +246,9 @@ def extract_eeprom_bytes_from_dump(dump_text: str) -> List[int]:
     Parses dump text looking for lines in format:
         0xNNNN HH HH HH ... (address followed by hex bytes)
     
+    Rows are placed by address (see serial.eeprom_dump.parse_hex_dump), so
+    a missing row reads as erased 0xFF instead of shifting later entries.
+    
     Args:
         dump_text (str): Raw dump text from device.
         
@@ -222,25 +261,17 @@ def extract_eeprom_bytes_from_dump(dump_text: str) -> List[int]:
         logger.info(f"[FAILMEM] Extracting EEPROM bytes from dump")
         logger.info(f"[FAILMEM]   Dump text length: {len(dump_text)} chars")
     
-    bytes_out = []
-    line_count = 0
-    
-    for line in dump_text.splitlines():
-        line = line.strip()
-        if not (line.startswith("0x") or line.startswith("0X")):
-            continue
-        
-        line_count += 1
-        parts = line.split()
-        # parts[0] is the address, skip it
-        for token in parts[1:]:
-            if re.fullmatch(r"[0-9A-Fa-f]{2}", token):
-                bytes_out.append(int(token, 16))
+    image = parse_hex_dump(dump_text)
+    bytes_out = list(image.span())
     
     if logger:
         logger.info(f"[FAILMEM] Extraction complete:")
-        logger.info(f"[FAILMEM]   Lines processed: {line_count}")
+        logger.info(f"[FAILMEM]   Lines processed: {len(image.rows)}")
         logger.info(f"[FAILMEM]   Bytes extracted: {len(bytes_out)}")
+        if image.gaps:
+            logger.warn(f"[FAILMEM]   Gaps in dump: {len(image.gaps)} (filled with 0xFF)")
+        if image.duplicates:
+            logger.warn(f"[FAILMEM]   Duplicate rows: {len(image.duplicates)}")
     
     # Truncate to expected block size if needed
     if len(bytes_out) > EVENT_LOG_BLOCK_SIZE:
@@ -251,7 +282,45 @@ def extract_eeprom_bytes_from_dump(dump_text: str) -> List[int]:
     return bytes_out
 
 
-def decode_event_log_region(byte_values: List[int]) -> Tuple[int, List[int]]:
+def decode_event_log_from_image(image: EepromImage, address: int,
+                                size: int = EVENT_LOG_BLOCK_SIZE) -> Tuple[int, List[int]]:
+    """Decode an event log region straight from a parsed EEPROM image.
+    
+    Lets a full ``DUMP_EEPROM`` capture (e.g. from analyze_eeprom_dump) feed
+    failure-memory decoding without reading or parsing the dump again.
+    
+    Args:
+        image (EepromImage): Parsed EEPROM image.
+        address (int): EEPROM address of the log region.
+        size (int, optional): Region size. Defaults to EVENT_LOG_BLOCK_SIZE.
+        
+    Returns:
+        Tuple[int, List[int]]: (pointer, ordered_codes), as decode_event_log_region.
+    """
+    return decode_event_log_region(image.slice(address, size))
+
+
+def _region_entries(data: bytes) -> Tuple[int, array, bool]:
+    """Split a log region into (pointer, big-endian entries, pointer_reset)."""
+    ptr = data[0] | (data[1] << 8)
+    entries = array("H")
+    entries.frombytes(data[2:2 + ((len(data) - 2) & ~1)])
+    if _HOST_LITTLE_ENDIAN:
+        entries.byteswap()
+    reset = ptr >= len(entries)
+    if reset:
+        ptr = 0
+    return ptr, entries, reset
+
+
+def _ordered_codes(entries: array, ptr: int) -> List[int]:
+    """Rotate the ring oldest→newest and drop empty (0x0000/0xFFFF) slots."""
+    ring = entries[ptr:] + entries[:ptr] if ptr else entries
+    return [c for c in ring if 0 < c < 0xFFFF]
+
+
+def decode_event_log_region(byte_values: Union[bytes, bytearray, memoryview, List[int]]
+                            ) -> Tuple[int, List[int]]:
     """Decode an event log region into pointer and ordered error codes.
     
     The log region layout (from event_log.c):
@@ -259,10 +328,12 @@ def decode_event_log_region(byte_values: List[int]) -> Tuple[int, List[int]]:
         [2..]: entries, 2 bytes each, BIG-endian 16-bit error codes
         
     The ring buffer is ordered from oldest to newest, with the pointer
-    indicating where the next write will occur.
+    indicating where the next write will occur. Entries are unpacked in
+    one ``array('H')`` conversion rather than byte by byte.
     
     Args:
-        byte_values (List[int]): Raw bytes from EEPROM dump.
+        byte_values (Union[bytes, bytearray, memoryview, List[int]]): Raw
+            bytes from EEPROM dump.
         
     Returns:
         Tuple[int, List[int]]: (pointer, ordered_codes)
@@ -271,55 +342,27 @@ def decode_event_log_region(byte_values: List[int]) -> Tuple[int, List[int]]:
               excluding 0xFFFF and 0x0000
     """
     logger = get_active_logger()
+    data = bytes(byte_values)
     
     if logger:
         logger.info(f"[FAILMEM] Decoding event log region")
-        logger.info(f"[FAILMEM]   Input bytes: {len(byte_values)}")
+        logger.info(f"[FAILMEM]   Input bytes: {len(data)}")
     
-    if len(byte_values) < 4:
+    if len(data) < 4:
         if logger:
-            logger.warn(f"[FAILMEM] Insufficient bytes for event log (need >= 4, got {len(byte_values)})")
+            logger.warn(f"[FAILMEM] Insufficient bytes for event log (need >= 4, got {len(data)})")
         return 0, []
     
-    # Extract pointer (little-endian at bytes 0-1)
-    ptr = byte_values[0] | (byte_values[1] << 8)
-    
-    if logger:
-        logger.info(f"[FAILMEM] Write pointer: {ptr} (0x{ptr:04X})")
-    
-    # Extract error code entries (big-endian, starting at byte 2)
-    entries_raw = []
-    for i in range(2, len(byte_values), 2):
-        if i + 1 >= len(byte_values):
-            break
-        hi = byte_values[i]
-        lo = byte_values[i + 1]
-        code = (hi << 8) | lo
-        entries_raw.append(code)
-    
-    max_entries = len(entries_raw)
-    if max_entries == 0:
-        if logger:
-            logger.info(f"[FAILMEM] No entries found in log region")
-        return ptr, []
+    ptr, entries, reset = _region_entries(data)
     
     if logger:
-        logger.info(f"[FAILMEM] Raw entries: {max_entries}")
+        raw_ptr = data[0] | (data[1] << 8)
+        logger.info(f"[FAILMEM] Write pointer: {raw_ptr} (0x{raw_ptr:04X})")
+        logger.info(f"[FAILMEM] Raw entries: {len(entries)}")
+        if reset:
+            logger.warn(f"[FAILMEM] Pointer {raw_ptr} >= max_entries {len(entries)}, resetting to 0")
     
-    # Validate pointer
-    if ptr >= max_entries:
-        if logger:
-            logger.warn(f"[FAILMEM] Pointer {ptr} >= max_entries {max_entries}, resetting to 0")
-        ptr = 0
-    
-    # Reorder from oldest to newest, filtering empty entries
-    ordered = []
-    for idx in range(max_entries):
-        j = (ptr + idx) % max_entries
-        code = entries_raw[j]
-        if code in (0xFFFF, 0x0000):
-            continue
-        ordered.append(code)
+    ordered = _ordered_codes(entries, ptr)
     
     if logger:
         logger.info(f"[FAILMEM] Decoded {len(ordered)} valid entries (oldest→newest)")
@@ -330,6 +373,95 @@ def decode_event_log_region(byte_values: List[int]) -> Tuple[int, List[int]]:
     return ptr, ordered
 
 
+def summarize_error_codes(codes: List[int]) -> Dict[str, Any]:
+    """Summarize an ordered list of error codes.
+    
+    Per-entry work is done by C-level counting; name lookups then run once
+    per distinct code, not once per entry.
+    
+    Args:
+        codes (List[int]): Error codes, oldest first.
+        
+    Returns:
+        Dict[str, Any]: Dictionary containing:
+            - total: Number of entries
+            - unique: Number of distinct codes
+            - counts: {code: occurrences}
+            - first / last: {code: index of first / last occurrence}
+            - by_module: {module_name: occurrences}
+            - by_severity: {severity_name: occurrences}
+            - by_fid: {"MODULE/file": occurrences}
+            - by_eid: {"MODULE/file/EID 0xN": occurrences}
+    """
+    last = {code: idx for idx, code in enumerate(codes)}
+    first = {code: idx for idx, code in reversed(list(enumerate(codes)))}
+    counts = Counter(codes)
+    
+    by_module: Dict[str, int] = {}
+    by_severity: Dict[str, int] = {}
+    by_fid: Dict[str, int] = {}
+    by_eid: Dict[str, int] = {}
+    for code, n in counts.items():
+        module_name, severity_name, fid_name = _code_names(code)
+        fid_key = f"{module_name}/{fid_name}"
+        eid_key = f"{fid_key}/EID 0x{code & 0xF:X}"
+        by_module[module_name] = by_module.get(module_name, 0) + n
+        by_severity[severity_name] = by_severity.get(severity_name, 0) + n
+        by_fid[fid_key] = by_fid.get(fid_key, 0) + n
+        by_eid[eid_key] = by_eid.get(eid_key, 0) + n
+    
+    return {
+        "total": len(codes),
+        "unique": len(counts),
+        "counts": dict(counts),
+        "first": first,
+        "last": last,
+        "by_module": by_module,
+        "by_severity": by_severity,
+        "by_fid": by_fid,
+        "by_eid": by_eid,
+    }
+
+
+def decode_event_log_regions(
+    data: Union[bytes, bytearray, memoryview],
+    region_size: int = EVENT_LOG_BLOCK_SIZE
+) -> Dict[str, Any]:
+    """Decode consecutive event log regions and summarize them together.
+    
+    For large captures holding several log regions back to back (e.g. a
+    slice of the full EEPROM image). Each region is decoded as in
+    decode_event_log_region, without per-region logging.
+    
+    Args:
+        data (Union[bytes, bytearray, memoryview]): Concatenated regions.
+        region_size (int, optional): Size of one region. Defaults to
+            EVENT_LOG_BLOCK_SIZE.
+        
+    Returns:
+        Dict[str, Any]: Dictionary containing:
+            - regions: [{"offset", "pointer", "error_codes"}] per region
+            - error_codes: All codes, region by region, oldest→newest
+            - summary: summarize_error_codes() of all codes
+    """
+    logger = get_active_logger()
+    view = memoryview(data).cast("B")
+    regions = []
+    all_codes: List[int] = []
+    for offset in range(0, len(view) - 3, region_size):
+        ptr, entries, _ = _region_entries(bytes(view[offset:offset + region_size]))
+        codes = _ordered_codes(entries, ptr)
+        regions.append({"offset": offset, "pointer": ptr, "error_codes": codes})
+        all_codes.extend(codes)
+    summary = summarize_error_codes(all_codes)
+    
+    if logger:
+        logger.info(f"[FAILMEM] Decoded {len(regions)} region(s): "
+                    f"{summary['total']} entries, {summary['unique']} distinct codes")
+    
+    return {"regions": regions, "error_codes": all_codes, "summary": summary}
+
+
 def read_failure_memory_uart(
     port: str,
     command: str,
@@ -386,7 +518,8 @@ def read_failure_memory_uart(
             logger.info(f"[FAILMEM RX] Waiting for dump data...")
         
         # Read response until EE_DUMP_END
-        response_bytes = bytearray()
+        scanner = MarkerScanner([("", "EE_DUMP_END")])
+        response_bytes = scanner.buf
         start_time = time.time()
         chunk_count = 0
         found_end_marker = False
@@ -395,16 +528,15 @@ def read_failure_memory_uart(
             if ser.in_waiting > 0:
                 chunk = ser.read(ser.in_waiting)
                 chunk_count += 1
-                response_bytes.extend(chunk)
+                scanner.feed(chunk)
                 elapsed = time.time() - start_time
                 
                 if logger:
                     logger.info(f"[FAILMEM RX] Chunk #{chunk_count}: {len(chunk)} bytes "
                               f"(elapsed: {elapsed:.3f}s, total: {len(response_bytes)} bytes)")
                 
-                # Check for end marker
-                text_so_far = response_bytes.decode('utf-8', errors='ignore')
-                if "EE_DUMP_END" in text_so_far:
+                # Check for end marker (only the new bytes are searched)
+                if scanner.complete:
                     found_end_marker = True
                     if logger:
                         logger.info(f"[FAILMEM RX] Found EE_DUMP_END marker, waiting 200ms for final data...")
@@ -413,7 +545,7 @@ def read_failure_memory_uart(
                     # Read any remaining data
                     if ser.in_waiting > 0:
                         final_chunk = ser.read(ser.in_waiting)
-                        response_bytes.extend(final_chunk)
+                        scanner.feed(final_chunk)
                         if logger:
                             logger.info(f"[FAILMEM RX] Final chunk: {len(final_chunk)} bytes")
                     break
@@ -531,6 +663,7 @@ def clear_failure_memory_uart(
         
         bytes_written = ser.write(cmd_bytes)
         ser.flush()
+        note_command(port, command)
         
         if logger:
             logger.info(f"[FAILMEM TX] Wrote {bytes_written} bytes")
@@ -580,6 +713,49 @@ def clear_failure_memory_uart(
                 logger.error(f"[FAILMEM ERROR] Failed to close port: {e}")
 
 
+def read_failure_memory(
+    port: str,
+    command: str,
+    baudrate: int = 115200,
+    timeout: float = FAILURE_MEM_TIMEOUT,
+    region_address: Optional[int] = None,
+    refresh: bool = False
+) -> Tuple[str, List[int], int, List[int]]:
+    """Read a failure log either over UART or from the session EEPROM image.
+    
+    With ``region_address`` set, the log region is sliced out of the cached
+    ``DUMP_EEPROM`` image (serial.eeprom_dump.cached_eeprom_image), which is
+    only re-captured after an EEPROM-affecting command or with ``refresh``.
+    Otherwise ``command`` is sent as in read_failure_memory_uart.
+    
+    Args:
+        port (str): Serial port identifier.
+        command (str): Read command (e.g., "read_error").
+        baudrate (int, optional): Communication baud rate. Defaults to 115200.
+        timeout (float, optional): Read timeout in seconds. Defaults to FAILURE_MEM_TIMEOUT.
+        region_address (Optional[int], optional): EEPROM address of the log
+            region in the full dump. Defaults to None (use ``command``).
+        refresh (bool, optional): Re-capture the EEPROM image even if the
+            cached one looks current. Defaults to False.
+        
+    Returns:
+        Tuple[str, List[int], int, List[int]]: Same as read_failure_memory_uart.
+    """
+    if region_address is None:
+        return read_failure_memory_uart(port, command, baudrate, timeout)
+    
+    logger = get_active_logger()
+    try:
+        image = cached_eeprom_image(port, baudrate, refresh=refresh)
+    except Exception as e:
+        raise FailureMemoryError(f"Failed to read failure memory: {type(e).__name__}: {e}")
+    if logger:
+        logger.info(f"[FAILMEM] Decoding region 0x{region_address:04X} from EEPROM image")
+    region = image.slice(region_address, EVENT_LOG_BLOCK_SIZE)
+    pointer, error_codes = decode_event_log_region(region)
+    return image.text, list(region), pointer, error_codes
+
+
 # ======================== TestAction Factories ========================
 
 def read_failure_log(
@@ -588,7 +764,9 @@ def read_failure_log(
     log_type: str = "ERROR",
     baudrate: int = 115200,
     timeout: float = FAILURE_MEM_TIMEOUT,
-    negative_test: bool = False
+    negative_test: bool = False,
+    region_address: Optional[int] = None,
+    refresh: bool = True
 ) -> TestAction:
     """Create a TestAction that reads and decodes a failure log.
     
@@ -608,6 +786,12 @@ def read_failure_log(
         timeout (float, optional): Maximum time to wait for dump in seconds.
             Defaults to FAILURE_MEM_TIMEOUT.
         negative_test (bool, optional): If True, test expects failure. Defaults to False.
+        region_address (Optional[int], optional): EEPROM address of the log
+            region; when set the log is decoded from the session EEPROM image
+            instead of a separate read. Defaults to None.
+        refresh (bool, optional): Re-capture the session EEPROM image
+            before decoding so the check sees the device's current log.
+            Only used with ``region_address``. Defaults to True.
         
     Returns:
         TestAction: TestAction that returns a dictionary with:
@@ -616,6 +800,8 @@ def read_failure_log(
             - pointer (int): Write pointer
             - error_codes (List[int]): Decoded error codes
             - decoded (List[Dict]): Detailed decode info for each code
+            - summary (Dict): Counts and first/last occurrence, see
+              summarize_error_codes
             
     Raises:
         FailureMemoryError: When executed, raises if read or decode fails.
@@ -645,12 +831,13 @@ def read_failure_log(
             logger.info(f"[FAILMEM TEST] Reading {log_type_upper} log from {port}")
         
         # Read and decode
-        dump_text, byte_values, pointer, error_codes = read_failure_memory_uart(
-            port, command, baudrate, timeout
+        dump_text, byte_values, pointer, error_codes = read_failure_memory(
+            port, command, baudrate, timeout, region_address, refresh
         )
         
         # Decode all error codes
         decoded = [decode_error_code(code) for code in error_codes]
+        summary = summarize_error_codes(error_codes)
         
         if logger:
             logger.info(f"[FAILMEM TEST] Read complete:")
@@ -676,6 +863,7 @@ def read_failure_log(
             "pointer": pointer,
             "error_codes": error_codes,
             "decoded": decoded,
+            "summary": summary,
         }
 
     metadata = {'sent': f"read_{log_type.lower()} (read {log_type.upper()} log)"}
@@ -743,7 +931,9 @@ def verify_error_present(
     log_type: str = "ERROR",
     baudrate: int = 115200,
     timeout: float = FAILURE_MEM_TIMEOUT,
-    negative_test: bool = False
+    negative_test: bool = False,
+    region_address: Optional[int] = None,
+    refresh: bool = True
 ) -> TestAction:
     """Create a TestAction that verifies error code(s) are present in the log.
     
@@ -760,6 +950,12 @@ def verify_error_present(
         baudrate (int, optional): Serial communication baud rate. Defaults to 115200.
         timeout (float, optional): Read timeout in seconds. Defaults to FAILURE_MEM_TIMEOUT.
         negative_test (bool, optional): If True, test expects failure. Defaults to False.
+        region_address (Optional[int], optional): EEPROM address of the log
+            region; when set the log is decoded from the session EEPROM image
+            instead of a separate read. Defaults to None.
+        refresh (bool, optional): Re-capture the session EEPROM image
+            before decoding so the check sees the device's current log.
+            Only used with ``region_address``. Defaults to True.
         
     Returns:
         TestAction: TestAction that returns True if all codes are found.
@@ -794,8 +990,9 @@ def verify_error_present(
                 logger.info(f"[FAILMEM TEST]   - 0x{code:04X}")
         
         # Read the log
-        _, _, _, error_codes = read_failure_memory_uart(
-            port, f"read_{log_type.lower()}", baudrate, timeout
+        _, _, _, error_codes = read_failure_memory(
+            port, f"read_{log_type.lower()}", baudrate, timeout, region_address,
+            refresh
         )
         
         # Check which codes are present and which are missing
@@ -837,7 +1034,9 @@ def verify_log_empty(
     log_type: str = "ERROR",
     baudrate: int = 115200,
     timeout: float = FAILURE_MEM_TIMEOUT,
-    negative_test: bool = False
+    negative_test: bool = False,
+    region_address: Optional[int] = None,
+    refresh: bool = True
 ) -> TestAction:
     """Create a TestAction that verifies a failure log is empty.
     
@@ -852,6 +1051,12 @@ def verify_log_empty(
         baudrate (int, optional): Serial communication baud rate. Defaults to 115200.
         timeout (float, optional): Read timeout in seconds. Defaults to FAILURE_MEM_TIMEOUT.
         negative_test (bool, optional): If True, test expects failure. Defaults to False.
+        region_address (Optional[int], optional): EEPROM address of the log
+            region; when set the log is decoded from the session EEPROM image
+            instead of a separate read. Defaults to None.
+        refresh (bool, optional): Re-capture the session EEPROM image
+            before decoding so the check sees the device's current log.
+            Only used with ``region_address``. Defaults to True.
         
     Returns:
         TestAction: TestAction that returns True if log is empty.
@@ -875,8 +1080,9 @@ def verify_log_empty(
             logger.info(f"[FAILMEM TEST] Verifying {log_type_upper} log is empty")
         
         # Read the log
-        _, _, _, error_codes = read_failure_memory_uart(
-            port, f"read_{log_type.lower()}", baudrate, timeout
+        _, _, _, error_codes = read_failure_memory(
+            port, f"read_{log_type.lower()}", baudrate, timeout, region_address,
+            refresh
         )
         
         if len(error_codes) == 0:
@@ -899,4 +1105,466 @@ def verify_log_empty(
             raise FailureMemoryError(error_msg)
 
     metadata = {'sent': f"read_{log_type.lower()} (verify empty)"}
-    return TestAction(name, execute, metadata=metadata, negative_test=negative_test)
\ No newline at end of file
+    return TestAction(name, execute, metadata=metadata, negative_test=negative_test)
+
+
+# ======================== Delta Tracking ========================
+
+_SNAPSHOT_RESOURCE_KEY = "failmem-snapshots"
+_SNAPSHOTS: Dict[Tuple[str, str], Dict[str, "FailureLogSnapshot"]] = {}
+_LATEST = "latest"
+
+
+@dataclass
+class FailureLogSnapshot:
+    """Decoded state of one failure log at a point in the test."""
+    label: str
+    log_type: str
+    pointer: int
+    entries: Tuple[int, ...]
+    codes: List[int]
+    timestamp: float
+    step: Optional[str] = None
+
+
+@dataclass
+class FailureLogDelta:
+    """Entries written to a failure log between two snapshots.
+    
+    ``status`` is "ok" when the delta was derived from the write pointer,
+    "cleared" when the log was cleared in between (``new_codes`` are the
+    entries written since the clear), "overflow" when the ring wrapped past
+    the older snapshot, "ambiguous" when a full ring kept its pointer (no
+    writes and a whole lap of identical writes look the same) or "resized"
+    when the region size changed; in the last three cases ``new_codes`` is
+    the whole current log.
+    """
+    since: FailureLogSnapshot
+    current: FailureLogSnapshot
+    new_codes: List[int]
+    status: str = "ok"
+
+    @property
+    def exact(self) -> bool:
+        """True when ``new_codes`` is exactly what was written in between."""
+        return self.status in ("ok", "cleared")
+
+
+def _current_step() -> Optional[str]:
+    fw = get_active_framework()
+    if fw is None or not fw.step_started:
+        return None
+    return max(fw.step_started, key=fw.step_started.get)
+
+
+def _read_snapshot(
+    port: str,
+    log_type: str,
+    label: Optional[str],
+    baudrate: int,
+    timeout: float,
+    region_address: Optional[int],
+    refresh: bool
+) -> FailureLogSnapshot:
+    """Read a failure log into a snapshot without storing it."""
+    log_type_upper = log_type.upper()
+    if log_type_upper not in ("ERROR", "WARNING"):
+        raise FailureMemoryError(f"Invalid log_type '{log_type}', must be 'ERROR' or 'WARNING'")
+    
+    _, byte_values, _, codes = read_failure_memory(
+        port, f"read_{log_type.lower()}", baudrate, timeout, region_address, refresh
+    )
+    if len(byte_values) >= 4:
+        pointer, entries, _ = _region_entries(bytes(byte_values))
+    else:
+        pointer, entries = 0, array("H")
+    step = _current_step()
+    return FailureLogSnapshot(
+        label=label or step or _LATEST,
+        log_type=log_type_upper,
+        pointer=pointer,
+        entries=tuple(entries),
+        codes=codes,
+        timestamp=time.time(),
+        step=step,
+    )
+
+
+def _store_snapshot(port: str, snapshot: FailureLogSnapshot) -> None:
+    store = _SNAPSHOTS.setdefault((port, snapshot.log_type), {})
+    store[snapshot.label] = snapshot
+    store[_LATEST] = snapshot
+    fw = get_active_framework()
+    if fw is not None:
+        fw.register_resource(_SNAPSHOT_RESOURCE_KEY, _SNAPSHOTS, lambda s: s.clear())
+
+
+def take_failure_snapshot(
+    port: str,
+    log_type: str = "ERROR",
+    label: Optional[str] = None,
+    baudrate: int = 115200,
+    timeout: float = FAILURE_MEM_TIMEOUT,
+    region_address: Optional[int] = None,
+    refresh: bool = False
+) -> FailureLogSnapshot:
+    """Read a failure log and store its pointer and ring contents.
+    
+    The snapshot is kept under ``label`` (and as the port's latest
+    snapshot) until the test ends.
+    
+    Args:
+        port (str): Serial port identifier.
+        log_type (str, optional): "ERROR" or "WARNING". Defaults to "ERROR".
+        label (Optional[str], optional): Name to store the snapshot under.
+            Defaults to the current step number.
+        baudrate (int, optional): Serial communication baud rate. Defaults to 115200.
+        timeout (float, optional): Read timeout in seconds. Defaults to FAILURE_MEM_TIMEOUT.
+        region_address (Optional[int], optional): Decode from the session
+            EEPROM image at this address instead of a separate read.
+        refresh (bool, optional): Re-capture the EEPROM image instead of
+            using the cached one (``region_address`` only). Defaults to False.
+        
+    Returns:
+        FailureLogSnapshot: The stored snapshot.
+    """
+    snapshot = _read_snapshot(port, log_type, label, baudrate, timeout,
+                              region_address, refresh)
+    _store_snapshot(port, snapshot)
+    
+    logger = get_active_logger()
+    if logger:
+        logger.info(f"[FAILMEM] Snapshot '{snapshot.label}' of {snapshot.log_type} log: "
+                    f"pointer={snapshot.pointer}, entries={len(snapshot.codes)}")
+    return snapshot
+
+
+def get_failure_snapshot(port: str, log_type: str = "ERROR",
+                         label: Optional[str] = None) -> FailureLogSnapshot:
+    """Return a stored snapshot (the latest one when ``label`` is None).
+    
+    Raises:
+        FailureMemoryError: If no such snapshot was taken.
+    """
+    store = _SNAPSHOTS.get((port, log_type.upper()), {})
+    snapshot = store.get(label or _LATEST)
+    if snapshot is None:
+        what = f"'{label}'" if label else "any"
+        raise FailureMemoryError(
+            f"No {log_type.upper()} log snapshot {what} for {port}; take one with snapshot_failure_log"
+        )
+    return snapshot
+
+
+def failure_log_delta(old: FailureLogSnapshot, new: FailureLogSnapshot) -> FailureLogDelta:
+    """Compute the entries written between two snapshots of the same log.
+    
+    Slots from the old write pointer up to the new one hold the new
+    entries; every other slot must be unchanged, otherwise the log was
+    cleared or overflowed in between.
+    
+    Args:
+        old (FailureLogSnapshot): Earlier snapshot.
+        new (FailureLogSnapshot): Later snapshot.
+        
+    Returns:
+        FailureLogDelta: New entries (oldest→newest) and how they were derived.
+    """
+    n = len(new.entries)
+    if n != len(old.entries) or n == 0:
+        return FailureLogDelta(old, new, list(new.codes), "resized" if n != len(old.entries) else "ok")
+    
+    p = old.pointer
+    old_ring = old.entries[p:] + old.entries[:p]
+    new_ring = new.entries[p:] + new.entries[:p]
+    written = (new.pointer - p) % n
+    
+    if old_ring[written:] == new_ring[written:]:
+        if written == 0 and all(0 < c < 0xFFFF for c in new_ring):
+            # A full ring back at the same pointer may hold a whole lap of
+            # new entries that happen to equal the old ones
+            return FailureLogDelta(old, new, list(new.codes), "ambiguous")
+        return FailureLogDelta(old, new, [c for c in new_ring[:written] if 0 < c < 0xFFFF])
+    
+    # Untouched slots changed: the log was reset (no old entry survived and
+    # the ring is not full) or it wrapped past the old pointer
+    survivors = any(0 < o < 0xFFFF and o == c for o, c in zip(old_ring, new_ring))
+    if not survivors and len(new.codes) < n:
+        return FailureLogDelta(old, new, list(new.codes), "cleared")
+    return FailureLogDelta(old, new, list(new.codes), "overflow")
+
+
+def _log_delta(logger, delta: FailureLogDelta) -> None:
+    if not logger:
+        return
+    logger.info(f"[FAILMEM] Delta since '{delta.since.label}': "
+                f"pointer {delta.since.pointer} -> {delta.current.pointer}, "
+                f"{len(delta.new_codes)} new entr{'y' if len(delta.new_codes) == 1 else 'ies'} "
+                f"({delta.status})")
+    if not delta.exact:
+        logger.warn(f"[FAILMEM] Log {delta.status} since snapshot; "
+                    f"reporting the whole current log")
+    for code in delta.new_codes:
+        info = decode_error_code(code)
+        desc = f" - {info['description']}" if info['description'] else ""
+        logger.info(f"[FAILMEM]   + 0x{code:04X} [{info['severity_name']}] "
+                    f"{info['module_name']}/{info['fid_name']}{desc}")
+
+
+def read_failure_delta(
+    port: str,
+    log_type: str = "ERROR",
+    since: Optional[str] = None,
+    baudrate: int = 115200,
+    timeout: float = FAILURE_MEM_TIMEOUT,
+    region_address: Optional[int] = None,
+    update: bool = True
+) -> FailureLogDelta:
+    """Read a failure log and return only the entries added since a snapshot.
+    
+    With ``region_address`` the EEPROM image is always re-captured for this
+    read: errors logged by the firmware itself never invalidate the cache.
+    
+    Args:
+        port (str): Serial port identifier.
+        log_type (str, optional): "ERROR" or "WARNING". Defaults to "ERROR".
+        since (Optional[str], optional): Snapshot label. Defaults to the
+            latest snapshot.
+        baudrate (int, optional): Serial communication baud rate. Defaults to 115200.
+        timeout (float, optional): Read timeout in seconds. Defaults to FAILURE_MEM_TIMEOUT.
+        region_address (Optional[int], optional): Decode from the session
+            EEPROM image at this address instead of a separate read.
+        update (bool, optional): Store this read as the new latest snapshot
+            (and under the current step). False leaves every stored
+            snapshot untouched. Defaults to True.
+        
+    Returns:
+        FailureLogDelta: New entries since the snapshot.
+    """
+    old = get_failure_snapshot(port, log_type, since)
+    new = _read_snapshot(port, log_type, None, baudrate, timeout, region_address, True)
+    if update:
+        _store_snapshot(port, new)
+    delta = failure_log_delta(old, new)
+    _log_delta(get_active_logger(), delta)
+    return delta
+
+
+def _as_code_list(codes: Union[int, List[int], None]) -> List[int]:
+    if codes is None:
+        return []
+    return [codes] if isinstance(codes, int) else list(codes)
+
+
+def snapshot_failure_log(
+    name: str,
+    port: str,
+    label: Optional[str] = None,
+    log_type: str = "ERROR",
+    baudrate: int = 115200,
+    timeout: float = FAILURE_MEM_TIMEOUT,
+    negative_test: bool = False,
+    region_address: Optional[int] = None,
+    refresh: bool = True
+) -> TestAction:
+    """Create a TestAction that snapshots a failure log for later delta checks.
+    
+    Args:
+        name (str): Human-readable name for the test step.
+        port (str): Serial port identifier.
+        label (Optional[str], optional): Snapshot label for ``since=`` in the
+            verify actions. Defaults to the step number.
+        log_type (str, optional): "ERROR" or "WARNING". Defaults to "ERROR".
+        baudrate (int, optional): Serial communication baud rate. Defaults to 115200.
+        timeout (float, optional): Read timeout in seconds. Defaults to FAILURE_MEM_TIMEOUT.
+        negative_test (bool, optional): If True, test expects failure. Defaults to False.
+        region_address (Optional[int], optional): Decode from the session
+            EEPROM image at this address instead of a separate read.
+        refresh (bool, optional): Re-capture the session EEPROM image for
+            the baseline. Defaults to True.
+        
+    Returns:
+        TestAction: TestAction that returns the FailureLogSnapshot.
+        
+    Example:
+        >>> snapshot_failure_log("Baseline ERROR log", "COM3", label="before_ocp")
+    """
+    def execute():
+        return take_failure_snapshot(port, log_type, label, baudrate, timeout,
+                                     region_address, refresh)
+
+    metadata = {
+        'sent': f"read_{log_type.lower()} (snapshot)",
+        'display_command': f"read_{log_type.lower()}",
+        'display_expected': f"Snapshot '{label or 'step'}'",
+    }
+    return TestAction(name, execute, metadata=metadata, negative_test=negative_test)
+
+
+def verify_no_new_errors(
+    name: str,
+    port: str,
+    since: Optional[str] = None,
+    log_type: str = "ERROR",
+    ignore_codes: Union[int, List[int], None] = None,
+    baudrate: int = 115200,
+    timeout: float = FAILURE_MEM_TIMEOUT,
+    negative_test: bool = False,
+    region_address: Optional[int] = None,
+    update: bool = True
+) -> TestAction:
+    """Create a TestAction that verifies no entries were logged since a snapshot.
+    
+    Only the ring slots written after the snapshot are examined, so the log
+    does not have to be cleared between sub-tests.
+    
+    Args:
+        name (str): Human-readable name for the test step.
+        port (str): Serial port identifier.
+        since (Optional[str], optional): Snapshot label. Defaults to the
+            latest snapshot of this log.
+        log_type (str, optional): "ERROR" or "WARNING". Defaults to "ERROR".
+        ignore_codes (Union[int, List[int], None], optional): Codes that may
+            appear without failing. Defaults to None.
+        baudrate (int, optional): Serial communication baud rate. Defaults to 115200.
+        timeout (float, optional): Read timeout in seconds. Defaults to FAILURE_MEM_TIMEOUT.
+        negative_test (bool, optional): If True, test expects failure. Defaults to False.
+        region_address (Optional[int], optional): Decode from the session
+            EEPROM image at this address instead of a separate read.
+        update (bool, optional): Make this read the new latest snapshot.
+            Defaults to True.
+        
+    Returns:
+        TestAction: TestAction that returns the FailureLogDelta.
+        
+    Raises:
+        FailureMemoryError: When executed, raises if new entries were logged.
+        
+    Example:
+        >>> verify_no_new_errors("No errors during relay cycling", "COM3",
+        ...                      since="before_relays")
+    """
+    ignored = set(_as_code_list(ignore_codes))
+
+    def execute():
+        logger = get_active_logger()
+        if logger:
+            logger.info(f"[FAILMEM TEST] {name}")
+        delta = read_failure_delta(port, log_type, since, baudrate, timeout,
+                                   region_address, update)
+        unexpected = [c for c in delta.new_codes if c not in ignored]
+        if unexpected:
+            entries_str = ", ".join(f"0x{c:04X}" for c in unexpected)
+            if delta.exact:
+                error_msg = (f"{len(unexpected)} new {log_type.upper()} entries since "
+                             f"'{delta.since.label}': {entries_str}")
+            else:
+                error_msg = (f"{log_type.upper()} log {delta.status} since "
+                             f"'{delta.since.label}', new entries cannot be isolated; "
+                             f"current log: {entries_str}")
+            if logger:
+                logger.error(f"[FAILMEM TEST] ✗ {error_msg}")
+            raise FailureMemoryError(error_msg)
+        if logger:
+            logger.info(f"[FAILMEM TEST] ✓ No new {log_type.upper()} entries since '{delta.since.label}'")
+        return delta
+
+    metadata = {
+        'sent': f"read_{log_type.lower()} (delta)",
+        'display_command': f"read_{log_type.lower()}",
+        'display_expected': f"No new entries since '{since or 'last snapshot'}'",
+    }
+    return TestAction(name, execute, metadata=metadata, negative_test=negative_test)
+
+
+def verify_new_errors(
+    name: str,
+    port: str,
+    expected_codes: Union[int, List[int]],
+    since: Optional[str] = None,
+    log_type: str = "ERROR",
+    exact: bool = True,
+    ordered: bool = False,
+    baudrate: int = 115200,
+    timeout: float = FAILURE_MEM_TIMEOUT,
+    negative_test: bool = False,
+    region_address: Optional[int] = None,
+    update: bool = True
+) -> TestAction:
+    """Create a TestAction that verifies which entries were logged since a snapshot.
+    
+    Args:
+        name (str): Human-readable name for the test step.
+        port (str): Serial port identifier.
+        expected_codes (Union[int, List[int]]): Codes that must have been
+            logged; repeat a code to require it several times.
+        since (Optional[str], optional): Snapshot label. Defaults to the
+            latest snapshot of this log.
+        log_type (str, optional): "ERROR" or "WARNING". Defaults to "ERROR".
+        exact (bool, optional): Fail on any additional new entry.
+            Defaults to True.
+        ordered (bool, optional): Require the new entries in exactly the
+            given order (implies ``exact``). Defaults to False.
+        baudrate (int, optional): Serial communication baud rate. Defaults to 115200.
+        timeout (float, optional): Read timeout in seconds. Defaults to FAILURE_MEM_TIMEOUT.
+        negative_test (bool, optional): If True, test expects failure. Defaults to False.
+        region_address (Optional[int], optional): Decode from the session
+            EEPROM image at this address instead of a separate read.
+        update (bool, optional): Make this read the new latest snapshot.
+            Defaults to True.
+        
+    Returns:
+        TestAction: TestAction that returns the FailureLogDelta.
+        
+    Raises:
+        FailureMemoryError: When executed, raises if the new entries do not
+            match, or if the log overflowed so the delta is not exact.
+        
+    Example:
+        >>> verify_new_errors("Invalid command logged once", "COM3",
+        ...                   expected_codes=[0x8409], since="before_bad_cmd")
+    """
+    expected = _as_code_list(expected_codes)
+
+    def execute():
+        logger = get_active_logger()
+        if logger:
+            logger.info(f"[FAILMEM TEST] {name}")
+        delta = read_failure_delta(port, log_type, since, baudrate, timeout,
+                                   region_address, update)
+        got = delta.new_codes
+        
+        problems = []
+        if not delta.exact:
+            problems.append(f"log {delta.status} since snapshot, delta is not exact")
+        if ordered:
+            if got != expected:
+                problems.append("order/content mismatch")
+        else:
+            missing = Counter(expected) - Counter(got)
+            extra = Counter(got) - Counter(expected)
+            if missing:
+                problems.append("missing " + ", ".join(
+                    f"0x{c:04X}" + (f" x{n}" if n > 1 else "") for c, n in missing.items()))
+            if exact and extra:
+                problems.append("unexpected " + ", ".join(
+                    f"0x{c:04X}" + (f" x{n}" if n > 1 else "") for c, n in extra.items()))
+        
+        if problems:
+            error_msg = (f"New {log_type.upper()} entries since '{delta.since.label}' "
+                         f"[{', '.join(f'0x{c:04X}' for c in got)}] do not match "
+                         f"[{', '.join(f'0x{c:04X}' for c in expected)}]: {'; '.join(problems)}")
+            if logger:
+                logger.error(f"[FAILMEM TEST] ✗ {error_msg}")
+            raise FailureMemoryError(error_msg)
+        if logger:
+            logger.info(f"[FAILMEM TEST] ✓ New {log_type.upper()} entries match expectation")
+        return delta
+
+    expected_str = ", ".join(f"0x{c:04X}" for c in expected)
+    metadata = {
+        'sent': f"read_{log_type.lower()} (delta)",
+        'display_command': f"read_{log_type.lower()}",
+        'display_expected': f"{'Exactly' if exact or ordered else 'At least'}: {expected_str}",
+    }
+    return TestAction(name, execute, metadata=metadata, negative_test=negative_test)
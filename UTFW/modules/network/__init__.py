@@ -37,13 +37,22 @@ __all__ = [
     # PCAP generation
     "pcap_create",
     "pcap_from_spec_action",
+    "pcap_from_template_action",
+    "FrameTemplate",
+    "benchmark_frame_builders",
 
     # PCAP analysis
     "read_PCAPFrames",
     "analyze_PCAP",
     "pcap_checkFrames",
+    "PcapStreamParser",
+    "PcapStreamChecker",
 
     # PCAP capture
     "CapturePcap",
+    "CapturePcapStream",
+    "StartCapture",
+    "StopCapture",
+    "CaptureSession",
     "Ping",
 ]
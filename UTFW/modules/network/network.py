@@ -260,6 +260,12 @@ def http_get(
         }
 
 
+def _invalidate_eeprom_images(reason: str) -> None:
+    """Mark every session EEPROM image as stale after a write over the network."""
+    from ..serial.eeprom_dump import invalidate_eeprom_cache
+    invalidate_eeprom_cache(None, reason)
+
+
 def http_post(
     url: str,
     data: Dict[str, Any],
@@ -292,6 +298,9 @@ def http_post(
     if headers is None:
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
+    # Web forms change device configuration behind the UART's back
+    _invalidate_eeprom_images(f"HTTP POST {url}")
+
     if logger:
         logger.info(f"[NETWORK]   Headers: {headers}")
 
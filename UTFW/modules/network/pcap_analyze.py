@@ -38,6 +38,7 @@ import os
 import shutil
 import subprocess
 import re
+import struct
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...core.core import TestAction
@@ -759,4 +760,254 @@ def pcap_checkFrames(
         )
         return frames
 
-    return TestAction(name, execute, negative_test=negative_test)
\ No newline at end of file
+    return TestAction(name, execute, negative_test=negative_test)
+
+
+# ======================== Streaming (live) analysis ========================
+
+# Classic pcap magic -> (struct byte order, timestamp fraction -> ns multiplier)
+_PCAP_MAGICS = {
+    b"\xd4\xc3\xb2\xa1": ("<", 1000),  # little-endian, microseconds
+    b"\xa1\xb2\xc3\xd4": (">", 1000),  # big-endian, microseconds
+    b"\x4d\x3c\xb2\xa1": ("<", 1),     # little-endian, nanoseconds
+    b"\xa1\xb2\x3c\x4d": (">", 1),     # big-endian, nanoseconds
+}
+
+_LINKTYPE_ETHERNET = 1
+_LINKTYPE_LINUX_SLL = 113
+_VLAN_TPIDS = (0x8100, 0x88A8, 0x9100)
+
+
+def _fmt_mac(raw: bytes) -> str:
+    return ":".join(f"{b:02x}" for b in raw)
+
+
+def _l3_payload(data: bytes, off: int, ethertype: int) -> bytes:
+    """Return the L4 payload for IPv4/IPv6 TCP/UDP, else everything after `off`."""
+    try:
+        if ethertype == 0x0800 and len(data) >= off + 20:
+            ihl = (data[off] & 0x0F) * 4
+            ip_end = min(len(data), off + int.from_bytes(data[off + 2 : off + 4], "big"))
+            proto = data[off + 9]
+            l4 = off + ihl
+        elif ethertype == 0x86DD and len(data) >= off + 40:
+            ip_end = min(len(data), off + 40 + int.from_bytes(data[off + 4 : off + 6], "big"))
+            proto = data[off + 6]
+            l4 = off + 40
+        else:
+            return data[off:]
+        if proto == 6 and len(data) >= l4 + 20:
+            return data[l4 + ((data[l4 + 12] >> 4) * 4) : ip_end]
+        if proto == 17:
+            return data[l4 + 8 : ip_end]
+        return data[l4:ip_end]
+    except IndexError:
+        return data[off:]
+
+
+def _decode_link_frame(linktype: int, data: bytes) -> Dict[str, Any]:
+    """Decode MACs, VLAN stack and payload from a raw captured frame."""
+    src = dst = ""
+    stack: List[Tuple[int, Optional[int]]] = []
+    if linktype == _LINKTYPE_ETHERNET and len(data) >= 14:
+        dst, src = _fmt_mac(data[0:6]), _fmt_mac(data[6:12])
+        et = int.from_bytes(data[12:14], "big")
+        off = 14
+        while et in _VLAN_TPIDS and len(data) >= off + 4:
+            tci = int.from_bytes(data[off : off + 2], "big")
+            stack.append((tci & 0x0FFF, tci >> 13))
+            et = int.from_bytes(data[off + 2 : off + 4], "big")
+            off += 4
+        payload = _l3_payload(data, off, et)
+    elif linktype == _LINKTYPE_LINUX_SLL and len(data) >= 16:
+        alen = int.from_bytes(data[4:6], "big")
+        src = _fmt_mac(data[6 : 6 + min(alen, 6)])
+        payload = _l3_payload(data, 16, int.from_bytes(data[14:16], "big"))
+    else:
+        payload = data
+    return {
+        "eth_src": src,
+        "eth_dst": dst,
+        "vlan_id": stack[0][0] if stack else None,
+        "vlan_pcp": stack[0][1] if stack else None,
+        "vlan_stack": stack,
+        "payload": bytes(payload),
+    }
+
+
+class PcapStreamParser:
+    """Incremental parser for a classic pcap byte stream (e.g. ``dumpcap -w -``).
+
+    Feed arbitrary chunks with `feed()`; every complete record is returned as a
+    frame dict in the same shape as `read_PCAPFrames` produces. pcapng streams
+    are not supported (request ``-F pcap`` from the capture tool).
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._order: Optional[str] = None
+        self._ts_mult = 1000
+        self.linktype: Optional[int] = None
+        self.frames_parsed = 0
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        self._buf += data
+        out: List[Dict[str, Any]] = []
+        off = 0
+        if self._order is None:
+            if len(self._buf) < 24:
+                return out
+            magic = bytes(self._buf[0:4])
+            if magic not in _PCAP_MAGICS:
+                raise PCAPAnalyzeError(
+                    f"Unsupported capture stream magic {magic.hex()} (expected classic pcap)"
+                )
+            self._order, self._ts_mult = _PCAP_MAGICS[magic]
+            self.linktype = int.from_bytes(self._buf[20:24], "little" if self._order == "<" else "big")
+            off = 24
+
+        rec = self._order + "IIII"
+        n = len(self._buf)
+        while off + 16 <= n:
+            ts_sec, ts_frac, caplen, origlen = struct.unpack_from(rec, self._buf, off)
+            if off + 16 + caplen > n:
+                break
+            data = bytes(self._buf[off + 16 : off + 16 + caplen])
+            off += 16 + caplen
+            self.frames_parsed += 1
+            frame = {
+                "frame_number": self.frames_parsed,
+                "frame_len": int(origlen),
+                "timestamp_ns": ts_sec * 1_000_000_000 + ts_frac * self._ts_mult,
+            }
+            frame.update(_decode_link_frame(self.linktype or 0, data))
+            out.append(frame)
+        if off:
+            del self._buf[:off]
+        return out
+
+
+class PcapStreamChecker:
+    """Incremental form of the `analyze_PCAP` expectations for live frames.
+
+    `check()` validates one frame as it arrives and returns an error string on
+    the first violation. `satisfied` turns True once the count expectation is
+    reached, so a streaming capture can stop early. `finish()` performs the
+    final count checks when the stream ends.
+
+    Args:
+        expect_count (Optional[int]): Exact number of frames; more frames is a
+            violation. When used to stop early, only the first N frames are seen.
+        expect_count_min (Optional[int]): Minimum number of frames.
+        frame_size, time_delta_ns, payload_patterns, expect_mac, vlan_expect:
+            Same semantics as in `analyze_PCAP`.
+    """
+
+    def __init__(
+        self,
+        *,
+        expect_count: Optional[int] = None,
+        expect_count_min: Optional[int] = None,
+        frame_size: Optional[Dict[str, int]] = None,
+        time_delta_ns: Optional[Dict[str, Any]] = None,
+        payload_patterns: Optional[List[Dict[str, Any]]] = None,
+        expect_mac: Optional[Dict[str, str]] = None,
+        vlan_expect: Optional[Dict[str, Any]] = None,
+    ):
+        if (expect_count is not None) and (expect_count_min is not None):
+            raise PCAPAnalyzeError("Provide either expect_count or expect_count_min, not both")
+        self.expect_count = expect_count
+        self.expect_count_min = expect_count_min
+        self.frame_size = frame_size or {}
+        self.time_delta_ns = time_delta_ns or {}
+        self.payload_patterns = payload_patterns
+        self.expect_mac = expect_mac or {}
+        self.vlan_expect = vlan_expect or {}
+        self.count = 0
+        self._last_ts: Optional[int] = None
+
+    @property
+    def satisfied(self) -> bool:
+        if self.expect_count is not None:
+            return self.count >= int(self.expect_count)
+        if self.expect_count_min is not None:
+            return self.count >= int(self.expect_count_min)
+        return False
+
+    def check(self, f: Dict[str, Any]) -> Optional[str]:
+        self.count += 1
+        fn = f["frame_number"]
+
+        if self.expect_count is not None and self.count > int(self.expect_count):
+            return f"Expected {self.expect_count} frames, got more (frame {fn})"
+
+        L = f["frame_len"]
+        eq, mn, mx = (self.frame_size.get(k) for k in ("eq", "min", "max"))
+        if eq is not None and L != int(eq):
+            return f"Frame {fn} length {L} != {eq}"
+        if mn is not None and L < int(mn):
+            return f"Frame {fn} length {L} < min {mn}"
+        if mx is not None and L > int(mx):
+            return f"Frame {fn} length {L} > max {mx}"
+
+        ts = f["timestamp_ns"]
+        if self.time_delta_ns and self._last_ts is not None:
+            d = ts - self._last_ts
+            td = self.time_delta_ns
+            # Same precedence as analyze_PCAP: eq, else min/max, else per_pair
+            if "eq" in td:
+                if d != int(td["eq"]):
+                    return f"Δt[{fn-1}->{fn}] {d}ns != {td['eq']}ns"
+            elif "min" in td or "max" in td:
+                if td.get("min") is not None and d < int(td["min"]):
+                    return f"Δt[{fn-1}->{fn}] {d}ns < min {td['min']}ns"
+                if td.get("max") is not None and d > int(td["max"]):
+                    return f"Δt[{fn-1}->{fn}] {d}ns > max {td['max']}ns"
+            elif "per_pair" in td:
+                pairs = td["per_pair"] or []
+                idx = self.count - 2
+                if idx >= len(pairs):
+                    return (f"time_delta_ns.per_pair length {len(pairs)} != expected "
+                            f"{self.count - 1} (no entry for {fn-1}->{fn})")
+                if d != int(pairs[idx]):
+                    return f"Δt[{fn-1}->{fn}] {d}ns != {pairs[idx]}ns"
+        self._last_ts = ts
+
+        if self.payload_patterns:
+            msg = _match_payload_patterns(f["payload"], self.payload_patterns)
+            if msg:
+                return f"Frame {fn} {msg}"
+
+        src, dst = self.expect_mac.get("src"), self.expect_mac.get("dst")
+        if src and f["eth_src"].lower() != src.lower():
+            return f"Frame {fn} eth.src {f['eth_src']} != {src}"
+        if dst and f["eth_dst"].lower() != dst.lower():
+            return f"Frame {fn} eth.dst {f['eth_dst']} != {dst}"
+
+        if self.vlan_expect:
+            ids = [vid for (vid, _pcp) in f.get("vlan_stack") or []]
+            want_ids = self.vlan_expect.get("id")
+            want_pcp = self.vlan_expect.get("priority")
+            if want_ids is not None:
+                wanted = want_ids if isinstance(want_ids, list) else [int(want_ids)]
+                missing = [v for v in wanted if v not in ids]
+                if missing:
+                    return f"Frame {fn} missing VLAN IDs {missing}, got {ids}"
+            if want_pcp is not None:
+                pcps = [p for (_, p) in f.get("vlan_stack") or [] if p is not None]
+                if int(want_pcp) not in pcps:
+                    return f"Frame {fn} VLAN priority {want_pcp} not in {pcps or '[]'}"
+        return None
+
+    def finish(self) -> Optional[str]:
+        n = self.count
+        if self.expect_count is not None and n != int(self.expect_count):
+            return f"Expected {self.expect_count} frames, got {n}"
+        if self.expect_count_min is not None and n < int(self.expect_count_min):
+            return f"Expected at least {self.expect_count_min} frames, got {n}"
+        td = self.time_delta_ns
+        if n >= 2 and "per_pair" in td and not ("eq" in td or "min" in td or "max" in td):
+            pairs = td["per_pair"] or []
+            if len(pairs) != n - 1:
+                return f"time_delta_ns.per_pair length {len(pairs)} != expected {n - 1}"
+        return None
@@ -1,17 +1,21 @@
 # UTFW/modules/network/pcap_capture.py
 import os
+import json
 import shlex
 import time
+import queue
 import signal
 import random
 import string
 import platform
+import threading
 import subprocess
 from pathlib import Path
-from typing import Optional, List, Union, Tuple
+from typing import Any, Dict, Optional, List, Union, Tuple
 
 from UTFW.core.logger import get_active_logger
-from UTFW.core.core import TestAction
+from UTFW.core.core import TestAction, get_active_framework
+from UTFW.core.utilities import get_cache_dir
 
 
 class PCAPCaptureError(Exception):
@@ -53,11 +57,120 @@ def _rand_tag(n: int = 6) -> str:
     return "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(n))
 
 
-def _dumpcap_list_interfaces(dumpcap_exe: str, env: Optional[dict], cwd: Optional[Union[str, os.PathLike]]) -> List[str]:
+# ======================== Interface resolution cache ========================
+# `dumpcap -D` costs 1-2 s on Windows. Listings and resolved name mappings are kept
+# per dumpcap executable in-process and on disk, and dropped when the tool binary
+# changes, a capture fails, or a requested interface is not in the cached listing.
+
+_IFACE_CACHE_FILE = "dumpcap_interfaces.json"
+_IFACE_CACHE_LOCK = threading.Lock()
+_IFACE_CACHE: Dict[str, Dict[str, Any]] = {}
+_IFACE_CACHE_LOADED = False
+
+
+def _iface_cache_key(dumpcap_exe: str) -> str:
+    return os.path.normcase(os.path.abspath(dumpcap_exe))
+
+
+def _iface_tool_mtime(dumpcap_exe: str) -> float:
+    try:
+        return os.path.getmtime(dumpcap_exe)
+    except OSError:
+        return 0.0
+
+
+def _iface_cache_path() -> Optional[Path]:
+    try:
+        return get_cache_dir("pcap") / _IFACE_CACHE_FILE
+    except Exception:
+        return None
+
+
+def _iface_cache_load() -> None:
+    """Load the on-disk cache once per process (caller holds the lock)."""
+    global _IFACE_CACHE_LOADED
+    if _IFACE_CACHE_LOADED:
+        return
+    _IFACE_CACHE_LOADED = True
+    path = _iface_cache_path()
+    if not path or not path.exists():
+        return
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            _IFACE_CACHE.update(data)
+    except Exception:
+        pass
+
+
+def _iface_cache_save() -> None:
+    """Persist the cache atomically (caller holds the lock)."""
+    path = _iface_cache_path()
+    if not path:
+        return
+    try:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(_IFACE_CACHE, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+def _iface_cache_get(dumpcap_exe: str) -> Optional[Dict[str, Any]]:
+    with _IFACE_CACHE_LOCK:
+        _iface_cache_load()
+        entry = _IFACE_CACHE.get(_iface_cache_key(dumpcap_exe))
+        if entry and entry.get("tool_mtime") == _iface_tool_mtime(dumpcap_exe):
+            return entry
+        return None
+
+
+def _iface_cache_put(dumpcap_exe: str, listing: Optional[List[str]] = None,
+                     requested: Optional[str] = None, resolved: Optional[str] = None) -> None:
+    with _IFACE_CACHE_LOCK:
+        _iface_cache_load()
+        key = _iface_cache_key(dumpcap_exe)
+        mtime = _iface_tool_mtime(dumpcap_exe)
+        entry = _IFACE_CACHE.get(key)
+        if not entry or entry.get("tool_mtime") != mtime:
+            entry = {"tool_mtime": mtime, "listing": [], "resolved": {}}
+            _IFACE_CACHE[key] = entry
+        if listing is not None:
+            entry["listing"] = list(listing)
+            entry["resolved"] = {}
+        if requested is not None and resolved is not None:
+            entry["resolved"][requested] = resolved
+        _iface_cache_save()
+
+
+def invalidate_interface_cache(dumpcap_exe: Optional[str] = None) -> None:
+    """Drop cached `dumpcap -D` listings and resolved interface names.
+
+    Args:
+        dumpcap_exe (Optional[str]): Only drop the entry for this executable.
+            When None, the whole cache (in-process and on disk) is cleared.
+    """
+    with _IFACE_CACHE_LOCK:
+        _iface_cache_load()
+        if dumpcap_exe is None:
+            _IFACE_CACHE.clear()
+        else:
+            _IFACE_CACHE.pop(_iface_cache_key(dumpcap_exe), None)
+        _iface_cache_save()
+    logger = get_active_logger()
+    if logger:
+        logger.log(f"[PCAP-CAPTURE] interface cache invalidated ({dumpcap_exe or 'all tools'})")
+
+
+def _dumpcap_list_interfaces(dumpcap_exe: str, env: Optional[dict], cwd: Optional[Union[str, os.PathLike]],
+                             use_cache: bool = True) -> List[str]:
     """
     Return lines of `dumpcap -D` output (interface list). Each line typically looks like:
       1. \\Device\\NPF_{GUID} (Ethernet 2)
       2. \\Device\\NPF_Loopback (Npcap Loopback Adapter)
+
+    With `use_cache`, a cached listing for this executable is returned without running
+    dumpcap; a fresh non-empty listing is stored in the cache.
     """
     logger = get_active_logger()
 
@@ -66,6 +179,13 @@ def _dumpcap_list_interfaces(dumpcap_exe: str, env: Optional[dict], cwd: Optiona
         logger.log(f"[PCAP-CAPTURE]   dumpcap_exe={dumpcap_exe}")
         logger.log(f"[PCAP-CAPTURE]   cwd={cwd or os.getcwd()}")
 
+    if use_cache:
+        entry = _iface_cache_get(dumpcap_exe)
+        if entry and entry.get("listing"):
+            if logger:
+                logger.log(f"[PCAP-CAPTURE] dumpcap -D served from cache ({len(entry['listing'])} interfaces)")
+            return list(entry["listing"])
+
     try:
         proc = subprocess.run(
             [dumpcap_exe, "-D"],
@@ -84,6 +204,9 @@ def _dumpcap_list_interfaces(dumpcap_exe: str, env: Optional[dict], cwd: Optiona
             for ln in result:
                 logger.log(f"[PCAP-CAPTURE]   {ln}")
 
+        if result and proc.returncode == 0:
+            _iface_cache_put(dumpcap_exe, listing=result)
+
         return result
 
     except subprocess.TimeoutExpired as e:
@@ -96,32 +219,16 @@ def _dumpcap_list_interfaces(dumpcap_exe: str, env: Optional[dict], cwd: Optiona
         return []
 
 
-def _dumpcap_resolve_interface(requested: str, dumpcap_exe: str, env: Optional[dict], cwd: Optional[Union[str, os.PathLike]]) -> Tuple[str, Optional[str]]:
-    """
-    Resolve a user-provided interface name/alias/number to what dumpcap accepts.
-    Order of preference:
-      1) Numeric index (as-is)
-      2) Windows convenience: if requested in {'lo','loopback', 'npcap loopback', '127.0.0.1'}
-         choose the entry whose desc/dev contains 'loopback'
-      3) Exact match on description or device
-      4) Substring match on description or device
-      5) Fallback to original string
+def _match_interface(req: str, lines: List[str]) -> Optional[str]:
+    """Match a requested interface against `dumpcap -D` lines.
+
+    Returns the matched device name (e.g. ``\\Device\\NPF_{GUID}`` or ``eth0``),
+    which dumpcap accepts for ``-i`` and which, unlike the index, does not move when
+    adapters are added or removed. Falls back to the index for lines without a
+    device name; None when nothing matches.
     """
     logger = get_active_logger()
 
-    if logger:
-        logger.log(f"[PCAP-CAPTURE] _dumpcap_resolve_interface() called")
-        logger.log(f"[PCAP-CAPTURE]   requested={requested}")
-
-    req = (requested or "").strip()
-    if req.isdigit():
-        if logger:
-            logger.log(f"[PCAP-CAPTURE] Interface is numeric: {req} (using as-is)")
-        return req, None
-
-    lines = _dumpcap_list_interfaces(dumpcap_exe, env, cwd)
-    pretty = "\n".join(lines) if lines else None
-
     entries = []
     for ln in lines:
         idx = dev = desc = None
@@ -152,7 +259,7 @@ def _dumpcap_resolve_interface(requested: str, dumpcap_exe: str, env: Optional[d
             if "loopback" in desc.lower() or "loopback" in dev.lower():
                 if logger:
                     logger.log(f"[PCAP-CAPTURE] Resolved to loopback: idx={idx}, desc={desc}")
-                return idx, pretty
+                return dev or idx
 
     # (3) Exact match on desc or dev
     if logger:
@@ -161,7 +268,7 @@ def _dumpcap_resolve_interface(requested: str, dumpcap_exe: str, env: Optional[d
         if lower_req == desc.lower() or lower_req == dev.lower():
             if logger:
                 logger.log(f"[PCAP-CAPTURE] Exact match found: idx={idx}, dev={dev}, desc={desc}")
-            return idx, pretty
+            return dev or idx
 
     # (4) Substring match on desc or dev
     if logger:
@@ -170,12 +277,120 @@ def _dumpcap_resolve_interface(requested: str, dumpcap_exe: str, env: Optional[d
         if lower_req in desc.lower() or lower_req in dev.lower():
             if logger:
                 logger.log(f"[PCAP-CAPTURE] Substring match found: idx={idx}, dev={dev}, desc={desc}")
-            return idx, pretty
+            return dev or idx
+
+    return None
+
+
+def _dumpcap_resolve_interface(requested: str, dumpcap_exe: str, env: Optional[dict], cwd: Optional[Union[str, os.PathLike]]) -> Tuple[str, Optional[str]]:
+    """
+    Resolve a user-provided interface name/alias/number to what dumpcap accepts.
+    Order of preference:
+      1) Numeric index (as-is)
+      2) Windows convenience: if requested in {'lo','loopback', 'npcap loopback', '127.0.0.1'}
+         choose the entry whose desc/dev contains 'loopback'
+      3) Exact match on description or device
+      4) Substring match on description or device
+      5) Fallback to original string
+
+    Matches resolve to the interface's device name, which dumpcap accepts as well as
+    the index. Resolved device names are cached per dumpcap executable. If the name is
+    not found in a cached listing, the cache is invalidated and dumpcap is probed again.
+    """
+    logger = get_active_logger()
 
-    # (5) Fallback
     if logger:
-        logger.log(f"[PCAP-CAPTURE] No match found, using requested value as-is: {req}")
-    return req, pretty
+        logger.log(f"[PCAP-CAPTURE] _dumpcap_resolve_interface() called")
+        logger.log(f"[PCAP-CAPTURE]   requested={requested}")
+
+    req = (requested or "").strip()
+    if req.isdigit():
+        if logger:
+            logger.log(f"[PCAP-CAPTURE] Interface is numeric: {req} (using as-is)")
+        return req, None
+
+    # Only device names are cached; a cached numeric index could name a
+    # different adapter once interfaces are added or removed.
+    cached = _iface_cache_get(dumpcap_exe)
+    dev = (cached or {}).get("resolved", {}).get(req)
+    if dev and not dev.isdigit():
+        if logger:
+            logger.log(f"[PCAP-CAPTURE] Resolved from cache: {req!r} -> {dev!r}")
+        return dev, "\n".join(cached.get("listing") or []) or None
+
+    lines = _dumpcap_list_interfaces(dumpcap_exe, env, cwd)
+    idx = _match_interface(req, lines)
+    if idx is None and cached and cached.get("listing"):
+        if logger:
+            logger.log(f"[PCAP-CAPTURE] {req!r} not in cached listing, re-probing dumpcap -D")
+        invalidate_interface_cache(dumpcap_exe)
+        lines = _dumpcap_list_interfaces(dumpcap_exe, env, cwd, use_cache=False)
+        idx = _match_interface(req, lines)
+    pretty = "\n".join(lines) if lines else None
+
+    # (5) Fallback
+    if idx is None:
+        if logger:
+            logger.log(f"[PCAP-CAPTURE] No match found, using requested value as-is: {req}")
+        return req, pretty
+
+    if not idx.isdigit():
+        _iface_cache_put(dumpcap_exe, requested=req, resolved=idx)
+    return idx, pretty
+
+
+def _select_tool(require_tool: Optional[str]) -> Tuple[str, str]:
+    """Pick the capture tool: the required one, else dumpcap, else tcpdump."""
+    dumpcap_path = _which("dumpcap")
+    tcpdump_path = _which("tcpdump")
+
+    if require_tool:
+        rq = require_tool.strip().lower()
+        if rq == "dumpcap":
+            if not dumpcap_path:
+                raise PCAPCaptureError("Requested tool 'dumpcap' not found in PATH.")
+            return "dumpcap", dumpcap_path
+        if rq == "tcpdump":
+            if not tcpdump_path:
+                raise PCAPCaptureError("Requested tool 'tcpdump' not found in PATH.")
+            return "tcpdump", tcpdump_path
+        raise PCAPCaptureError(f"Unknown require_tool={require_tool!r}; use 'dumpcap' or 'tcpdump'.")
+
+    # Prefer dumpcap when available
+    if dumpcap_path:
+        return "dumpcap", dumpcap_path
+    if tcpdump_path:
+        return "tcpdump", tcpdump_path
+    raise PCAPCaptureError("Neither 'dumpcap' nor 'tcpdump' found in PATH.")
+
+
+def _merge_env(env: Optional[dict]) -> dict:
+    """Copy os.environ and apply overrides; a None value removes the variable."""
+    proc_env = os.environ.copy()
+    if env:
+        for k, v in env.items():
+            if v is None and k in proc_env:
+                proc_env.pop(k, None)
+            elif v is not None:
+                proc_env[str(k)] = str(v)
+    return proc_env
+
+
+def _stop_process(proc: subprocess.Popen, timeout_s: float = 5.0) -> None:
+    """Gracefully stop a capture tool (SIGINT / terminate), killing it on timeout."""
+    if proc.poll() is not None:
+        return
+    try:
+        if platform.system().lower().startswith("win"):
+            proc.terminate()
+        else:
+            proc.send_signal(signal.SIGINT)
+        proc.wait(timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    except Exception:
+        proc.kill()
 
 
 def CapturePcap(name: str,
@@ -248,32 +463,7 @@ def CapturePcap(name: str,
     """
     # PRE-RESOLVE: Do expensive setup BEFORE execute() to minimize startup latency
     # This is critical for parallel execution where timing matters
-    dumpcap_path = _which("dumpcap")
-    tcpdump_path = _which("tcpdump")
-
-    tool = None
-    if require_tool:
-        rq = require_tool.strip().lower()
-        if rq == "dumpcap":
-            if not dumpcap_path:
-                raise PCAPCaptureError("Requested tool 'dumpcap' not found in PATH.")
-            tool = ("dumpcap", dumpcap_path)
-        elif rq == "tcpdump":
-            if not tcpdump_path:
-                raise PCAPCaptureError("Requested tool 'tcpdump' not found in PATH.")
-            tool = ("tcpdump", tcpdump_path)
-        else:
-            raise PCAPCaptureError(f"Unknown require_tool={require_tool!r}; use 'dumpcap' or 'tcpdump'.")
-    else:
-        # Prefer dumpcap when available
-        if dumpcap_path:
-            tool = ("dumpcap", dumpcap_path)
-        elif tcpdump_path:
-            tool = ("tcpdump", tcpdump_path)
-        else:
-            raise PCAPCaptureError("Neither 'dumpcap' nor 'tcpdump' found in PATH.")
-
-    tool_name, tool_exe = tool
+    tool_name, tool_exe = _select_tool(require_tool)
 
     # PRE-RESOLVE interface for dumpcap to avoid delay during execution
     pre_resolved_iface = None
@@ -370,14 +560,8 @@ def CapturePcap(name: str,
                 argv += [bpf]
 
         # Environment
-        proc_env = os.environ.copy()
         # Ensure dumpcap honors system capture privileges (Windows: Npcap in Admin mode might be needed)
-        if env:
-            for k, v in env.items():
-                if v is None and k in proc_env:
-                    proc_env.pop(k, None)
-                elif v is not None:
-                    proc_env[str(k)] = str(v)
+        proc_env = _merge_env(env)
 
         # Logging â€“ pre-exec
         if logger:
@@ -486,8 +670,10 @@ def CapturePcap(name: str,
         if rc not in (0, None):
             # Provide helpful hint when interface may be invalid
             hint = ""
-            if tool_name == "dumpcap" and "no such device" in (stderr or "").lower():
-                hint = " (check interface name or use numeric index from 'dumpcap -D')"
+            if tool_name == "dumpcap":
+                invalidate_interface_cache(tool_exe)
+                if "no such device" in (stderr or "").lower():
+                    hint = " (check interface name or use numeric index from 'dumpcap -D')"
             raise PCAPCaptureError(f"{tool_name} exited with non-zero status {rc}{hint}")
 
         # Validate output
@@ -525,6 +711,484 @@ def CapturePcap(name: str,
 
     return TestAction(name, execute, negative_test=negative_test)
 
+def CapturePcapStream(name: str,
+                      *,
+                      interface: str,
+                      bpf: Optional[str] = None,
+                      duration_s: Optional[float] = None,
+                      packet_count: Optional[int] = None,
+                      snaplen: Optional[int] = None,
+                      promiscuous: bool = True,
+                      expect_count: Optional[int] = None,
+                      expect_count_min: Optional[int] = None,
+                      frame_size: Optional[Dict[str, int]] = None,
+                      time_delta_ns: Optional[Dict[str, Any]] = None,
+                      payload_patterns: Optional[List[Dict[str, Any]]] = None,
+                      expect_mac: Optional[Dict[str, str]] = None,
+                      vlan_expect: Optional[Dict[str, Any]] = None,
+                      stop_when_satisfied: bool = True,
+                      save_path: Optional[str] = None,
+                      keep_frames: bool = False,
+                      require_tool: Optional[str] = None,
+                      env: Optional[dict] = None,
+                      cwd: Optional[Union[str, os.PathLike]] = None,
+                      negative_test: bool = False) -> TestAction:
+    """Create a TestAction that captures live traffic and validates it while it streams.
+
+    Instead of writing a file and analyzing it afterwards, the capture tool writes classic
+    pcap to stdout (``-w -``). Frames are parsed incrementally and fed to a
+    `PcapStreamChecker` carrying the same expectations as `analyze_PCAP`. The capture
+    stops as soon as:
+      - a frame violates an expectation (fail fast), or
+      - the count expectation is reached and `stop_when_satisfied` is True, or
+      - `duration_s` / `packet_count` is reached, or the tool exits.
+
+    Filtering happens at capture time with `bpf` (tshark display filters are not
+    available in streaming mode). Payload checks see the TCP/UDP payload for IPv4/IPv6
+    frames and the raw L2 payload otherwise.
+
+    Args:
+        name (str): Human-readable name for the test action.
+        interface (str): OS interface name, description, or numeric index (dumpcap -D).
+        bpf (str, optional): Capture-time Berkeley Packet Filter.
+        duration_s (float, optional): Maximum capture time in seconds.
+        packet_count (int, optional): Stop after this many packets (-c).
+        snaplen (int, optional): Maximum bytes per packet to capture (-s).
+        promiscuous (bool, optional): Enable promiscuous mode (default True).
+        expect_count, expect_count_min, frame_size, time_delta_ns, payload_patterns,
+        expect_mac, vlan_expect: Expectations, same semantics as `analyze_PCAP`.
+        stop_when_satisfied (bool, optional): Stop once the count expectation is met.
+            Defaults to True.
+        save_path (str, optional): Also tee the raw pcap stream to this file.
+        keep_frames (bool, optional): Include the parsed frame dicts in the result.
+            Defaults to False to keep memory flat on long captures.
+        require_tool (str, optional): Force "dumpcap" or "tcpdump".
+        env (dict, optional): Extra environment variables for the capture subprocess.
+        cwd (str | PathLike, optional): Working directory for the capture subprocess.
+
+    Returns:
+        TestAction: Action returning a dict with ``frames`` (count), ``stopped_early``,
+        ``elapsed_s``, ``save_path`` and, with `keep_frames`, ``frame_list``.
+
+    Raises:
+        PCAPCaptureError: If the tool cannot be started or exits with an error, or any
+            expectation fails.
+
+    Example:
+        >>> CapturePcapStream(
+        ...     "Wait for 5 SNMP responses",
+        ...     interface="eth0",
+        ...     bpf="udp and src port 161",
+        ...     duration_s=10,
+        ...     expect_count_min=5,
+        ... )()
+    """
+    from .pcap_analyze import PcapStreamParser, PcapStreamChecker, PCAPAnalyzeError
+
+    tool_name, tool_exe = _select_tool(require_tool)
+    resolved_iface = interface
+    if tool_name == "dumpcap":
+        resolved_iface, _ = _dumpcap_resolve_interface(interface, tool_exe, os.environ.copy(), cwd)
+
+    def execute():
+        logger = get_active_logger()
+        tag = _rand_tag()
+
+        try:
+            checker = PcapStreamChecker(
+                expect_count=expect_count,
+                expect_count_min=expect_count_min,
+                frame_size=frame_size,
+                time_delta_ns=time_delta_ns,
+                payload_patterns=payload_patterns,
+                expect_mac=expect_mac,
+                vlan_expect=vlan_expect,
+            )
+        except PCAPAnalyzeError as e:
+            raise PCAPCaptureError(str(e)) from e
+        parser = PcapStreamParser()
+
+        argv: List[str] = [tool_exe, "-i", resolved_iface]
+        if tool_name == "dumpcap":
+            argv += ["-F", "pcap", "-w", "-", "-q"]
+            if duration_s is not None:
+                argv += ["-a", f"duration:{max(1, int(float(duration_s)))}"]
+            if bpf:
+                argv += ["-f", bpf]
+        else:
+            # -U: packet-buffered output so frames reach the pipe immediately
+            argv += ["-U", "-w", "-"]
+        if not promiscuous:
+            argv += ["-p"]
+        if snaplen is not None:
+            argv += ["-s", str(int(snaplen))]
+        if packet_count is not None:
+            argv += ["-c", str(int(packet_count))]
+        if tool_name == "tcpdump" and bpf:
+            argv += [bpf]
+
+        if logger:
+            logger.log(f"[PCAP-STREAM] tag={tag} tool={tool_name} interface={interface!r} -> {resolved_iface!r}")
+            logger.log(f"[PCAP-STREAM] tag={tag} bpf={bpf!r} duration_s={duration_s} packet_count={packet_count} "
+                       f"stop_when_satisfied={stop_when_satisfied} save_path={save_path}")
+            logger.log(f"[PCAP-STREAM] tag={tag} argv={_quote_list(argv)}")
+
+        try:
+            proc = subprocess.Popen(
+                argv,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=_merge_env(env),
+                cwd=str(cwd) if cwd else None,
+            )
+        except Exception as e:
+            raise PCAPCaptureError(f"Failed to start {tool_name}: {e}") from e
+
+        chunks: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        stderr_lines: List[str] = []
+
+        def _pump_stdout():
+            try:
+                while True:
+                    data = proc.stdout.read1(65536)
+                    if not data:
+                        break
+                    chunks.put(data)
+            finally:
+                chunks.put(None)
+
+        def _pump_stderr():
+            for ln in proc.stderr:
+                stderr_lines.append(ln.decode("utf-8", errors="replace").rstrip())
+
+        threading.Thread(target=_pump_stdout, daemon=True).start()
+        threading.Thread(target=_pump_stderr, daemon=True).start()
+
+        start_time = time.time()
+        deadline = start_time + float(duration_s) + 3.0 if duration_s is not None else None
+        save_fh = None
+        if save_path:
+            _make_parent_dirs(save_path)
+            save_fh = open(save_path, "wb")
+
+        frame_list: List[dict] = []
+        violation: Optional[str] = None
+        stopped_early = False
+        tool_exited = False
+        try:
+            while True:
+                timeout = 0.5 if deadline is None else max(0.0, min(0.5, deadline - time.time()))
+                try:
+                    data = chunks.get(timeout=timeout)
+                except queue.Empty:
+                    if deadline is not None and time.time() >= deadline:
+                        break
+                    continue
+                if data is None:
+                    tool_exited = True
+                    break
+                if save_fh:
+                    save_fh.write(data)
+                try:
+                    frames = parser.feed(data)
+                except PCAPAnalyzeError as e:
+                    violation = str(e)
+                    break
+                for f in frames:
+                    violation = checker.check(f)
+                    if keep_frames:
+                        frame_list.append(f)
+                    if violation:
+                        break
+                    if stop_when_satisfied and checker.satisfied:
+                        stopped_early = True
+                        break
+                if violation or stopped_early:
+                    break
+        finally:
+            _stop_process(proc)
+            if save_fh:
+                save_fh.close()
+
+        elapsed = time.time() - start_time
+        rc = proc.returncode
+        if logger:
+            logger.log(f"[PCAP-STREAM] tag={tag} exit_code={rc} elapsed_s={elapsed:.3f} "
+                       f"frames={checker.count} stopped_early={stopped_early}")
+            if stderr_lines:
+                logger.log("[PCAP-STREAM STDERR]\n" + "\n".join(stderr_lines))
+
+        if violation:
+            if logger:
+                logger.log(f"[PCAP-STREAM] tag={tag} ✗ {violation}")
+            raise PCAPCaptureError(violation)
+
+        if tool_exited and rc not in (0, None) and parser.frames_parsed == 0:
+            if tool_name == "dumpcap":
+                invalidate_interface_cache(tool_exe)
+            raise PCAPCaptureError(f"{tool_name} exited with non-zero status {rc}")
+
+        final = checker.finish()
+        if final:
+            if logger:
+                logger.log(f"[PCAP-STREAM] tag={tag} ✗ {final}")
+            raise PCAPCaptureError(final)
+
+        if logger:
+            logger.log(f"[PCAP-STREAM] tag={tag} ✓ {checker.count} frame(s) validated")
+
+        result = {
+            "frames": checker.count,
+            "stopped_early": stopped_early,
+            "elapsed_s": elapsed,
+            "save_path": save_path,
+        }
+        if keep_frames:
+            result["frame_list"] = frame_list
+        return result
+
+    return TestAction(name, execute, negative_test=negative_test)
+
+
+# ======================== Background capture sessions ========================
+
+_SESSIONS: Dict[str, "CaptureSession"] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+class CaptureSession:
+    """Handle for a capture running in the background between StartCapture and StopCapture.
+
+    The capture tool writes to `output_path` until `stop()` is called (or until the
+    optional `max_duration_s` safety limit). Sessions started inside a running
+    TestFramework are registered with it and stopped automatically at the end of
+    the test if no StopCapture step ran.
+    """
+
+    def __init__(self, session: str, tool_name: str, tool_exe: str, argv: List[str],
+                 output_path: str, env: dict, cwd: Optional[Union[str, os.PathLike]]):
+        self.session = session
+        self.tool_name = tool_name
+        self.tool_exe = tool_exe
+        self.argv = argv
+        self.output_path = output_path
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        self.returncode: Optional[int] = None
+        self._env = env
+        self._cwd = cwd
+        self._proc: Optional[subprocess.Popen] = None
+        self._stderr: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self, init_timeout_s: float = 3.0) -> None:
+        """Launch the capture tool and wait until it has written the file header."""
+        logger = get_active_logger()
+        _make_parent_dirs(self.output_path)
+        if logger:
+            logger.log(f"[PCAP-SESSION] {self.session}: argv={_quote_list(self.argv)}")
+        try:
+            self._proc = subprocess.Popen(
+                self.argv,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                env=self._env,
+                cwd=str(self._cwd) if self._cwd else None,
+                text=True,
+            )
+        except Exception as e:
+            raise PCAPCaptureError(f"Failed to start {self.tool_name}: {e}") from e
+        self.started_at = time.time()
+
+        def _drain_stderr():
+            for ln in self._proc.stderr:
+                self._stderr.append(ln.rstrip())
+
+        threading.Thread(target=_drain_stderr, daemon=True).start()
+
+        deadline = time.time() + init_timeout_s
+        out = Path(self.output_path)
+        while time.time() < deadline:
+            if self._proc.poll() is not None:
+                break
+            if out.exists() and out.stat().st_size >= 24:
+                break
+            time.sleep(0.05)
+        if self._proc.poll() not in (None, 0):
+            self.returncode = self._proc.returncode
+            if self.tool_name == "dumpcap":
+                invalidate_interface_cache(self.tool_exe)
+            raise PCAPCaptureError(
+                f"{self.tool_name} exited during start-up with status {self.returncode}: "
+                + " | ".join(self._stderr[-5:])
+            )
+        if logger:
+            logger.log(f"[PCAP-SESSION] {self.session}: capturing (pid={self._proc.pid}) -> {self.output_path}")
+
+    def stop(self) -> str:
+        """Stop the capture (idempotent) and return the output path."""
+        with self._lock:
+            if self._proc is not None and self.stopped_at is None:
+                _stop_process(self._proc)
+                self.returncode = self._proc.returncode
+                self.stopped_at = time.time()
+                with _SESSIONS_LOCK:
+                    if _SESSIONS.get(self.session) is self:
+                        _SESSIONS.pop(self.session, None)
+                logger = get_active_logger()
+                if logger:
+                    size = Path(self.output_path).stat().st_size if Path(self.output_path).exists() else 0
+                    logger.log(f"[PCAP-SESSION] {self.session}: stopped rc={self.returncode} "
+                               f"duration={self.stopped_at - (self.started_at or self.stopped_at):.3f}s size={size} bytes")
+                    if self._stderr:
+                        logger.log("[PCAP-SESSION STDERR]\n" + "\n".join(self._stderr))
+        return self.output_path
+
+
+def get_capture_session(session: str) -> Optional[CaptureSession]:
+    """Return the running capture session with this name, or None."""
+    with _SESSIONS_LOCK:
+        return _SESSIONS.get(session)
+
+
+def StartCapture(name: str,
+                 session: str,
+                 output_path: str,
+                 *,
+                 interface: str,
+                 bpf: Optional[str] = None,
+                 snaplen: Optional[int] = None,
+                 promiscuous: bool = True,
+                 file_format: str = "pcapng",
+                 max_duration_s: Optional[float] = None,
+                 require_tool: Optional[str] = None,
+                 env: Optional[dict] = None,
+                 cwd: Optional[Union[str, os.PathLike]] = None,
+                 negative_test: bool = False) -> TestAction:
+    """Create a TestAction that starts a background capture session and returns immediately.
+
+    The capture keeps running while later steps (SNMP, HTTP, UART, ...) execute and is
+    finalized by a `StopCapture` step with the same `session` name. This replaces padded
+    `duration_s` guesses and PTE threading around `CapturePcap`. If the test ends with the
+    session still open, the framework stops it after the teardown steps.
+
+    Args:
+        name (str): Human-readable name for the test action.
+        session (str): Session name used by `StopCapture` to find this capture.
+        output_path (str): Capture file to write (parents are created).
+        interface (str): OS interface name, description, or numeric index (dumpcap -D).
+        bpf (str, optional): Capture-time Berkeley Packet Filter.
+        snaplen (int, optional): Maximum bytes per packet to capture (-s).
+        promiscuous (bool, optional): Enable promiscuous mode (default True).
+        file_format (str, optional): "pcapng" (default) or "pcap" (dumpcap only).
+        max_duration_s (float, optional): Safety auto-stop for dumpcap (-a duration).
+        require_tool (str, optional): Force "dumpcap" or "tcpdump".
+        env (dict, optional): Extra environment variables for the capture subprocess.
+        cwd (str | PathLike, optional): Working directory for the capture subprocess.
+
+    Returns:
+        TestAction: Action that returns the `CaptureSession` handle once capturing.
+
+    Raises:
+        PCAPCaptureError: If the session name is already running or the tool fails to start.
+
+    Example:
+        >>> steps = [
+        ...     StartCapture("Start SNMP capture", "snmp", "snmp.pcapng",
+        ...                  interface="eth0", bpf="udp port 161"),
+        ...     snmp.get_action(...),
+        ...     StopCapture("Stop SNMP capture", "snmp"),
+        ...     analyze_PCAP("Check SNMP", "snmp.pcapng", "snmp", expect_count_min=2),
+        ... ]
+    """
+    tool_name, tool_exe = _select_tool(require_tool)
+    resolved_iface = interface
+    if tool_name == "dumpcap":
+        resolved_iface, _ = _dumpcap_resolve_interface(interface, tool_exe, os.environ.copy(), cwd)
+
+    def execute():
+        with _SESSIONS_LOCK:
+            if session in _SESSIONS:
+                raise PCAPCaptureError(f"Capture session {session!r} is already running")
+
+        argv: List[str] = [tool_exe, "-i", resolved_iface]
+        if tool_name == "dumpcap":
+            fmt = str(file_format).strip().lower()
+            if fmt in {"pcap", "pcapng"}:
+                argv += ["-F", fmt]
+            # -q: no packet counters on stderr for long-running sessions
+            argv += ["-w", output_path, "-q"]
+            if max_duration_s is not None:
+                argv += ["-a", f"duration:{max(1, int(float(max_duration_s)))}"]
+            if bpf:
+                argv += ["-f", bpf]
+        else:
+            argv += ["-U", "-w", output_path]
+        if not promiscuous:
+            argv += ["-p"]
+        if snaplen is not None:
+            argv += ["-s", str(int(snaplen))]
+        if tool_name == "tcpdump" and bpf:
+            argv += [bpf]
+
+        sess = CaptureSession(session, tool_name, tool_exe, argv, output_path, _merge_env(env), cwd)
+        sess.start()
+        with _SESSIONS_LOCK:
+            _SESSIONS[session] = sess
+
+        fw = get_active_framework()
+        if fw is not None:
+            fw.register_resource(f"pcap:{session}", sess, lambda s: s.stop())
+        return sess
+
+    return TestAction(name, execute, negative_test=negative_test)
+
+
+def StopCapture(name: str,
+                session: str,
+                *,
+                settle_s: float = 0.2,
+                negative_test: bool = False) -> TestAction:
+    """Create a TestAction that stops a background capture session and returns its file.
+
+    Args:
+        name (str): Human-readable name for the test action.
+        session (str): Session name given to `StartCapture`.
+        settle_s (float, optional): Delay before stopping so in-flight packets are
+            written. Defaults to 0.2 seconds.
+
+    Returns:
+        TestAction: Action returning the capture file path, ready for `analyze_PCAP`,
+        `read_PCAPFrames` or `pcap_checkFrames`.
+
+    Raises:
+        PCAPCaptureError: If no such session is running or no capture file was written.
+    """
+
+    def execute():
+        sess = get_capture_session(session)
+        if sess is None:
+            raise PCAPCaptureError(f"No running capture session named {session!r}")
+        if settle_s and settle_s > 0:
+            time.sleep(float(settle_s))
+
+        fw = get_active_framework()
+        if fw is not None and fw.get_resource(f"pcap:{session}") is sess:
+            fw.release_resource(f"pcap:{session}")
+        path = sess.stop()
+
+        out = Path(path)
+        if not out.exists() or out.stat().st_size == 0:
+            raise PCAPCaptureError(f"No capture output written to {path!r}")
+        return path
+
+    return TestAction(name, execute, negative_test=negative_test)
+
+
 def Ping(name: str,
          target: str,
          *,
@@ -53,6 +53,23 @@ _PCAP_NETWORK_ETHERNET = 1  # LINKTYPE_ETHERNET
 # Ethernet overheads
 ETH_HDR_LEN = 14
 ETH_FCS_LEN = 4
+IPV4_HDR_LEN = 20
+
+# Accepted EtherType names (build_ethernet_frame / FrameTemplate)
+_ETHERTYPE_MAP = {
+    "ipv4": 0x0800,
+    "arp": 0x0806,
+    "wakeonlan": 0x0842,
+    "vlan": 0x8100,
+    "ipv6": 0x86DD,
+    "mpls_uc": 0x8847,
+    "mpls_mc": 0x8848,
+    "pppoe_discovery": 0x8863,
+    "pppoe_session": 0x8864,
+    "lldp": 0x88B5,
+    "homeplug": 0x887B,
+    "profinet": 0x8892,
+}
 
 # ======================== Speed Parser ========================
 
@@ -127,6 +144,19 @@ def _ip4_bytes(x: Union[str, bytes]) -> bytes:
         raise PCAPGenError(f"Invalid IPv4 address: {x!r}")
 
 
+def _ethertype_value(ethertype: Union[int, str]) -> int:
+    """Resolve an EtherType given as int, hex string ("0x88b6") or common name."""
+    if isinstance(ethertype, str):
+        name = ethertype.strip().lower()
+        if name.startswith("0x"):
+            return int(name, 16) & 0xFFFF
+        et = _ETHERTYPE_MAP.get(name)
+        if et is None:
+            raise PCAPGenError(f"Unknown ethertype name {ethertype!r}")
+        return et
+    return int(ethertype) & 0xFFFF
+
+
 def _checksum16(data: bytes) -> int:
     # standard IP header checksum
     if len(data) % 2 == 1:
@@ -142,6 +172,14 @@ def _crc32_le(data: bytes) -> int:
     return zlib.crc32(data) & 0xFFFFFFFF
 
 
+def _checksum16_update(cksum: int, old_word: int, new_word: int) -> int:
+    # RFC 1624 eqn. 3: HC' = ~(~HC + ~m + m'), one's-complement arithmetic
+    s = (~cksum & 0xFFFF) + (~old_word & 0xFFFF) + (new_word & 0xFFFF)
+    s = (s & 0xFFFF) + (s >> 16)
+    s = (s & 0xFFFF) + (s >> 16)
+    return (~s) & 0xFFFF
+
+
 def _ensure_dir(path: str) -> None:
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -352,31 +390,7 @@ def build_ethernet_frame(
 
     d = _mac_from_any(dst_mac)
     s = _mac_from_any(src_mac)
-    if isinstance(ethertype, str):
-        # Accept common names or hex strings like "0x88b6"
-        name = ethertype.strip().lower()
-        ETHERTYPE_MAP = {
-            "ipv4": 0x0800,
-            "arp": 0x0806,
-            "wakeonlan": 0x0842,
-            "vlan": 0x8100,
-            "ipv6": 0x86DD,
-            "mpls_uc": 0x8847,
-            "mpls_mc": 0x8848,
-            "pppoe_discovery": 0x8863,
-            "pppoe_session": 0x8864,
-            "lldp": 0x88B5,
-            "homeplug": 0x887B,
-            "profinet": 0x8892,
-        }
-        if name.startswith("0x"):
-            et = int(name, 16)
-        else:
-            et = ETHERTYPE_MAP.get(name)
-            if et is None:
-                raise PCAPGenError(f"Unknown ethertype name {ethertype!r}")
-    else:
-        et = int(ethertype) & 0xFFFF
+    et = _ethertype_value(ethertype)
     hdr = d + s + struct.pack("!H", et)
     body = payload or b""
     frame_wo_fcs = hdr + body
@@ -404,6 +418,199 @@ def build_ethernet_frame(
     return result
 
 
+class FrameTemplate:
+    """Precompiled Ethernet (optionally IPv4) frame for fast variant generation.
+
+    The fixed fields are packed once into a reusable buffer. Variants are made
+    by patching the IP identification, addresses or payload bytes in place:
+    the IPv4 header checksum is updated incrementally (RFC 1624) instead of
+    being recomputed, and the FCS is computed with ``zlib.crc32`` over a
+    memoryview of the buffer without building intermediate ``bytes`` objects.
+
+    The frame layout (and therefore the total length) is fixed at construction;
+    payload patches must fit inside the payload area given there.
+
+    Args:
+        dst_mac (Union[str, bytes]): Destination MAC. Defaults to broadcast.
+        src_mac (Union[str, bytes]): Source MAC. Defaults to 00:11:22:33:44:55.
+        ethertype (Union[int, str]): EtherType for raw Ethernet mode. Ignored when
+            ``ipv4`` is True (0x0800 is used).
+        payload (bytes): Initial Ethernet payload (raw mode) or IPv4 payload.
+        total_size_including_fcs (Optional[int]): Exact frame length incl. FCS;
+            zero padding is added after the payload.
+        fcs_xormask (int): XOR mask applied to the computed FCS.
+        ipv4 (bool): Build an IPv4 header in front of the payload.
+        ip_src, ip_dst (Optional[Union[str, bytes]]): IPv4 addresses (required with ``ipv4``).
+        ip_protocol (int): IPv4 protocol number. Defaults to 17 (UDP).
+        ip_identification (int): Initial IPv4 Identification field.
+        ip_df (bool): IPv4 "Don't Fragment" flag.
+        ip_ttl (int): IPv4 TTL.
+        ip_tos (int): IPv4 TOS/DSCP field.
+
+    Raises:
+        PCAPGenError: On invalid addresses, missing IPv4 addresses, or when the
+            requested total size cannot hold header + payload + FCS.
+
+    Example:
+        >>> tpl = FrameTemplate(ipv4=True, ip_src="10.0.0.1", ip_dst="10.0.0.2",
+        ...                     payload=b"\x00" * 64)
+        >>> frames = [tpl.variant(identification=i) for i in range(1000)]
+    """
+
+    def __init__(
+        self,
+        *,
+        dst_mac: Union[str, bytes] = "ff:ff:ff:ff:ff:ff",
+        src_mac: Union[str, bytes] = "00:11:22:33:44:55",
+        ethertype: Union[int, str] = 0x0800,
+        payload: bytes = b"",
+        total_size_including_fcs: Optional[int] = None,
+        fcs_xormask: int = 0,
+        ipv4: bool = False,
+        ip_src: Optional[Union[str, bytes]] = None,
+        ip_dst: Optional[Union[str, bytes]] = None,
+        ip_protocol: int = 17,
+        ip_identification: int = 0,
+        ip_df: bool = False,
+        ip_ttl: int = 64,
+        ip_tos: int = 0,
+    ):
+        payload = bytes(payload or b"")
+        self.ipv4 = bool(ipv4)
+        self.fcs_xormask = int(fcs_xormask) & 0xFFFFFFFF
+
+        et = 0x0800 if self.ipv4 else _ethertype_value(ethertype)
+        l3_len = (IPV4_HDR_LEN if self.ipv4 else 0) + len(payload)
+        body_len = ETH_HDR_LEN + l3_len
+        if total_size_including_fcs is not None:
+            want = int(total_size_including_fcs)
+            if want < body_len + ETH_FCS_LEN:
+                raise PCAPGenError(
+                    "total_size_including_fcs smaller than header+payload+FCS"
+                )
+            body_len = want - ETH_FCS_LEN
+
+        self._ip_off = ETH_HDR_LEN
+        self._payload_off = ETH_HDR_LEN + (IPV4_HDR_LEN if self.ipv4 else 0)
+        self._payload_len = len(payload)
+        self._fcs_off = body_len
+        self._buf = bytearray(body_len + ETH_FCS_LEN)
+        self._view = memoryview(self._buf)
+
+        self._buf[0:6] = _mac_from_any(dst_mac)
+        self._buf[6:12] = _mac_from_any(src_mac)
+        struct.pack_into("!H", self._buf, 12, et)
+
+        if self.ipv4:
+            if not ip_src or not ip_dst:
+                raise PCAPGenError("ipv4=True requires ip_src and ip_dst")
+            flags_off = (0x2 << 13) if ip_df else 0
+            struct.pack_into(
+                "!BBHHHBBH4s4s",
+                self._buf,
+                self._ip_off,
+                (4 << 4) | 5,
+                int(ip_tos) & 0xFF,
+                l3_len & 0xFFFF,
+                int(ip_identification) & 0xFFFF,
+                flags_off,
+                int(ip_ttl) & 0xFF,
+                int(ip_protocol) & 0xFF,
+                0,
+                _ip4_bytes(ip_src),
+                _ip4_bytes(ip_dst),
+            )
+            cksum = _checksum16(bytes(self._view[self._ip_off : self._ip_off + IPV4_HDR_LEN]))
+            struct.pack_into("!H", self._buf, self._ip_off + 10, cksum)
+
+        self._buf[self._payload_off : self._payload_off + self._payload_len] = payload
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    @property
+    def payload_len(self) -> int:
+        """Size of the patchable payload area in bytes."""
+        return self._payload_len
+
+    def _patch_ip_word(self, rel_off: int, value: int) -> None:
+        off = self._ip_off + rel_off
+        old = (self._buf[off] << 8) | self._buf[off + 1]
+        value &= 0xFFFF
+        if old == value:
+            return
+        ck_off = self._ip_off + 10
+        cksum = (self._buf[ck_off] << 8) | self._buf[ck_off + 1]
+        struct.pack_into("!H", self._buf, off, value)
+        struct.pack_into("!H", self._buf, ck_off, _checksum16_update(cksum, old, value))
+
+    def _require_ipv4(self) -> None:
+        if not self.ipv4:
+            raise PCAPGenError("FrameTemplate was not built with ipv4=True")
+
+    def set_identification(self, identification: int) -> "FrameTemplate":
+        """Patch the IPv4 Identification field (checksum updated incrementally)."""
+        self._require_ipv4()
+        self._patch_ip_word(4, int(identification))
+        return self
+
+    def set_ip_src(self, addr: Union[str, bytes]) -> "FrameTemplate":
+        """Patch the IPv4 source address (checksum updated incrementally)."""
+        self._require_ipv4()
+        raw = _ip4_bytes(addr)
+        self._patch_ip_word(12, (raw[0] << 8) | raw[1])
+        self._patch_ip_word(14, (raw[2] << 8) | raw[3])
+        return self
+
+    def set_ip_dst(self, addr: Union[str, bytes]) -> "FrameTemplate":
+        """Patch the IPv4 destination address (checksum updated incrementally)."""
+        self._require_ipv4()
+        raw = _ip4_bytes(addr)
+        self._patch_ip_word(16, (raw[0] << 8) | raw[1])
+        self._patch_ip_word(18, (raw[2] << 8) | raw[3])
+        return self
+
+    def set_payload(self, data: bytes, offset: int = 0) -> "FrameTemplate":
+        """Overwrite payload bytes starting at `offset` within the payload area."""
+        n = len(data)
+        if offset < 0 or offset + n > self._payload_len:
+            raise PCAPGenError(
+                f"payload patch [{offset}:{offset + n}] exceeds payload area of {self._payload_len}B"
+            )
+        start = self._payload_off + offset
+        self._view[start : start + n] = data
+        return self
+
+    def render(self) -> bytes:
+        """Compute the FCS for the current buffer state and return the frame bytes."""
+        fcs = (zlib.crc32(self._view[: self._fcs_off]) & 0xFFFFFFFF) ^ self.fcs_xormask
+        struct.pack_into("<I", self._buf, self._fcs_off, fcs)
+        return bytes(self._buf)
+
+    def variant(
+        self,
+        *,
+        identification: Optional[int] = None,
+        ip_src: Optional[Union[str, bytes]] = None,
+        ip_dst: Optional[Union[str, bytes]] = None,
+        payload: Optional[bytes] = None,
+        payload_offset: int = 0,
+    ) -> bytes:
+        """Apply the given patches and return the rendered frame.
+
+        Patches persist in the template; fields not given keep their last value.
+        """
+        if identification is not None:
+            self.set_identification(identification)
+        if ip_src is not None:
+            self.set_ip_src(ip_src)
+        if ip_dst is not None:
+            self.set_ip_dst(ip_dst)
+        if payload is not None:
+            self.set_payload(payload, payload_offset)
+        return self.render()
+
+
 def _pcap_append_frames_ns(
     path: str,
     frames: List[bytes],
@@ -1021,4 +1228,136 @@ def pcap_from_spec_action(
 
         return output_path
 
-    return TestAction(name, execute, negative_test=negative_test)
\ No newline at end of file
+    return TestAction(name, execute, negative_test=negative_test)
+
+
+def pcap_from_template_action(
+    name: str,
+    output_path: str,
+    template: FrameTemplate,
+    count: int,
+    *,
+    identification_start: Optional[int] = None,
+    delta_ns: int = 0,
+    start_time_ns: int = 0,
+    overwrite: bool = True,
+    negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that writes `count` variants of a FrameTemplate to a PCAP.
+
+    Frames are rendered from the template's reused buffer and written with a single
+    file open, so large bursts avoid the per-frame header rebuild, checksum loop and
+    file reopen done by `pcap_create`. When `identification_start` is given (IPv4
+    templates only), frame i carries Identification ``identification_start + i``.
+
+    Args:
+        name (str): Human-readable name for the test action.
+        output_path (str): Target PCAP path; created if missing.
+        template (FrameTemplate): Precompiled frame to render.
+        count (int): Number of frames to write.
+        identification_start (Optional[int], optional): First IPv4 Identification value;
+            None keeps the template's current value for all frames.
+        delta_ns (int, optional): Timestamp increment between frames. Defaults to 0.
+        start_time_ns (int, optional): Timestamp of the first frame when the file is empty.
+        overwrite (bool, optional): If True, delete an existing PCAP before writing.
+            If False, append after the last record's timestamp. Defaults to True.
+
+    Returns:
+        TestAction: Action that writes the frames and returns `output_path` on success.
+
+    Raises:
+        PCAPGenError: If `count` is negative or a template patch is invalid.
+
+    Example:
+        >>> tpl = FrameTemplate(ipv4=True, ip_src="10.0.0.1", ip_dst="10.0.0.2",
+        ...                     payload=b"\\x22" * 64, total_size_including_fcs=128)
+        >>> pcap_from_template_action("10k frames", "burst.pcap", tpl, 10_000,
+        ...                           identification_start=1, delta_ns=1_000)()
+    """
+
+    def execute():
+        logger = get_active_logger()
+        n = int(count)
+        if n < 0:
+            raise PCAPGenError("count must be >= 0")
+
+        if overwrite and os.path.exists(output_path):
+            os.remove(output_path)
+        last_ts_ns, _ = _pcap_read_last_record(output_path)
+        ts = int(start_time_ns) if last_ts_ns is None else int(last_ts_ns) + int(delta_ns)
+
+        if logger:
+            logger.log(
+                f"[PCAPGEN] from-template target={output_path} count={n} frame_len={len(template)} "
+                f"ipv4={template.ipv4} ident_start={identification_start} delta_ns={delta_ns}"
+            )
+
+        _pcap_write_global_header_if_missing(output_path, _PCAP_NETWORK_ETHERNET)
+        rec_hdr = struct.Struct("<IIII")
+        frame_len = len(template)
+        with open(output_path, "ab") as f:
+            for i in range(n):
+                if identification_start is not None:
+                    template.set_identification(int(identification_start) + i)
+                f.write(rec_hdr.pack(ts // 1_000_000_000, ts % 1_000_000_000, frame_len, frame_len))
+                f.write(template.render())
+                ts += int(delta_ns)
+
+        if logger:
+            logger.log(f"[PCAPGEN] from-template appended {n} frame(s) -> {output_path}")
+
+        return output_path
+
+    return TestAction(name, execute, negative_test=negative_test)
+
+
+def benchmark_frame_builders(count: int = 10_000, payload_len: int = 64) -> dict:
+    """Measure IPv4/Ethernet frame build throughput: per-call builders vs. FrameTemplate.
+
+    Both paths produce the same frames (IPv4 Identification incremented per frame).
+    The legacy path includes the builders' own logging when a logger is active.
+
+    Args:
+        count (int): Number of frames to build with each method.
+        payload_len (int): IPv4 payload length in bytes.
+
+    Returns:
+        dict: ``{"count", "legacy_fps", "template_fps", "speedup"}``.
+    """
+    import time
+
+    payload = bytes(int(payload_len))
+    t0 = time.perf_counter()
+    for i in range(count):
+        pkt = build_ipv4_packet(
+            src="10.0.0.1", dst="10.0.0.2", payload=payload, protocol=17,
+            identification=i, flags_df=False, flags_mf=False,
+            frag_offset_units8=0, ttl=64, tos=0,
+        )
+        build_ethernet_frame(
+            dst_mac="ff:ff:ff:ff:ff:ff", src_mac="00:11:22:33:44:55",
+            ethertype=0x0800, payload=pkt, total_size_including_fcs=None, fcs_xormask=0,
+        )
+    legacy_s = time.perf_counter() - t0
+
+    tpl = FrameTemplate(ipv4=True, ip_src="10.0.0.1", ip_dst="10.0.0.2", payload=payload)
+    t0 = time.perf_counter()
+    for i in range(count):
+        tpl.set_identification(i)
+        tpl.render()
+    template_s = time.perf_counter() - t0
+
+    result = {
+        "count": int(count),
+        "legacy_fps": count / legacy_s if legacy_s > 0 else float("inf"),
+        "template_fps": count / template_s if template_s > 0 else float("inf"),
+        "speedup": legacy_s / template_s if template_s > 0 else float("inf"),
+    }
+    logger = get_active_logger()
+    if logger:
+        logger.log(
+            f"[PCAPGEN] benchmark count={count} payload={payload_len}B "
+            f"legacy={result['legacy_fps']:.0f} fps template={result['template_fps']:.0f} fps "
+            f"speedup=x{result['speedup']:.1f}"
+        )
+    return result
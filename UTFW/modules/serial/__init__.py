@@ -11,21 +11,57 @@ Capabilities:
 - Reboot detection and ready state monitoring
 - System information parsing and validation
 - Network parameter configuration
-- EEPROM dump capture and analysis
+- EEPROM dump capture and analysis (hex or CRC-checked base64)
+- Session-wide EEPROM image cache invalidated by EEPROM-affecting commands
+- Streaming capture of marker-delimited dump blocks
 - Channel state management and verification
+- Background port monitor with step-window assertions
 
 Author: DvidMakesThings
 """
 
 from .serial import *
+from .monitor import (
+    SerialMonitorError,
+    SerialMonitor,
+    PortLease,
+    open_monitor,
+    close_monitor,
+    get_monitor,
+    borrow_port,
+    step_window,
+    start_monitor,
+    stop_monitor,
+    assert_seen,
+)
+from .eeprom_dump import (
+    EepromDumpError,
+    EepromImage,
+    parse_hex_dump,
+    parse_base64_dump,
+    parse_dump,
+    read_eeprom_image,
+    reset_b64_support,
+    last_eeprom_image,
+    cached_eeprom_image,
+    eeprom_region,
+    eeprom_generation,
+    invalidate_eeprom_cache,
+    note_command,
+    EEPROM_WRITE_COMMANDS,
+)
 
 __all__ = [
     # Exceptions
     "SerialTestError",
+    "SerialMonitorError",
+    "EepromDumpError",
     
     # Core communication functions
     "send_command",
     "wait_for_reboot_and_ready",
+    "read_delimited_block",
+    "MarkerScanner",
     
     # Parsing utilities
     "parse_sysinfo_response",
@@ -44,8 +80,38 @@ __all__ = [
     "set_network_parameter_simple",
     "verify_network_change",
     "factory_reset_complete",
+    "read_block",
     "send_eeprom_dump_command",
     "validate_eeprom_markers",
     "analyze_eeprom_dump",
     "load_eeprom_checks_from_json",
+
+    # EEPROM dump parsing
+    "EepromImage",
+    "parse_hex_dump",
+    "parse_base64_dump",
+    "parse_dump",
+    "read_eeprom_image",
+    "reset_b64_support",
+    "last_eeprom_image",
+
+    # Session EEPROM image cache
+    "cached_eeprom_image",
+    "eeprom_region",
+    "eeprom_generation",
+    "invalidate_eeprom_cache",
+    "note_command",
+    "EEPROM_WRITE_COMMANDS",
+
+    # Background monitor
+    "SerialMonitor",
+    "PortLease",
+    "open_monitor",
+    "close_monitor",
+    "get_monitor",
+    "borrow_port",
+    "step_window",
+    "start_monitor",
+    "stop_monitor",
+    "assert_seen",
 ]
\ No newline at end of file
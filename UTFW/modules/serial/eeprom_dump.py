@@ -0,0 +1,566 @@
+# eeprom_dump.py
+"""
+UTFW EEPROM Dump Parser
+=======================
+In-process capture and parsing of device EEPROM dumps.
+
+The device prints its EEPROM between ``EE_DUMP_START`` and ``EE_DUMP_END``
+as address/hex rows::
+
+    0x0000 53 4E 2D 30 ...
+
+:func:`parse_hex_dump` turns those rows into one :class:`EepromImage`, a
+``bytearray`` indexed by EEPROM address, converting each row with a single
+``bytes.fromhex`` call instead of a regex per byte. Missing address ranges
+and rows printed twice are recorded on the image rather than silently
+shifting later bytes.
+
+Firmware that supports it can send the same data base64 encoded with a
+CRC32 (see :func:`parse_base64_dump` for the framing), which is about a
+third of the hex size on the wire and is integrity checked.
+:func:`read_eeprom_image` captures either form and remembers per port
+whether the base64 mode is available.
+
+The image is what EEPROM checks and failure-memory decoding consume, so a
+dump is parsed once no matter how many consumers look at it.
+:func:`cached_eeprom_image` goes further and keeps one image per port for
+the whole test, tagged with a device-state generation counter. Commands
+that may write EEPROM (factory reset, network/channel set, failure-log
+clear, error replies) advance the counter, and the next consumer then
+re-captures.
+
+Usage:
+    from UTFW.modules.serial.eeprom_dump import read_eeprom_image, cached_eeprom_image
+
+    image = read_eeprom_image("COM10", 115200, mode="auto")
+    print(image.ascii(0x0000, 32), image.gaps)
+
+    # Several steps, one UART dump until something writes EEPROM
+    serial_no = cached_eeprom_image("COM10").ascii(0x0000, 32)
+
+Author: DvidMakesThings
+"""
+
+import base64
+import binascii
+import re
+import threading
+import zlib
+from typing import Optional, Dict, List, Tuple
+
+from ...core.logger import get_active_logger
+from ...core.core import get_active_framework
+from .serial import SerialTestError, read_delimited_block
+
+DUMP_START_MARKER = "EE_DUMP_START"
+DUMP_END_MARKER = "EE_DUMP_END"
+DUMP_COMMAND = "DUMP_EEPROM"
+DUMP_B64_COMMAND = "DUMP_EEPROM B64"
+B64_HEADER = "EE_B64"
+EEPROM_FILL = 0xFF
+
+_B64_HEADER_RE = re.compile(
+    r"EE_B64\s+(0[xX][0-9A-Fa-f]+|\d+)\s+(\d+)\s+(?:CRC32=)?(0[xX][0-9A-Fa-f]+)"
+)
+
+# Per-port result of base64 mode negotiation (True = supported), kept for
+# the running test only
+_B64_RESOURCE_KEY = "eeprom-b64-support"
+_B64_SUPPORT: Dict[str, bool] = {}
+_LAST_IMAGE: Optional["EepromImage"] = None
+
+
+class EepromDumpError(SerialTestError):
+    """Exception raised when an EEPROM dump cannot be captured or parsed."""
+    pass
+
+
+# ======================== EEPROM Image ========================
+
+class EepromImage:
+    """Address-indexed EEPROM contents parsed from one dump.
+
+    ``data[addr]`` is the byte at EEPROM address ``addr`` for every address
+    from 0 to ``end - 1``; addresses the dump did not cover hold
+    ``EEPROM_FILL`` and are listed in :attr:`gaps`.
+
+    Attributes:
+        data (bytearray): Image indexed by address.
+        start (int): Lowest address present in the dump.
+        end (int): One past the highest address present.
+        rows (List[Tuple[int, int]]): ``(address, length)`` of each parsed row
+            in dump order.
+        gaps (List[Tuple[int, int]]): ``(address, length)`` ranges between
+            ``start`` and ``end`` that no row covered.
+        duplicates (List[int]): Addresses of rows that overlapped an earlier row.
+        conflicts (List[int]): Subset of ``duplicates`` whose data differed.
+        source (str): ``"hex"`` or ``"base64"``.
+        crc32 (Optional[int]): Verified CRC32 for base64 dumps.
+        text (str): Raw dump text the image was parsed from.
+    """
+
+    def __init__(self, data: bytearray, start: int, end: int,
+                 rows: List[Tuple[int, int]], gaps: List[Tuple[int, int]],
+                 duplicates: List[int], conflicts: List[int],
+                 source: str = "hex", crc32: Optional[int] = None, text: str = ""):
+        self.data = data
+        self.start = start
+        self.end = end
+        self.rows = rows
+        self.gaps = gaps
+        self.duplicates = duplicates
+        self.conflicts = conflicts
+        self.source = source
+        self.crc32 = crc32
+        self.text = text
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return (f"EepromImage(0x{self.start:04X}-0x{self.end:04X}, rows={len(self.rows)}, "
+                f"gaps={len(self.gaps)}, duplicates={len(self.duplicates)}, source={self.source})")
+
+    @property
+    def complete(self) -> bool:
+        """True when the dump covered its address span without gaps or conflicts."""
+        return bool(self.rows) and not self.gaps and not self.conflicts
+
+    def slice(self, address: int, length: int) -> bytes:
+        """Return ``length`` bytes from ``address``, clipped to the image."""
+        lo = max(0, min(address, len(self.data)))
+        hi = max(lo, min(address + length, len(self.data)))
+        return bytes(self.data[lo:hi])
+
+    def span(self) -> bytes:
+        """Bytes from the first to the last dumped address."""
+        return bytes(self.data[self.start:self.end])
+
+    def ascii(self, address: int, length: int, trim_nul: bool = True) -> str:
+        """Decode a region as text, stopping at the first NUL by default."""
+        raw = self.slice(address, length)
+        if trim_nul and b"\x00" in raw:
+            raw = raw[:raw.index(b"\x00")]
+        return raw.decode("utf-8", errors="ignore")
+
+    def hex_rows(self, row_size: int = 16) -> str:
+        """Render the dumped span as ``0xNNNN HH HH ...`` rows."""
+        lines = []
+        for addr in range(self.start - self.start % row_size, self.end, row_size):
+            chunk = self.data[addr:addr + row_size]
+            lines.append(f"0x{addr:04X} {chunk.hex(' ').upper()}")
+        return "\n".join(lines)
+
+    def ascii_table(self, row_size: int = 16) -> str:
+        """Render the dumped span as hex rows with a printable ASCII column."""
+        table = bytes(c if 0x20 <= c <= 0x7E else 0x2E for c in range(256))
+        lines = []
+        for addr in range(self.start - self.start % row_size, self.end, row_size):
+            chunk = bytes(self.data[addr:addr + row_size])
+            hex_cells = chunk.hex(" ").upper().ljust(row_size * 3 - 1)
+            lines.append(f"0x{addr:04X}  {hex_cells}   |{chunk.translate(table).decode('ascii')}|")
+        return "\n".join(lines)
+
+
+def _split_row(line: str) -> Optional[Tuple[int, bytes]]:
+    """Parse one ``0xNNNN HH HH ...`` row, or return None for other lines."""
+    line = line.strip()
+    if not (line.startswith("0x") or line.startswith("0X")):
+        return None
+    parts = line.split(None, 1)
+    try:
+        addr = int(parts[0].rstrip(":"), 16)
+    except ValueError:
+        return None
+    body = parts[1] if len(parts) > 1 else ""
+    bar = body.find("|")
+    if bar >= 0:
+        body = body[:bar]
+    try:
+        return addr, bytes.fromhex(body)
+    except ValueError:
+        # Stray tokens on the row: keep only well-formed byte cells
+        cells = [t for t in body.split() if len(t) == 2]
+        try:
+            return addr, bytes.fromhex(" ".join(cells))
+        except ValueError:
+            return addr, bytes(int(t, 16) for t in cells
+                               if all(c in "0123456789abcdefABCDEF" for c in t))
+
+
+def _dump_body(text: str) -> str:
+    """Return the text between the dump markers, or all of it if absent."""
+    start = text.find(DUMP_START_MARKER)
+    if start >= 0:
+        start += len(DUMP_START_MARKER)
+        end = text.find(DUMP_END_MARKER, start)
+        return text[start:end if end >= 0 else len(text)]
+    end = text.find(DUMP_END_MARKER)
+    return text if end < 0 else text[:end]
+
+
+def _build_image(rows: List[Tuple[int, bytes]], source: str, text: str,
+                 fill: int = EEPROM_FILL, crc: Optional[int] = None) -> EepromImage:
+    """Place parsed rows at their addresses and record gaps and duplicates."""
+    if not rows:
+        return EepromImage(bytearray(), 0, 0, [], [], [], [], source, crc, text)
+
+    start = min(a for a, _ in rows)
+    end = max(a + len(d) for a, d in rows)
+    data = bytearray([fill]) * end
+    covered = bytearray(end)
+    duplicates: List[int] = []
+    conflicts: List[int] = []
+    for addr, chunk in rows:
+        hi = addr + len(chunk)
+        if covered.find(1, addr, hi) >= 0:
+            duplicates.append(addr)
+            if data[addr:hi] != chunk:
+                conflicts.append(addr)
+        data[addr:hi] = chunk
+        covered[addr:hi] = b"\x01" * len(chunk)
+
+    gaps: List[Tuple[int, int]] = []
+    pos = covered.find(0, start, end)
+    while pos >= 0:
+        stop = covered.find(1, pos, end)
+        stop = end if stop < 0 else stop
+        gaps.append((pos, stop - pos))
+        pos = covered.find(0, stop, end)
+
+    return EepromImage(data, start, end, [(a, len(d)) for a, d in rows],
+                       gaps, duplicates, conflicts, source, crc, text)
+
+
+# ======================== Parsers ========================
+
+def parse_hex_dump(text: str, fill: int = EEPROM_FILL) -> EepromImage:
+    """Parse an address/hex EEPROM dump into an :class:`EepromImage`.
+
+    Only the text between ``EE_DUMP_START`` and ``EE_DUMP_END`` is parsed
+    when the markers are present. Rows may carry a trailing ``|ascii|``
+    column, as in the helper's ASCII view.
+
+    Args:
+        text (str): Dump text as received from the device.
+        fill (int, optional): Value for addresses the dump did not cover.
+            Defaults to 0xFF (erased EEPROM).
+
+    Returns:
+        EepromImage: Parsed image with gap/duplicate bookkeeping.
+
+    Example:
+        >>> img = parse_hex_dump("EE_DUMP_START\\n0x0000 41 42\\nEE_DUMP_END")
+        >>> img.slice(0, 2)
+        b'AB'
+    """
+    rows = []
+    for line in _dump_body(text).splitlines():
+        row = _split_row(line)
+        if row is not None and row[1]:
+            rows.append(row)
+    return _build_image(rows, "hex", text, fill)
+
+
+def parse_base64_dump(text: str, fill: int = EEPROM_FILL) -> EepromImage:
+    """Parse a base64 EEPROM dump and verify its CRC32.
+
+    Expected framing between the dump markers::
+
+        EE_B64 <start_address> <length> CRC32=0x<crc32>
+        <base64 payload, any line wrapping>
+
+    The CRC is the standard zlib/IEEE CRC32 of the decoded payload.
+
+    Args:
+        text (str): Dump text as received from the device.
+        fill (int, optional): Value for addresses below the start address.
+            Defaults to 0xFF.
+
+    Returns:
+        EepromImage: Parsed image with ``source="base64"``.
+
+    Raises:
+        EepromDumpError: If the header is missing, the payload is not valid
+            base64, or the length or CRC does not match.
+    """
+    body = _dump_body(text)
+    m = _B64_HEADER_RE.search(body)
+    if not m:
+        raise EepromDumpError(f"Base64 dump header '{B64_HEADER}' not found")
+    addr = int(m.group(1), 0)
+    length = int(m.group(2))
+    crc = int(m.group(3), 16)
+
+    payload = "".join(body[m.end():].split())
+    try:
+        data = base64.b64decode(payload, validate=True)
+    except (binascii.Error, ValueError) as e:
+        raise EepromDumpError(f"Base64 dump payload is corrupt: {e}")
+    if len(data) != length:
+        raise EepromDumpError(f"Base64 dump length mismatch: header {length}, got {len(data)}")
+    actual = zlib.crc32(data) & 0xFFFFFFFF
+    if actual != crc:
+        raise EepromDumpError(f"Base64 dump CRC mismatch: header 0x{crc:08X}, got 0x{actual:08X}")
+    return _build_image([(addr, data)] if data else [], "base64", text, fill, crc)
+
+
+def parse_dump(text: str, fill: int = EEPROM_FILL) -> EepromImage:
+    """Parse a dump in whichever format it arrived (base64 or hex rows)."""
+    if B64_HEADER in text:
+        return parse_base64_dump(text, fill)
+    return parse_hex_dump(text, fill)
+
+
+# ======================== Capture ========================
+
+def _capture(port: str, baudrate: int, command: str,
+             overall_timeout: float) -> Tuple[str, str]:
+    """Return ``(dump block or "", everything received)``."""
+    scanner = read_delimited_block(
+        port, command, (DUMP_START_MARKER, DUMP_END_MARKER),
+        baudrate=baudrate,
+        overall_timeout=overall_timeout,
+        log_label="eeprom-dump",
+    )
+    if not scanner.complete:
+        return "", scanner.text()
+    return scanner.block(0), scanner.text()
+
+
+def _remember_b64_support(port: str, supported: bool) -> None:
+    """Store the negotiation result for the rest of the running test."""
+    _B64_SUPPORT[port] = supported
+    fw = get_active_framework()
+    if fw is not None:
+        fw.register_resource(_B64_RESOURCE_KEY, _B64_SUPPORT, lambda d: d.clear())
+
+
+def reset_b64_support(port: Optional[str] = None) -> None:
+    """Forget base64 negotiation results so ``mode="auto"`` probes again.
+
+    Args:
+        port (Optional[str]): Port to reset, or None for every port.
+    """
+    if port is None:
+        _B64_SUPPORT.clear()
+    else:
+        _B64_SUPPORT.pop(port, None)
+
+
+def read_eeprom_image(port: str,
+                      baudrate: int = 115200,
+                      mode: str = "hex",
+                      command: str = DUMP_COMMAND,
+                      b64_command: str = DUMP_B64_COMMAND,
+                      overall_timeout: float = 20.0,
+                      probe_timeout: float = 3.0) -> EepromImage:
+    """Capture an EEPROM dump over UART and parse it into an image.
+
+    Args:
+        port (str): Serial port identifier.
+        baudrate (int, optional): Serial communication baud rate.
+            Defaults to 115200.
+        mode (str, optional): ``"hex"`` for the classic dump, ``"base64"`` to
+            require the CRC-checked base64 dump, or ``"auto"`` to try base64
+            and fall back to hex when the firmware does not answer it. A
+            rejected probe is remembered per port until the test ends (see
+            :func:`reset_b64_support`); a silent one is retried next time.
+            Defaults to "hex".
+        command (str, optional): Hex dump command. Defaults to "DUMP_EEPROM".
+        b64_command (str, optional): Base64 dump command.
+            Defaults to "DUMP_EEPROM B64".
+        overall_timeout (float, optional): Capture timeout. Defaults to 20.0.
+        probe_timeout (float, optional): How long ``"auto"`` waits for a
+            base64 answer the first time. Defaults to 3.0.
+
+    Returns:
+        EepromImage: Parsed image.
+
+    Raises:
+        EepromDumpError: If no complete dump is received or it cannot be
+            parsed.
+    """
+    global _LAST_IMAGE
+    mode = mode.lower()
+    if mode not in ("hex", "base64", "auto"):
+        raise EepromDumpError(f"Invalid dump mode '{mode}', must be 'hex', 'base64' or 'auto'")
+
+    logger = get_active_logger()
+    text = ""
+    if mode == "base64" or (mode == "auto" and _B64_SUPPORT.get(port, True)):
+        known = port in _B64_SUPPORT
+        text, received = _capture(port, baudrate, b64_command,
+                                  overall_timeout if known or mode == "base64" else probe_timeout)
+        # An unknown-command reply is logged to failure memory by the firmware
+        note_command(port, b64_command, received)
+        if B64_HEADER not in text:
+            if mode == "base64":
+                raise EepromDumpError(f"No base64 EEPROM dump received for '{b64_command}'")
+            if received.strip():
+                _remember_b64_support(port, False)
+                if logger:
+                    logger.info(f"[EEPROM] Base64 dump not supported on {port}, using hex dump")
+            elif logger:
+                logger.info(f"[EEPROM] No answer to '{b64_command}' on {port}, using hex dump")
+            text = ""
+        else:
+            _remember_b64_support(port, True)
+
+    if not text:
+        text, _received = _capture(port, baudrate, command, overall_timeout)
+        if not text:
+            raise EepromDumpError(
+                f"EEPROM dump incomplete: '{DUMP_START_MARKER}'/'{DUMP_END_MARKER}' not received")
+
+    image = parse_dump(text)
+    if not image.rows:
+        raise EepromDumpError("No valid EEPROM rows found in dump")
+    if logger:
+        logger.info(f"[EEPROM] Parsed {image.end - image.start} bytes "
+                    f"(0x{image.start:04X}-0x{image.end - 1:04X}) from {len(image.rows)} "
+                    f"{image.source} row(s)")
+        if image.gaps:
+            logger.warn(f"[EEPROM] Gaps: " + ", ".join(
+                f"0x{a:04X}+{n}" for a, n in image.gaps[:8])
+                + (" ..." if len(image.gaps) > 8 else ""))
+        if image.duplicates:
+            logger.warn(f"[EEPROM] Duplicate rows at: " + ", ".join(
+                f"0x{a:04X}" for a in image.duplicates[:8])
+                + (f" ({len(image.conflicts)} with differing data)" if image.conflicts else ""))
+    _LAST_IMAGE = image
+    return image
+
+
+def last_eeprom_image() -> Optional[EepromImage]:
+    """Return the most recently captured EEPROM image, if any."""
+    return _LAST_IMAGE
+
+
+# ======================== Session Image Cache ========================
+
+# Command prefixes that change EEPROM contents (case-insensitive)
+EEPROM_WRITE_COMMANDS: Tuple[str, ...] = (
+    "RFS", "FACTORY", "REBOOT", "SET_", "CONFIG_", "CLEAR_", "WRITE_", "ERASE_",
+)
+
+# Error replies mean the firmware may have logged to failure memory
+_ERROR_RESPONSE_RE = re.compile(r"\b(?:ERROR|ERR|UNKNOWN|INVALID)\b", re.IGNORECASE)
+
+_CACHE_RESOURCE_KEY = "eeprom-image-cache"
+_CACHE_LOCK = threading.Lock()
+_GENERATIONS: Dict[str, int] = {}
+_IMAGE_CACHE: Dict[str, Tuple[int, EepromImage]] = {}
+
+
+def eeprom_generation(port: str) -> int:
+    """Return the device-state generation counter for ``port``.
+
+    The counter increases every time a command that may have written EEPROM
+    is sent; a cached image is only reused while the counter is unchanged.
+    """
+    with _CACHE_LOCK:
+        return _GENERATIONS.get(port, 0)
+
+
+def invalidate_eeprom_cache(port: Optional[str] = None, reason: str = "") -> None:
+    """Advance the generation of one port (or all ports) so the next read re-captures.
+
+    Args:
+        port (Optional[str]): Port to invalidate, or None for every port.
+        reason (str, optional): Logged with the invalidation.
+    """
+    with _CACHE_LOCK:
+        ports = [port] if port is not None else list(set(_GENERATIONS) | set(_IMAGE_CACHE))
+        for p in ports:
+            _GENERATIONS[p] = _GENERATIONS.get(p, 0) + 1
+            _IMAGE_CACHE.pop(p, None)
+    logger = get_active_logger()
+    if logger and ports:
+        why = f" ({reason})" if reason else ""
+        logger.info(f"[EEPROM] Image cache invalidated for {', '.join(ports)}{why}")
+
+
+def note_command(port: str, command: str, response: str = "") -> bool:
+    """Record a command sent to the device and invalidate the cache if it writes EEPROM.
+
+    Called by the serial and failure-memory senders. A command counts as
+    EEPROM-affecting when it starts with one of ``EEPROM_WRITE_COMMANDS``
+    or when the device answered with an error (which the firmware logs
+    to failure memory).
+
+    Args:
+        port (str): Port the command was sent on.
+        command (str): Command text.
+        response (str, optional): Device reply, if available.
+
+    Returns:
+        bool: True if the cache was invalidated.
+    """
+    cmd = command.strip().upper()
+    if cmd.startswith(EEPROM_WRITE_COMMANDS):
+        invalidate_eeprom_cache(port, cmd.split()[0])
+        return True
+    if response and _ERROR_RESPONSE_RE.search(response):
+        invalidate_eeprom_cache(port, f"error reply to {cmd.split()[0] if cmd else 'command'}")
+        return True
+    return False
+
+
+def _clear_image_cache(_resource=None) -> None:
+    with _CACHE_LOCK:
+        _IMAGE_CACHE.clear()
+
+
+def cached_eeprom_image(port: str,
+                        baudrate: int = 115200,
+                        mode: str = "hex",
+                        refresh: bool = False,
+                        overall_timeout: float = 20.0) -> EepromImage:
+    """Return the EEPROM image for ``port``, capturing it only when stale.
+
+    The first call captures a dump with :func:`read_eeprom_image` and stores
+    it with the current device-state generation. Later calls return the
+    stored image as long as no EEPROM-affecting command was sent in
+    between (see :func:`note_command`). Web POSTs, SNMP sets and reboot
+    waits invalidate it too; anything else that may write EEPROM (e.g. an
+    error the firmware logs on its own) must call
+    :func:`invalidate_eeprom_cache` or pass ``refresh=True``. Inside a
+    running test the cache is dropped when the test ends.
+
+    Args:
+        port (str): Serial port identifier.
+        baudrate (int, optional): Serial communication baud rate.
+            Defaults to 115200.
+        mode (str, optional): Dump mode for a fresh capture. Defaults to "hex".
+        refresh (bool, optional): Force a new capture. Defaults to False.
+        overall_timeout (float, optional): Capture timeout. Defaults to 20.0.
+
+    Returns:
+        EepromImage: Current EEPROM image.
+    """
+    logger = get_active_logger()
+    generation = eeprom_generation(port)
+    if not refresh:
+        with _CACHE_LOCK:
+            entry = _IMAGE_CACHE.get(port)
+        if entry is not None and entry[0] == generation:
+            if logger:
+                logger.info(f"[EEPROM] Using cached image for {port} (generation {generation})")
+            return entry[1]
+
+    image = read_eeprom_image(port, baudrate, mode=mode, overall_timeout=overall_timeout)
+    with _CACHE_LOCK:
+        # A write sent while capturing makes this image stale already
+        if _GENERATIONS.get(port, 0) == generation:
+            _IMAGE_CACHE[port] = (generation, image)
+
+    fw = get_active_framework()
+    if fw is not None:
+        fw.register_resource(_CACHE_RESOURCE_KEY, _IMAGE_CACHE, _clear_image_cache)
+    return image
+
+
+def eeprom_region(port: str, address: int, length: int, baudrate: int = 115200) -> bytes:
+    """Read ``length`` bytes at ``address`` from the session EEPROM image."""
+    return cached_eeprom_image(port, baudrate).slice(address, length)
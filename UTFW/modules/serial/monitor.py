@@ -0,0 +1,694 @@
+# monitor.py
+"""
+UTFW Serial Monitor
+===================
+Background UART monitor that owns a serial port for the whole test.
+
+Without a monitor the port is only open while a command runs, so boot
+logs, error prints or watchdog resets that arrive between commands are
+lost. A :class:`SerialMonitor` keeps the port open, timestamps every
+received chunk into a ring buffer and a rotating log file, and lends the
+port to command steps: while a monitor runs, ``send_command``,
+``wait_for_reboot_and_ready`` and the other serial functions (and
+``waveshare.uart``) get a :class:`PortLease` instead of opening the port
+themselves. The lease sees only the bytes received while it is held;
+the monitor records everything, tagging leased bytes with the owner.
+
+Later steps assert on what was seen in a time window, e.g. "pattern X
+appeared between step 3 and step 5", without having waited for it.
+
+Usage:
+    import UTFW
+    serial = UTFW.modules.serial
+
+    serial.start_monitor("Monitor DUT console", "/dev/ttyUSB0")
+    ...
+    serial.assert_seen("No watchdog reset during update",
+                       "/dev/ttyUSB0", r"WDT RESET", between=("3", "5"),
+                       negative=True)
+
+Author: DvidMakesThings
+"""
+
+import bisect
+import logging
+import logging.handlers
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple, Any, Union
+
+from ...core.logger import get_active_logger
+from ...core.core import TestAction, get_active_framework
+
+MONITOR_RING_BYTES = 4 * 1024 * 1024
+MONITOR_FILE_BYTES = 10 * 1024 * 1024
+MONITOR_FILE_BACKUPS = 3
+
+# Default wait for a lease held by another step, and the reconnect backoff
+# after the port drops (USB re-enumeration on reset)
+BORROW_WAIT_S = 10.0
+RECONNECT_MIN_S = 0.1
+RECONNECT_MAX_S = 1.0
+
+_MONITOR_RESOURCE_PREFIX = "serial-monitor:"
+_MONITORS: Dict[str, "SerialMonitor"] = {}
+_MONITORS_LOCK = threading.Lock()
+
+
+class SerialMonitorError(Exception):
+    """Exception raised when the serial monitor fails or an assertion on its record fails."""
+    pass
+
+
+@dataclass
+class MonitorChunk:
+    """One received (or transmitted) chunk."""
+    timestamp: float
+    offset: int
+    data: bytes
+    direction: str = "rx"
+    owner: Optional[str] = None
+
+
+# ======================== Port Lease ========================
+
+class PortLease:
+    """Borrowed access to a monitored port, shaped like ``serial.Serial``.
+
+    Supports the subset the serial functions use: ``write``, ``flush``,
+    ``read``, ``readinto``, ``readline``, ``in_waiting``, the buffer resets
+    and ``close`` (which hands the port back to the monitor).
+    """
+
+    def __init__(self, monitor: "SerialMonitor", owner: str, timeout: Optional[float]):
+        self._monitor = monitor
+        self.owner = owner
+        self.timeout = timeout
+        self.port = monitor.port
+        self.baudrate = monitor.baudrate
+        self._buf = bytearray()
+        self._closed = False
+
+    # Fed by the monitor's reader thread while it holds the monitor condition
+    def _feed(self, data: bytes) -> None:
+        self._buf += data
+
+    @property
+    def is_open(self) -> bool:
+        return not self._closed
+
+    @property
+    def in_waiting(self) -> int:
+        with self._monitor._cond:
+            return len(self._buf)
+
+    def write(self, data: bytes) -> int:
+        self._check_open()
+        return self._monitor._write(bytes(data), self.owner)
+
+    def flush(self) -> None:
+        self._check_open()
+        self._monitor._flush()
+
+    def read(self, size: int = 1) -> bytes:
+        """Read up to ``size`` bytes, waiting up to ``timeout`` for the first one."""
+        self._check_open()
+        deadline = None if self.timeout is None else time.time() + self.timeout
+        with self._monitor._cond:
+            while not self._buf and self._monitor.running:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._monitor._cond.wait(remaining)
+            data = bytes(self._buf[:size])
+            del self._buf[:size]
+        return data
+
+    def readinto(self, buf) -> int:
+        data = self.read(len(buf))
+        buf[:len(data)] = data
+        return len(data)
+
+    def readline(self) -> bytes:
+        line = bytearray()
+        while not line.endswith(b"\n"):
+            data = self.read(1)
+            if not data:
+                break
+            line += data
+        return bytes(line)
+
+    def reset_input_buffer(self) -> None:
+        with self._monitor._cond:
+            self._buf.clear()
+
+    def reset_output_buffer(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._monitor._release(self)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise SerialMonitorError(f"Lease on {self.port} is closed")
+
+    def __enter__(self) -> "PortLease":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ======================== Monitor ========================
+
+class SerialMonitor:
+    """Owns a serial port and records everything it receives.
+
+    A read error (e.g. the port vanishing while the device resets) does not
+    end the monitor: the port is reopened with a backoff until it comes
+    back or :meth:`stop` is called.
+
+    Args:
+        port: Serial port identifier.
+        baudrate: Baud rate.
+        log_path: Rotating log file (None = no file).
+        ring_bytes: Bytes of history kept in memory.
+        max_file_bytes: Size at which the log file rotates.
+        backup_count: Rotated files kept.
+        serial_port: Already open pyserial object to use instead of opening ``port``.
+    """
+
+    def __init__(self, port: str, baudrate: int = 115200,
+                 log_path: Optional[Union[str, Path]] = None,
+                 ring_bytes: int = MONITOR_RING_BYTES,
+                 max_file_bytes: int = MONITOR_FILE_BYTES,
+                 backup_count: int = MONITOR_FILE_BACKUPS,
+                 serial_port: Any = None):
+        self.port = port
+        self.baudrate = baudrate
+        self.log_path = Path(log_path) if log_path else None
+        self.ring_bytes = ring_bytes
+        self._ser = serial_port
+        self._chunks: deque = deque()
+        self._ring_size = 0
+        self._rx_total = 0
+        self._cond = threading.Condition()
+        self._lease: Optional[PortLease] = None
+        self._lease_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._file_log: Optional[logging.Logger] = None
+        self._handler: Optional[logging.Handler] = None
+        self._max_file_bytes = max_file_bytes
+        self._backup_count = backup_count
+        self.running = False
+        self.error: Optional[str] = None
+        self.reconnects = 0
+        self.started_at: Optional[float] = None
+
+    # -- lifecycle --
+
+    def start(self) -> "SerialMonitor":
+        if self.running:
+            return self
+        if self._ser is None:
+            from .serial import _open_connection
+            self._ser = _open_connection(self.port, self.baudrate, timeout=0.05, direct=True)
+        if self.log_path:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._handler = logging.handlers.RotatingFileHandler(
+                self.log_path, maxBytes=self._max_file_bytes,
+                backupCount=self._backup_count, encoding="utf-8")
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+            self._file_log = logging.getLogger(f"utfw.serial.monitor.{id(self)}")
+            self._file_log.propagate = False
+            self._file_log.setLevel(logging.INFO)
+            self._file_log.addHandler(self._handler)
+        self.running = True
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._reader, daemon=True,
+                                        name=f"utfw-serial-monitor-{self.port}")
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self._cond:
+            if not self.running:
+                return
+            self.running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        try:
+            self._ser.close()
+        except Exception:
+            pass
+        if self._handler is not None:
+            self._file_log.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+
+    def _reader(self) -> None:
+        while self.running:
+            ser = self._ser
+            try:
+                data = ser.read(max(1, ser.in_waiting))
+                if data and ser.in_waiting:
+                    data += ser.read(ser.in_waiting)
+            except Exception as exc:
+                if not self.running:
+                    return
+                self.error = f"{type(exc).__name__}: {exc}"
+                self._reconnect()
+                continue
+            if data:
+                self._record(data, "rx")
+
+    def _reconnect(self) -> None:
+        """Reopen the port after a read error, retrying until it is back or stop() is called."""
+        logger = get_active_logger()
+        if logger:
+            logger.warn(f"[MONITOR] {self.port} lost ({self.error}), reconnecting")
+        try:
+            self._ser.close()
+        except Exception:
+            pass
+        delay = RECONNECT_MIN_S
+        while True:
+            with self._cond:
+                if not self.running:
+                    return
+                self._cond.wait(delay)
+                if not self.running:
+                    return
+            try:
+                with self._write_lock:
+                    self._ser.open()
+            except Exception as exc:
+                self.error = f"{type(exc).__name__}: {exc}"
+                delay = min(delay * 2, RECONNECT_MAX_S)
+                continue
+            self.error = None
+            self.reconnects += 1
+            if logger:
+                logger.info(f"[MONITOR] {self.port} reconnected")
+            return
+
+    def _record(self, data: bytes, direction: str, owner: Optional[str] = None) -> None:
+        now = time.time()
+        with self._cond:
+            if direction == "rx":
+                lease = self._lease
+                owner = lease.owner if lease else None
+                if lease is not None:
+                    lease._feed(data)
+                chunk = MonitorChunk(now, self._rx_total, data, direction, owner)
+                self._rx_total += len(data)
+            else:
+                chunk = MonitorChunk(now, self._rx_total, data, direction, owner)
+            self._chunks.append(chunk)
+            self._ring_size += len(data)
+            while self._ring_size > self.ring_bytes and len(self._chunks) > 1:
+                self._ring_size -= len(self._chunks.popleft().data)
+            self._cond.notify_all()
+        if self._file_log is not None:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            text = data.decode("utf-8", errors="replace").encode("unicode_escape").decode("ascii")
+            self._file_log.info(f"{stamp}.{int(now * 1000) % 1000:03d} {direction.upper()} "
+                                f"[{owner or '-'}] {text}")
+
+    # -- lending --
+
+    def borrow(self, owner: str = "command", timeout: Optional[float] = 2.0,
+               wait: Optional[float] = None) -> PortLease:
+        """Lend the port to a command; bytes received from now on go to the lease too.
+
+        Args:
+            owner: Label recorded with the bytes received during the lease.
+            timeout: ``read()`` timeout of the lease.
+            wait: Seconds to wait for a previous lease (None = forever).
+        """
+        if not self.running:
+            raise SerialMonitorError(f"Monitor on {self.port} is not running"
+                                     + (f" ({self.error})" if self.error else ""))
+        if not self._lease_lock.acquire(timeout=-1 if wait is None else wait):
+            raise SerialMonitorError(f"Port {self.port} is still lent to "
+                                     f"'{self._lease.owner if self._lease else '?'}'")
+        lease = PortLease(self, owner, timeout)
+        with self._cond:
+            self._lease = lease
+        return lease
+
+    def _release(self, lease: PortLease) -> None:
+        with self._cond:
+            if self._lease is not lease:
+                return
+            self._lease = None
+        self._lease_lock.release()
+
+    def _write(self, data: bytes, owner: Optional[str]) -> int:
+        with self._write_lock:
+            self._record(data, "tx", owner)
+            return self._ser.write(data)
+
+    def _flush(self) -> None:
+        with self._write_lock:
+            self._ser.flush()
+
+    def write(self, data: bytes, owner: str = "monitor") -> int:
+        """Transmit without borrowing the port (responses are not captured separately)."""
+        return self._write(bytes(data), owner)
+
+    # -- record access --
+
+    @property
+    def bytes_received(self) -> int:
+        return self._rx_total
+
+    def chunks(self, start: Optional[float] = None, end: Optional[float] = None,
+               direction: Optional[str] = "rx",
+               include_leased: bool = True) -> List[MonitorChunk]:
+        """Return recorded chunks with ``start <= timestamp <= end``."""
+        with self._cond:
+            chunks = list(self._chunks)
+        if start is not None:
+            chunks = chunks[bisect.bisect_left([c.timestamp for c in chunks], start):]
+        return [c for c in chunks
+                if (end is None or c.timestamp <= end)
+                and (direction is None or c.direction == direction)
+                and (include_leased or c.owner is None)]
+
+    def text(self, start: Optional[float] = None, end: Optional[float] = None,
+             include_leased: bool = True) -> str:
+        """Received text within a time window."""
+        return b"".join(c.data for c in self.chunks(start, end, "rx", include_leased)
+                        ).decode("utf-8", errors="replace")
+
+    def find(self, pattern: Union[str, "re.Pattern"], start: Optional[float] = None,
+             end: Optional[float] = None, include_leased: bool = True,
+             regex: bool = True) -> List[Tuple[float, str]]:
+        """Find a pattern in the received stream within a time window.
+
+        Matches spanning chunk boundaries are found; each match is reported
+        with the timestamp of the chunk holding its first byte.
+
+        Returns:
+            List of ``(timestamp, matched text)``.
+        """
+        chunks = self.chunks(start, end, "rx", include_leased)
+        if not chunks:
+            return []
+        starts, texts, pos = [], [], 0
+        for c in chunks:
+            piece = c.data.decode("utf-8", errors="replace")
+            starts.append(pos)
+            texts.append(piece)
+            pos += len(piece)
+        text = "".join(texts)
+        if regex:
+            rx = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
+            spans = [(m.start(), m.group(0)) for m in rx.finditer(text)]
+        else:
+            spans, idx = [], text.find(pattern)
+            while idx >= 0:
+                spans.append((idx, pattern))
+                idx = text.find(pattern, idx + 1)
+        return [(chunks[bisect.bisect_right(starts, s) - 1].timestamp, m) for s, m in spans]
+
+    def wait_for(self, pattern: str, timeout: float = 10.0,
+                 since: Optional[float] = None) -> Tuple[float, str]:
+        """Block until the pattern appears after ``since`` (default: now)."""
+        since = time.time() if since is None else since
+        deadline = time.time() + timeout
+        while True:
+            found = self.find(pattern, since)
+            if found:
+                return found[0]
+            remaining = deadline - time.time()
+            if remaining <= 0 or not self.running:
+                raise SerialMonitorError(f"Pattern '{pattern}' not seen on {self.port} "
+                                         f"within {timeout}s")
+            with self._cond:
+                self._cond.wait(min(remaining, 0.2))
+
+
+# ======================== Registry ========================
+
+def get_monitor(port: str) -> Optional[SerialMonitor]:
+    """Return the running monitor that owns ``port``, or None."""
+    with _MONITORS_LOCK:
+        mon = _MONITORS.get(port)
+    return mon if mon is not None and mon.running else None
+
+
+def borrow_port(port: str, owner: str = "command",
+                timeout: Optional[float] = 2.0,
+                wait: Optional[float] = BORROW_WAIT_S) -> Optional[PortLease]:
+    """Borrow ``port`` from its monitor, or return None if it is not monitored.
+
+    Raises:
+        SerialMonitorError: If another lease is still held after ``wait``
+            seconds (None waits forever).
+    """
+    mon = get_monitor(port)
+    return mon.borrow(owner, timeout, wait) if mon is not None else None
+
+
+def open_monitor(port: str, baudrate: int = 115200,
+                 log_path: Optional[Union[str, Path]] = None,
+                 ring_bytes: int = MONITOR_RING_BYTES,
+                 max_file_bytes: int = MONITOR_FILE_BYTES,
+                 backup_count: int = MONITOR_FILE_BACKUPS,
+                 serial_port: Any = None) -> SerialMonitor:
+    """Start a monitor on ``port`` and register it with the running test.
+
+    Inside a test the monitor is stopped automatically at teardown.
+    """
+    with _MONITORS_LOCK:
+        if port in _MONITORS and _MONITORS[port].running:
+            raise SerialMonitorError(f"Port {port} is already monitored")
+    mon = SerialMonitor(port, baudrate, log_path, ring_bytes, max_file_bytes,
+                        backup_count, serial_port).start()
+    with _MONITORS_LOCK:
+        _MONITORS[port] = mon
+    fw = get_active_framework()
+    if fw is not None:
+        fw.register_resource(f"{_MONITOR_RESOURCE_PREFIX}{port}", mon,
+                             lambda _m: _end_monitor(port))
+    return mon
+
+
+def _end_monitor(port: str) -> Optional[SerialMonitor]:
+    with _MONITORS_LOCK:
+        mon = _MONITORS.pop(port, None)
+    if mon is not None:
+        mon.stop()
+    return mon
+
+
+def close_monitor(port: str) -> None:
+    """Stop the monitor on ``port`` (no-op if there is none)."""
+    fw = get_active_framework()
+    if fw is not None:
+        fw.release_resource(f"{_MONITOR_RESOURCE_PREFIX}{port}")
+    _end_monitor(port)
+
+
+def step_window(start_step: Optional[str] = None,
+                end_step: Optional[str] = None) -> Tuple[Optional[float], Optional[float]]:
+    """Resolve step IDs to a wall-clock window.
+
+    ``start_step`` maps to the start of that step (or of its first
+    sub-step, so "3" covers "3.1", "3.2", ...), ``end_step`` to the end of
+    that step, or "now" while it is still running. None leaves the bound
+    open.
+
+    Raises:
+        SerialMonitorError: If a step has not started yet.
+    """
+    fw = get_active_framework()
+    if fw is None and (start_step or end_step):
+        raise SerialMonitorError("Step windows need a running TestFramework")
+
+    def matching(step_id: str) -> List[str]:
+        ids = [s for s in fw.step_started if s == step_id or s.startswith(step_id + ".")]
+        if not ids:
+            raise SerialMonitorError(f"Step {step_id} has not started")
+        return ids
+
+    start = end = None
+    if start_step:
+        start = min(fw.step_started[s] for s in matching(start_step))
+    if end_step:
+        ids = set(matching(end_step))
+        finished = {s.step_number: s for s in fw.test_steps if s.step_number in ids}
+        if len(finished) < len(ids):
+            end = time.time()
+        else:
+            end = max((s.start_time or 0.0) + s.duration for s in finished.values())
+    return start, end
+
+
+# ======================== TestAction Factories ========================
+
+def start_monitor(
+        name: str,
+        port: str,
+        baudrate: int = 115200,
+        log_path: Optional[str] = None,
+        ring_bytes: int = MONITOR_RING_BYTES,
+        max_file_bytes: int = MONITOR_FILE_BYTES,
+        backup_count: int = MONITOR_FILE_BACKUPS,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction that starts a background monitor on a port.
+
+    From then on every serial function using ``port`` borrows it from
+    the monitor. The monitor is stopped by :func:`stop_monitor` or at
+    teardown.
+
+    Args:
+        name: Human-readable name for the test action.
+        port: Serial port identifier.
+        baudrate: Baud rate.
+        log_path: Rotating log file; defaults to
+            ``<reports dir>/serial_monitor_<port>.log`` inside a test.
+        ring_bytes: Bytes of history kept in memory.
+        max_file_bytes: Size at which the log file rotates.
+        backup_count: Rotated files kept.
+        negative_test: Mark as negative test.
+    """
+
+    def execute():
+        logger = get_active_logger()
+        path = log_path
+        fw = get_active_framework()
+        if path is None and fw is not None and fw.reports_dir:
+            safe = re.sub(r"[^A-Za-z0-9_.-]", "_", port)
+            path = str(Path(fw.reports_dir) / f"serial_monitor_{safe}.log")
+
+        if logger:
+            logger.info("")
+            logger.info("=" * 80)
+            logger.info("[SERIAL] MONITOR START")
+            logger.info("=" * 80)
+            logger.info(f"  Port:     {port}")
+            logger.info(f"  Baudrate: {baudrate}")
+            logger.info(f"  Ring:     {ring_bytes} bytes")
+            logger.info(f"  Log file: {path or '-'}")
+
+        mon = open_monitor(port, baudrate, path, ring_bytes, max_file_bytes, backup_count)
+
+        if logger:
+            logger.info("✓ Monitor running")
+            logger.info("=" * 80)
+        return mon
+
+    metadata = {
+        'display_command': f"Monitor {port} @ {baudrate}",
+        'display_expected': 'running',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def stop_monitor(name: str, port: str, negative_test: bool = False) -> TestAction:
+    """Create a TestAction that stops the monitor on a port.
+
+    Returns:
+        TestAction returning the number of bytes the monitor received.
+    """
+
+    def execute():
+        logger = get_active_logger()
+        mon = get_monitor(port)
+        received = mon.bytes_received if mon else 0
+        close_monitor(port)
+        if logger:
+            logger.info(f"[SERIAL] Monitor on {port} stopped ({received} bytes received)")
+        return received
+
+    metadata = {
+        'display_command': f"Stop monitor {port}",
+        'display_expected': 'stopped',
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
+
+
+def assert_seen(
+        name: str,
+        port: str,
+        pattern: str,
+        between: Optional[Tuple[Optional[str], Optional[str]]] = None,
+        min_count: int = 1,
+        max_count: Optional[int] = None,
+        negative: bool = False,
+        include_leased: bool = True,
+        regex: bool = True,
+        negative_test: bool = False
+) -> TestAction:
+    """Create a TestAction asserting the monitor saw a pattern in a step window.
+
+    Args:
+        name: Human-readable name for the test action.
+        port: Monitored port.
+        pattern: Regular expression (or literal with ``regex=False``).
+        between: ``(start_step, end_step)`` IDs, e.g. ``("3", "5")``; None or
+            a None bound means since monitor start / until now.
+        min_count: Minimum number of matches.
+        max_count: Maximum number of matches.
+        negative: Assert the pattern was NOT seen.
+        include_leased: Also search bytes received while a command held the
+            port (False = only unsolicited output).
+        regex: Treat ``pattern`` as a regular expression.
+        negative_test: Mark as negative test.
+
+    Returns:
+        TestAction returning the list of ``(timestamp, match)``.
+    """
+    start_step, end_step = between or (None, None)
+
+    def execute():
+        logger = get_active_logger()
+        mon = get_monitor(port)
+        if mon is None:
+            raise SerialMonitorError(f"No monitor is running on {port}")
+        start, end = step_window(start_step, end_step)
+        found = mon.find(pattern, start, end, include_leased, regex)
+        window = (f"{'step ' + start_step if start_step else 'monitor start'} .. "
+                  f"{'step ' + end_step if end_step else 'now'}")
+
+        if logger:
+            logger.info("")
+            logger.info("[SERIAL] MONITOR ASSERTION")
+            logger.info(f"  Pattern: {pattern}")
+            logger.info(f"  Window:  {window}")
+            logger.info(f"  Matches: {len(found)}")
+            for ts, text in found[:20]:
+                logger.info(f"    {time.strftime('%H:%M:%S', time.localtime(ts))}"
+                            f".{int(ts * 1000) % 1000:03d}  {text!r}")
+
+        if negative:
+            if found:
+                raise SerialMonitorError(
+                    f"Pattern '{pattern}' seen {len(found)} time(s) in {window} on {port}")
+        elif len(found) < min_count or (max_count is not None and len(found) > max_count):
+            expected = f">= {min_count}" if max_count is None else f"{min_count}..{max_count}"
+            raise SerialMonitorError(
+                f"Pattern '{pattern}' seen {len(found)} time(s) in {window} on {port}, "
+                f"expected {expected}")
+        if logger:
+            logger.info("✓ Monitor assertion passed")
+        return found
+
+    metadata = {
+        'display_command': f"Monitor {port}: {pattern}",
+        'display_expected': ("absent" if negative else f">= {min_count}")
+                            + (f" in steps {start_step}..{end_step}" if between else ""),
+    }
+    return TestAction(name, execute, negative_test=negative_test, metadata=metadata)
@@ -23,12 +23,16 @@ from typing import Optional, Dict, List, Tuple, Any, Union
 
 from ...core.logger import get_active_logger
 from ...core.core import TestAction
+from ...core.validation import compile_patterns, match_table, scan_response
+from .monitor import PortLease, borrow_port, get_monitor
 
 DEBUG = False  # Set to True to enable debug prints
 
 # Global response caching for validation chaining
 _LAST_RESPONSE: Optional[str] = None
 
+_CH_STATE_RE = re.compile(r"CH\s*([1-8])\s*[=:]\s*(ON|OFF)", re.IGNORECASE)
+
 
 def _format_hex_dump(data: bytes, bytes_per_line: int = 16) -> str:
     """Format binary data as a detailed hex dump with ASCII preview.
@@ -109,30 +113,48 @@ def _ensure_pyserial():
         raise ImportError("pyserial is required. Install with: pip install pyserial")
 
 
-def _open_connection(port: str, baudrate: int = 115200, timeout: float = 2.0):
+def _open_connection(port: str, baudrate: int = 115200, timeout: float = 2.0,
+                     direct: bool = False):
     """Open a serial connection with proper configuration and logging.
 
     This function opens a serial port with the specified parameters and
     configures it for reliable communication. It also logs the connection
-    event using the active logger.
+    event using the active logger. If a serial monitor owns the port, the
+    port is borrowed from it instead (see ``monitor.py``).
 
     Args:
         port (str): Serial port identifier (e.g., "COM3", "/dev/ttyUSB0").
         baudrate (int, optional): Communication baud rate. Defaults to 115200.
         timeout (float, optional): Read timeout in seconds. Defaults to 2.0.
+        direct (bool, optional): Always open the port itself. Defaults to False.
 
     Returns:
-        serial.Serial: Configured and opened serial port object.
+        serial.Serial: Configured and opened serial port object (or a
+        ``PortLease`` behaving like one).
 
     Raises:
-        SerialTestError: If the port cannot be opened or configured.
+        SerialTestError: If the port cannot be opened or configured, or a
+            serial monitor holds it at a different baud rate.
     """
+    logger = get_active_logger()
+
+    if not direct:
+        monitor = get_monitor(port)
+        if monitor is not None and monitor.baudrate != baudrate:
+            raise SerialTestError(
+                f"{port} is held by a serial monitor at {monitor.baudrate} baud, "
+                f"requested {baudrate}; stop the monitor before changing the baud rate"
+            )
+        lease = borrow_port(port, timeout=timeout)
+        if lease is not None:
+            if logger:
+                logger.info(f"[SERIAL] Borrowing {port} from the running monitor")
+            return lease
+
     _ensure_pyserial()
     import serial.tools.list_ports as list_ports_check
     import serial as pyserial
 
-    logger = get_active_logger()
-
     if logger:
         logger.info("=" * 80)
         logger.info("[SERIAL] OPENING CONNECTION")
@@ -209,6 +231,18 @@ def _open_connection(port: str, baudrate: int = 115200, timeout: float = 2.0):
         raise SerialTestError(error_msg)
 
 
+def _note_eeprom_command(port: str, command: str, response: str = "") -> bool:
+    """Let the session EEPROM image cache see a command sent to the device."""
+    from .eeprom_dump import note_command
+    return note_command(port, command, response)
+
+
+def _invalidate_eeprom_image(port: Optional[str], reason: str) -> None:
+    """Mark the session EEPROM image of ``port`` (None = all ports) as stale."""
+    from .eeprom_dump import invalidate_eeprom_cache
+    invalidate_eeprom_cache(port, reason)
+
+
 def send_command(port: str, command: str, baudrate: int = 115200, timeout: float = 2.0) -> str:
     """Send a command via serial port and return the complete response.
 
@@ -259,6 +293,7 @@ def send_command(port: str, command: str, baudrate: int = 115200, timeout: float
         # Write command to serial port
         bytes_written = ser.write(cmd_bytes)
         ser.flush()
+        eeprom_touched = _note_eeprom_command(port, command)
 
         if logger:
             logger.info("")
@@ -325,6 +360,9 @@ def send_command(port: str, command: str, baudrate: int = 115200, timeout: float
                 logger.info(f"    {line}")
             logger.info("")
 
+        if not eeprom_touched:
+            _note_eeprom_command(port, command, text)
+
         _set_last_response(text)
         return text
 
@@ -362,8 +400,9 @@ def wait_for_reboot_and_ready(port: str, ready_token: str = "SYSTEM READY",
     This function monitors a serial port for a complete reboot sequence:
     1) Waits for the serial port to disappear (device starts rebooting).
     2) Waits for the serial port to reappear (device back after reboot).
-    3) After reconnection, opens the port and waits for the ready banner
-       containing the specified token.
+    3) After reconnection, opens the port (or borrows it from a running
+       monitor) and waits for the ready banner containing the specified
+       token.
     
     All steps are logged via the active logger.
     
@@ -396,6 +435,9 @@ def wait_for_reboot_and_ready(port: str, ready_token: str = "SYSTEM READY",
         logger.info(f"  Timeout:      {timeout}s")
         logger.info("")
 
+    # The firmware logs the reset and may rewrite EEPROM while booting
+    _invalidate_eeprom_image(port, "reboot")
+
     start_time = time.time()
     deadline = start_time + timeout
 
@@ -467,7 +509,8 @@ def wait_for_reboot_and_ready(port: str, ready_token: str = "SYSTEM READY",
             logger.info(f"  Attempt #{connection_attempts} (timeout: {remaining_time:.1f}s remaining)")
 
         try:
-            ser = serial.Serial(port=port, baudrate=baudrate, timeout=1.0)
+            ser = (borrow_port(port, owner="reboot", timeout=1.0)
+                   or serial.Serial(port=port, baudrate=baudrate, timeout=1.0))
         except Exception as e:
             if logger:
                 logger.info(f"[SERIAL] Connection attempt #{connection_attempts} failed: "
@@ -483,7 +526,14 @@ def wait_for_reboot_and_ready(port: str, ready_token: str = "SYSTEM READY",
             chunk_count = 0
             banner_found = False
 
-            while time.time() < deadline:
+            # A monitor may have recorded the banner before the lease started
+            mon = get_monitor(port) if isinstance(ser, PortLease) else None
+            if mon is not None and ready_token.lower() in mon.text(start_time).lower():
+                banner_found = True
+                if logger:
+                    logger.info(f"    ✓ Ready token '{ready_token}' seen by the monitor")
+
+            while not banner_found and time.time() < deadline:
                 if ser.in_waiting > 0:
                     chunk = ser.read(ser.in_waiting)
                     chunk_count += 1
@@ -581,11 +631,9 @@ def parse_sysinfo_response(response: str) -> Dict[str, str]:
         logger.info("")
 
     sysinfo = {}
-    lines = response.replace("\r\n", "\n").replace("\r", "\n").splitlines()
 
-    for line in lines:
-        line = line.strip()
-        if not line or line in ["SYSTEM INFORMATION:", "Clock Sources :"]:
+    for line in match_table(response).lines:
+        if line in ["SYSTEM INFORMATION:", "Clock Sources :"]:
             continue
 
         if line.startswith("[ECHO]"):
@@ -763,20 +811,18 @@ def parse_get_ch_all(response: str) -> Dict[int, bool]:
         logger.info(f"[SERIAL] parse_get_ch_all() called")
         logger.info(f"[SERIAL]   Response length: {len(response)} characters")
 
-    lines = response.replace("\r\n", "\n").replace("\r", "\n").splitlines()
+    lines = match_table(response).lines
     ch_map: Dict[int, bool] = {}
-    pat = re.compile(r"CH\s*([1-8])\s*[=:]\s*(ON|OFF)", re.IGNORECASE)
 
     if logger:
         logger.info(f"[SERIAL] Parsing {len(lines)} lines for channel states")
 
-    for raw in lines:
-        s = raw.strip()
+    for s in lines:
         # strip optional "[ECHO]" prefix if present
         if s.startswith("[ECHO]"):
             s = s[6:].strip()
 
-        m = pat.search(s)
+        m = _CH_STATE_RE.search(s)
         if not m:
             continue
         ch = int(m.group(1))
@@ -1168,8 +1214,10 @@ def validate_single_token(
         ...     "Check for HELP command", response_text, "HELP"
         ... )
     """
+    patterns = compile_patterns([token])
+
     def execute():
-        if token not in response:
+        if not scan_response(response, patterns).has(token):
             raise SerialTestError(f"Missing required token: {token}")
         return True
     return TestAction(name, execute, negative_test=negative_test)
@@ -1206,9 +1254,11 @@ def validate_tokens(
         ...     ["HELP", "SYSINFO", "REBOOT", "NETINFO"]
         ... )
     """
+    patterns = compile_patterns(tokens)
+
     def execute():
         text = _use_response(response)
-        missing = [t for t in tokens if t not in text]
+        missing = scan_response(text, patterns).missing()
         if missing:
             raise SerialTestError(f"Missing required tokens: {', '.join(missing)}")
         return True
@@ -1439,38 +1489,159 @@ def factory_reset_complete(
 
 # ======================== EEPROM Dump Helpers ========================
 
-def _read_until_markers(port: str,
-                        baudrate: int,
-                        command: str,
-                        want_start: str,
-                        want_end: str,
-                        per_read_timeout: float = 1.0,
-                        overall_timeout: float = 20.0,
-                        read_grace: float = 1.0) -> str:
-    """Send command and read until both start and end markers appear.
-    
-    This internal helper function sends a command and continues reading
-    until both start and end markers are detected in the response. It's
-    used specifically for EEPROM dump operations that have defined
-    start/end boundaries.
-    
+class MarkerScanner:
+    """Incremental start/end marker search over a growing byte stream.
+
+    Each :meth:`feed` only searches the newly received bytes plus an overlap
+    of ``len(marker) - 1`` bytes, so the total work stays linear in the
+    stream size no matter how many chunks arrive. Markers are matched on the
+    raw UTF-8 bytes; nothing is decoded until :meth:`text` or :meth:`block`
+    is called.
+
+    Several marker pairs may be tracked at once. For each pair the first
+    start marker is located, then the first end marker after it. An empty
+    start marker matches at offset 0; an empty end marker never completes,
+    so the read runs until its timeout.
+
+    Args:
+        pairs (List[Tuple[str, str]]): ``(start_marker, end_marker)`` pairs.
+
+    Example:
+        >>> scanner = MarkerScanner([("EE_DUMP_START", "EE_DUMP_END")])
+        >>> scanner.feed(b"junk\\r\\nEE_DUMP_START\\r\\n0x0000 FF")
+        False
+        >>> scanner.feed(b"\\r\\nEE_DUMP_END\\r\\n")
+        True
+        >>> scanner.inner(0)
+        '\\r\\n0x0000 FF\\r\\n'
+    """
+
+    def __init__(self, pairs: List[Tuple[str, str]]):
+        if not pairs:
+            raise SerialTestError("MarkerScanner needs at least one marker pair")
+        self.pairs = [(s or "", e or "") for s, e in pairs]
+        self._markers = [(s.encode("utf-8"), e.encode("utf-8")) for s, e in self.pairs]
+        self.buf = bytearray()
+        # Byte offsets per pair: start of start marker / end of end marker
+        self.starts: List[Optional[int]] = [0 if not s else None for s, _ in self._markers]
+        self.ends: List[Optional[int]] = [None] * len(self._markers)
+        self._next = [0] * len(self._markers)
+
+    def feed(self, chunk: bytes) -> bool:
+        """Append received bytes and advance the marker search.
+
+        Args:
+            chunk (bytes): Newly received bytes.
+
+        Returns:
+            bool: True once every pair has both markers.
+        """
+        if chunk:
+            self.buf += chunk
+            for i, (start, end) in enumerate(self._markers):
+                if self.ends[i] is None:
+                    self._advance(i, start, end)
+        return self.complete
+
+    def _advance(self, i: int, start: bytes, end: bytes) -> None:
+        buf = self.buf
+        if self.starts[i] is None:
+            pos = buf.find(start, self._next[i])
+            if pos < 0:
+                self._next[i] = max(self._next[i], len(buf) - len(start) + 1)
+                return
+            self.starts[i] = pos
+            self._next[i] = pos + len(start)
+        if not end:
+            return
+        pos = buf.find(end, self._next[i])
+        if pos < 0:
+            self._next[i] = max(self._next[i], len(buf) - len(end) + 1)
+            return
+        self.ends[i] = pos + len(end)
+
+    @property
+    def complete(self) -> bool:
+        """True when every pair's end marker has been seen."""
+        return all(e is not None for e in self.ends)
+
+    @property
+    def last_end(self) -> Optional[int]:
+        """Byte offset just past the last end marker seen, if any."""
+        seen = [e for e in self.ends if e is not None]
+        return max(seen) if seen else None
+
+    def span(self, index: int = 0) -> Tuple[Optional[int], Optional[int]]:
+        """Return ``(start, end)`` byte offsets of a pair, markers included."""
+        return self.starts[index], self.ends[index]
+
+    def block(self, index: int = 0) -> Optional[str]:
+        """Decoded text of a pair including both markers, or None if incomplete."""
+        start, end = self.span(index)
+        if start is None or end is None:
+            return None
+        return bytes(self.buf[start:end]).decode("utf-8", errors="replace")
+
+    def inner(self, index: int = 0) -> Optional[str]:
+        """Decoded text strictly between a pair's markers, or None if incomplete."""
+        start, end = self.span(index)
+        if start is None or end is None:
+            return None
+        lo = start + len(self._markers[index][0])
+        hi = end - len(self._markers[index][1])
+        return bytes(self.buf[lo:hi]).decode("utf-8", errors="replace")
+
+    def text(self) -> str:
+        """Decode the whole captured stream once."""
+        return self.buf.decode("utf-8", errors="replace")
+
+
+def read_delimited_block(port: str,
+                         command: str,
+                         markers: Union[Tuple[str, str], List[Tuple[str, str]]],
+                         baudrate: int = 115200,
+                         per_read_timeout: float = 1.0,
+                         overall_timeout: float = 20.0,
+                         read_grace: float = 1.0,
+                         log_label: str = "block") -> MarkerScanner:
+    """Send a command and stream the reply until all marker pairs are closed.
+
+    Incoming bytes are fed to a :class:`MarkerScanner`, so detection cost is
+    linear in the dump size. Once the last end marker has been seen the read
+    stops as soon as the rest of that line has arrived, or after
+    ``read_grace`` seconds at most, instead of always idling for the full
+    grace period. Anything already buffered at that point is drained without
+    waiting.
+
     Args:
         port (str): Serial port identifier.
-        baudrate (int): Serial communication baud rate.
-        command (str): Command to send.
-        want_start (str): Start marker to wait for.
-        want_end (str): End marker to wait for.
+        command (str): Command to send (CRLF is appended).
+        markers: One ``(start, end)`` pair or a list of pairs.
+        baudrate (int, optional): Serial communication baud rate.
+            Defaults to 115200.
         per_read_timeout (float, optional): Per-read timeout. Defaults to 1.0.
-        overall_timeout (float, optional): Overall operation timeout. Defaults to 20.0.
-        read_grace (float, optional): Grace period after end marker. Defaults to 1.0.
-        
+        overall_timeout (float, optional): Overall operation timeout.
+            Defaults to 20.0.
+        read_grace (float, optional): Maximum wait for the end marker's line
+            terminator. Defaults to 1.0.
+        log_label (str, optional): Label used in the RX log line.
+            Defaults to "block".
+
     Returns:
-        str: Complete captured text including both markers.
+        MarkerScanner: Scanner holding the raw capture and marker offsets.
+            Use ``.text()`` for the full capture and ``.inner(i)`` /
+            ``.block(i)`` for individual blocks.
+
+    Example:
+        >>> scan = read_delimited_block("COM3", "DUMP_EEPROM",
+        ...                             ("EE_DUMP_START", "EE_DUMP_END"))
+        >>> body = scan.inner(0)
     """
+    pairs = [markers] if isinstance(markers, tuple) else list(markers)
+    scanner = MarkerScanner(pairs)
     ser = _open_connection(port, baudrate, per_read_timeout)
     logger = get_active_logger()
     try:
-        # Send command
         payload = (command.strip() + "\r\n")
         if logger:
             logger.info(f"[SERIAL TX] bytes={len(payload.encode('utf-8'))}")
@@ -1478,37 +1649,38 @@ def _read_until_markers(port: str,
         ser.write(payload.encode("utf-8"))
         ser.flush()
 
-        # Read loop
-        buf = bytearray()
-        got_start = False
-        got_end = False
+        deadline = time.time() + overall_timeout
         t_end_seen: Optional[float] = None
-        deadline = time.time() + max(overall_timeout, 6.0)
 
         old_timeout = ser.timeout
         ser.timeout = per_read_timeout
         try:
             while time.time() < deadline:
-                chunk = ser.read(4096)
-                if chunk:
-                    buf.extend(chunk)
-                    text_so_far = buf.decode("utf-8", errors="replace")
-
-                    if not got_start and (not want_start or want_start in text_so_far):
-                        got_start = True
-
-                    if got_start and want_end and want_end in text_so_far and not got_end:
-                        got_end = True
+                if t_end_seen is None:
+                    waiting = ser.in_waiting
+                    chunk = ser.read(min(waiting, 65536) if waiting else 1)
+                    if scanner.feed(chunk):
                         t_end_seen = time.time()
-
-                if got_end and t_end_seen is not None:
-                    if time.time() - t_end_seen >= read_grace:
+                if t_end_seen is not None:
+                    # Stop once the end marker's line is terminated
+                    if scanner.buf.find(b"\n", scanner.last_end) >= 0:
                         break
-            text = buf.decode("utf-8", errors="replace")
+                    remaining = read_grace - (time.time() - t_end_seen)
+                    if remaining <= 0:
+                        break
+                    ser.timeout = min(per_read_timeout, remaining)
+                    scanner.feed(ser.read(1))
+
+            waiting = ser.in_waiting
+            if waiting:
+                scanner.feed(ser.read(waiting))
+
             if logger:
-                logger.info(f"[SERIAL RX] eeprom-dump bytes={len(buf)}")
+                text = scanner.text()
+                logger.info(f"[SERIAL RX] {log_label} bytes={len(scanner.buf)} "
+                            f"complete={scanner.complete}")
                 logger.info(text.replace("\r", "\\r").replace("\n", "\\n\n"))
-            return text
+            return scanner
         finally:
             ser.timeout = old_timeout
     finally:
@@ -1519,11 +1691,108 @@ def _read_until_markers(port: str,
                 logger.info(f"[SERIAL] Closed port={port}")
 
 
+def _read_until_markers(port: str,
+                        baudrate: int,
+                        command: str,
+                        want_start: str,
+                        want_end: str,
+                        per_read_timeout: float = 1.0,
+                        overall_timeout: float = 20.0,
+                        read_grace: float = 1.0) -> str:
+    """Send command and read until both start and end markers appear.
+    
+    Thin wrapper over :func:`read_delimited_block` for a single marker pair,
+    kept for the EEPROM dump actions.
+    
+    Args:
+        port (str): Serial port identifier.
+        baudrate (int): Serial communication baud rate.
+        command (str): Command to send.
+        want_start (str): Start marker to wait for.
+        want_end (str): End marker to wait for.
+        per_read_timeout (float, optional): Per-read timeout. Defaults to 1.0.
+        overall_timeout (float, optional): Overall operation timeout. Defaults to 20.0.
+        read_grace (float, optional): Maximum wait after end marker. Defaults to 1.0.
+        
+    Returns:
+        str: Complete captured text including both markers.
+    """
+    scanner = read_delimited_block(
+        port, command, (want_start, want_end),
+        baudrate=baudrate,
+        per_read_timeout=per_read_timeout,
+        overall_timeout=max(overall_timeout, 6.0),
+        read_grace=read_grace,
+        log_label="eeprom-dump",
+    )
+    return scanner.text()
+
+
+def read_block(name: str,
+               port: str,
+               command: str,
+               start_marker: str,
+               end_marker: str,
+               baudrate: int = 115200,
+               include_markers: bool = True,
+               overall_timeout: float = 20.0,
+               negative_test: bool = False) -> TestAction:
+    """Create a TestAction that captures one marker-delimited block.
+
+    Generic counterpart of :func:`send_eeprom_dump_command` for any dump
+    command whose output is framed by start/end markers. The returned text
+    is also cached for the validation helpers.
+
+    Args:
+        name (str): Human-readable name for the test action.
+        port (str): Serial port identifier to use.
+        command (str): Command that produces the block.
+        start_marker (str): Start marker text.
+        end_marker (str): End marker text.
+        baudrate (int, optional): Serial communication baud rate.
+            Defaults to 115200.
+        include_markers (bool, optional): Return the markers with the block
+            body. Defaults to True.
+        overall_timeout (float, optional): Overall read timeout.
+            Defaults to 20.0.
+        negative_test (bool, optional): Mark as negative test.
+            Defaults to False.
+
+    Returns:
+        TestAction: TestAction that returns the block text.
+
+    Raises:
+        SerialTestError: When executed, if the end marker is not received.
+
+    Example:
+        >>> read_block("Dump log", "COM3", "DUMP_LOG", "LOG_START", "LOG_END")
+    """
+    def execute():
+        scanner = read_delimited_block(
+            port, command, (start_marker, end_marker),
+            baudrate=baudrate,
+            overall_timeout=overall_timeout,
+        )
+        if not scanner.complete:
+            missing = start_marker if scanner.starts[0] is None else end_marker
+            raise SerialTestError(f"'{command}': marker '{missing}' not received")
+        text = scanner.block(0) if include_markers else scanner.inner(0)
+        _set_last_response(text)
+        return text
+
+    metadata = {
+        "display_command": command,
+        "display_expected": f"{start_marker} ... {end_marker}",
+    }
+    return TestAction(name, execute, metadata=metadata, negative_test=negative_test)
+
+
 def send_eeprom_dump_command(
         name: str,
         port: str,
         baudrate: int = 115200,
-        negative_test: bool = False) -> TestAction:
+        negative_test: bool = False,
+        use_cache: bool = False) -> TestAction:
     """Create a TestAction that captures a complete EEPROM dump with markers.
     
     This TestAction factory creates an action that sends a DUMP_EEPROM command
@@ -1536,6 +1805,11 @@ def send_eeprom_dump_command(
         port (str): Serial port identifier to use.
         baudrate (int, optional): Serial communication baud rate.
             Defaults to 115200.
+        use_cache (bool, optional): Reuse the session EEPROM image when no
+            EEPROM-affecting command was sent since it was captured
+            (see eeprom_dump.cached_eeprom_image). Only UART commands, web
+            POSTs, SNMP sets and reboots are tracked, so leave this off when
+            the device may change EEPROM on its own. Defaults to False.
             
     Returns:
         TestAction: TestAction that returns the complete EEPROM dump text
@@ -1547,6 +1821,9 @@ def send_eeprom_dump_command(
         ... )
     """
     def execute():
+        if use_cache:
+            from .eeprom_dump import cached_eeprom_image
+            return cached_eeprom_image(port, baudrate).text
         # IMPORTANT: capture UNTIL both markers are present, and include them.
         return _read_until_markers(
             port=port,
@@ -1600,7 +1877,7 @@ negative_test: bool = False) -> TestAction:
 
 
 def analyze_eeprom_dump(name: str, port: str, baudrate: int, checks: str, reports_dir: Optional[str] = None,
-negative_test: bool = False) -> TestAction:
+negative_test: bool = False, mode: str = "hex", use_cache: bool = False) -> TestAction:
     """Create a TestAction that performs comprehensive EEPROM dump analysis.
     
     This TestAction factory creates an action that captures an EEPROM dump,
@@ -1609,9 +1886,9 @@ negative_test: bool = False) -> TestAction:
     handle the actual dump capture and parsing.
 
     The action performs:
-    1. EEPROM dump capture via utilities.parse_eeprom_data()
+    1. EEPROM dump capture and parsing via eeprom_dump.read_eeprom_image()
     2. Validation rules loading from JSON file
-    3. ASCII hexdump parsing into byte arrays
+    3. Raw/ASCII dump files written next to the report
     4. Validation execution (ascii/hex, pattern/regex/expect/contains)
     5. Summary report generation
 
@@ -1622,10 +1899,16 @@ negative_test: bool = False) -> TestAction:
         checks (str): Path to JSON file containing validation rules.
         reports_dir (Optional[str]): Base directory for reports. If None,
             uses the active logger's directory or falls back to TestCases/Reports.
+        mode (str, optional): Dump mode, "hex", "base64" or "auto"
+            (see eeprom_dump.read_eeprom_image). Defaults to "hex".
+        use_cache (bool, optional): Reuse the session EEPROM image when no
+            EEPROM-affecting command was sent since it was captured.
+            Defaults to False.
 
     Returns:
         TestAction: TestAction that returns a dictionary containing analysis
-            results including file paths, address ranges, and validation findings.
+            results including file paths, address ranges, gaps and validation
+            findings, plus the parsed ``image``.
     
     Example:
         >>> analysis_action = analyze_eeprom_dump(
@@ -1640,8 +1923,8 @@ negative_test: bool = False) -> TestAction:
         import re
         import inspect
         from pathlib import Path
-        from ...core import utilities
         from ...core.logger import get_active_logger
+        from .eeprom_dump import read_eeprom_image, cached_eeprom_image
 
         logger = get_active_logger()
         
@@ -1711,29 +1994,33 @@ negative_test: bool = False) -> TestAction:
         save_dir = base_reports / "EEPROM"
         save_dir.mkdir(parents=True, exist_ok=True)
 
-        # 1) Run helper to capture raw/ascii dumps (over serial)
+        # 1) Capture and parse the dump in-process (over serial)
         if logger:
             logger.info("[EEPROM] Step 1: Reading EEPROM dump from device")
             logger.info("-" * 80)
             logger.info(f"  Port:     {port}")
             logger.info(f"  Baudrate: {baudrate}")
+            logger.info(f"  Mode:     {mode}")
             logger.info(f"  Save Dir: {save_dir}")
             logger.info("")
         
-        parsed = utilities.parse_eeprom_data(port=port, baudrate=baudrate, save_to_dir=str(save_dir))
+        if use_cache:
+            image = cached_eeprom_image(port, baudrate, mode=mode)
+        else:
+            image = read_eeprom_image(port, baudrate, mode=mode)
         
         if logger:
             logger.info("✓ EEPROM dump retrieved")
             logger.info("")
-        ascii_text = (parsed.get("ascii") or "").replace("\r\n", "\n").replace("\r", "\n")
         raw_path = save_dir / "eeprom_dump_raw.log"
         ascii_path = save_dir / "eeprom_dump_ascii.log"
-
-        if not ascii_text.strip():
-            if ascii_path.exists():
-                ascii_text = ascii_path.read_text(encoding="utf-8")
-            if not ascii_text.strip():
-                raise SerialTestError("ASCII EEPROM dump is empty after helper processing.")
+        if image.source == "hex":
+            raw_lines = [ln.strip() for ln in image.text.splitlines()
+                         if ln.strip().lower().startswith("0x")]
+            raw_path.write_text("\n".join(raw_lines), encoding="utf-8")
+        else:
+            raw_path.write_text(image.hex_rows(), encoding="utf-8")
+        ascii_path.write_text("### EEPROM ASCII View\n" + image.ascii_table(), encoding="utf-8")
 
         # 2) Load checks JSON
         if logger:
@@ -1754,30 +2041,9 @@ negative_test: bool = False) -> TestAction:
             logger.info(f"✓ Loaded {len(check_list)} validation checks")
             logger.info("")
 
-        # 3) Parse ASCII hexdump into rows and contiguous image
-        hex_line_pat = re.compile(
-            r"^\s*(0x[0-9A-Fa-f]{4,})\s+((?:[0-9A-Fa-f]{2}\s+){15}[0-9A-Fa-f]{2})\s+\|.*\|\s*$"
-        )
-        lines = [ln for ln in ascii_text.split("\n") if ln.strip()]
-        rows = []
-        for ln in lines:
-            m = hex_line_pat.match(ln)
-            if not m:
-                continue
-            addr_s, hex_block = m.groups()
-            addr = int(addr_s, 16)
-            data = bytes(int(bt, 16) for bt in hex_block.split())
-            if len(data) != 16:
-                continue
-            rows.append((addr, data))
-        if not rows:
-            raise SerialTestError("No valid hexdump rows recognized in ASCII dump.")
-
-        min_addr = min(a for a, _ in rows)
-        max_addr = max(a + len(b) - 1 for a, b in rows)
-        image = bytearray([0xFF] * (max_addr + 1))
-        for a, b in rows:
-            image[a:a+len(b)] = b
+        # 3) Address span of the parsed image
+        min_addr = image.start
+        max_addr = image.end - 1
 
         # 4) Execute checks
         if logger:
@@ -1794,9 +2060,7 @@ negative_test: bool = False) -> TestAction:
                 length = addr_end - addr_start + 1
             if length is None:
                 raise _LocalError("either length or end must be provided")
-            s = max(0, min(addr_start, len(image)))
-            e = max(0, min(addr_start + length, len(image)))
-            return bytes(image[s:e])
+            return image.slice(addr_start, length)
 
         for idx, chk in enumerate(check_list, 1):
             try:
@@ -1957,14 +2221,23 @@ negative_test: bool = False) -> TestAction:
             
             logger.info(f"  Address Range:  0x{min_addr:04X} - 0x{max_addr:04X}")
             logger.info(f"  Total Bytes:    {max_addr - min_addr + 1}")
+            if image.gaps:
+                logger.info(f"  Gaps:           {len(image.gaps)}")
+            if image.duplicates:
+                logger.info(f"  Duplicate Rows: {len(image.duplicates)}")
             logger.info("")
         
         # 6) Write summary
         summary_path = save_dir / "eeprom_summary.txt"
         with summary_path.open("w", encoding="utf-8") as sf:
             sf.write(f"EEPROM Parse Summary - {name}\n")
-            sf.write(f"Source lines parsed: {len(rows)}\n")
+            sf.write(f"Source lines parsed: {len(image.rows)} ({image.source})\n")
             sf.write(f"Address span: 0x{min_addr:04X} - 0x{max_addr:04X} ({max_addr - min_addr + 1} bytes)\n")
+            for gap_addr, gap_len in image.gaps:
+                sf.write(f"Gap         : 0x{gap_addr:04X} ({gap_len} bytes missing)\n")
+            for dup_addr in image.duplicates:
+                note = " (conflicting data)" if dup_addr in image.conflicts else ""
+                sf.write(f"Duplicate   : row 0x{dup_addr:04X}{note}\n")
             sf.write(f"Dump (raw)   : {raw_path.name if raw_path.exists() else '<missing>'}\n")
             sf.write(f"Dump (ascii) : {ascii_path.name if ascii_path.exists() else '<missing>'}\n")
             sf.write(f"Checks file  : {checks_path.name}\n")
@@ -1996,7 +2269,10 @@ negative_test: bool = False) -> TestAction:
             "summary_path": str(summary_path),
             "min_addr": min_addr,
             "max_addr": max_addr,
+            "gaps": image.gaps,
+            "duplicates": image.duplicates,
             "findings": findings,
+            "image": image,
         }
 
     checks_file = Path(checks).name
@@ -178,6 +178,12 @@ def get_value(ip: str, oid: str, community: str = "public", timeout: float = 3.0
     return value
 
 
+def _invalidate_eeprom_images(reason: str) -> None:
+    """Mark every session EEPROM image as stale after a write over SNMP."""
+    from ..serial.eeprom_dump import invalidate_eeprom_cache
+    invalidate_eeprom_cache(None, reason)
+
+
 def set_integer(ip: str, oid: str, value: int, community: str = "public", timeout: float = 3.0) -> bool:
     """Set an SNMP integer value with logging.
 
@@ -210,6 +216,9 @@ def set_integer(ip: str, oid: str, value: int, community: str = "public", timeou
         logger.info("")
 
     cmd = ["snmpset", "-v1", "-c", community, ip, oid, "i", str(value)]
+    # Outlet states and settings are persisted by the firmware; a power
+    # cycle of the DUT also logs to its failure memory
+    _invalidate_eeprom_images(f"SNMP SET {oid}")
     rc, out, err = _run_snmp_command(cmd, timeout)
     ok = (rc == 0)
 